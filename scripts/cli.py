@@ -4,6 +4,10 @@ Enhanced CLI wrapper for Azure Tenant Grapher
 
 This script provides an improved command-line interface with better error handling,
 configuration validation, and progress tracking.
+
+Startup is kept light: command modules under src/commands are registered by
+name on a LazyGroup and only imported when their command runs, and the
+commands defined here import their handlers inside the command body.
 """
 
 import asyncio
@@ -18,67 +22,6 @@ from rich.console import Console
 from rich.logging import RichHandler
 from rich.style import Style
 
-from src.cli_dashboard_manager import DashboardExitException
-from src.commands.abstract_graph import abstract_graph
-from src.commands.auth import app_registration as app_registration_cmd
-from src.commands.config import config as config_cmd
-
-# Import modular commands for CLI registration (Issue #482)
-from src.commands.ctf_cmd import ctf as ctf_group
-from src.commands.database import (
-    backup as backup_cmd,
-)
-from src.commands.database import (
-    backup_db as backup_db_cmd,
-)
-from src.commands.database import (
-    container as container_cmd,
-)
-from src.commands.database import (
-    restore as restore_cmd,
-)
-from src.commands.database import (
-    wipe as wipe_cmd,
-)
-from src.commands.deploy import deploy_command
-from src.commands.doctor import check_permissions as check_permissions_cmd
-from src.commands.doctor import doctor as doctor_cmd
-from src.commands.export_abstraction import export_abstraction_command
-from src.commands.layer_cmd import layer as layer_group
-from src.commands.list_deployments import list_deployments
-from src.commands.report import report as report_cmd
-from src.commands.scaling import (
-    scale_clean as scale_clean_cmd,
-)
-from src.commands.scaling import (
-    scale_down as scale_down_cmd,
-)
-from src.commands.scaling import (
-    scale_stats as scale_stats_cmd,
-)
-from src.commands.scaling import (
-    scale_up as scale_up_cmd,
-)
-from src.commands.scaling import (
-    scale_validate as scale_validate_cmd,
-)
-from src.commands.sentinel import setup_sentinel_command
-from src.commands.spa import spa_start as spa_start_command
-from src.commands.spa import spa_stop as spa_stop_command
-from src.commands.spec import generate_spec_command_handler, spec_command_handler
-from src.commands.tenant import create_tenant as create_tenant_cmd
-from src.commands.validate_deployment import validate_deployment_command
-from src.commands.version import (
-    backup_metadata as backup_metadata_cmd,
-)
-from src.commands.version import (
-    rebuild_graph as rebuild_graph_cmd,
-)
-from src.commands.version import (
-    version_check as version_check_cmd,
-)
-from src.commands.visualize import visualize_command_handler
-
 # Initialize console for rich output
 console = Console()
 
@@ -160,9 +103,7 @@ load_dotenv()
 try:
     import click
 
-    # Import from modular commands (Issue #722 - cli_commands.py removed)
-    from src.commands.scan import build_command_handler
-    from src.iac.cli_handler import generate_iac_command_handler
+    from src.commands.lazy import LazyGroup
 except ImportError as e:
     print(str(f"Import error: {e}"))
     print("Please ensure all required packages are installed:")
@@ -182,7 +123,15 @@ except ImportError:
         return False
 
 
-# (Removed duplicate import of DashboardExitException)
+async def generate_iac_command_handler(**kwargs: Any) -> Any:
+    """Run the IaC generation handler, importing the IaC stack on first use.
+
+    Kept as a module attribute so tests can patch
+    ``scripts.cli.generate_iac_command_handler``.
+    """
+    from src.iac.cli_handler import generate_iac_command_handler as handler
+
+    return await handler(**kwargs)
 
 
 def async_command(f: Callable[..., Coroutine[Any, Any, Any]]) -> Callable[..., Any]:
@@ -190,6 +139,8 @@ def async_command(f: Callable[..., Coroutine[Any, Any, Any]]) -> Callable[..., A
 
     @functools.wraps(f)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
+        from src.cli_dashboard_manager import DashboardExitException
+
         try:
             try:
                 loop = asyncio.get_running_loop()
@@ -288,7 +239,7 @@ def show_comprehensive_help(ctx: click.Context) -> None:
     click.echo("🌐 Documentation: https://github.com/your-repo/azure-tenant-grapher")
 
 
-@click.group(invoke_without_command=True)
+@click.group(cls=LazyGroup, invoke_without_command=True)
 @click.option(
     "--log-level",
     default="INFO",
@@ -426,6 +377,8 @@ async def build(
 
     Use --no-dashboard to disable the dashboard and emit logs line by line to the terminal.
     """
+    from src.commands.scan import build_command_handler
+
     debug = ctx.obj.get("debug", False)
     if debug:
         print("[DEBUG] CLI build command called", flush=True)
@@ -569,6 +522,8 @@ async def scan(
 
     Note: 'scan' is an alias for 'build' - both commands are identical.
     """
+    from src.commands.scan import build_command_handler
+
     debug = ctx.obj.get("debug", False)
     if debug:
         print("[DEBUG] CLI scan command called", flush=True)
@@ -655,6 +610,8 @@ async def visualize(
     ctx: click.Context, link_hierarchy: bool, no_container: bool
 ) -> None:
     """Generate graph visualization from existing Neo4j data (no tenant-id required)."""
+    from src.commands.visualize import visualize_command_handler
+
     await visualize_command_handler(ctx, link_hierarchy, no_container)
 
 
@@ -814,6 +771,8 @@ async def spec(
     ctx: click.Context, tenant_id: str, domain_name: Optional[str] = None
 ) -> None:
     """Generate only the tenant specification (requires existing graph)."""
+    from src.commands.spec import spec_command_handler
+
     await spec_command_handler(ctx, tenant_id, domain_name)
 
 
@@ -832,6 +791,8 @@ def generate_spec(
     ctx: click.Context, limit: Optional[int], output: Optional[str], hierarchical: bool
 ) -> None:
     """Generate anonymized tenant Markdown specification (no tenant-id required)."""
+    from src.commands.spec import generate_spec_command_handler
+
     generate_spec_command_handler(ctx, limit, output, hierarchical)
 
 
@@ -1234,62 +1195,171 @@ cli.add_command(generate_sim_doc, "gensimdoc")
 
 # ==============================================================================
 # Register modular commands (Issue #482: CLI Modularization)
-# These commands are now defined in src/commands/ modules for maintainability
+# These commands are now defined in src/commands/ modules for maintainability.
+# They are registered lazily: each module is imported only when its command
+# runs, so the short help shown by `atg --help` is recorded here.
 # ==============================================================================
 
 # Register create-tenant command (from src.commands.tenant)
-cli.add_command(create_tenant_cmd, "create-tenant")
+cli.add_lazy_command(
+    "create-tenant",
+    "src.commands.tenant:create_tenant",
+    "Create a tenant graph from a tenant spec.",
+)
 
 # Register graph abstraction command (from src.commands.abstract_graph)
-cli.add_command(abstract_graph)
+cli.add_lazy_command(
+    "abstract-graph",
+    "src.commands.abstract_graph:abstract_graph",
+    "Create abstracted subset of Azure tenant graph with optional security "
+    "preservation.",
+)
 
 # Register SPA commands (from src.commands.spa)
-cli.add_command(spa_start_command, "start")
-cli.add_command(spa_stop_command, "stop")
+cli.add_lazy_command(
+    "start",
+    "src.commands.spa:spa_start",
+    "Start the local SPA/Electron dashboard and MCP server.",
+)
+cli.add_lazy_command(
+    "stop",
+    "src.commands.spa:spa_stop",
+    "Stop the local SPA/Electron dashboard and MCP server.",
+)
 
 # Register auth command (from src.commands.auth)
-cli.add_command(app_registration_cmd, "app-registration")
+cli.add_lazy_command(
+    "app-registration",
+    "src.commands.auth:app_registration",
+    "Create an Azure AD app registration for Azure Tenant Grapher.",
+)
 
 # Register deployment commands (existing)
-cli.add_command(deploy_command, "deploy")
-cli.add_command(list_deployments, "list-deployments")
-cli.add_command(validate_deployment_command, "validate-deployment")
+cli.add_lazy_command(
+    "deploy",
+    "src.commands.deploy:deploy_command",
+    "Deploy generated IaC to target tenant.",
+)
+cli.add_lazy_command(
+    "list-deployments",
+    "src.commands.list_deployments:list_deployments",
+    "List all registered IaC deployments.",
+)
+cli.add_lazy_command(
+    "validate-deployment",
+    "src.commands.validate_deployment:validate_deployment_command",
+    "Validate deployment by comparing source and target graphs.",
+)
 
 # Register export-abstraction command (Issue #508)
-cli.add_command(export_abstraction_command, "export-abstraction")
+cli.add_lazy_command(
+    "export-abstraction",
+    "src.commands.export_abstraction:export_abstraction_command",
+    "Export graph abstraction to visualization format.",
+)
 
 # Register sentinel command (Issue #518)
-cli.add_command(setup_sentinel_command, "setup-sentinel")
+cli.add_lazy_command(
+    "setup-sentinel",
+    "src.commands.sentinel:setup_sentinel_command",
+    "Set up Azure Sentinel and Log Analytics with diagnostic settings.",
+)
 
 # Register database commands (Issue #482: CLI Modularization)
-cli.add_command(backup_cmd, "backup")
-cli.add_command(backup_db_cmd, "backup-db")
-cli.add_command(restore_cmd, "restore")
-cli.add_command(restore_cmd, "restore-db")  # Alias
-cli.add_command(wipe_cmd, "wipe")
+cli.add_lazy_command(
+    "backup",
+    "src.commands.database:backup",
+    "Backup the Neo4j database to a file.",
+)
+cli.add_lazy_command(
+    "backup-db",
+    "src.commands.database:backup_db",
+    "Backup the Neo4j database and save it to BACKUP_PATH.",
+)
+cli.add_lazy_command(
+    "restore",
+    "src.commands.database:restore",
+    "Restore the Neo4j database from a backup file.",
+)
+cli.add_lazy_command(
+    "restore-db",  # Alias
+    "src.commands.database:restore",
+    "Restore the Neo4j database from a backup file.",
+)
+cli.add_lazy_command(
+    "wipe",
+    "src.commands.database:wipe",
+    "Wipe all data from the Neo4j database.",
+)
+
+# Register incremental sync command (from src.commands.sync)
+cli.add_lazy_command(
+    "sync",
+    "src.commands.sync:sync",
+    "Apply Azure resource changes to the graph incrementally.",
+)
 
 # Register version tracking commands (Issue #706: Graph Version Tracking)
-cli.add_command(version_check_cmd, "version-check")
-cli.add_command(rebuild_graph_cmd, "rebuild-graph")
-cli.add_command(backup_metadata_cmd, "backup-metadata")
+cli.add_lazy_command(
+    "version-check",
+    "src.commands.version:version_check",
+    "Check graph construction version status.",
+)
+cli.add_lazy_command(
+    "rebuild-graph",
+    "src.commands.version:rebuild_graph",
+    "Rebuild graph database with current version.",
+)
+cli.add_lazy_command(
+    "backup-metadata",
+    "src.commands.version:backup_metadata",
+    "Backup graph metadata to file.",
+)
 
 # Register diagnostic commands (Phase 4)
-cli.add_command(doctor_cmd, "doctor")
-cli.add_command(check_permissions_cmd, "check-permissions")
+cli.add_lazy_command(
+    "doctor",
+    "src.commands.doctor:doctor",
+    "Check for all registered CLI tools and offer to install if missing.",
+)
+cli.add_lazy_command(
+    "check-permissions",
+    "src.commands.doctor:check_permissions",
+    "Check Microsoft Graph API permissions for AAD/Entra ID discovery.",
+)
 
 # Register infrastructure commands (Phase 4)
-cli.add_command(config_cmd, "config")
-cli.add_command(container_cmd, "container")
+cli.add_lazy_command(
+    "config",
+    "src.commands.config:config",
+    "Show current configuration (without sensitive data).",
+)
+cli.add_lazy_command(
+    "container",
+    "src.commands.database:container",
+    "Manage Neo4j container.",
+)
 
 # Register reporting commands (Issue #569)
-cli.add_command(report_cmd, "report")
+cli.add_lazy_command(
+    "report",
+    "src.commands.report:report",
+    "Generate comprehensive tenant report.",
+)
 
 # Register layer command group (Issue #482: CLI Modularization - Phase 3)
-cli.add_command(layer_group)
+cli.add_lazy_command(
+    "layer",
+    "src.commands.layer_cmd:layer",
+    "Layer management commands for multi-layer graph projections.",
+)
 
 # Register CTF command group (Issue #552: CTF Overlay System)
-
-cli.add_command(ctf_group)
+cli.add_lazy_command(
+    "ctf",
+    "src.commands.ctf_cmd:ctf",
+    "CTF (Capture The Flag) overlay management commands.",
+)
 
 
 @cli.command()
@@ -1800,11 +1870,31 @@ async def cost_report(
 # ============================================================================
 
 # Register scale command groups and individual commands
-cli.add_command(scale_up_cmd, "scale-up")
-cli.add_command(scale_down_cmd, "scale-down")
-cli.add_command(scale_clean_cmd, "scale-clean")
-cli.add_command(scale_validate_cmd, "scale-validate")
-cli.add_command(scale_stats_cmd, "scale-stats")
+cli.add_lazy_command(
+    "scale-up",
+    "src.commands.scaling:scale_up",
+    "Scale up operations - add synthetic nodes to the graph for testing.",
+)
+cli.add_lazy_command(
+    "scale-down",
+    "src.commands.scaling:scale_down",
+    "Scale down operations - sample/reduce the graph for testing.",
+)
+cli.add_lazy_command(
+    "scale-clean",
+    "src.commands.scaling:scale_clean",
+    "Clean up all synthetic data from the graph.",
+)
+cli.add_lazy_command(
+    "scale-validate",
+    "src.commands.scaling:scale_validate",
+    "Validate graph integrity after scale operations.",
+)
+cli.add_lazy_command(
+    "scale-stats",
+    "src.commands.scaling:scale_stats",
+    "Show graph statistics and metrics.",
+)
 
 
 # ============================================================================
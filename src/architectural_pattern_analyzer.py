@@ -19,7 +19,7 @@ import json
 import logging
 from collections import defaultdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import networkx as nx
 from neo4j import Driver, GraphDatabase
@@ -31,6 +31,9 @@ from src.analysis.patterns.detectors.pattern_detector import (
     PatternDetector,
 )
 
+if TYPE_CHECKING:
+    from src.replicator.modules.graph_snapshot import GraphSnapshot
+
 logger = logging.getLogger(__name__)
 
 
@@ -586,6 +589,9 @@ class ArchitecturalPatternAnalyzer:
             source_tenant_id.lower() if source_tenant_id else None
         )
         self.driver: Optional[Driver] = None
+        # Optional in-memory graph snapshot; when set, relationship and type
+        # queries are answered from it instead of Neo4j
+        self.snapshot: Optional[GraphSnapshot] = None
 
         # Initialize modular components (Issue #714)
         self._pattern_detector = PatternDetector()
@@ -639,6 +645,13 @@ class ArchitecturalPatternAnalyzer:
         Returns:
             List of relationship records with source/target labels and types
         """
+        if self.snapshot is not None:
+            all_relationships = self.snapshot.relationships(self.source_tenant_id)
+            logger.info(
+                f"Loaded {len(all_relationships)} relationships from graph snapshot"
+            )
+            return all_relationships
+
         if not self.driver:
             raise RuntimeError("Not connected to Neo4j. Call connect() first.")
 
@@ -752,6 +765,9 @@ class ArchitecturalPatternAnalyzer:
         Returns:
             Dict mapping resource_type → count of resources of that type.
         """
+        if self.snapshot is not None:
+            return self.snapshot.resource_type_counts()
+
         if not self.driver:
             raise RuntimeError("Not connected to Neo4j. Call connect() first.")
 
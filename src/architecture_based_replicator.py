@@ -37,6 +37,7 @@ from .architecture_replication_constants import (
 )
 from .replicator.modules import (
     ConfigurationSimilarity,
+    GraphSnapshot,
     GraphStructureAnalyzer,
     InstanceSelector,
     OrphanedResourceManager,
@@ -64,6 +65,8 @@ class ArchitecturePatternReplicator:
         neo4j_user: str,
         neo4j_password: str,
         source_tenant_id: str | None = None,
+        use_graph_snapshot: bool = True,
+        snapshot_cache_dir: str | None = None,
     ):
         """
         Initialize the architecture-based replicator.
@@ -75,10 +78,17 @@ class ArchitecturePatternReplicator:
             source_tenant_id: Azure tenant ID of the source scan.  Passed to
                 ``ArchitecturalPatternAnalyzer`` so that resources belonging to
                 other tenants are excluded from pattern analysis.
+            use_graph_snapshot: If True, load the source graph into memory once
+                and answer the per-pattern queries of the bricks from it
+            snapshot_cache_dir: Directory to persist graph snapshots in, keyed by
+                graph version, so unchanged graphs are not re-read (optional)
         """
         self.neo4j_uri = neo4j_uri
         self.neo4j_user = neo4j_user
         self.neo4j_password = neo4j_password
+        self.use_graph_snapshot = use_graph_snapshot
+        self.snapshot_cache_dir = snapshot_cache_dir
+        self.snapshot: GraphSnapshot | None = None
 
         # Pattern analyzer for building generalized graphs
         self.analyzer = ArchitecturalPatternAnalyzer(
@@ -165,6 +175,9 @@ class ArchitecturePatternReplicator:
         self.analyzer.connect()
 
         try:
+            if self.use_graph_snapshot:
+                self._load_graph_snapshot()
+
             # Step 1: Build source pattern graph
             all_relationships = self.analyzer.fetch_all_relationships()
             aggregated_relationships = self.analyzer.aggregate_relationships(
@@ -219,6 +232,29 @@ class ArchitecturePatternReplicator:
         finally:
             self.analyzer.close()
 
+    def _load_graph_snapshot(self) -> None:
+        """
+        Load the source graph snapshot and share it with the analyzer and bricks.
+
+        Falls back to querying Neo4j directly if the snapshot cannot be loaded.
+        """
+        if self.analyzer.driver is None:
+            return
+
+        try:
+            with self.analyzer.driver.session() as session:
+                snapshot = GraphSnapshot.load(
+                    session, cache_dir=self.snapshot_cache_dir
+                )
+        except Exception as e:
+            logger.warning(f"Could not load graph snapshot, querying Neo4j: {e}")
+            return
+
+        self.snapshot = snapshot
+        self.analyzer.snapshot = snapshot
+        self.instance_finder.snapshot = snapshot
+        self.target_builder.snapshot = snapshot
+
     def _fetch_pattern_resources(
         self,
         use_configuration_coherence: bool = True,
@@ -287,7 +323,11 @@ class ArchitecturePatternReplicator:
                     else:
                         # Use PatternInstanceFinder brick for simple connected instances
                         instances = self.instance_finder.find_connected_instances(
-                            session, matched_resources
+                            session,
+                            matched_resources,
+                            pattern_name,
+                            self.detected_patterns,
+                            include_colocated_orphaned_resources,
                         )
 
                 logger.info(
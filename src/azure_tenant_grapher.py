@@ -5,13 +5,20 @@ This module provides functionality to walk Azure tenant resources and build
 a Neo4j graph database of those resources and their relationships.
 """
 
+import asyncio
 import logging
 import os
+import time
 import warnings
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from .config_manager import AzureTenantGrapherConfig
 from .llm_descriptions import create_llm_generator
+from .services.discovery_budget import (
+    DiscoveryBudget,
+    SubscriptionTiming,
+    log_subscription_timings,
+)
 from .utils.console_icons import (
     ICON_ERROR,
     ICON_FILE,
@@ -170,6 +177,252 @@ class AzureTenantGrapher:
 
     # Legacy async LLM pool processing removed; handled by services.
 
+    async def _discover_all_subscriptions(
+        self,
+        subscriptions: List[Dict[str, Any]],
+        all_resources: List[Dict[str, Any]],
+        filter_config: Optional[Any],
+        resource_limit: Optional[int],
+        resource_sink: Optional[
+            Callable[[List[Dict[str, Any]]], Awaitable[Any]]
+        ] = None,
+    ) -> List[SubscriptionTiming]:
+        """
+        Discover resources in every subscription concurrently.
+
+        Subscriptions fan out up to ``subscription_concurrency`` at a time and
+        share one fair-share ARM budget across all discovery phases, so a single
+        very large subscription cannot starve the others.
+
+        Args:
+            subscriptions: Subscriptions from discovery
+            all_resources: List that receives discovered resources (in subscription order)
+            filter_config: Optional FilterConfig
+            resource_limit: Optional per-subscription resource limit
+            resource_sink: Optional async callable that receives hydrated
+                batches as discovery completes them; all_resources is left
+                untouched when given
+
+        Returns:
+            Per-subscription timing records
+        """
+        processing = self.config.processing
+        budget_tokens = getattr(processing, "arm_request_budget", 50)
+        concurrency = getattr(processing, "subscription_concurrency", 10)
+        budget = DiscoveryBudget(
+            budget_tokens if isinstance(budget_tokens, int) else 50
+        )
+        self.discovery_service.budget = budget
+        semaphore = asyncio.Semaphore(
+            max(1, concurrency if isinstance(concurrency, int) else 10)
+        )
+
+        async def _discover(
+            subscription: Dict[str, Any],
+        ) -> Tuple[List[Dict[str, Any]], SubscriptionTiming]:
+            async with semaphore:
+                start = time.perf_counter()
+                resources: List[Dict[str, Any]] = []
+                streamed = 0
+                error: Optional[str] = None
+                kwargs: Dict[str, Any] = {}
+                if resource_sink is not None:
+
+                    async def _sink(batch: List[Dict[str, Any]]) -> None:
+                        nonlocal streamed
+                        streamed += len(batch)
+                        await resource_sink(batch)
+
+                    kwargs["resource_sink"] = _sink
+                try:
+                    resources = (
+                        await self.discovery_service.discover_resources_in_subscription(
+                            subscription["id"],
+                            filter_config=filter_config,
+                            resource_limit=resource_limit,
+                            **kwargs,
+                        )
+                    )
+                except Exception as e:
+                    logger.exception(
+                        f"Error discovering resources for subscription {subscription['id']}"
+                    )
+                    error = str(e)
+                timing = budget.timing_for(subscription["id"])
+                timing.display_name = subscription.get("display_name") or ""
+                timing.wall_seconds = time.perf_counter() - start
+                timing.resource_count = len(resources) + streamed
+                timing.error = error
+                return resources, timing
+
+        try:
+            results = await asyncio.gather(*[_discover(s) for s in subscriptions])
+        finally:
+            self.discovery_service.budget = None
+
+        timings: List[SubscriptionTiming] = []
+        for resources, timing in results:
+            all_resources.extend(resources)
+            timings.append(timing)
+        return timings
+
+    async def _fetch_service_principal_resources(
+        self, subscriptions: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Fetch service principals from Graph and convert them to resource dicts."""
+        logger.info("Fetching service principals from Microsoft Graph API...")
+        service_principals = await self.aad_graph_service.get_service_principals()  # type: ignore[union-attr]
+        logger.info(
+            f"Successfully fetched {len(service_principals)} service principals from Graph API"
+        )
+
+        sp_resources: List[Dict[str, Any]] = []
+        for sp in service_principals:
+            sp_resource = {
+                "id": f"/servicePrincipals/{sp['id']}",
+                "name": sp.get("displayName", sp["id"]),
+                "type": "Microsoft.Graph/servicePrincipals",
+                "properties": sp,
+                "subscription_id": subscriptions[0]["id"] if subscriptions else "",
+                "resource_group": None,  # Service principals are tenant-level
+                "location": "global",
+                "tags": {},
+            }
+            sp_resources.append(sp_resource)
+            logger.debug(
+                f"Added service principal: {sp_resource['name']} (ID: {sp['id']})"
+            )
+        return sp_resources
+
+    async def _stream_build(
+        self,
+        subscriptions: List[Dict[str, Any]],
+        progress_callback: Optional[Any],
+        filter_config: Optional[Any],
+        resource_limit: Optional[int],
+    ) -> Tuple[Any, List[SubscriptionTiming]]:
+        """
+        Discover and process resources as one bounded pipeline.
+
+        Discovery pushes hydrated batches into a ResourceStream while
+        processing workers drain it, so peak memory follows the queue depth
+        instead of the size of the tenant. Relationship rules that need every
+        target node in the graph are flushed once the stream is drained.
+
+        Args:
+            subscriptions: Subscriptions from discovery
+            progress_callback: Optional progress callback for processing
+            filter_config: Optional FilterConfig (without active filters)
+            resource_limit: Optional resource limit, applied per subscription
+                and to the stream as a whole
+
+        Returns:
+            Tuple of (ProcessingStats, per-subscription timings)
+        """
+        from .services.resource_processing import ResourceStream
+
+        queue_depth = getattr(self.config.processing, "pipeline_queue_depth", 1000)
+        stream = ResourceStream(
+            max_depth=queue_depth if isinstance(queue_depth, int) else 1000,
+            resource_limit=resource_limit,
+        )
+        logger.info(
+            f"{ICON_ITERATION} Streaming discovery into processing (queue depth {stream.max_depth})"
+        )
+
+        async def _produce() -> List[SubscriptionTiming]:
+            try:
+                timings = await self._discover_all_subscriptions(
+                    subscriptions,
+                    [],
+                    filter_config,
+                    resource_limit,
+                    resource_sink=stream.put_many,
+                )
+                if self.aad_graph_service:
+                    logger.info("Enriching with Entra ID (Azure AD) identity data...")
+                    try:
+                        sp_resources = await self._fetch_service_principal_resources(
+                            subscriptions
+                        )
+                        added = await stream.put_many(sp_resources)
+                        logger.info(
+                            f"Successfully added {added} service principals to processing queue"
+                        )
+                    except Exception as e:
+                        logger.exception(
+                            f"Failed to fetch service principals from Graph API: {e}"
+                        )
+                        logger.warning(
+                            "Continuing without service principal enrichment"
+                        )
+                return timings
+            finally:
+                await stream.close()
+
+        with self.session_manager:
+            consumer = asyncio.create_task(
+                self.processing_service.process_resource_stream(
+                    stream,
+                    progress_callback=progress_callback,
+                    tenant_id=self.config.tenant_id,
+                )
+            )
+            producer = asyncio.create_task(_produce())
+            done, _ = await asyncio.wait(
+                {producer, consumer}, return_when=asyncio.FIRST_EXCEPTION
+            )
+            # A failed consumer would leave discovery blocked on a full queue
+            if consumer in done and consumer.exception() is not None:
+                producer.cancel()
+                await asyncio.gather(producer, return_exceptions=True)
+                raise consumer.exception()  # type: ignore[misc]
+            subscription_timings = await producer
+            stats = await consumer
+        return stats, subscription_timings
+
+    def _update_graph_metadata(self) -> None:
+        """Record the current graph version and scan time (Issue #706)."""
+        try:
+            from datetime import datetime
+
+            from .version_tracking.detector import VersionDetector
+            from .version_tracking.metadata import GraphMetadataService
+
+            detector = VersionDetector()
+            current_version = detector.read_semaphore_version()
+
+            if current_version:
+                metadata_service = GraphMetadataService(self.session_manager)
+                timestamp = datetime.now().isoformat()
+                metadata_service.write_metadata(
+                    version=current_version, last_scan_at=timestamp
+                )
+                logger.info(
+                    f"{ICON_SUCCESS} Updated graph metadata: version={current_version}, last_scan={timestamp}"
+                )
+            else:
+                logger.warning(
+                    f"{ICON_WARNING} Could not read version from semaphore file - metadata not updated"
+                )
+        except Exception as e:
+            logger.warning(f"Failed to update graph metadata: {e}")
+
+    def _build_result(
+        self,
+        stats: Any,
+        subscriptions: List[Dict[str, Any]],
+        subscription_timings: List[SubscriptionTiming],
+    ) -> Dict[str, Any]:
+        """Build the build_graph summary dict (back-compat shape)."""
+        log_subscription_timings(subscription_timings)
+        result = stats.to_dict()
+        result["subscriptions"] = len(subscriptions)
+        result["subscription_timings"] = [t.to_dict() for t in subscription_timings]
+        result["success"] = True
+        logger.info(str(f"[DEBUG][BUILD_GRAPH] Returning build result: {result}"))
+        return result
+
     async def build_graph(
         self,
         progress_callback: Optional[Any] = None,
@@ -195,25 +448,31 @@ class AzureTenantGrapher:
                 logger.warning(f"{ICON_WARNING} No subscriptions found in tenant")
                 return {"subscriptions": 0, "resources": 0, "success": False}
 
-            # 2. Discover resources in all subscriptions
-            all_resources: List[Dict[str, Any]] = []
             resource_limit = getattr(self.config.processing, "resource_limit", None)
 
-            for subscription in subscriptions:
-                try:
-                    resources = (
-                        await self.discovery_service.discover_resources_in_subscription(
-                            subscription["id"],
-                            filter_config=filter_config,
-                            resource_limit=resource_limit,
-                        )
-                    )
-                    all_resources.extend(resources)
-                except Exception:
-                    logger.exception(
-                        f"Error discovering resources for subscription {subscription['id']}"
-                    )
-                    continue
+            # Unfiltered scans stream discovery straight into processing.
+            # Filtered scans need the whole filtered set for referenced-resource,
+            # cross-RG dependency and identity collection, so they materialise it.
+            streaming = getattr(self.config.processing, "streaming_pipeline", False)
+            if (
+                streaming is True
+                and not force_rebuild_edges
+                and not (filter_config and filter_config.has_filters())
+            ):
+                stats, subscription_timings = await self._stream_build(
+                    subscriptions, progress_callback, filter_config, resource_limit
+                )
+                logger.info(
+                    f"[DEBUG][BUILD_GRAPH] Completed streaming discovery and processing. Stats: {stats.to_dict() if hasattr(stats, 'to_dict') else stats}"
+                )
+                self._update_graph_metadata()
+                return self._build_result(stats, subscriptions, subscription_timings)
+
+            # 2. Discover resources in all subscriptions concurrently
+            all_resources: List[Dict[str, Any]] = []
+            subscription_timings = await self._discover_all_subscriptions(
+                subscriptions, all_resources, filter_config, resource_limit
+            )
 
             # 2.1. Pre-run in-memory de-duplication (Phase 1 efficiency improvement)
             logger.info(f"{ICON_FILE}  Processing {len(all_resources)} discovered resources")
@@ -318,6 +577,12 @@ class AzureTenantGrapher:
                     discovery_service=self.discovery_service,
                     db_ops=processor.db_ops,
                     relationship_rules=ALL_RELATIONSHIP_RULES,
+                    max_depth=getattr(
+                        self.config.processing, "dependency_max_depth", 3
+                    ),
+                    fetch_concurrency=getattr(
+                        self.config.processing, "dependency_fetch_concurrency", 20
+                    ),
                 )
 
                 try:
@@ -349,39 +614,15 @@ class AzureTenantGrapher:
                 logger.info("=" * 70)
 
                 try:
-                    # Fetch service principals
-                    logger.info(
-                        "Fetching service principals from Microsoft Graph API..."
-                    )
-                    service_principals = (
-                        await self.aad_graph_service.get_service_principals()
-                    )
-                    logger.info(
-                        f"Successfully fetched {len(service_principals)} service principals from Graph API"
-                    )
-
                     # Convert service principals to resource format and add to all_resources
+                    sp_resources = await self._fetch_service_principal_resources(
+                        subscriptions
+                    )
                     sp_count_before = len(all_resources)
-                    for sp in service_principals:
-                        sp_resource = {
-                            "id": f"/servicePrincipals/{sp['id']}",
-                            "name": sp.get("displayName", sp["id"]),
-                            "type": "Microsoft.Graph/servicePrincipals",
-                            "properties": sp,
-                            "subscription_id": subscriptions[0]["id"]
-                            if subscriptions
-                            else "",
-                            "resource_group": None,  # Service principals are tenant-level
-                            "location": "global",
-                            "tags": {},
-                        }
-                        all_resources.append(sp_resource)
-                        logger.debug(
-                            f"Added service principal: {sp_resource['name']} (ID: {sp['id']})"
-                        )
+                    all_resources.extend(sp_resources)
 
                     logger.info(
-                        f"Successfully added {len(service_principals)} service principals to processing queue"
+                        f"Successfully added {len(sp_resources)} service principals to processing queue"
                     )
                     logger.info(
                         f"Total resources after AAD enrichment: {len(all_resources)} (was {sp_count_before})"
@@ -433,15 +674,6 @@ class AzureTenantGrapher:
                         f"{ICON_FOLDER} Found {len(existing_resources)} existing resources in database"
                     )
 
-                    # Create a processor instance for database operations
-                    processor = self.processing_service.processor_factory(
-                        self.session_manager,
-                        self.processing_service.llm_generator,
-                        getattr(self.config.processing, "resource_limit", None),
-                        getattr(self.config.processing, "max_retries", 3),
-                        self.config.tenant_id,
-                    )
-
                     # Clear existing non-containment relationships first
                     logger.info(f"{ICON_TRASH} Clearing existing non-containment relationships...")
                     with self.session_manager.session() as session:
@@ -452,34 +684,28 @@ class AzureTenantGrapher:
                             DELETE rel
                         """)
 
-                    # Re-run relationship rules for all existing resources
-                    for i, resource in enumerate(existing_resources):
+                    # Re-run relationship rules for all existing resources;
+                    # containment is preserved.
+                    def report_rebuild_progress(done: int, total: int) -> None:
                         if progress_callback:
                             progress_callback(
-                                processed=i + 1,
-                                total=len(existing_resources),
-                                successful=i + 1,
+                                processed=done,
+                                total=total,
+                                successful=done,
                                 failed=0,
                                 skipped=0,
                                 llm_generated=0,
                                 llm_skipped=0,
                             )
 
-                        logger.debug(
-                            f"{ICON_ITERATION} Rebuilding edges for resource {i + 1}/{len(existing_resources)}: {resource.get('name', 'Unknown')}"
-                        )
-
-                        # Re-emit relationships (but not containment - that's preserved)
-                        from src.relationship_rules import ALL_RELATIONSHIP_RULES
-
-                        for rule in ALL_RELATIONSHIP_RULES:
-                            try:
-                                if rule.applies(resource):
-                                    rule.emit(resource, processor.db_ops)
-                            except Exception as e:
-                                logger.exception(
-                                    f"Relationship rule {rule.__class__.__name__} failed during rebuild: {e}"
-                                )
+                    queued = self.processing_service.reevaluate_relationships(
+                        existing_resources,
+                        tenant_id=self.config.tenant_id,
+                        progress_callback=report_rebuild_progress,
+                    )
+                    logger.info(
+                        f"{ICON_ITERATION} Queued {queued} extracted relationships for {len(existing_resources)} resources"
+                    )
 
                     logger.info(
                         f"{ICON_SUCCESS} Completed rebuilding edges for {len(existing_resources)} existing resources."
@@ -508,37 +734,10 @@ class AzureTenantGrapher:
                     )
 
             # 4. Update graph metadata with current version (Issue #706)
-            try:
-                from datetime import datetime
-
-                from .version_tracking.detector import VersionDetector
-                from .version_tracking.metadata import GraphMetadataService
-
-                detector = VersionDetector()
-                current_version = detector.read_semaphore_version()
-
-                if current_version:
-                    metadata_service = GraphMetadataService(self.session_manager)
-                    timestamp = datetime.now().isoformat()
-                    metadata_service.write_metadata(
-                        version=current_version, last_scan_at=timestamp
-                    )
-                    logger.info(
-                        f"{ICON_SUCCESS} Updated graph metadata: version={current_version}, last_scan={timestamp}"
-                    )
-                else:
-                    logger.warning(
-                        f"{ICON_WARNING} Could not read version from semaphore file - metadata not updated"
-                    )
-            except Exception as e:
-                logger.warning(f"Failed to update graph metadata: {e}")
+            self._update_graph_metadata()
 
             # 5. Return stats as dict (back-compat)
-            result = stats.to_dict()
-            result["subscriptions"] = len(subscriptions)
-            result["success"] = True
-            logger.info(str(f"[DEBUG][BUILD_GRAPH] Returning build result: {result}"))
-            return result
+            return self._build_result(stats, subscriptions, subscription_timings)
 
         except Exception as e:
             logger.exception("Error during graph building")
@@ -43,6 +43,7 @@ from src.services.layer import (
     LayerManagementService,
     LayerNotFoundError,
 )
+from src.services.layer.archive import read_archive_metadata
 from src.utils.neo4j_startup import ensure_neo4j_running
 from src.utils.session_manager import Neo4jSessionManager
 
@@ -561,6 +562,7 @@ async def layer_copy_command_handler(
     yes: bool,
     no_container: bool,
     debug: bool,
+    copy_on_write: bool = False,
 ) -> None:
     """
     Copy an entire layer (nodes + relationships).
@@ -598,6 +600,8 @@ async def layer_copy_command_handler(
                 f"  Source:  {source} ({format_number(source_layer.node_count)} nodes)"
             )
             console.print(str(f"  Target:  {target}"))
+            if copy_on_write:
+                console.print("  Mode:    copy-on-write (no nodes copied)")
             console.print()
 
             if not click.confirm("Confirm copy operation?", default=True):
@@ -621,6 +625,7 @@ async def layer_copy_command_handler(
                 description=description,
                 copy_metadata=copy_metadata,
                 batch_size=1000,
+                copy_on_write=copy_on_write,
             )
 
             end_time = datetime.utcnow()
@@ -1250,6 +1255,80 @@ async def layer_refresh_stats_command_handler(
         sys.exit(2)
 
 
+# =============================================================================
+# Command: atg layer materialize
+# =============================================================================
+
+
+async def layer_materialize_command_handler(
+    layer_id: str,
+    yes: bool,
+    no_container: bool,
+    debug: bool,
+) -> None:
+    """
+    Copy inherited nodes into a copy-on-write layer so it stands alone.
+    """
+    if not no_container:
+        ensure_neo4j_running(debug)
+
+    service = get_layer_service()
+
+    try:
+        layer = await service.get_layer(layer_id)
+        if not layer:
+            console.print(str(f"[red]Layer not found: {layer_id}[/red]"))
+            sys.exit(1)
+
+        if not layer.is_copy_on_write:
+            console.print(
+                f"Layer [cyan]{layer_id}[/cyan] is not copy-on-write; nothing to do"
+            )
+            return
+
+        chain = await service.get_layer_chain(layer_id)
+
+        if not yes:
+            console.print(str(f"Materializing layer: [cyan]{layer_id}[/cyan]"))
+            console.print()
+            console.print(str(f"  Reads through: {' → '.join(chain[1:])}"))
+            console.print(f"  Delta:         {format_number(layer.node_count)} nodes")
+            console.print()
+
+            if not click.confirm("Confirm materialize operation?", default=True):
+                console.print("Cancelled.")
+                sys.exit(3)
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+        ) as progress:
+            task = progress.add_task("Materializing layer...", total=None)
+
+            start_time = datetime.utcnow()
+            layer = await service.materialize_layer(layer_id, batch_size=1000)
+            duration = (datetime.utcnow() - start_time).total_seconds()
+
+            progress.update(task, completed=True)
+
+        console.print()
+        console.print("[green]✓[/green] Layer materialized")
+        console.print()
+        console.print(str(f"[bold]Layer:[/bold] {layer_id}"))
+        console.print(str(f"[bold]Nodes:[/bold] {format_number(layer.node_count)}"))
+        console.print(
+            f"[bold]Relationships:[/bold] {format_number(layer.relationship_count)}"
+        )
+        console.print(str(f"[bold]Time:[/bold] {duration:.1f} seconds"))
+
+    except Exception as e:
+        console.print(str(f"[red]Error materializing layer: {e}[/red]"))
+        if debug:
+            console.print_exception()
+        sys.exit(4)
+
+
 # =============================================================================
 # Command: atg layer archive
 # =============================================================================
@@ -1265,7 +1344,7 @@ async def layer_archive_command_handler(
     debug: bool,
 ) -> None:
     """
-    Export layer to JSON archive file.
+    Export layer to JSON or compressed chunked archive file.
     """
     if not no_container:
         ensure_neo4j_running(debug)
@@ -1314,6 +1393,7 @@ async def layer_archive_command_handler(
                 layer_id=layer_id,
                 output_path=output_path,
                 include_original=include_original,
+                archive_format="chunked" if compress else None,
             )
 
             end_time = datetime.utcnow()
@@ -1354,9 +1434,10 @@ async def layer_restore_command_handler(
     yes: bool,
     no_container: bool,
     debug: bool,
+    resume: bool = False,
 ) -> None:
     """
-    Restore layer from JSON archive.
+    Restore layer from JSON or chunked archive.
     """
     if not no_container:
         ensure_neo4j_running(debug)
@@ -1369,16 +1450,13 @@ async def layer_restore_command_handler(
             console.print(str(f"[red]Archive not found: {archive_path}[/red]"))
             sys.exit(1)
 
-        # Load archive to preview
-        with open(archive_path) as f:
-            archive_data = json.load(f)
-
-        metadata = archive_data["metadata"]
+        # Load archive metadata to preview
+        metadata = read_archive_metadata(archive_path)
         original_layer_id = metadata["layer_id"]
         target_layer_id = layer_id or original_layer_id
 
         # Check if target layer already exists
-        if await service.get_layer(target_layer_id):
+        if not resume and await service.get_layer(target_layer_id):
             console.print(str(f"[red]Layer already exists: {target_layer_id}[/red]"))
             console.print(
                 "\nUse --layer-id to specify a different ID, or delete the existing layer first."
@@ -1422,6 +1500,7 @@ async def layer_restore_command_handler(
             layer = await service.restore_layer(
                 archive_path=archive_path,
                 target_layer_id=layer_id,
+                resume=resume,
             )
 
             end_time = datetime.utcnow()
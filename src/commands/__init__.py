@@ -10,22 +10,35 @@ Issue #482: CLI Modularization
 
 import importlib
 import logging
-from typing import Callable, Optional
+from typing import Any, Callable, Optional
 
 import click
 
-# Re-export from base for convenience (must be at top to avoid E402)
-from .base import (
-    CommandContext,
-    DashboardLogHandler,
-    async_command,
-    command_context,
-    exit_with_error,
-    get_neo4j_config_from_env,
-    get_tenant_id,
+logger = logging.getLogger(__name__)
+
+# Convenience re-exports from base. They are resolved on first access so that
+# importing a single command module (or src.commands.lazy at CLI startup)
+# does not pull in base's Neo4j/container/dashboard dependencies.
+_BASE_EXPORTS = frozenset(
+    {
+        "CommandContext",
+        "DashboardLogHandler",
+        "async_command",
+        "command_context",
+        "exit_with_error",
+        "get_neo4j_config_from_env",
+        "get_tenant_id",
+    }
 )
 
-logger = logging.getLogger(__name__)
+
+def __getattr__(name: str) -> Any:
+    if name in _BASE_EXPORTS:
+        from . import base
+
+        return getattr(base, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Registry of all available commands
 _COMMAND_REGISTRY: dict[str, Callable] = {}
@@ -60,6 +73,7 @@ _COMMAND_MODULES: dict[str, str] = {
     "app-registration": "src.commands.auth",
     # Monitoring/analysis commands
     "monitor": "src.commands.monitor",
+    "sync": "src.commands.sync",
     "fidelity": "src.commands.fidelity",
     # Cost commands
     "cost-analysis": "src.commands.cost",
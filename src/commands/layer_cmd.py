@@ -5,13 +5,14 @@ This module provides the layer command group for multi-layer graph projection ma
 - layer show: Display detailed layer information
 - layer active: Show or set active layer
 - layer create: Create new empty layer
-- layer copy: Duplicate layer with all nodes/relationships
+- layer copy: Duplicate layer with all nodes/relationships (or copy-on-write)
+- layer materialize: Turn a copy-on-write layer into a standalone layer
 - layer delete: Remove layer and its data
 - layer diff: Compare two layers
 - layer validate: Check layer integrity
 - layer refresh-stats: Update layer metadata counts
-- layer archive: Export layer to JSON
-- layer restore: Import layer from JSON archive
+- layer archive: Export layer to a JSON or chunked archive
+- layer restore: Import layer from an archive (resumable)
 
 Issue #482: CLI Modularization - Phase 3 (Layer Commands)
 """
@@ -28,6 +29,7 @@ from src.cli_commands_layer import (
     layer_delete_command_handler,
     layer_diff_command_handler,
     layer_list_command_handler,
+    layer_materialize_command_handler,
     layer_refresh_stats_command_handler,
     layer_restore_command_handler,
     layer_show_command_handler,
@@ -330,6 +332,11 @@ async def layer_create(
     default=True,
     help="Copy metadata dict from source (default: true)",
 )
+@click.option(
+    "--copy-on-write",
+    is_flag=True,
+    help="Record only changes over the source instead of copying its nodes",
+)
 @click.option(
     "--make-active",
     is_flag=True,
@@ -354,6 +361,7 @@ async def layer_copy(
     name: Optional[str],
     description: Optional[str],
     copy_metadata: bool,
+    copy_on_write: bool,
     make_active: bool,
     yes: bool,
     no_container: bool,
@@ -366,6 +374,7 @@ async def layer_copy(
         name=name,
         description=description,
         copy_metadata=copy_metadata,
+        copy_on_write=copy_on_write,
         make_active=make_active,
         yes=yes,
         no_container=no_container,
@@ -373,6 +382,41 @@ async def layer_copy(
     )
 
 
+# =============================================================================
+# layer materialize
+# =============================================================================
+
+
+@layer.command(name="materialize")
+@click.argument("layer_id")
+@click.option(
+    "--yes",
+    is_flag=True,
+    help="Skip confirmation",
+)
+@click.option(
+    "--no-container",
+    is_flag=True,
+    help="Do not auto-start Neo4j container",
+)
+@click.pass_context
+@async_command
+async def layer_materialize(
+    ctx: click.Context,
+    layer_id: str,
+    yes: bool,
+    no_container: bool,
+) -> None:
+    """Copy inherited nodes into a copy-on-write layer."""
+    debug = ctx.obj.get("debug", False)
+    await layer_materialize_command_handler(
+        layer_id=layer_id,
+        yes=yes,
+        no_container=no_container,
+        debug=debug,
+    )
+
+
 # =============================================================================
 # layer delete
 # =============================================================================
@@ -587,7 +631,7 @@ async def layer_refresh_stats(
 @click.option(
     "--compress",
     is_flag=True,
-    help="Compress archive with gzip",
+    help="Write a compressed chunked archive (default unless OUTPUT_PATH ends in .json)",
 )
 @click.option(
     "--yes",
@@ -610,7 +654,7 @@ async def layer_archive(
     yes: bool,
     no_container: bool,
 ) -> None:
-    """Export layer to JSON archive file."""
+    """Export layer to JSON or compressed chunked archive file."""
     debug = ctx.obj.get("debug", False)
     await layer_archive_command_handler(
         layer_id=layer_id,
@@ -641,6 +685,11 @@ async def layer_archive(
     is_flag=True,
     help="Set as active layer after restore",
 )
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="Continue an interrupted restore of this archive",
+)
 @click.option(
     "--yes",
     is_flag=True,
@@ -658,15 +707,17 @@ async def layer_restore(
     archive_path: str,
     layer_id: Optional[str],
     make_active: bool,
+    resume: bool,
     yes: bool,
     no_container: bool,
 ) -> None:
-    """Restore layer from JSON archive."""
+    """Restore layer from JSON or chunked archive."""
     debug = ctx.obj.get("debug", False)
     await layer_restore_command_handler(
         archive_path=archive_path,
         layer_id=layer_id,
         make_active=make_active,
+        resume=resume,
         yes=yes,
         no_container=no_container,
         debug=debug,
@@ -686,6 +737,7 @@ __all__ = [
     "layer_delete",
     "layer_diff",
     "layer_list",
+    "layer_materialize",
     "layer_refresh_stats",
     "layer_restore",
     "layer_show",
@@ -0,0 +1,94 @@
+"""Lazy-loading Click group for the atg CLI.
+
+Commands are registered by name with an ``"module:attribute"`` import path
+and their module is only imported when the command is dispatched (or its
+own ``--help`` is shown). Group-level help is rendered from the short help
+recorded at registration, so ``atg --help`` imports no command modules.
+
+This module must stay cheap to import: it is loaded on every CLI start.
+"""
+
+import importlib
+from typing import Any, Optional
+
+import click
+
+
+class LazyGroup(click.Group):
+    """Click group that imports registered commands on first use."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        # name -> (import path, short help); set before Group.__init__, which
+        # may call add_command()
+        self.lazy_commands: dict[str, tuple[str, str]] = {}
+        super().__init__(*args, **kwargs)
+
+    def add_lazy_command(self, name: str, import_path: str, short_help: str) -> None:
+        """Register a command to be imported on first use.
+
+        Like add_command(), this replaces any command already registered
+        under the same name.
+
+        Args:
+            name: Command name as used on the command line
+            import_path: ``"package.module:attribute"`` of the Click command
+            short_help: One-line help shown in the group's command list
+        """
+        if ":" not in import_path:
+            raise ValueError(
+                f"Lazy command {name!r} needs a 'module:attribute' import path, "
+                f"got {import_path!r}"
+            )
+        self.commands.pop(name, None)
+        self.lazy_commands[name] = (import_path, short_help)
+
+    def add_command(self, cmd: click.Command, name: Optional[str] = None) -> None:
+        name = name or cmd.name
+        super().add_command(cmd, name)
+        if name:
+            self.lazy_commands.pop(name, None)
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*self.commands, *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in self.lazy_commands:
+            return self._load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(
+        self, ctx: click.Context, formatter: click.HelpFormatter
+    ) -> None:
+        """List commands without importing the ones not yet loaded."""
+        names = self.list_commands(ctx)
+        if not names:
+            return
+        limit = formatter.width - 6 - max(len(name) for name in names)
+
+        rows = []
+        for name in names:
+            if name in self.lazy_commands:
+                # Truncate like a loaded command would
+                placeholder = click.Command(name, help=self.lazy_commands[name][1])
+                rows.append((name, placeholder.get_short_help_str(limit)))
+                continue
+            cmd = self.commands[name]
+            if not cmd.hidden:
+                rows.append((name, cmd.get_short_help_str(limit)))
+
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+    def _load(self, name: str) -> click.Command:
+        """Import a lazily registered command and register it for real."""
+        import_path, _ = self.lazy_commands[name]
+        module_name, attribute = import_path.split(":", 1)
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise TypeError(
+                f"Lazy command {name!r} resolved to {type(command).__name__}, "
+                f"expected a click.Command ({import_path})"
+            )
+        self.add_command(command, name)
+        return command
@@ -0,0 +1,159 @@
+"""Incremental sync command.
+
+This module provides the 'sync' command, which applies Azure Resource Graph
+changes since each subscription's watermark to the graph instead of running
+a full rescan. With --watch it keeps syncing on an interval.
+"""
+
+import sys
+from typing import Optional, Sequence
+
+import click
+
+from src.commands.base import async_command, get_tenant_id
+
+
+@click.command("sync")
+@click.option(
+    "--tenant-id",
+    help="Azure tenant ID (defaults to AZURE_TENANT_ID from .env)",
+)
+@click.option(
+    "--subscription-id",
+    "subscription_ids",
+    multiple=True,
+    help="Subscription to sync (repeatable; default: every subscription in the graph)",
+)
+@click.option(
+    "--since",
+    help="ISO8601 timestamp to read changes from, overriding the stored watermark",
+)
+@click.option(
+    "--watch",
+    is_flag=True,
+    help="Keep syncing every --interval seconds until interrupted",
+)
+@click.option(
+    "--interval",
+    default=300,
+    type=int,
+    help="Seconds between sync cycles in watch mode (default: 300)",
+)
+@click.option(
+    "--no-container",
+    is_flag=True,
+    help="Do not auto-start Neo4j container",
+)
+@click.pass_context
+@async_command
+async def sync(
+    ctx: click.Context,
+    tenant_id: Optional[str],
+    subscription_ids: Sequence[str],
+    since: Optional[str],
+    watch: bool,
+    interval: int,
+    no_container: bool,
+) -> None:
+    """Apply Azure resource changes to the graph incrementally.
+
+    Reads every Resource Graph change since each subscription's watermark,
+    coalesces repeated changes to the same resource, upserts the changed
+    resources, re-evaluates relationships for them and their neighbours, and
+    marks deleted resources in batches.
+
+    Examples:
+
+        # One incremental sync of every subscription in the graph
+        atg sync
+
+        # Keep the graph fresh every five minutes
+        atg sync --watch --interval 300
+
+        # Re-read changes for one subscription from a fixed point
+        atg sync --subscription-id <subscription-id> --since 2024-06-01T00:00:00Z
+    """
+    await sync_command_handler(
+        tenant_id=tenant_id,
+        subscription_ids=list(subscription_ids),
+        since=since,
+        watch=watch,
+        interval=interval,
+        no_container=no_container,
+        debug=ctx.obj.get("debug", False) if ctx.obj else False,
+    )
+
+
+async def sync_command_handler(
+    tenant_id: Optional[str],
+    subscription_ids: Sequence[str],
+    since: Optional[str],
+    watch: bool,
+    interval: int,
+    no_container: bool = False,
+    debug: bool = False,
+) -> None:
+    """
+    Run one incremental sync, or keep syncing in watch mode.
+
+    Args:
+        tenant_id: Azure tenant ID (falls back to AZURE_TENANT_ID)
+        subscription_ids: Subscriptions to sync; empty syncs all in the graph
+        since: Timestamp overriding the stored watermark (single sync only)
+        watch: Repeat the sync every interval seconds
+        interval: Seconds between cycles in watch mode
+        no_container: Skip auto-starting Neo4j container
+        debug: Enable debug output
+    """
+    from src.config_manager import create_config_from_env, setup_logging
+    from src.llm_descriptions import create_llm_generator
+    from src.services.change_feed_ingestion_service import (
+        ChangeFeedIngestionService,
+    )
+    from src.services.resource_processing_service import ResourceProcessingService
+    from src.utils.neo4j_startup import ensure_neo4j_running
+    from src.utils.session_manager import Neo4jSessionManager
+
+    effective_tenant_id = get_tenant_id(tenant_id)
+    config = create_config_from_env(effective_tenant_id, debug=debug)
+    setup_logging(config.logging)
+
+    if since and watch:
+        click.echo("--since applies to a single sync; omit it with --watch", err=True)
+        sys.exit(1)
+
+    if not no_container:
+        ensure_neo4j_running(debug)
+
+    session_manager = Neo4jSessionManager(config.neo4j)
+    processing_service = ResourceProcessingService(
+        session_manager,
+        create_llm_generator() if config.azure_openai.is_configured() else None,
+        config.processing,
+    )
+    service = ChangeFeedIngestionService(config, session_manager, processing_service)
+
+    with session_manager:
+        if watch:
+            click.echo(
+                f"Watching for resource changes every {interval}s (Ctrl+C to stop)"
+            )
+            try:
+                await service.watch(subscription_ids or None, interval=interval)
+            except KeyboardInterrupt:
+                click.echo("Sync stopped")
+            return
+
+        targets = list(subscription_ids) or service.list_subscription_ids()
+        if not targets:
+            click.echo("No subscriptions found in the graph; run 'atg scan' first")
+            return
+        for subscription_id in targets:
+            try:
+                upserted = await service.ingest_changes_for_subscription(
+                    subscription_id, since_timestamp=since
+                )
+            except ValueError as e:
+                click.echo(f"Error: {e}", err=True)
+                sys.exit(1)
+            click.echo(f"{subscription_id}: {len(upserted)} resources upserted")
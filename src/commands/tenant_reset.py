@@ -130,13 +130,16 @@ async def _reset_tenant(tenant_id: str, dry_run: bool):
         atg_sp_fingerprint = await service.validate_atg_sp_before_deletion(tenant_id)
         click.echo(f"✓ ATG SP verified: {atg_sp_fingerprint['display_name']}")
 
-        # Order resources by dependencies
-        deletion_waves = await service.order_by_dependencies(scope_data["to_delete"])
-        click.echo(f"\n🔄 Deletion waves: {len(deletion_waves)}")
-
-        # Execute deletion
+        # Execute deletion in dependency order
         click.echo("\n🗑️  Deleting resources...")
-        results = await service.delete_resources(deletion_waves, concurrency=10)
+        results = await service.delete_resources_by_dependencies(
+            scope_data["to_delete"], concurrency=10
+        )
+        stats = results["stats"]
+        click.echo(
+            f"🔄 {stats['throughput']:.1f} resources/s, "
+            f"critical path {stats['critical_path_length']} resources"
+        )
 
         # Post-deletion verification
         click.echo("\n🛡️  Post-deletion verification...")
@@ -250,8 +253,9 @@ async def _reset_subscriptions(tenant_id: str, subscription_ids: list, dry_run:
             sys.exit(0)
 
         # Execute
-        deletion_waves = await service.order_by_dependencies(scope_data["to_delete"])
-        results = await service.delete_resources(deletion_waves, concurrency=10)
+        results = await service.delete_resources_by_dependencies(
+            scope_data["to_delete"], concurrency=10
+        )
 
         # Display results
         click.echo("\n✅ Reset complete")
@@ -354,8 +358,9 @@ async def _reset_resource_groups(
             sys.exit(0)
 
         # Execute
-        deletion_waves = await service.order_by_dependencies(scope_data["to_delete"])
-        results = await service.delete_resources(deletion_waves, concurrency=10)
+        results = await service.delete_resources_by_dependencies(
+            scope_data["to_delete"], concurrency=10
+        )
 
         # Display results
         click.echo("\n✅ Reset complete")
@@ -441,8 +446,9 @@ async def _reset_resource(tenant_id: str, resource_id: str, dry_run: bool):
             sys.exit(0)
 
         # Execute
-        deletion_waves = await service.order_by_dependencies(scope_data["to_delete"])
-        results = await service.delete_resources(deletion_waves, concurrency=1)
+        results = await service.delete_resources_by_dependencies(
+            scope_data["to_delete"], concurrency=1
+        )
 
         # Display results
         if results["deleted"]:
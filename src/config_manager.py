@@ -31,6 +31,11 @@ environment variable handling, and configuration validation.
 """
 
 
+def atg_state_dir() -> Path:
+    """Directory for local working state such as spill files (ATG_STATE_DIR, default ~/.atg)."""
+    return Path(os.getenv("ATG_STATE_DIR") or Path.home() / ".atg").expanduser()
+
+
 def _set_azure_http_log_level(log_level: str) -> None:
     """Set log levels for HTTP-related loggers to reduce noise."""
     http_loggers = [
@@ -148,6 +153,87 @@ class ProcessingConfig:
     max_build_threads: int = field(
         default_factory=lambda: int(os.getenv("MAX_BUILD_THREADS", "20"))
     )
+    # Subscriptions discovered concurrently by build_graph, and the global ARM
+    # request budget they share across all discovery phases
+    subscription_concurrency: int = field(
+        default_factory=lambda: int(os.getenv("SUBSCRIPTION_CONCURRENCY", "10"))
+    )
+    arm_request_budget: int = field(
+        default_factory=lambda: int(os.getenv("ARM_REQUEST_BUDGET", "50"))
+    )
+    # Discovery backend for property hydration: "sdk" (threaded sync SDK calls)
+    # or "aiohttp" (native async client with a shared connection pool)
+    discovery_backend: str = field(
+        default_factory=lambda: os.getenv("DISCOVERY_BACKEND", "sdk").lower()
+    )
+    # Property hydration mode: "arm" (one GET per resource) or "resource_graph"
+    # (bulk Resource Graph pages, per-resource GET only for uncovered types)
+    property_hydration: str = field(
+        default_factory=lambda: os.getenv("PROPERTY_HYDRATION", "arm").lower()
+    )
+    arm_endpoint: str = field(
+        default_factory=lambda: os.getenv(
+            "ARM_ENDPOINT", "https://management.azure.com"
+        )
+    )
+    arm_max_connections: int = field(
+        default_factory=lambda: int(os.getenv("ARM_MAX_CONNECTIONS", "100"))
+    )
+    arm_per_host_concurrency: int = field(
+        default_factory=lambda: int(os.getenv("ARM_PER_HOST_CONCURRENCY", "50"))
+    )
+    # Filtered scans follow relationship references out of the filter this
+    # many hops, fetching missing dependencies with at most this many ARM
+    # requests in flight
+    dependency_max_depth: int = field(
+        default_factory=lambda: int(os.getenv("DEPENDENCY_MAX_DEPTH", "3"))
+    )
+    dependency_fetch_concurrency: int = field(
+        default_factory=lambda: int(os.getenv("DEPENDENCY_FETCH_CONCURRENCY", "20"))
+    )
+    # Stream discovered resources straight into processing workers through a
+    # bounded queue instead of materialising the whole tenant first
+    streaming_pipeline: bool = field(
+        default_factory=lambda: os.getenv("STREAMING_PIPELINE", "true").lower()
+        == "true"
+    )
+    pipeline_queue_depth: int = field(
+        default_factory=lambda: int(os.getenv("PIPELINE_QUEUE_DEPTH", "1000"))
+    )
+    # Resource node writes are queued and flushed with UNWIND in batches of
+    # this size (0 writes every resource in its own transaction), or once the
+    # oldest queued write is older than the flush interval in seconds
+    node_write_batch_size: int = field(
+        default_factory=lambda: int(os.getenv("NODE_WRITE_BATCH_SIZE", "500"))
+    )
+    node_write_flush_interval: float = field(
+        default_factory=lambda: float(os.getenv("NODE_WRITE_FLUSH_INTERVAL", "5.0"))
+    )
+    # SQLite cache of LLM resource descriptions keyed by resource content, so
+    # rescans of unchanged resources skip the LLM (empty disables the cache)
+    description_cache_path: str = field(
+        default_factory=lambda: os.getenv(
+            "LLM_DESCRIPTION_CACHE",
+            str(atg_state_dir() / "llm_description_cache.sqlite"),
+        )
+    )
+    # Buffered relationships beyond the in-memory window spill to a per-tenant
+    # SQLite file in this directory and are replayed once all nodes exist
+    # (empty keeps them in memory)
+    relationship_spill_dir: str = field(
+        default_factory=lambda: os.getenv(
+            "RELATIONSHIP_SPILL_DIR", str(atg_state_dir() / "relationship_spill")
+        )
+    )
+    relationship_buffer_window: int = field(
+        default_factory=lambda: int(os.getenv("RELATIONSHIP_BUFFER_WINDOW", "10000"))
+    )
+    # Opt-in write-ahead journal of started/written resources, one file per
+    # tenant in this directory, so a crashed run's unwritten resources are
+    # reprocessed (empty, the default, disables the journal)
+    progress_journal_dir: str = field(
+        default_factory=lambda: os.getenv("PROGRESS_JOURNAL_DIR", "")
+    )
     retry_delay: float = field(
         default_factory=lambda: float(os.getenv("PROCESSING_RETRY_DELAY", "1.0"))
     )
@@ -183,6 +269,32 @@ class ProcessingConfig:
             raise ValueError("Retry delay must be non-negative")
         if self.resource_limit is not None and self.resource_limit < 1:
             raise ValueError("Resource limit must be at least 1")
+        if self.subscription_concurrency < 1:
+            raise ValueError("Subscription concurrency must be at least 1")
+        if self.arm_request_budget < 1:
+            raise ValueError("ARM request budget must be at least 1")
+        if self.discovery_backend not in ("sdk", "aiohttp"):
+            raise ValueError("Discovery backend must be one of: ['sdk', 'aiohttp']")
+        if self.property_hydration not in ("arm", "resource_graph"):
+            raise ValueError(
+                "Property hydration must be one of: ['arm', 'resource_graph']"
+            )
+        if self.arm_max_connections < 1:
+            raise ValueError("ARM max connections must be at least 1")
+        if self.arm_per_host_concurrency < 1:
+            raise ValueError("ARM per-host concurrency must be at least 1")
+        if self.dependency_max_depth < 1:
+            raise ValueError("Dependency max depth must be at least 1")
+        if self.dependency_fetch_concurrency < 1:
+            raise ValueError("Dependency fetch concurrency must be at least 1")
+        if self.pipeline_queue_depth < 1:
+            raise ValueError("Pipeline queue depth must be at least 1")
+        if self.node_write_batch_size < 0:
+            raise ValueError("Node write batch size must be non-negative")
+        if self.node_write_flush_interval < 0:
+            raise ValueError("Node write flush interval must be non-negative")
+        if self.relationship_buffer_window < 1:
+            raise ValueError("Relationship buffer window must be at least 1")
 
 
 @dataclass
@@ -422,6 +534,25 @@ class AzureTenantGrapherConfig:
         )
         logger.info(str(f"   - Max Concurrency: {self.processing.max_concurrency}"))
         logger.info(str(f"   - Max Retries: {self.processing.max_retries}"))
+        logger.info(
+            f"   - Subscription Concurrency: {self.processing.subscription_concurrency}"
+        )
+        logger.info(
+            str(f"   - ARM Request Budget: {self.processing.arm_request_budget}")
+        )
+        logger.info(str(f"   - Discovery Backend: {self.processing.discovery_backend}"))
+        logger.info(
+            str(f"   - Property Hydration: {self.processing.property_hydration}")
+        )
+        logger.info(
+            str(f"   - Streaming Pipeline: {self.processing.streaming_pipeline}")
+        )
+        logger.info(
+            str(f"   - Pipeline Queue Depth: {self.processing.pipeline_queue_depth}")
+        )
+        logger.info(
+            str(f"   - Node Write Batch Size: {self.processing.node_write_batch_size}")
+        )
         logger.info(
             str(f"   - Parallel Processing: {self.processing.parallel_processing}")
         )
@@ -474,6 +605,20 @@ class AzureTenantGrapherConfig:
                 "max_concurrency": self.processing.max_concurrency,
                 "max_retries": self.processing.max_retries,
                 "retry_delay": self.processing.retry_delay,
+                "subscription_concurrency": self.processing.subscription_concurrency,
+                "arm_request_budget": self.processing.arm_request_budget,
+                "discovery_backend": self.processing.discovery_backend,
+                "property_hydration": self.processing.property_hydration,
+                "dependency_max_depth": self.processing.dependency_max_depth,
+                "dependency_fetch_concurrency": self.processing.dependency_fetch_concurrency,
+                "streaming_pipeline": self.processing.streaming_pipeline,
+                "pipeline_queue_depth": self.processing.pipeline_queue_depth,
+                "node_write_batch_size": self.processing.node_write_batch_size,
+                "node_write_flush_interval": self.processing.node_write_flush_interval,
+                "description_cache_path": self.processing.description_cache_path,
+                "relationship_spill_dir": self.processing.relationship_spill_dir,
+                "relationship_buffer_window": self.processing.relationship_buffer_window,
+                "progress_journal_dir": self.processing.progress_journal_dir,
                 "parallel_processing": self.processing.parallel_processing,
                 "auto_start_container": self.processing.auto_start_container,
             },
@@ -15,6 +15,7 @@ from .architecture_replication_constants import (
     MIN_CLUSTER_SIZE,
 )
 from .architecture_replication_models import ConfigurationCluster
+from .replicator.modules.configuration_similarity import ConfigurationSimilarity
 
 logger = logging.getLogger(__name__)
 
@@ -131,6 +132,9 @@ class ConfigurationCoherenceAnalyzer:
         """
         Cluster resources by configuration coherence using agglomerative clustering.
         
+        Delegates to ConfigurationSimilarity.cluster_by_coherence, which uses the
+        same similarity function as compute_similarity.
+        
         Args:
             resources: List of resources to cluster
             resource_fingerprints: Map of resource ID to configuration fingerprint
@@ -139,61 +143,9 @@ class ConfigurationCoherenceAnalyzer:
         Returns:
             List of clusters, where each cluster is a list of resources
         """
-        if len(resources) < MIN_CLUSTER_SIZE:
-            # < 2 resources, no clustering needed
-            return [resources] if resources else []
-        
-        # Compute pairwise similarities
-        similarity_matrix = {}
-        for i, res1 in enumerate(resources):
-            for j, res2 in enumerate(resources):
-                if i < j:
-                    fp1 = resource_fingerprints[res1["id"]]
-                    fp2 = resource_fingerprints[res2["id"]]
-                    sim = self.compute_similarity(fp1, fp2)
-                    similarity_matrix[(i, j)] = sim
-        
-        # Start with each resource in its own cluster
-        clusters = [[res] for res in resources]
-        
-        # Iteratively merge most similar clusters above threshold
-        merged = True
-        while merged and len(clusters) > 1:
-            merged = False
-            best_sim = coherence_threshold
-            best_pair = None
-            
-            # Find best cluster pair to merge
-            for i in range(len(clusters)):
-                for j in range(i + 1, len(clusters)):
-                    # Compute average similarity between clusters
-                    similarities = []
-                    for res1 in clusters[i]:
-                        for res2 in clusters[j]:
-                            idx1 = resources.index(res1)
-                            idx2 = resources.index(res2)
-                            key = (min(idx1, idx2), max(idx1, idx2))
-                            if key in similarity_matrix:
-                                similarities.append(similarity_matrix[key])
-                    
-                    if similarities:
-                        avg_sim = sum(similarities) / len(similarities)
-                        if avg_sim > best_sim:
-                            best_sim = avg_sim
-                            best_pair = (i, j)
-            
-            # Merge best pair if found
-            if best_pair:
-                i, j = best_pair
-                merged_cluster = clusters[i] + clusters[j]
-                # Remove old clusters (remove j first to preserve i index)
-                clusters.pop(j)
-                clusters.pop(i)
-                clusters.append(merged_cluster)
-                merged = True
-        
-        # Only return clusters with minimum size
-        return [c for c in clusters if len(c) >= MIN_CLUSTER_SIZE]
+        return ConfigurationSimilarity.cluster_by_coherence(
+            resources, resource_fingerprints, coherence_threshold
+        )
     
     def find_configuration_coherent_instances(
         self,
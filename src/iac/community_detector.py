@@ -5,96 +5,190 @@ Detects connected components (communities) in the resource graph to enable:
 - Per-community Terraform file generation
 - Parallel deployment of independent communities
 - Elimination of undeclared resource reference errors
+
+Components are computed from the plain edge list between abstracted
+resources: the node and edge lists are each streamed once and merged with a
+union-find over integer-indexed nodes, which stays near-linear on 100k+
+resource graphs. When the Graph Data Science plugin is installed, its WCC
+procedure is used instead.
 """
 
 import logging
+import uuid
 from collections import defaultdict
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Optional, Set
 
 logger = logging.getLogger(__name__)
 
+RESOURCE_IDS_QUERY = """
+MATCH (r:Resource)
+WHERE NOT r:Original  // Use abstracted nodes only
+RETURN r.id AS id
+"""
+
+RESOURCE_EDGES_QUERY = """
+MATCH (a:Resource)-[]->(b:Resource)
+WHERE NOT a:Original AND NOT b:Original AND a <> b
+RETURN a.id AS src, b.id AS tgt
+"""
+
+GDS_AVAILABLE_QUERY = """
+SHOW PROCEDURES YIELD name
+WHERE name = 'gds.wcc.stream'
+RETURN count(*) AS available
+"""
+
+GDS_PROJECT_QUERY = """
+MATCH (a:Resource)
+WHERE NOT a:Original
+OPTIONAL MATCH (a)-[]->(b:Resource)
+WHERE NOT b:Original AND a <> b
+WITH gds.graph.project($graph_name, a, b) AS g
+RETURN g.graphName AS graph_name
+"""
+
+GDS_WCC_QUERY = """
+CALL gds.wcc.stream($graph_name)
+YIELD nodeId, componentId
+RETURN gds.util.asNode(nodeId).id AS id, componentId AS component
+"""
+
+GDS_DROP_QUERY = "CALL gds.graph.drop($graph_name, false) YIELD graphName"
+
+
+class UnionFind:
+    """Disjoint-set forest over integers 0..n-1 with union by size and path halving."""
+
+    def __init__(self, size: int = 0):
+        self.parent: List[int] = list(range(size))
+        self.size: List[int] = [1] * size
+
+    def add(self) -> int:
+        """Add a new singleton element and return its index."""
+        index = len(self.parent)
+        self.parent.append(index)
+        self.size.append(1)
+        return index
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> None:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+
 
 class CommunityDetector:
     """Detect communities (connected components) in resource graph."""
 
-    def __init__(self, neo4j_driver):
-        """Initialize with Neo4j driver."""
+    def __init__(self, neo4j_driver, use_gds: Optional[bool] = None):
+        """Initialize with Neo4j driver.
+
+        Args:
+            neo4j_driver: Neo4j driver
+            use_gds: Use the GDS WCC procedure. None detects whether the
+                plugin is installed; False always uses the in-process union-find.
+        """
         self.driver = neo4j_driver
+        self.use_gds = use_gds
 
     def detect_communities(self) -> List[Set[str]]:
         """
-        Detect communities using Neo4j graph algorithms.
+        Detect communities (weakly connected components) of abstracted resources.
 
         Returns:
-            List of sets, where each set contains resource IDs in that community
+            List of sets, where each set contains resource IDs in that community,
+            largest first
         """
+        communities: Optional[List[Set[str]]] = None
         with self.driver.session() as session:
-            # Use Cypher to find weakly connected components
-            # This groups resources that are connected by any path
-            result = session.run("""  # type: ignore[arg-type]
-                MATCH (r:Resource)
-                WHERE NOT r:Original  // Use abstracted nodes only
-
-                // For each resource, find all resources connected to it
-                OPTIONAL MATCH path = (r)-[*]-(connected:Resource)
-                WHERE connected <> r AND NOT connected:Original
-
-                WITH r.id AS resource_id,
-                     collect(DISTINCT connected.id) AS connected_ids
-
-                RETURN resource_id, connected_ids
-                ORDER BY resource_id
-            """)
-
-            # Build adjacency list
-            adjacency = defaultdict(set)
-            all_resources = set()
-
-            for record in result:
-                resource_id = record["resource_id"]
-                connected_ids = record["connected_ids"] or []
-
-                all_resources.add(resource_id)
-                for connected_id in connected_ids:
-                    if connected_id:  # Skip None values
-                        adjacency[resource_id].add(connected_id)
-                        adjacency[connected_id].add(resource_id)
-                        all_resources.add(connected_id)
-
-            # Find connected components using DFS
-            communities = []
-            visited = set()
-
-            for resource_id in all_resources:
-                if resource_id not in visited:
-                    # Start new community
-                    community = set()
-                    stack = [resource_id]
-
-                    while stack:
-                        current = stack.pop()
-                        if current in visited:
-                            continue
-
-                        visited.add(current)
-                        community.add(current)
-
-                        # Add all connected resources to stack
-                        for neighbor in adjacency.get(current, set()):
-                            if neighbor not in visited:
-                                stack.append(neighbor)
-
-                    communities.append(community)
-
-            # Sort communities by size (largest first)
-            communities.sort(key=len, reverse=True)
-
-            logger.info(
-                f"Detected {len(communities)} communities. "
-                f"Sizes: {[len(c) for c in communities[:10]]}"
-            )
-
-            return communities
+            if self.use_gds is not False and self._gds_available(session):
+                communities = self._detect_with_gds(session)
+            if communities is None:
+                communities = self._detect_with_union_find(session)
+
+        # Sort communities by size (largest first)
+        communities.sort(key=len, reverse=True)
+
+        logger.info(
+            f"Detected {len(communities)} communities. "
+            f"Sizes: {[len(c) for c in communities[:10]]}"
+        )
+
+        return communities
+
+    def _gds_available(self, session: Any) -> bool:
+        if self.use_gds:
+            return True
+        try:
+            record = session.run(GDS_AVAILABLE_QUERY).single()
+            return bool(record and record["available"])
+        except Exception as e:
+            logger.debug(f"Could not check for GDS procedures: {e}")
+            return False
+
+    def _detect_with_gds(self, session: Any) -> Optional[List[Set[str]]]:
+        """Run GDS WCC on a temporary projection; None if GDS fails."""
+        graph_name = f"atg-communities-{uuid.uuid4().hex[:8]}"
+        try:
+            session.run(GDS_PROJECT_QUERY, graph_name=graph_name).consume()
+            components: Dict[Any, Set[str]] = defaultdict(set)
+            for record in session.run(GDS_WCC_QUERY, graph_name=graph_name):
+                if record["id"]:
+                    components[record["component"]].add(record["id"])
+            return list(components.values())
+        except Exception as e:
+            logger.warning(f"GDS WCC failed, using union-find: {e}")
+            return None
+        finally:
+            try:
+                session.run(GDS_DROP_QUERY, graph_name=graph_name).consume()
+            except Exception as e:
+                logger.debug(f"Could not drop GDS projection {graph_name}: {e}")
+
+    def _detect_with_union_find(self, session: Any) -> List[Set[str]]:
+        """Stream node and edge lists once and merge them with a union-find."""
+        index: Dict[str, int] = {}
+        ids: List[str] = []
+        forest = UnionFind()
+
+        def node(resource_id: str) -> int:
+            i = index.get(resource_id)
+            if i is None:
+                i = forest.add()
+                index[resource_id] = i
+                ids.append(resource_id)
+            return i
+
+        for record in session.run(RESOURCE_IDS_QUERY):
+            if record["id"]:
+                node(record["id"])
+
+        edge_count = 0
+        for record in session.run(RESOURCE_EDGES_QUERY):
+            src, tgt = record["src"], record["tgt"]
+            if src and tgt:
+                forest.union(node(src), node(tgt))
+                edge_count += 1
+
+        components: Dict[int, Set[str]] = defaultdict(set)
+        for i, resource_id in enumerate(ids):
+            components[forest.find(i)].add(resource_id)
+
+        logger.debug(
+            f"Union-find over {len(ids)} resources and {edge_count} edges "
+            f"produced {len(components)} components"
+        )
+        return list(components.values())
 
     def get_community_metadata(self, community: Set[str]) -> Dict[str, Any]:
         """
@@ -126,7 +220,9 @@ class CommunityDetector:
             return {
                 "size": len(community),
                 "type_counts": type_counts,
-                "dominant_type": max(type_counts.items(), key=lambda x: x[1])[0]
-                if type_counts
-                else "unknown",
+                "dominant_type": (
+                    max(type_counts.items(), key=lambda x: x[1])[0]
+                    if type_counts
+                    else "unknown"
+                ),
             }
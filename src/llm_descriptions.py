@@ -1088,28 +1088,6 @@ def should_generate_description(resource_dict: dict[str, Any], session: Any) ->
     # Query Neo4j for node by id, get llm_description and change-indicator fields
     try:
         try:
-            # DEBUG: Print all property keys and types for this node before running the query
-            try:
-                key_result = run_neo4j_query_with_retry(
-                    session,
-                    "MATCH (r:Resource {id: $id}) RETURN keys(r) AS prop_keys",
-                    id=resource_id,
-                )
-                key_record = key_result.single()
-                if key_record and "prop_keys" in key_record:
-                    prop_keys = key_record["prop_keys"]
-                    logger.debug(
-                        "Resource property keys",
-                        resource_id=resource_id,
-                        prop_keys=prop_keys,
-                    )
-            except Exception as prop_exc:
-                logger.warning(
-                    "Could not inspect properties",
-                    resource_id=resource_id,
-                    error=str(prop_exc),
-                )
-
             result = run_neo4j_query_with_retry(
                 session,
                 """
@@ -1,11 +1,15 @@
 from .creator_rule import CreatorRule
 from .depends_on_rule import DependsOnRule
 from .diagnostic_rule import DiagnosticRule
+from .dispatch import RuleDispatcher
+from .evaluation import RuleEvaluator
 from .identity_rule import IdentityRule
 from .monitoring_rule import MonitoringRule
 from .network_rule_optimized import NetworkRuleOptimized
 from .nic_relationship_rule import NICRelationshipRule
 from .region_rule import RegionRule
+from .relationship_buffer import SpillingRelationshipBuffer
+from .relationship_rule import RelationshipRule, RelationshipTuple
 from .secret_rule import SecretRule
 from .subnet_extraction_rule import SubnetExtractionRule
 from .tag_rule import TagRule
@@ -47,3 +51,5 @@ def create_relationship_rules():
 
 # Default rule list with dual-graph enabled
 ALL_RELATIONSHIP_RULES = create_relationship_rules()
+# Type index over ALL_RELATIONSHIP_RULES (shares the rule instances)
+ALL_RELATIONSHIP_RULE_DISPATCHER = RuleDispatcher(ALL_RELATIONSHIP_RULES)
@@ -12,6 +12,8 @@ class CreatorRule(RelationshipRule):
     Note: User/ServicePrincipal nodes are shared between graphs (not duplicated).
     """
 
+    trigger_keys = frozenset({"systemData", "properties"})
+
     def applies(self, resource: Dict[str, Any]) -> bool:
         # ARM resources may have 'createdBy' in properties or systemData
         sysdata = resource.get("systemData", {})
@@ -1,8 +1,8 @@
-from typing import Any, Dict, Set
+from typing import Any, Dict, List, Set
 
 import structlog  # type: ignore[import-untyped]
 
-from .relationship_rule import RelationshipRule
+from .relationship_rule import RelationshipRule, RelationshipTuple
 
 logger = structlog.get_logger(__name__)
 
@@ -15,6 +15,8 @@ class DependsOnRule(RelationshipRule):
     Supports dual-graph architecture - creates relationships in both original and abstracted graphs.
     """
 
+    trigger_keys = frozenset({"dependsOn"})
+
     def applies(self, resource: Dict[str, Any]) -> bool:
         depends_on = resource.get("dependsOn")
         return isinstance(depends_on, list) and len(depends_on) > 0
@@ -33,6 +35,19 @@ class DependsOnRule(RelationshipRule):
                     f"🔗 Queued DEPENDS_ON: {rid.split('/')[-1]} -> {dep_id.split('/')[-1]}"
                 )
 
+    def extract_relationships(
+        self, resource: Dict[str, Any]
+    ) -> List[RelationshipTuple]:
+        """DEPENDS_ON edges for the dependsOn array."""
+        rid = resource.get("id")
+        if not rid:
+            return []
+        return [
+            (str(rid), "DEPENDS_ON", dep_id, None)
+            for dep_id in resource.get("dependsOn", [])
+            if isinstance(dep_id, str)
+        ]
+
     def extract_target_ids(self, resource: Dict[str, Any]) -> Set[str]:
         """
         Extract ARM dependsOn resource IDs.
@@ -14,6 +14,8 @@ class DiagnosticRule(RelationshipRule):
     Note: DiagnosticSetting and LogAnalyticsWorkspace nodes are shared between graphs.
     """
 
+    trigger_keys = frozenset({"diagnosticSettings", "resources", "children"})
+
     def applies(self, resource: Dict[str, Any]) -> bool:
         # Applies if resource has diagnosticSettings ARM children or property
         if "diagnosticSettings" in resource and isinstance(
@@ -0,0 +1,58 @@
+"""
+Relationship Rule Dispatch
+
+Indexes relationship rules by the resource types and top-level keys they
+declare (see RelationshipRule.resource_types / resource_type_suffixes /
+trigger_keys), so each resource is only offered to the handful of rules that
+can apply to it instead of calling applies() on every rule.
+"""
+
+from typing import Any, Dict, List, Sequence, Tuple
+
+from .relationship_rule import RelationshipRule
+
+# Candidate sets are memoized per (type, top-level keys); bound the memo so
+# resources with unusual key sets cannot grow it without limit
+_MAX_SHAPES = 4096
+
+
+class RuleDispatcher:
+    """Routes resources to candidate rules, preserving rule order."""
+
+    def __init__(self, rules: Sequence[RelationshipRule]) -> None:
+        self.rules = list(rules)
+        self._by_shape: Dict[Tuple[Any, Tuple[str, ...]], Tuple[int, ...]] = {}
+
+    def _matches(
+        self, rule: RelationshipRule, rtype: str, keys: Tuple[str, ...]
+    ) -> bool:
+        if not (
+            rule.resource_types or rule.resource_type_suffixes or rule.trigger_keys
+        ):
+            # No hints: offer every resource
+            return True
+        if rtype in rule.resource_types:
+            return True
+        if rule.resource_type_suffixes and rtype.endswith(rule.resource_type_suffixes):
+            return True
+        return not rule.trigger_keys.isdisjoint(keys)
+
+    def candidate_indices(self, resource: Dict[str, Any]) -> Tuple[int, ...]:
+        """Indices of rules that may apply to the resource, in rule order."""
+        shape = (resource.get("type"), tuple(resource))
+        indices = self._by_shape.get(shape)
+        if indices is None:
+            rtype = str(shape[0] or "").lower()
+            indices = tuple(
+                i
+                for i, rule in enumerate(self.rules)
+                if self._matches(rule, rtype, shape[1])
+            )
+            if len(self._by_shape) >= _MAX_SHAPES:
+                self._by_shape.clear()
+            self._by_shape[shape] = indices
+        return indices
+
+    def candidates(self, resource: Dict[str, Any]) -> List[RelationshipRule]:
+        """Rules that may apply to the resource; applies() still decides."""
+        return [self.rules[i] for i in self.candidate_indices(resource)]
@@ -0,0 +1,209 @@
+"""
+Relationship Rule Evaluation
+
+Evaluates relationship rules over many resources at once. Rule matching
+(via RuleDispatcher) and the pure parsing in extract_relationships() run in
+a process pool for large inputs; the resulting edges are then queued into
+the rules' buffers in the calling process, in resource order. Rules that need
+database access for a resource (extract_relationships() returns None) have
+emit() called serially afterwards, exactly as before.
+"""
+
+import copy
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import structlog  # type: ignore[import-untyped]
+
+from .dispatch import RuleDispatcher
+from .relationship_rule import RelationshipRule, RelationshipTuple
+
+logger = structlog.get_logger(__name__)
+
+# Per resource: (rule index, planned edges or None when emit() must run)
+RulePlan = List[Tuple[int, Optional[List[RelationshipTuple]]]]
+
+DEFAULT_CHUNK_SIZE = 2000
+# Below this many resources, pool start-up costs more than it saves
+DEFAULT_MIN_PARALLEL = 5000
+
+# Set in each worker process by _init_worker
+_worker_dispatcher: Optional[RuleDispatcher] = None
+
+
+def _detached_rules(rules: Sequence[RelationshipRule]) -> List[RelationshipRule]:
+    """Shallow copies of the rules with their own, empty buffers."""
+    detached = []
+    for rule in rules:
+        clone = copy.copy(rule)
+        clone._relationship_buffer = []
+        clone._spill_buffer = None
+        detached.append(clone)
+    return detached
+
+
+def plan_resources(
+    dispatcher: RuleDispatcher, resources: Sequence[Dict[str, Any]]
+) -> List[RulePlan]:
+    """
+    Match rules to resources and extract the edges that need no database.
+
+    Errors are not raised here: a rule whose applies() or
+    extract_relationships() fails is planned for emit(), which re-runs it
+    under the caller's error handling.
+
+    Args:
+        dispatcher: Dispatcher over the rules to evaluate
+        resources: Resources to evaluate
+
+    Returns:
+        One plan per resource, in input order
+    """
+    plans: List[RulePlan] = []
+    for resource in resources:
+        plan: RulePlan = []
+        for index in dispatcher.candidate_indices(resource):
+            rule = dispatcher.rules[index]
+            try:
+                if not rule.applies(resource):
+                    continue
+                edges = (
+                    rule.extract_relationships(resource)
+                    if rule.enable_dual_graph
+                    else None
+                )
+            except Exception:
+                edges = None
+            plan.append((index, edges))
+        plans.append(plan)
+    return plans
+
+
+def _pool_context() -> Any:
+    """
+    Start method for evaluation workers: forkserver where available, else spawn.
+
+    The evaluating process already runs threads (the graph writer, asyncio's
+    to_thread workers), and forking a threaded process can copy locks that
+    are held mid-operation into the child.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _init_worker(rules: Sequence[RelationshipRule]) -> None:
+    global _worker_dispatcher
+    _worker_dispatcher = RuleDispatcher(rules)
+
+
+def _plan_chunk(resources: List[Dict[str, Any]]) -> List[RulePlan]:
+    if _worker_dispatcher is None:
+        raise RuntimeError("Rule evaluation worker was not initialized")
+    return plan_resources(_worker_dispatcher, resources)
+
+
+class RuleEvaluator:
+    """Evaluates relationship rules over a batch of resources."""
+
+    def __init__(
+        self,
+        rules: Sequence[RelationshipRule],
+        max_workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        min_parallel: int = DEFAULT_MIN_PARALLEL,
+    ) -> None:
+        """
+        Args:
+            rules: Rule instances whose buffers receive the planned edges
+            max_workers: Worker processes (default: CPU count); 1 disables the pool
+            chunk_size: Resources per worker task
+            min_parallel: Smallest input evaluated in the pool
+        """
+        self.dispatcher = RuleDispatcher(rules)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = max(1, chunk_size)
+        self.min_parallel = min_parallel
+
+    @property
+    def rules(self) -> List[RelationshipRule]:
+        return self.dispatcher.rules
+
+    def evaluate(self, resources: Sequence[Dict[str, Any]]) -> List[RulePlan]:
+        """
+        Plan every resource, in a process pool when the input is large enough.
+
+        Falls back to evaluating in-process if the pool cannot be used.
+
+        Returns:
+            One plan per resource, in input order
+        """
+        if self.max_workers < 2 or len(resources) < self.min_parallel:
+            return plan_resources(self.dispatcher, resources)
+
+        chunks = [
+            list(resources[start : start + self.chunk_size])
+            for start in range(0, len(resources), self.chunk_size)
+        ]
+        try:
+            with ProcessPoolExecutor(
+                max_workers=min(self.max_workers, len(chunks)),
+                mp_context=_pool_context(),
+                initializer=_init_worker,
+                initargs=(_detached_rules(self.rules),),
+            ) as pool:
+                plans: List[RulePlan] = []
+                for chunk_plans in pool.map(_plan_chunk, chunks):
+                    plans.extend(chunk_plans)
+                return plans
+        except Exception as e:
+            logger.warning(
+                f"Parallel rule evaluation failed, evaluating in-process: {e}"
+            )
+            return plan_resources(self.dispatcher, resources)
+
+    def apply(
+        self,
+        resources: Sequence[Dict[str, Any]],
+        db_ops: Any,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> int:
+        """
+        Evaluate the rules and queue or emit every relationship.
+
+        Buffers are not flushed; callers flush once all nodes exist.
+
+        Args:
+            resources: Resources to evaluate
+            db_ops: DatabaseOperations used by emit() and auto-flush
+            progress_callback: Called with (done, total) after each resource
+
+        Returns:
+            Number of relationships queued from extracted plans
+        """
+        plans = self.evaluate(resources)
+        total = len(resources)
+        queued = 0
+        for done, (resource, plan) in enumerate(zip(resources, plans), start=1):
+            for index, edges in plan:
+                rule = self.rules[index]
+                try:
+                    if edges is None:
+                        if rule.applies(resource):
+                            rule.emit(resource, db_ops)
+                        continue
+                    for src_id, rel_type, tgt_id, props in edges:
+                        rule.queue_dual_graph_relationship(
+                            src_id, rel_type, tgt_id, props
+                        )
+                    queued += len(edges)
+                    rule.auto_flush_if_needed(db_ops)
+                except Exception as e:
+                    logger.exception(
+                        f"Relationship rule {rule.__class__.__name__} failed: {e}"
+                    )
+            if progress_callback:
+                progress_callback(done, total)
+        return queued
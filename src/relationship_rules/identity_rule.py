@@ -34,6 +34,9 @@ class IdentityRule(RelationshipRule):
     Note: Identity nodes (User, ServicePrincipal, ManagedIdentity, etc.) are shared between graphs.
     """
 
+    resource_type_suffixes = ("roleassignments", "roledefinitions")
+    trigger_keys = frozenset({"identity"})
+
     def applies(self, resource: Dict[str, Any]) -> bool:
         rtype = resource.get("type", "")
         # RBAC: roleAssignments, roleDefinitions
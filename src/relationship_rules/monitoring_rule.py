@@ -1,6 +1,6 @@
-from typing import Any, Dict, Set
+from typing import Any, Dict, List, Set
 
-from .relationship_rule import RelationshipRule
+from .relationship_rule import RelationshipRule, RelationshipTuple
 
 
 class MonitoringRule(RelationshipRule):
@@ -11,6 +11,8 @@ class MonitoringRule(RelationshipRule):
     Supports dual-graph architecture - creates relationships in both original and abstracted graphs.
     """
 
+    trigger_keys = frozenset({"diagnosticSettings"})
+
     def applies(self, resource: Dict[str, Any]) -> bool:
         diag_settings = resource.get("diagnosticSettings")
         return isinstance(diag_settings, list) and len(diag_settings) > 0
@@ -26,6 +28,20 @@ class MonitoringRule(RelationshipRule):
                     db_ops, str(rid), "LOGS_TO", str(ws)
                 )
 
+    def extract_relationships(
+        self, resource: Dict[str, Any]
+    ) -> List[RelationshipTuple]:
+        """LOGS_TO edges for each diagnostic setting with a workspace."""
+        rid = resource.get("id")
+        if not rid:
+            return []
+        relationships: List[RelationshipTuple] = []
+        for ds in resource.get("diagnosticSettings", []):
+            ws = ds.get("workspaceId")
+            if ws:
+                relationships.append((str(rid), "LOGS_TO", str(ws), None))
+        return relationships
+
     def extract_target_ids(self, resource: Dict[str, Any]) -> Set[str]:
         """
         Extract Log Analytics Workspace resource IDs.
@@ -7,11 +7,11 @@ Creates relationships for Network Interfaces:
 """
 
 import json
-from typing import Any, Dict, Set
+from typing import Any, Dict, List, Set
 
 import structlog  # type: ignore[import-untyped]
 
-from .relationship_rule import RelationshipRule
+from .relationship_rule import RelationshipRule, RelationshipTuple
 
 logger = structlog.get_logger(__name__)
 
@@ -25,6 +25,8 @@ class NICRelationshipRule(RelationshipRule):
     - (NetworkInterface) -[:SECURED_BY]-> (NetworkSecurityGroup) if NSG attached
     """
 
+    resource_types = frozenset({"microsoft.network/networkinterfaces"})
+
     def applies(self, resource: Dict[str, Any]) -> bool:
         """Apply to network interfaces only."""
         rtype = resource.get("type", "")
@@ -32,7 +34,19 @@ class NICRelationshipRule(RelationshipRule):
 
     def emit(self, resource: Dict[str, Any], db_ops: Any) -> None:
         """Extract subnet and NSG relationships from NIC."""
+        for src_id, rel_type, tgt_id, _ in self.extract_relationships(resource):
+            self.queue_dual_graph_relationship(src_id, rel_type, tgt_id)
+            logger.debug(
+                f"🔗 Queued {rel_type}: {src_id.split('/')[-1]} -> {tgt_id.split('/')[-1]}"
+            )
+            self.auto_flush_if_needed(db_ops)
+
+    def extract_relationships(
+        self, resource: Dict[str, Any]
+    ) -> List[RelationshipTuple]:
+        """Subnet and NSG relationships of a NIC, without touching the database."""
         rid = resource.get("id")
+        relationships: List[RelationshipTuple] = []
 
         # Parse properties JSON
         props_dict = {}
@@ -43,7 +57,8 @@ class NICRelationshipRule(RelationshipRule):
                     props_dict = json.loads(props_str)
                 except json.JSONDecodeError as e:
                     logger.warning(f"Failed to parse properties for NIC {rid}: {e}")
-                    return  # Exit early - can't extract relationships without properties
+                    # Can't extract relationships without properties
+                    return relationships
             elif isinstance(props_str, dict):
                 props_dict = props_str
 
@@ -61,30 +76,18 @@ class NICRelationshipRule(RelationshipRule):
                     if isinstance(subnet, dict):
                         subnet_id = subnet.get("id")
                         if subnet_id and rid:
-                            self.queue_dual_graph_relationship(
-                                str(rid),
-                                "CONNECTED_TO",
-                                str(subnet_id),
-                            )
-                            logger.debug(
-                                f"🔗 Queued CONNECTED_TO: {rid.split('/')[-1]} -> {subnet_id.split('/')[-1]}"
+                            relationships.append(
+                                (str(rid), "CONNECTED_TO", str(subnet_id), None)
                             )
-                            self.auto_flush_if_needed(db_ops)
 
         # (NIC) -[:SECURED_BY]-> (NSG) if NSG is attached
         nsg = props_dict.get("networkSecurityGroup")
         if nsg and isinstance(nsg, dict):
             nsg_id = nsg.get("id")
             if nsg_id and rid:
-                self.queue_dual_graph_relationship(
-                    str(rid),
-                    "SECURED_BY",
-                    str(nsg_id),
-                )
-                logger.debug(
-                    f"🔗 Queued SECURED_BY: {rid.split('/')[-1]} -> {nsg_id.split('/')[-1]}"
-                )
-                self.auto_flush_if_needed(db_ops)
+                relationships.append((str(rid), "SECURED_BY", str(nsg_id), None))
+
+        return relationships
 
     def extract_target_ids(self, resource: Dict[str, Any]) -> Set[str]:
         """Extract subnet and NSG IDs that this NIC references."""
@@ -12,6 +12,8 @@ class RegionRule(RelationshipRule):
     Note: Region nodes are shared between graphs (not duplicated).
     """
 
+    trigger_keys = frozenset({"location"})
+
     def applies(self, resource: Dict[str, Any]) -> bool:
         return bool(resource.get("location"))
 
@@ -0,0 +1,216 @@
+"""
+Spilling Relationship Buffer
+
+Relationship rules buffer Resource-to-Resource edges until every node
+exists (auto-flush is disabled). For large tenants that is millions of
+tuples, so rules with a SpillingRelationshipBuffer attached keep only a
+bounded in-memory window and append the rest to a local SQLite file. Once
+all nodes are written, the file is replayed in UNWIND batches grouped by
+relationship type and sorted by source and target.
+
+Rows are deleted only after their batch commits, so a crashed run leaves
+the unwritten edges on disk and the next replay of the same file picks them
+up. Replaying a batch twice is harmless because the write uses MERGE.
+"""
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import structlog  # type: ignore[import-untyped]
+
+from .relationship_rule import (
+    RelationshipRule,
+    RelationshipTuple,
+    batch_relationship_query,
+)
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_WINDOW_SIZE = 10_000
+DEFAULT_REPLAY_BATCH_SIZE = 1_000
+
+
+class SpillingRelationshipBuffer:
+    """Append-only on-disk store of buffered relationships, shared by rules."""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        batch_size: int = DEFAULT_REPLAY_BATCH_SIZE,
+    ) -> None:
+        """
+        Open (creating if needed) the spill file.
+
+        Args:
+            path: SQLite file path; ":memory:" keeps the store in-process
+            window_size: Relationships a rule holds in memory before spilling
+            batch_size: Relationships per UNWIND query during replay
+        """
+        self.path = str(path)
+        if self.path != ":memory:":
+            self.path = str(Path(self.path).expanduser())
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self.window_size = max(1, window_size)
+        self.batch_size = max(1, batch_size)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # Keyed by the edge itself, so an edge queued twice is written once;
+        # the key order is also the replay order
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS relationships (
+                rel_type TEXT NOT NULL,
+                src_id TEXT NOT NULL,
+                tgt_id TEXT NOT NULL,
+                properties TEXT,
+                PRIMARY KEY (rel_type, src_id, tgt_id)
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.commit()
+
+    def extend(self, relationships: Iterable[RelationshipTuple]) -> int:
+        """
+        Append relationships to the spill file.
+
+        Relationship types outside RelationshipRule.VALID_RELATIONSHIP_TYPES
+        are rejected here, as the replay query interpolates the type.
+
+        Args:
+            relationships: (src_id, rel_type, tgt_id, properties) tuples
+
+        Returns:
+            Number of relationships stored
+        """
+        rows = []
+        for src_id, rel_type, tgt_id, properties in relationships:
+            if rel_type not in RelationshipRule.VALID_RELATIONSHIP_TYPES:
+                logger.error(
+                    f"Invalid relationship type '{rel_type}' in buffer, skipping. "
+                    f"Valid types: {RelationshipRule.VALID_RELATIONSHIP_TYPES}"
+                )
+                continue
+            rows.append(
+                (
+                    rel_type,
+                    src_id,
+                    tgt_id,
+                    json.dumps(properties, default=str) if properties else None,
+                )
+            )
+        if not rows:
+            return 0
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO relationships (rel_type, src_id, tgt_id, properties) "
+                "VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (rel_type, src_id, tgt_id) "
+                "DO UPDATE SET properties = excluded.properties",
+                rows,
+            )
+            self._conn.commit()
+        return len(rows)
+
+    def pending_by_type(self) -> Dict[str, int]:
+        """Relationships waiting for replay, per relationship type."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT rel_type, count(*) FROM relationships GROUP BY rel_type"
+            ).fetchall()
+        return {rel_type: int(count) for rel_type, count in rows}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(
+                self._conn.execute("SELECT count(*) FROM relationships").fetchone()[0]
+            )
+
+    def _next_batch(self, rel_type: str) -> List[Tuple[str, str, Optional[str]]]:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT src_id, tgt_id, properties FROM relationships "
+                "WHERE rel_type = ? ORDER BY src_id, tgt_id LIMIT ?",
+                (rel_type, self.batch_size),
+            ).fetchall()
+
+    def _discard(self, rel_type: str, rows: List[Tuple[str, str, Any]]) -> None:
+        with self._lock:
+            self._conn.executemany(
+                "DELETE FROM relationships "
+                "WHERE rel_type = ? AND src_id = ? AND tgt_id = ?",
+                [(rel_type, src_id, tgt_id) for src_id, tgt_id, _ in rows],
+            )
+            self._conn.commit()
+
+    def replay(self, db_ops: Any) -> int:
+        """
+        Write every stored relationship to Neo4j and remove it from the file.
+
+        Each batch is its own transaction and is deleted from the file only
+        after it commits. On a database error replay stops, leaving the
+        remaining relationships stored for the next replay.
+
+        Args:
+            db_ops: DatabaseOperations instance with session_manager
+
+        Returns:
+            Number of abstracted relationships created
+        """
+        session_manager = getattr(db_ops, "session_manager", None)
+        if session_manager is None:
+            logger.error(
+                f"Cannot replay {len(self)} spilled relationships without a session manager"
+            )
+            return 0
+
+        total_created = 0
+        for rel_type, pending in sorted(self.pending_by_type().items()):
+            logger.info(f"💾 Replaying {pending} spilled {rel_type} relationships...")
+            query = batch_relationship_query(rel_type)
+            type_created = 0
+            while True:
+                rows = self._next_batch(rel_type)
+                if not rows:
+                    break
+                relationships = [
+                    {
+                        "src_id": src_id,
+                        "tgt_id": tgt_id,
+                        "properties": json.loads(properties) if properties else {},
+                    }
+                    for src_id, tgt_id, properties in rows
+                ]
+                try:
+                    with session_manager.session() as session:
+                        with session.begin_transaction() as tx:
+                            record = tx.run(query, relationships=relationships).single()
+                            tx.commit()
+                except Exception as e:
+                    logger.exception(
+                        f"Error replaying spilled {rel_type} relationships, "
+                        f"{len(self)} left in {self.path}: {e}"
+                    )
+                    return total_created + type_created
+                type_created += record["created"] if record else 0
+                self._discard(rel_type, rows)
+
+            if type_created < pending:
+                logger.warning(
+                    f"⚠️  Replay created {type_created}/{pending} {rel_type} relationships"
+                )
+            else:
+                logger.info(
+                    f"✅ Successfully created {type_created} {rel_type} relationships"
+                )
+            total_created += type_created
+        return total_created
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
@@ -1,10 +1,50 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Optional, Set, Tuple
 
 import structlog  # type: ignore[import-untyped]
 
+if TYPE_CHECKING:
+    from .relationship_buffer import SpillingRelationshipBuffer
+
 logger = structlog.get_logger(__name__)
 
+# (src_id, rel_type, tgt_id, properties) as held in relationship buffers
+RelationshipTuple = Tuple[str, str, str, Optional[Dict[str, Any]]]
+
+
+def batch_relationship_query(rel_type: str) -> str:
+    """
+    UNWIND query creating one relationship type in both graphs.
+
+    Expects $relationships as a list of {src_id, tgt_id, properties} maps and
+    returns the number of abstracted relationships as `created`. rel_type is
+    interpolated, so callers must check it against VALID_RELATIONSHIP_TYPES.
+    """
+    return f"""
+    // Batch create relationships using UNWIND for optimal performance
+    UNWIND $relationships AS rel
+
+    // Find original nodes (indexed lookups)
+    MATCH (src_orig:Resource:Original {{id: rel.src_id}})
+    MATCH (tgt_orig:Resource:Original {{id: rel.tgt_id}})
+
+    // Create relationship between original nodes
+    MERGE (src_orig)-[r_orig:{rel_type}]->(tgt_orig)
+    SET r_orig += rel.properties
+
+    // Find abstracted nodes via indexed abstracted_id property
+    // This replaces the slow OPTIONAL MATCH traversal with fast index lookups
+    WITH src_orig, tgt_orig, rel
+    MATCH (src_abs:Resource {{original_id: src_orig.id}})
+    MATCH (tgt_abs:Resource {{original_id: tgt_orig.id}})
+
+    // Create relationship between abstracted nodes
+    MERGE (src_abs)-[r_abs:{rel_type}]->(tgt_abs)
+    SET r_abs += rel.properties
+
+    RETURN count(r_abs) as created
+    """
+
 
 class RelationshipRule(ABC):
     """
@@ -42,6 +82,15 @@ class RelationshipRule(ABC):
         "USES",  # VM -> NIC relationship
     }
 
+    # Dispatch hints used by RuleDispatcher. A rule is only offered resources
+    # whose (lower-cased) type is in resource_types or ends with one of
+    # resource_type_suffixes, or that have one of trigger_keys. A rule that
+    # declares none of them is offered every resource. applies() still has
+    # the final say, so hints only need to be a superset of it.
+    resource_types: FrozenSet[str] = frozenset()
+    resource_type_suffixes: Tuple[str, ...] = ()
+    trigger_keys: FrozenSet[str] = frozenset()
+
     def __init__(
         self, enable_dual_graph: bool = False, enable_auto_flush: bool = False
     ):
@@ -56,10 +105,10 @@ class RelationshipRule(ABC):
         self.enable_dual_graph = enable_dual_graph
         self.enable_auto_flush = enable_auto_flush
         # Buffer for batched relationship creation
-        self._relationship_buffer: List[
-            Tuple[str, str, str, Optional[Dict[str, Any]]]
-        ] = []
+        self._relationship_buffer: List[RelationshipTuple] = []
         self._buffer_size = 100  # Batch size for relationship creation
+        # Optional on-disk store the buffer spills into (see attach_spill_buffer)
+        self._spill_buffer: Optional[SpillingRelationshipBuffer] = None
 
     @abstractmethod
     def applies(self, resource: Dict[str, Any]) -> bool:
@@ -74,6 +123,26 @@ class RelationshipRule(ABC):
         """
         pass
 
+    def extract_relationships(
+        self, resource: Dict[str, Any]
+    ) -> Optional[List[RelationshipTuple]]:
+        """
+        Extract the Resource-to-Resource relationships emit() would queue.
+
+        Pure parsing with no database access, so it can run in a worker
+        process (see RuleEvaluator). Only meaningful for resources that
+        applies() accepts.
+
+        Args:
+            resource: Resource dict with 'id', 'type', 'properties', etc.
+
+        Returns:
+            Relationship tuples to queue, or None if emit() has to run with
+            db_ops for this resource (e.g. it upserts nodes). The default is
+            None for every resource.
+        """
+        return None
+
     def extract_target_ids(self, resource: Dict[str, Any]) -> Set[str]:
         """
         Extract resource IDs that this rule would create relationships to.
@@ -488,6 +557,41 @@ class RelationshipRule(ABC):
             properties: Optional relationship properties
         """
         self._relationship_buffer.append((src_id, rel_type, tgt_id, properties))
+        if (
+            self._spill_buffer is not None
+            and self.enable_dual_graph
+            and len(self._relationship_buffer) >= self._spill_buffer.window_size
+        ):
+            self.spill_relationship_buffer()
+
+    def attach_spill_buffer(
+        self, spill_buffer: Optional["SpillingRelationshipBuffer"]
+    ) -> None:
+        """
+        Spill queued relationships to disk instead of holding them in memory.
+
+        While attached, the in-memory buffer is moved to the spill buffer
+        whenever it reaches the spill buffer's window size, and flushing
+        replays the spill buffer instead of dropping an oversized buffer.
+        Only used in dual-graph mode. Pass None to detach.
+
+        Args:
+            spill_buffer: Shared on-disk buffer, or None
+        """
+        self._spill_buffer = spill_buffer
+
+    def spill_relationship_buffer(self) -> int:
+        """
+        Move the in-memory buffer to the attached spill buffer.
+
+        Returns:
+            int: Number of relationships moved (0 if no spill buffer is attached)
+        """
+        if self._spill_buffer is None or not self._relationship_buffer:
+            return 0
+        moved = self._spill_buffer.extend(self._relationship_buffer)
+        self._relationship_buffer.clear()
+        return moved
 
     def flush_relationship_buffer(self, db_ops: Any) -> int:
         """
@@ -507,6 +611,12 @@ class RelationshipRule(ABC):
         Returns:
             int: Number of relationships created
         """
+        if self._spill_buffer is not None and self.enable_dual_graph:
+            # Nothing is dropped: the buffer joins the spilled relationships and
+            # all of them are replayed in sorted, type-grouped batches
+            self.spill_relationship_buffer()
+            return self._spill_buffer.replay(db_ops)
+
         if not self._relationship_buffer:
             return 0
 
@@ -587,31 +697,7 @@ class RelationshipRule(ABC):
                             f"💾 Flushing {expected_count} {rel_type} relationships..."
                         )
 
-                        query = f"""
-                        // Batch create relationships using UNWIND for optimal performance
-                        UNWIND $relationships AS rel
-
-                        // Find original nodes (indexed lookups)
-                        MATCH (src_orig:Resource:Original {{id: rel.src_id}})
-                        MATCH (tgt_orig:Resource:Original {{id: rel.tgt_id}})
-
-                        // Create relationship between original nodes
-                        MERGE (src_orig)-[r_orig:{rel_type}]->(tgt_orig)
-                        SET r_orig += rel.properties
-
-                        // Find abstracted nodes via indexed abstracted_id property
-                        // This replaces the slow OPTIONAL MATCH traversal with fast index lookups
-                        WITH src_orig, tgt_orig, rel
-                        MATCH (src_abs:Resource {{original_id: src_orig.id}})
-                        MATCH (tgt_abs:Resource {{original_id: tgt_orig.id}})
-
-                        // Create relationship between abstracted nodes
-                        MERGE (src_abs)-[r_abs:{rel_type}]->(tgt_abs)
-                        SET r_abs += rel.properties
-
-                        RETURN count(r_abs) as created
-                        """
-
+                        query = batch_relationship_query(rel_type)
                         result = tx.run(query, relationships=relationships)
                         record = result.single()
                         if record:
@@ -30,6 +30,8 @@ class SecretRule(RelationshipRule):
     and abstracted graphs. KeyVaultSecret nodes are shared between graphs.
     """
 
+    resource_types = frozenset({"microsoft.keyvault/vaults"})
+
     def applies(self, resource: Dict[str, Any]) -> bool:
         """
         Check if this rule applies to the given resource.
@@ -29,6 +29,8 @@ class SubnetExtractionRule(RelationshipRule):
     Supports dual-graph architecture - creates relationships in both original and abstracted graphs.
     """
 
+    resource_types = frozenset({"microsoft.network/virtualnetworks"})
+
     def applies(self, resource: Dict[str, Any]) -> bool:
         """
         Check if this rule applies to the resource.
@@ -13,6 +13,8 @@ class TagRule(RelationshipRule):
     Note: Tag nodes are shared between graphs (not duplicated).
     """
 
+    trigger_keys = frozenset({"tags"})
+
     def applies(self, resource: Dict[str, Any]) -> bool:
         return bool(resource.get("tags"))
 
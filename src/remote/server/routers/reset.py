@@ -244,14 +244,13 @@ async def execute_tenant_reset(
             request.tenant_id
         )
 
-        # Order resources by dependencies
-        deletion_waves = await service.order_by_dependencies(scope_data["to_delete"])
-
-        # Execute deletion
+        # Execute deletion in dependency order
         import time
 
         start_time = time.time()
-        results = await service.delete_resources(deletion_waves, concurrency=10)
+        results = await service.delete_resources_by_dependencies(
+            scope_data["to_delete"], concurrency=10
+        )
         duration = time.time() - start_time
 
         # Post-deletion verification
@@ -124,47 +124,31 @@ class OperationsService:
                 "Initializing Azure connection",
             )
 
-            # Execute discovery using existing service
-            # This wraps discovery_service.discover_all_resources()
+            # Discover and process through the existing build pipeline, which
+            # streams discovered resources straight into processing workers
+            # instead of holding the whole tenant in memory
             loop = asyncio.get_event_loop()
 
             def run_scan():
-                """Sync wrapper for ATG scan (which may be sync or async)."""
-                # The actual scan process
-                resources = asyncio.run(
-                    grapher.discovery_service.discover_all_resources()  # type: ignore[attr-defined]
-                )
-                return resources
+                """Sync wrapper for ATG scan."""
+                return asyncio.run(grapher.build_graph())
 
             # Run in executor to avoid blocking
-            resources = await loop.run_in_executor(None, run_scan)
-
-            await self.progress_tracker.publish(
-                job_id,
-                "progress",
-                f"Discovered {len(resources)} resources",
-                {"resource_count": len(resources)},
-            )
-
-            # Process resources using existing service
-            def process_resources():
-                """Sync wrapper for resource processing."""
-                return asyncio.run(
-                    grapher.processing_service.process_resources(resources)
-                )
-
-            await loop.run_in_executor(None, process_resources)
+            result = await loop.run_in_executor(None, run_scan)
+            if not result.get("success"):
+                raise RuntimeError(result.get("error") or "Graph build failed")
+            resource_count = result.get("total_resources", 0)
 
             await self.progress_tracker.publish(
                 job_id,
                 "complete",
-                f"Scan complete - processed {len(resources)} resources",
-                {"resource_count": len(resources)},
+                f"Scan complete - processed {resource_count} resources",
+                {"resource_count": resource_count},
             )
 
             return {
                 "status": "complete",
-                "resource_count": len(resources),
+                "resource_count": resource_count,
                 "tenant_id": tenant_id,
             }
 
@@ -6,6 +6,7 @@ Each brick is self-contained with clear public contracts.
 """
 
 from .configuration_similarity import ConfigurationSimilarity
+from .graph_snapshot import GraphSnapshot
 from .graph_structure_analyzer import GraphStructureAnalyzer
 from .instance_selector import InstanceSelector
 from .orphaned_resource_manager import OrphanedResourceManager
@@ -15,6 +16,7 @@ from .target_graph_builder import TargetGraphBuilder
 
 __all__ = [
     "ConfigurationSimilarity",
+    "GraphSnapshot",
     "GraphStructureAnalyzer",
     "InstanceSelector",
     "OrphanedResourceManager",
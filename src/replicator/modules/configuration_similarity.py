@@ -4,6 +4,13 @@ Configuration Similarity Brick
 Pure utility brick for computing configuration similarity and clustering resources
 by configuration coherence.
 
+Clustering encodes each fingerprint as integer codes (location, SKU tier, tag
+key set), computes the similarity kernel once per distinct code combination
+with NumPy, and runs average-linkage agglomeration over a dense matrix of
+cluster-pair similarity sums with a cached best partner per cluster. Merges
+follow the same order and tie-breaking as the pairwise merge loop, in roughly
+O(n^2) instead of O(n^4).
+
 Philosophy:
 - Single Responsibility: Configuration comparison and clustering
 - Self-contained: No external state
@@ -14,8 +21,11 @@ Philosophy:
 from __future__ import annotations
 
 import json
+from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
+
 from ...architecture_replication_constants import (
     CONFIGURATION_SIMILARITY_WEIGHTS,
     DEFAULT_COHERENCE_THRESHOLD,
@@ -23,6 +33,24 @@ from ...architecture_replication_constants import (
 )
 
 
+@dataclass(frozen=True)
+class FingerprintCodes:
+    """
+    Categorical encoding of configuration fingerprints.
+
+    Attributes:
+        location: Location code per resource (-1 when missing)
+        sku_tier: SKU tier code per resource (-1 when missing)
+        tag_set: Index of each resource's tag key set into ``tag_keys``
+        tag_keys: Boolean matrix (distinct tag key sets x distinct tag keys)
+    """
+
+    location: np.ndarray
+    sku_tier: np.ndarray
+    tag_set: np.ndarray
+    tag_keys: np.ndarray
+
+
 class ConfigurationSimilarity:
     """
     Computes configuration similarity and clusters resources by coherence.
@@ -33,6 +61,9 @@ class ConfigurationSimilarity:
     Public Contract:
         - compute_similarity(fingerprint1, fingerprint2) -> float
         - cluster_by_coherence(resources, fingerprints, threshold) -> list[list[dict]]
+        - encode_fingerprints(fingerprints) -> FingerprintCodes
+        - similarity_matrix(codes) -> np.ndarray
+        - average_linkage(similarity, threshold) -> list[list[int]]
     """
 
     @staticmethod
@@ -128,57 +159,195 @@ class ConfigurationSimilarity:
             # < 2 resources, no clustering needed
             return [resources] if resources else []
 
-        # Compute pairwise similarities
-        similarity_matrix = {}
-        for i, res1 in enumerate(resources):
-            for j, res2 in enumerate(resources):
-                if i < j:
-                    fp1 = resource_fingerprints[res1["id"]]
-                    fp2 = resource_fingerprints[res2["id"]]
-                    sim = ConfigurationSimilarity.compute_similarity(fp1, fp2)
-                    similarity_matrix[(i, j)] = sim
-
-        # Start with each resource in its own cluster
-        clusters = [[res] for res in resources]
-
-        # Iteratively merge most similar clusters above threshold
-        merged = True
-        while merged and len(clusters) > 1:
-            merged = False
-            best_sim = coherence_threshold
-            best_pair = None
-
-            # Find best cluster pair to merge
-            for i in range(len(clusters)):
-                for j in range(i + 1, len(clusters)):
-                    # Compute average similarity between clusters
-                    similarities = []
-                    for res1 in clusters[i]:
-                        for res2 in clusters[j]:
-                            idx1 = resources.index(res1)
-                            idx2 = resources.index(res2)
-                            key = (min(idx1, idx2), max(idx1, idx2))
-                            if key in similarity_matrix:
-                                similarities.append(similarity_matrix[key])
-
-                    if similarities:
-                        avg_sim = sum(similarities) / len(similarities)
-                        if avg_sim > best_sim:
-                            best_sim = avg_sim
-                            best_pair = (i, j)
-
-            # Merge best pair if found
-            if best_pair:
-                i, j = best_pair
-                merged_cluster = clusters[i] + clusters[j]
-                # Remove old clusters (remove j first to preserve i index)
-                clusters.pop(j)
-                clusters.pop(i)
-                clusters.append(merged_cluster)
-                merged = True
+        codes = ConfigurationSimilarity.encode_fingerprints(
+            [resource_fingerprints[res["id"]] for res in resources]
+        )
+        similarity = ConfigurationSimilarity.similarity_matrix(codes)
+        clusters = ConfigurationSimilarity.average_linkage(
+            similarity, coherence_threshold
+        )
 
         # Only return clusters with minimum size
-        return [c for c in clusters if len(c) >= MIN_CLUSTER_SIZE]
+        return [
+            [resources[i] for i in cluster]
+            for cluster in clusters
+            if len(cluster) >= MIN_CLUSTER_SIZE
+        ]
+
+    @staticmethod
+    def encode_fingerprints(fingerprints: list[dict[str, Any]]) -> FingerprintCodes:
+        """
+        Encode configuration fingerprints as integer category codes.
+
+        Args:
+            fingerprints: Fingerprints as produced by
+                ArchitecturalPatternAnalyzer.create_configuration_fingerprint
+
+        Returns:
+            FingerprintCodes for use with similarity_matrix
+        """
+        locations: dict[Any, int] = {}
+        tiers: dict[str, int] = {}
+        tag_sets: dict[frozenset[str], int] = {}
+        location = np.full(len(fingerprints), -1, dtype=np.int32)
+        sku_tier = np.full(len(fingerprints), -1, dtype=np.int32)
+        tag_set = np.empty(len(fingerprints), dtype=np.int32)
+
+        for i, fingerprint in enumerate(fingerprints):
+            loc = fingerprint.get("location", "")
+            if loc:
+                location[i] = locations.setdefault(loc, len(locations))
+
+            tier = ConfigurationSimilarity._extract_sku_tier(fingerprint.get("sku", ""))
+            if tier:
+                sku_tier[i] = tiers.setdefault(tier, len(tiers))
+
+            tags_data = ConfigurationSimilarity._parse_tags(fingerprint.get("tags", {}))
+            keys = frozenset(tags_data.keys() if isinstance(tags_data, dict) else [])
+            tag_set[i] = tag_sets.setdefault(keys, len(tag_sets))
+
+        key_index: dict[str, int] = {}
+        for keys in tag_sets:
+            for key in keys:
+                key_index.setdefault(key, len(key_index))
+        tag_keys = np.zeros((len(tag_sets), len(key_index)), dtype=bool)
+        for keys, row in tag_sets.items():
+            tag_keys[row, [key_index[key] for key in keys]] = True
+
+        return FingerprintCodes(location, sku_tier, tag_set, tag_keys)
+
+    @staticmethod
+    def similarity_matrix(codes: FingerprintCodes) -> np.ndarray:
+        """
+        Compute all pairwise similarities from encoded fingerprints.
+
+        Produces the same values as compute_similarity: the kernel is evaluated
+        once per distinct (location, tier, tag set) profile and expanded to the
+        full n x n matrix.
+
+        Args:
+            codes: Encoded fingerprints
+
+        Returns:
+            Symmetric (n x n) float64 similarity matrix
+        """
+        weights = CONFIGURATION_SIMILARITY_WEIGHTS
+        profiles, profile_of = np.unique(
+            np.stack([codes.location, codes.sku_tier, codes.tag_set], axis=1),
+            axis=0,
+            return_inverse=True,
+        )
+        location, sku_tier, tag_set = profiles.T
+
+        # Tag key Jaccard between distinct tag sets
+        tag_keys = codes.tag_keys.astype(np.int64)
+        intersection = tag_keys @ tag_keys.T
+        counts = tag_keys.sum(axis=1)
+        union = counts[:, None] + counts[None, :] - intersection
+        jaccard = np.divide(
+            intersection,
+            union,
+            out=np.zeros(union.shape, dtype=np.float64),
+            where=union > 0,
+        )
+
+        # Same accumulation order as compute_similarity
+        kernel = np.zeros((len(profiles), len(profiles)))
+        kernel += np.where(
+            (location[:, None] == location[None, :]) & (location[:, None] >= 0),
+            weights["location"],
+            0.0,
+        )
+        kernel += np.where(
+            (sku_tier[:, None] == sku_tier[None, :]) & (sku_tier[:, None] >= 0),
+            weights["sku_tier"],
+            0.0,
+        )
+        kernel += weights["tags"] * jaccard[np.ix_(tag_set, tag_set)]
+
+        profile_of = profile_of.ravel()
+        return kernel[np.ix_(profile_of, profile_of)]
+
+    @staticmethod
+    def average_linkage(similarity: np.ndarray, threshold: float) -> list[list[int]]:
+        """
+        Agglomerative average-linkage clustering with a similarity cut-off.
+
+        Repeatedly merges the pair of clusters with the highest average
+        similarity while it exceeds the threshold. Clusters are kept in
+        creation order (the merged cluster goes last, members of the earlier
+        cluster first) and ties go to the earliest pair, as in the pairwise
+        merge loop this replaces.
+
+        Each cluster caches its best partner among later clusters, so a merge
+        costs one O(n) row update plus a rescan only for clusters whose best
+        partner was consumed.
+
+        Args:
+            similarity: Symmetric (n x n) similarity matrix; overwritten in place
+            threshold: Merges require average similarity strictly above this
+
+        Returns:
+            Clusters as lists of row indices, in creation order
+        """
+        n = similarity.shape[0]
+        if n == 0:
+            return []
+
+        sums = similarity  # cluster-pair similarity sums, indexed by slot
+        size = np.ones(n)
+        order = np.arange(n)  # creation order of the cluster in each slot
+        active = np.ones(n, dtype=bool)
+        members: list[list[int]] = [[i] for i in range(n)]
+        best = np.full(n, -1)
+        best_sim = np.full(n, -np.inf)
+
+        def find_best(slot: int) -> None:
+            later = active & (order > order[slot])
+            if not later.any():
+                best[slot], best_sim[slot] = -1, -np.inf
+                return
+            averages = np.where(later, sums[slot] / (size[slot] * size), -np.inf)
+            top = averages.max()
+            tied = np.flatnonzero(averages == top)
+            best[slot] = tied[np.argmin(order[tied])]
+            best_sim[slot] = top
+
+        for slot in range(n):
+            find_best(slot)
+
+        next_order = n
+        while True:
+            top = best_sim.max()
+            if not top > threshold:
+                break
+            tied = np.flatnonzero(best_sim == top)
+            first = tied[np.argmin(order[tied])]
+            second = best[first]
+
+            # Merge second into first's slot; the new cluster is the latest
+            sums[first] += sums[second]
+            sums[:, first] = sums[first]
+            size[first] += size[second]
+            members[first] = members[first] + members[second]
+            members[second] = []
+            active[second] = False
+            order[first] = next_order
+            next_order += 1
+            best[second], best_sim[second] = -1, -np.inf
+            best[first], best_sim[first] = -1, -np.inf
+
+            # Earlier clusters gain the merged one as a candidate partner
+            stale = active & ((best == first) | (best == second))
+            averages = sums[first] / (size[first] * size)
+            improved = active & ~stale & (averages > best_sim)
+            improved[first] = False
+            best[improved] = first
+            best_sim[improved] = averages[improved]
+            for slot in np.flatnonzero(stale):
+                find_best(slot)
+
+        return [members[slot] for slot in np.argsort(order) if active[slot]]
 
     @staticmethod
     def _parse_tags(tags_data: Any) -> dict[str, Any]:
@@ -218,4 +387,4 @@ class ConfigurationSimilarity:
         return ""
 
 
-__all__ = ["ConfigurationSimilarity"]
+__all__ = ["ConfigurationSimilarity", "FingerprintCodes"]
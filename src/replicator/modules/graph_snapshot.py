@@ -0,0 +1,556 @@
+"""
+Graph Snapshot Brick
+
+In-memory snapshot of the source graph shared by the replicator bricks.
+
+The whole graph is pulled from Neo4j once (one node query, one edge query)
+and kept as interned, integer-indexed arrays:
+- node ids, names and raw Azure types, with label sets and types interned to codes
+- a boolean mask of ``Resource:Original`` nodes
+- edge source/target/relationship-type arrays with CSR offsets by source and
+  by target
+- ResourceGroup membership: the CONTAINS edges from ResourceGroup to Original
+  resources
+
+PatternInstanceFinder, TargetGraphBuilder (and through it InstanceSelector)
+and ArchitecturalPatternAnalyzer answer their per-pattern queries from the
+snapshot instead of re-scanning Neo4j. Snapshots can be persisted to a single
+``.npz`` file keyed by a graph version (node/edge counts and the latest
+``updated_at``), so a repeated run against an unchanged graph only issues the
+version query.
+
+Philosophy:
+- Single Responsibility: Read-only graph snapshot and its lookups
+- Self-contained: NumPy arrays and plain Python tables, no Neo4j objects kept
+- Regeneratable: Rebuilt from Neo4j or loaded from disk
+- Zero-BS: All functions work, no stubs
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT_VERSION = 1
+
+NODES_QUERY = """
+MATCH (n)
+RETURN id(n) AS nid,
+       labels(n) AS labels,
+       n.id AS id,
+       n.type AS type,
+       n.name AS name,
+       CASE WHEN n:Original THEN n.location END AS location,
+       CASE WHEN n:Original THEN n.tags END AS tags,
+       CASE WHEN n:Original THEN n.properties END AS properties
+"""
+
+EDGES_QUERY = """
+MATCH (source)-[r]->(target)
+WHERE type(r) <> 'SCAN_SOURCE_NODE'
+RETURN id(source) AS source, id(target) AS target, type(r) AS rel_type
+"""
+
+GRAPH_VERSION_QUERY = """
+CALL { MATCH (n) RETURN count(n) AS nodes }
+CALL { MATCH ()-[r]->() RETURN count(r) AS relationships }
+CALL { MATCH (r:Resource) RETURN toString(max(r.updated_at)) AS updated_at }
+RETURN nodes, relationships, updated_at
+"""
+
+# Original resources under a UUID-named management group belong to another
+# tenant (same rule as ArchitecturalPatternAnalyzer.fetch_all_relationships)
+_FOREIGN_MANAGEMENT_GROUP = re.compile(
+    r".*/managementgroups/[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}/.*",
+    re.DOTALL,
+)
+
+
+def _intern(values: Iterable[Any], table: dict[Any, int]) -> np.ndarray:
+    return np.fromiter(
+        (table.setdefault(value, len(table)) for value in values), dtype=np.int32
+    )
+
+
+def _csr(keys: np.ndarray, size: int) -> tuple[np.ndarray, np.ndarray]:
+    """Stable CSR grouping: (offsets, order) so keys[order] is sorted."""
+    order = np.argsort(keys, kind="stable").astype(np.int32)
+    counts = np.bincount(keys, minlength=size)
+    offsets = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return offsets, order
+
+
+class GraphSnapshot:
+    """
+    Read-only, integer-indexed snapshot of the source graph.
+
+    Public Contract:
+        - from_session(session) -> GraphSnapshot
+        - load(session, cache_dir) -> GraphSnapshot
+        - save(path) / from_file(path)
+        - relationships(source_tenant_id) -> list[dict]
+        - resource_type_counts() -> dict[str, int]
+        - resource_group_records(types) -> list[dict]
+        - connections_among(resource_ids) -> list[dict]
+        - relationships_touching(resource_ids) -> list[dict]
+    """
+
+    def __init__(
+        self,
+        ids: list[str | None],
+        names: list[str | None],
+        label_sets: list[tuple[str, ...]],
+        node_label_set: np.ndarray,
+        types: list[str | None],
+        node_type: np.ndarray,
+        rel_types: list[str],
+        edge_source: np.ndarray,
+        edge_target: np.ndarray,
+        edge_rel: np.ndarray,
+        attributes: dict[int, tuple[Any, Any, Any]] | None = None,
+        version: str | None = None,
+    ):
+        """
+        Build a snapshot from interned tables.
+
+        Args:
+            ids: ``n.id`` per node
+            names: ``n.name`` per node
+            label_sets: Distinct label tuples
+            node_label_set: Index into ``label_sets`` per node
+            types: Distinct ``n.type`` values
+            node_type: Index into ``types`` per node
+            rel_types: Distinct relationship types
+            edge_source: Source node index per edge
+            edge_target: Target node index per edge
+            edge_rel: Index into ``rel_types`` per edge
+            attributes: (location, tags, properties) of Original resources by node index
+            version: Graph version the snapshot was taken at
+        """
+        self.ids = ids
+        self.names = names
+        self.label_sets = label_sets
+        self.node_label_set = node_label_set
+        self.types = types
+        self.node_type = node_type
+        self.rel_types = rel_types
+        self.edge_source = edge_source
+        self.edge_target = edge_target
+        self.edge_rel = edge_rel
+        self.attributes = attributes or {}
+        self.version = version
+
+        node_count = len(ids)
+        self.out_offsets, self.out_edges = _csr(edge_source, node_count)
+        self.in_offsets, self.in_edges = _csr(edge_target, node_count)
+
+        label_flags = np.array(
+            [
+                (
+                    "Resource" in labels and "Original" in labels,
+                    "ResourceGroup" in labels,
+                )
+                for labels in label_sets
+            ],
+            dtype=bool,
+        ).reshape(-1, 2)
+        self.is_original = label_flags[node_label_set, 0]
+        is_resource_group = label_flags[node_label_set, 1]
+
+        # Original resources by id (first occurrence wins)
+        self.index: dict[str, int] = {}
+        for i in np.flatnonzero(self.is_original):
+            if ids[i] is not None:
+                self.index.setdefault(ids[i], int(i))
+
+        # ResourceGroup -[:CONTAINS]-> Resource:Original memberships
+        contains = rel_types.index("CONTAINS") if "CONTAINS" in rel_types else -1
+        membership = (
+            (edge_rel == contains)
+            & is_resource_group[edge_source]
+            & self.is_original[edge_target]
+        )
+        self.membership_edges = np.flatnonzero(membership).astype(np.int32)
+        self._resource_group_records: list[dict[str, Any]] | None = None
+
+    @classmethod
+    def from_session(cls, session, version: str | None = None) -> GraphSnapshot:
+        """
+        Pull the full graph from Neo4j with one node and one edge query.
+
+        Args:
+            session: Neo4j session
+            version: Graph version to record on the snapshot
+
+        Returns:
+            GraphSnapshot
+        """
+        position: dict[int, int] = {}
+        ids: list[str | None] = []
+        names: list[str | None] = []
+        label_sets: dict[tuple[str, ...], int] = {}
+        types: dict[str | None, int] = {}
+        label_codes: list[int] = []
+        type_codes: list[int] = []
+        attributes: dict[int, tuple[Any, Any, Any]] = {}
+
+        for record in session.run(NODES_QUERY):
+            i = len(ids)
+            position[record["nid"]] = i
+            labels = tuple(record["labels"])
+            ids.append(record["id"])
+            names.append(record["name"])
+            label_codes.append(label_sets.setdefault(labels, len(label_sets)))
+            type_codes.append(types.setdefault(record["type"], len(types)))
+            if "Original" in labels:
+                attributes[i] = (
+                    record["location"],
+                    record["tags"],
+                    record["properties"],
+                )
+
+        sources: list[int] = []
+        targets: list[int] = []
+        rel_names: list[str] = []
+        for record in session.run(EDGES_QUERY):
+            source = position.get(record["source"])
+            target = position.get(record["target"])
+            if source is None or target is None:
+                continue  # Node created after the node query ran
+            sources.append(source)
+            targets.append(target)
+            rel_names.append(record["rel_type"])
+
+        rel_types: dict[str, int] = {}
+        edge_rel = _intern(rel_names, rel_types)
+        snapshot = cls(
+            ids=ids,
+            names=names,
+            label_sets=list(label_sets),
+            node_label_set=np.array(label_codes, dtype=np.int32),
+            types=list(types),
+            node_type=np.array(type_codes, dtype=np.int32),
+            rel_types=list(rel_types),
+            edge_source=np.array(sources, dtype=np.int32),
+            edge_target=np.array(targets, dtype=np.int32),
+            edge_rel=edge_rel,
+            attributes=attributes,
+            version=version,
+        )
+        logger.info(
+            f"Loaded graph snapshot: {len(ids)} nodes, {len(sources)} relationships, "
+            f"{len(snapshot.index)} original resources"
+        )
+        return snapshot
+
+    @staticmethod
+    def graph_version(session) -> str:
+        """
+        Cheap fingerprint of the graph's current state.
+
+        Uses node and relationship counts (served from Neo4j's count store)
+        and the latest ``updated_at`` of any Resource.
+
+        Args:
+            session: Neo4j session
+
+        Returns:
+            Hex digest identifying the graph version
+        """
+        record = session.run(GRAPH_VERSION_QUERY).single()
+        raw = f"{record['nodes']}:{record['relationships']}:{record['updated_at']}"
+        return hashlib.sha256(raw.encode()).hexdigest()[:16]
+
+    @classmethod
+    def load(cls, session, cache_dir: str | Path | None = None) -> GraphSnapshot:
+        """
+        Load a snapshot, reusing an on-disk copy for the current graph version.
+
+        Args:
+            session: Neo4j session
+            cache_dir: Directory for persisted snapshots; None disables persistence
+
+        Returns:
+            GraphSnapshot
+        """
+        if cache_dir is None:
+            return cls.from_session(session)
+
+        version = cls.graph_version(session)
+        path = Path(cache_dir) / f"graph-snapshot-{version}.npz"
+        if path.exists():
+            try:
+                snapshot = cls.from_file(path)
+                logger.info(f"Loaded graph snapshot {version} from {path}")
+                return snapshot
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable graph snapshot {path}: {e}")
+
+        snapshot = cls.from_session(session, version=version)
+        try:
+            snapshot.save(path)
+        except OSError as e:
+            logger.warning(f"Could not persist graph snapshot to {path}: {e}")
+        return snapshot
+
+    def save(self, path: str | Path) -> None:
+        """
+        Persist the snapshot as a single ``.npz`` file (no pickled objects).
+
+        Args:
+            path: Target file path
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        attribute_nodes = sorted(self.attributes)
+        tables = {
+            "format": SNAPSHOT_FORMAT_VERSION,
+            "version": self.version,
+            "ids": self.ids,
+            "names": self.names,
+            "label_sets": [list(labels) for labels in self.label_sets],
+            "types": self.types,
+            "rel_types": self.rel_types,
+            "attribute_nodes": attribute_nodes,
+            "attributes": [list(self.attributes[i]) for i in attribute_nodes],
+        }
+        encoded = json.dumps(tables, default=str).encode("utf-8")
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez_compressed(
+                f,
+                tables=np.frombuffer(encoded, dtype=np.uint8),
+                node_label_set=self.node_label_set,
+                node_type=self.node_type,
+                edge_source=self.edge_source,
+                edge_target=self.edge_target,
+                edge_rel=self.edge_rel,
+            )
+        tmp_path.replace(path)
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> GraphSnapshot:
+        """
+        Load a snapshot written by ``save``.
+
+        Args:
+            path: Snapshot file path
+
+        Returns:
+            GraphSnapshot
+
+        Raises:
+            ValueError: If the file was written by an incompatible format version
+        """
+        with np.load(path, allow_pickle=False) as data:
+            tables = json.loads(data["tables"].tobytes().decode("utf-8"))
+            if tables.get("format") != SNAPSHOT_FORMAT_VERSION:
+                raise ValueError(
+                    f"Unsupported graph snapshot format: {tables.get('format')}"
+                )
+            return cls(
+                ids=tables["ids"],
+                names=tables["names"],
+                label_sets=[tuple(labels) for labels in tables["label_sets"]],
+                node_label_set=data["node_label_set"],
+                types=tables["types"],
+                node_type=data["node_type"],
+                rel_types=tables["rel_types"],
+                edge_source=data["edge_source"],
+                edge_target=data["edge_target"],
+                edge_rel=data["edge_rel"],
+                attributes={
+                    node: tuple(values)
+                    for node, values in zip(
+                        tables["attribute_nodes"], tables["attributes"]
+                    )
+                },
+                version=tables["version"],
+            )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _belongs_to_tenant(self, node: int, source_tenant_id: str) -> bool:
+        if not self.is_original[node]:
+            return True
+        resource_id = self.ids[node]
+        if resource_id is None:
+            return False
+        lowered = resource_id.lower()
+        return (
+            not _FOREIGN_MANAGEMENT_GROUP.fullmatch(lowered)
+            or source_tenant_id in lowered
+        )
+
+    def _relationship(self, edge: int) -> dict[str, Any]:
+        source = int(self.edge_source[edge])
+        target = int(self.edge_target[edge])
+        return {
+            "source_labels": list(self.label_sets[self.node_label_set[source]]),
+            "source_type": self.types[self.node_type[source]],
+            "rel_type": self.rel_types[self.edge_rel[edge]],
+            "target_labels": list(self.label_sets[self.node_label_set[target]]),
+            "target_type": self.types[self.node_type[target]],
+        }
+
+    def relationships(
+        self, source_tenant_id: str | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        All relationships, in the shape of ``fetch_all_relationships``.
+
+        Args:
+            source_tenant_id: Lower-cased tenant ID; when set, Original resources
+                under another tenant's UUID-named management group are excluded
+
+        Returns:
+            List of relationship records with source/target labels and types
+        """
+        edges: Iterable[int] = range(len(self.edge_source))
+        if source_tenant_id:
+            allowed = np.array(
+                [
+                    self._belongs_to_tenant(i, source_tenant_id)
+                    for i in range(len(self))
+                ],
+                dtype=bool,
+            )
+            edges = np.flatnonzero(
+                allowed[self.edge_source] & allowed[self.edge_target]
+            ).tolist()
+        return [self._relationship(edge) for edge in edges]
+
+    def resource_type_counts(self) -> dict[str, int]:
+        """
+        Count Original resources per Azure type, like ``fetch_all_resource_types``.
+
+        Returns:
+            Dict mapping resource type to count
+        """
+        counts = np.bincount(
+            self.node_type[self.is_original], minlength=len(self.types)
+        )
+        return {
+            rtype: int(count)
+            for rtype, count in zip(self.types, counts)
+            if rtype and count
+        }
+
+    def resource(self, node: int) -> dict[str, Any]:
+        """Raw ``{"id", "type", "name"}`` of a node (type is the full Azure type)."""
+        return {
+            "id": self.ids[node],
+            "type": self.types[self.node_type[node]],
+            "name": self.names[node],
+        }
+
+    def resource_group_records(
+        self, types: Iterable[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        ResourceGroup/resource rows, like the ``(rg)-[:CONTAINS]->(r:Resource:Original)``
+        queries of PatternInstanceFinder, ordered by ResourceGroup id.
+
+        Args:
+            types: Only include resources with these full Azure types
+
+        Returns:
+            Records with resource_group_id, id, type, name, location, tags, properties
+        """
+        if self._resource_group_records is None:
+            records = []
+            for edge in self.membership_edges:
+                rg = int(self.edge_source[edge])
+                node = int(self.edge_target[edge])
+                location, tags, properties = self.attributes.get(
+                    node, (None, None, None)
+                )
+                records.append(
+                    {
+                        "resource_group_id": self.ids[rg],
+                        **self.resource(node),
+                        "location": location,
+                        "tags": tags,
+                        "properties": properties,
+                    }
+                )
+            records.sort(
+                key=lambda r: (
+                    r["resource_group_id"] is None,
+                    r["resource_group_id"] or "",
+                )
+            )
+            self._resource_group_records = records
+
+        if types is None:
+            return self._resource_group_records
+        wanted = set(types)
+        return [r for r in self._resource_group_records if r["type"] in wanted]
+
+    def _edges_of(self, node: int) -> Iterator[int]:
+        yield from self.out_edges[self.out_offsets[node] : self.out_offsets[node + 1]]
+        yield from self.in_edges[self.in_offsets[node] : self.in_offsets[node + 1]]
+
+    def connections_among(self, resource_ids: Iterable[str]) -> list[dict[str, Any]]:
+        """
+        Direct relationships between Original resources that are both in a set.
+
+        Args:
+            resource_ids: Resource IDs
+
+        Returns:
+            Records with source_id and target_id
+        """
+        nodes = {self.index[rid] for rid in resource_ids if rid in self.index}
+        records = []
+        for node in nodes:
+            for edge in self.out_edges[
+                self.out_offsets[node] : self.out_offsets[node + 1]
+            ]:
+                target = int(self.edge_target[edge])
+                if target in nodes:
+                    records.append(
+                        {"source_id": self.ids[node], "target_id": self.ids[target]}
+                    )
+        return records
+
+    def relationships_touching(
+        self, resource_ids: Iterable[str]
+    ) -> list[dict[str, Any]]:
+        """
+        Relationships with an Original resource from the set at either end.
+
+        Matches the relationship queries of TargetGraphBuilder.
+
+        Args:
+            resource_ids: Resource IDs
+
+        Returns:
+            Relationship records with source_id/target_id plus labels and types
+        """
+        edges: set[int] = set()
+        for rid in resource_ids:
+            node = self.index.get(rid)
+            if node is not None:
+                edges.update(int(edge) for edge in self._edges_of(node))
+        records = []
+        for edge in sorted(edges):
+            record = self._relationship(edge)
+            record["source_id"] = self.ids[self.edge_source[edge]]
+            record["target_id"] = self.ids[self.edge_target[edge]]
+            records.append(record)
+        return records
+
+
+__all__ = ["GraphSnapshot"]
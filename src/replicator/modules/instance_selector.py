@@ -215,8 +215,11 @@ class InstanceSelector:
 
         selected_instances: list[tuple[str, list[dict[str, Any]]]] = []
         remaining_instances = list(all_instances)  # Make a copy
+        current_nodes: set[str] = set()
 
-        # Greedy selection: iteratively pick the instance that best improves our score
+        # Greedy selection: iteratively pick the instance that best improves our score.
+        # The source spectrum is memoized by the analyzer, so each candidate only
+        # pays for its own hypothetical target graph.
         for i in range(min(target_instance_count, len(remaining_instances))):
             best_score = float("inf")
             best_idx = 0
@@ -242,15 +245,7 @@ class InstanceSelector:
                 if score < best_score:
                     best_score = score
                     best_idx = idx
-                    best_new_nodes = set(hypothetical_target.nodes()) - (
-                        set(
-                            self.graph_builder.build_from_instances(
-                                selected_instances
-                            ).nodes()
-                        )
-                        if selected_instances
-                        else set()
-                    )
+                    best_new_nodes = set(hypothetical_target.nodes()) - current_nodes
 
             # Select the best instance
             pattern_name, instance = remaining_instances.pop(best_idx)
@@ -25,6 +25,7 @@ from ...architecture_replication_constants import (
 if TYPE_CHECKING:
     from ...architectural_pattern_analyzer import ArchitecturalPatternAnalyzer
     from .configuration_similarity import ConfigurationSimilarity
+    from .graph_snapshot import GraphSnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +41,8 @@ class PatternInstanceFinder:
     Dependencies (injected):
         - analyzer: ArchitecturalPatternAnalyzer for type resolution and fingerprinting
         - config_similarity: ConfigurationSimilarity for clustering
+        - snapshot: Optional GraphSnapshot; when set, queries are answered from
+          memory and the session argument is not used
 
     Public Contract:
         - find_connected_instances(session, matched_types, ...) -> list[list[dict]]
@@ -50,6 +53,7 @@ class PatternInstanceFinder:
         self,
         analyzer: ArchitecturalPatternAnalyzer,
         config_similarity: ConfigurationSimilarity,
+        snapshot: GraphSnapshot | None = None,
     ):
         """
         Initialize with injected dependencies.
@@ -57,9 +61,11 @@ class PatternInstanceFinder:
         Args:
             analyzer: ArchitecturalPatternAnalyzer for resource type resolution
             config_similarity: ConfigurationSimilarity for clustering resources
+            snapshot: Shared in-memory graph snapshot (optional)
         """
         self.analyzer = analyzer
         self.config_similarity = config_similarity
+        self.snapshot = snapshot
 
     def find_connected_instances(
         self,
@@ -113,7 +119,10 @@ class PatternInstanceFinder:
         RETURN r.id as id, r.type as type, r.name as name, rg.id as resource_group_id
         """
 
-        result = session.run(query)
+        if self.snapshot is not None:
+            result = self.snapshot.resource_group_records()
+        else:
+            result = session.run(query)
 
         # Build mapping: ResourceGroup -> List of resources in that RG
         rg_to_pattern_resources = {}  # Resources matching this pattern
@@ -158,7 +167,10 @@ class PatternInstanceFinder:
         RETURN source.id as source_id, target.id as target_id
         """
 
-        result = session.run(query, ids=list(resource_info.keys()))
+        if self.snapshot is not None:
+            result = self.snapshot.connections_among(resource_info.keys())
+        else:
+            result = session.run(query, ids=list(resource_info.keys()))
 
         # Build adjacency list for direct connections
         direct_connections = {rid: set() for rid in resource_info.keys()}
@@ -281,7 +293,10 @@ class PatternInstanceFinder:
                    r.properties as properties
             ORDER BY rg.id
             """
-            result = session.run(query)
+            if self.snapshot is not None:
+                result = self.snapshot.resource_group_records()
+            else:
+                result = session.run(query)
         else:
             # Original behavior: only get pattern type resources
             query = """
@@ -314,7 +329,10 @@ class PatternInstanceFinder:
                 ]:
                     full_types.append(f"{namespace}/{simplified}")
 
-            result = session.run(query, types=full_types)
+            if self.snapshot is not None:
+                result = self.snapshot.resource_group_records(types=full_types)
+            else:
+                result = session.run(query, types=full_types)
 
         # Group by ResourceGroup first
         rg_to_pattern_resources = {}  # Only pattern types
@@ -19,6 +19,7 @@ from neo4j import GraphDatabase
 
 if TYPE_CHECKING:
     from ...architectural_pattern_analyzer import ArchitecturalPatternAnalyzer
+    from .graph_snapshot import GraphSnapshot
 
 class TargetGraphBuilder:
     """
@@ -33,6 +34,8 @@ class TargetGraphBuilder:
         - neo4j_uri: Neo4j connection URI
         - neo4j_user: Neo4j username
         - neo4j_password: Neo4j password
+        - snapshot: Optional GraphSnapshot; when set, relationships are read
+          from memory instead of Neo4j
 
     Public Contract:
         - build_from_instances(selected_instances) -> nx.MultiDiGraph
@@ -44,6 +47,7 @@ class TargetGraphBuilder:
         neo4j_uri: str,
         neo4j_user: str,
         neo4j_password: str,
+        snapshot: GraphSnapshot | None = None,
     ):
         """
         Initialize with injected dependencies.
@@ -53,11 +57,13 @@ class TargetGraphBuilder:
             neo4j_uri: Neo4j connection URI
             neo4j_user: Neo4j username
             neo4j_password: Neo4j password
+            snapshot: Shared in-memory graph snapshot (optional)
         """
         self.analyzer = analyzer
         self.neo4j_uri = neo4j_uri
         self.neo4j_user = neo4j_user
         self.neo4j_password = neo4j_password
+        self.snapshot = snapshot
         # Relationship cache: resource_id -> list of relationships
         self._relationship_cache: dict[str, list[dict[str, Any]]] = {}
         self._cache_enabled = False
@@ -98,6 +104,12 @@ class TargetGraphBuilder:
         if not all_resource_ids:
             return
 
+        if self.snapshot is not None:
+            for record in self.snapshot.relationships_touching(all_resource_ids):
+                self._cache_relationship(record)
+            self._cache_enabled = True
+            return
+
         # Query Neo4j once for all relationships
         driver = GraphDatabase.driver(
             self.neo4j_uri, auth=(self.neo4j_user, self.neo4j_password)
@@ -124,31 +136,35 @@ class TargetGraphBuilder:
 
                 # Store relationships indexed by resource ID
                 for record in result:
-                    rel = {
-                        "source_labels": record["source_labels"],
-                        "source_type": record["source_type"],
-                        "rel_type": record["rel_type"],
-                        "target_labels": record["target_labels"],
-                        "target_type": record["target_type"],
-                    }
-
-                    # Add to cache for both source and target IDs
-                    source_id = record["source_id"]
-                    target_id = record["target_id"]
-
-                    if source_id not in self._relationship_cache:
-                        self._relationship_cache[source_id] = []
-                    self._relationship_cache[source_id].append(rel)
-
-                    if target_id not in self._relationship_cache:
-                        self._relationship_cache[target_id] = []
-                    self._relationship_cache[target_id].append(rel)
+                    self._cache_relationship(record)
 
         finally:
             driver.close()
 
         self._cache_enabled = True
 
+    def _cache_relationship(self, record: Any) -> None:
+        """Add a relationship record to the cache under its source and target IDs."""
+        rel = {
+            "source_labels": record["source_labels"],
+            "source_type": record["source_type"],
+            "rel_type": record["rel_type"],
+            "target_labels": record["target_labels"],
+            "target_type": record["target_type"],
+        }
+
+        # Add to cache for both source and target IDs
+        source_id = record["source_id"]
+        target_id = record["target_id"]
+
+        if source_id not in self._relationship_cache:
+            self._relationship_cache[source_id] = []
+        self._relationship_cache[source_id].append(rel)
+
+        if target_id not in self._relationship_cache:
+            self._relationship_cache[target_id] = []
+        self._relationship_cache[target_id].append(rel)
+
     def build_from_instances(
         self, selected_instances: list[tuple[str, list[dict[str, Any]]]]
     ) -> nx.MultiDiGraph:
@@ -214,6 +230,8 @@ class TargetGraphBuilder:
                         if rel_tuple not in seen_rels:
                             relationships.append(rel)
                             seen_rels.add(rel_tuple)
+        elif self.snapshot is not None:
+            relationships = self.snapshot.relationships_touching(all_resource_ids)
         else:
             # Query Neo4j (original behavior)
             driver = GraphDatabase.driver(
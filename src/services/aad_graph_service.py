@@ -1,7 +1,9 @@
+import asyncio
 import logging
 import os
+import re
 import time
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set
 
 from azure.identity import ClientSecretCredential  # type: ignore[import-untyped]
 from kiota_abstractions.base_request_configuration import (
@@ -23,9 +25,68 @@ from msgraph.graph_service_client import (
     GraphServiceClient,  # type: ignore[import-untyped]
 )
 
+from .aad_identity_writer import AADIdentityWriter
+from .graph_batch_client import DEFAULT_GRAPH_ENDPOINT, GraphBatchClient
+
 logger = logging.getLogger(__name__)
 
 
+def _snake_case(name: str) -> str:
+    """Graph property name to Graph SDK attribute name (displayName -> display_name)."""
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+
+def _user_node_props(user: Dict[str, Any]) -> Dict[str, Any]:
+    """User node properties with IaC-standard fields."""
+    user_id = user.get("id")
+    display_name = user.get("displayName", user_id)
+    return {
+        "id": user_id,
+        "display_name": display_name,
+        "user_principal_name": user.get("userPrincipalName"),
+        "mail": user.get("mail"),
+        "type": "Microsoft.Graph/users",
+        "name": display_name,
+        "displayName": display_name,
+        "location": "global",
+        "resourceGroup": "identity-resources",
+    }
+
+
+def _group_node_props(group: Dict[str, Any]) -> Dict[str, Any]:
+    """IdentityGroup node properties with IaC-standard fields."""
+    group_id = group.get("id")
+    display_name = group.get("displayName", group_id)
+    return {
+        "id": group_id,
+        "display_name": display_name,
+        "mail": group.get("mail"),
+        "description": group.get("description"),
+        "type": "Microsoft.Graph/groups",
+        "name": display_name,
+        "displayName": display_name,
+        "location": "global",
+        "resourceGroup": "identity-resources",
+    }
+
+
+def _service_principal_node_props(sp: Dict[str, Any]) -> Dict[str, Any]:
+    """ServicePrincipal node properties with IaC-standard fields."""
+    sp_id = sp.get("id")
+    display_name = sp.get("displayName", sp_id)
+    return {
+        "id": sp_id,
+        "display_name": display_name,
+        "app_id": sp.get("appId"),
+        "service_principal_type": sp.get("servicePrincipalType"),
+        "type": "Microsoft.Graph/servicePrincipals",
+        "name": display_name,
+        "displayName": display_name,
+        "location": "global",
+        "resourceGroup": "identity-resources",
+    }
+
+
 class AADGraphService:
     """
     Service for fetching Azure AD users and groups from Microsoft Graph API.
@@ -34,11 +95,22 @@ class AADGraphService:
       - AZURE_CLIENT_ID
       - AZURE_CLIENT_SECRET
       - AZURE_TENANT_ID
+
+    Lookups by ID go through the Graph ``$batch`` endpoint. GRAPH_ENDPOINT
+    overrides the Graph base URL and AAD_BATCH_CONCURRENCY caps the number of
+    batches in flight.
     """
 
+    USER_SELECT = ["id", "displayName", "userPrincipalName", "mail"]
+    GROUP_SELECT = ["id", "displayName", "mail", "description"]
+    SERVICE_PRINCIPAL_SELECT = ["id", "displayName", "appId", "servicePrincipalType"]
+
     def __init__(self, use_mock: bool = False):
         self.use_mock = use_mock
         self.client: Optional[GraphServiceClient] = None
+        self.credential: Optional[ClientSecretCredential] = None
+        self.graph_endpoint = os.environ.get("GRAPH_ENDPOINT", DEFAULT_GRAPH_ENDPOINT)
+        self.batch_concurrency = int(os.environ.get("AAD_BATCH_CONCURRENCY", "4"))
 
         if not use_mock:
             self._initialize_graph_client()
@@ -64,6 +136,7 @@ class AADGraphService:
         credential = ClientSecretCredential(
             tenant_id=tenant_id, client_id=client_id, client_secret=client_secret
         )
+        self.credential = credential
 
         # Initialize Graph client with credential
         scopes = ["https://graph.microsoft.com/.default"]
@@ -110,6 +183,106 @@ class AADGraphService:
                 )
                 time.sleep(sleep_time)
 
+    async def _get_by_ids(
+        self, collection: str, ids: Set[str], select: List[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch directory objects by ID with batched ``id in (...)`` queries.
+
+        IDs that do not exist or cannot be read are logged by the batch client
+        and left out of the result.
+        """
+        if not self.client or self.credential is None:
+            raise RuntimeError("Graph client not initialized")
+
+        async with GraphBatchClient(
+            self.credential,
+            endpoint=self.graph_endpoint,
+            max_concurrent_batches=self.batch_concurrency,
+        ) as batch_client:
+            objects = await batch_client.get_by_ids(collection, ids, select)
+            logger.debug(f"Graph batch stats: {batch_client.get_stats()}")
+        return [{key: obj.get(key) for key in select} for obj in objects]
+
+    async def _iter_pages(self, collection: str) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yield one page of a Graph collection at a time, following ``@odata.nextLink``.
+
+        Each page request is retried independently, so a throttled page does not
+        restart the whole listing.
+
+        Args:
+            collection: "users", "groups" or "service_principals"
+        """
+        if not self.client:
+            raise RuntimeError("Graph client not initialized")
+
+        query_params_cls, select = {
+            "users": (
+                UsersRequestBuilder.UsersRequestBuilderGetQueryParameters,
+                self.USER_SELECT,
+            ),
+            "groups": (
+                GroupsRequestBuilder.GroupsRequestBuilderGetQueryParameters,
+                self.GROUP_SELECT,
+            ),
+            "service_principals": (
+                ServicePrincipalsRequestBuilder.ServicePrincipalsRequestBuilderGetQueryParameters,
+                self.SERVICE_PRINCIPAL_SELECT,
+            ),
+        }[collection]
+        request_config = RequestConfiguration(
+            query_parameters=query_params_cls(select=select)
+        )
+        builder = getattr(self.client, collection)
+
+        page = await self._retry_with_backoff(
+            lambda: builder.get(request_configuration=request_config)
+        )
+        fetched = 0
+        while page:
+            if page.value:
+                fetched += len(page.value)
+                yield [
+                    {key: getattr(obj, _snake_case(key), None) for key in select}
+                    for obj in page.value
+                ]
+            next_link = page.odata_next_link
+            if not next_link:
+                break
+            logger.info(
+                f"Fetching next page of {collection} (current count: {fetched})"
+            )
+            page = await self._retry_with_backoff(
+                lambda link=next_link: builder.with_url(link).get()
+            )
+
+    async def iter_user_pages(self) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield users one Graph page at a time."""
+        if self.use_mock:
+            yield await self.get_users()
+            return
+        async for page in self._iter_pages("users"):
+            yield page
+
+    async def iter_group_pages(self) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield groups one Graph page at a time."""
+        if self.use_mock:
+            yield await self.get_groups()
+            return
+        async for page in self._iter_pages("groups"):
+            yield page
+
+    async def iter_service_principal_pages(
+        self,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield service principals one Graph page at a time."""
+        if self.use_mock:
+            yield await self.get_service_principals()
+            return
+        async for page in self._iter_pages("service_principals"):
+            yield page
+
     async def get_users(self) -> List[Dict[str, Any]]:
         """
         Fetches users from Microsoft Graph API using SDK, handling pagination and throttling.
@@ -124,60 +297,9 @@ class AADGraphService:
         if not self.client:
             raise RuntimeError("Graph client not initialized")
 
-        async def fetch_users():
-            users = []
-
-            # Configure request to get all pages
-            query_params = UsersRequestBuilder.UsersRequestBuilderGetQueryParameters(
-                select=["id", "displayName", "userPrincipalName", "mail"]
-            )
-            request_config = RequestConfiguration(query_parameters=query_params)
-
-            # Get first page
-            if not self.client:
-                raise RuntimeError("Graph client not initialized")
-            users_page = await self.client.users.get(
-                request_configuration=request_config
-            )
-
-            if users_page and users_page.value:
-                for user in users_page.value:
-                    users.append(
-                        {
-                            "id": user.id,
-                            "displayName": user.display_name,
-                            "userPrincipalName": user.user_principal_name,
-                            "mail": user.mail,
-                        }
-                    )
-
-            # Handle pagination
-            while users_page and users_page.odata_next_link:
-                logger.info(
-                    f"Fetching next page of users (current count: {len(users)})"
-                )
-                if not self.client:
-                    raise RuntimeError("Graph client not initialized")
-                users_page = await self.client.users.with_url(
-                    users_page.odata_next_link
-                ).get()
-
-                if users_page and users_page.value:
-                    for user in users_page.value:
-                        users.append(
-                            {
-                                "id": user.id,
-                                "displayName": user.display_name,
-                                "userPrincipalName": user.user_principal_name,
-                                "mail": user.mail,
-                            }
-                        )
-
-            logger.info(str(f"Fetched {len(users)} users from Microsoft Graph"))
-            return users
-
-        result = await self._retry_with_backoff(fetch_users)
-        return result if result is not None else []
+        users = [user async for page in self._iter_pages("users") for user in page]
+        logger.info(str(f"Fetched {len(users)} users from Microsoft Graph"))
+        return users
 
     async def get_users_by_ids(self, user_ids: Set[str]) -> List[Dict[str, Any]]:
         """
@@ -203,33 +325,7 @@ class AADGraphService:
         if not self.client:
             raise RuntimeError("Graph client not initialized")
 
-        users = []
-
-        # Fetch each user individually (batch requests could be optimized later)
-        for user_id in user_ids:
-            try:
-
-                async def fetch_user(uid=user_id):
-                    if not self.client:
-                        raise RuntimeError("Graph client not initialized")
-                    user = await self.client.users.by_user_id(uid).get()
-                    if user:
-                        return {
-                            "id": user.id,
-                            "displayName": user.display_name,
-                            "userPrincipalName": user.user_principal_name,
-                            "mail": user.mail,
-                        }
-                    return None
-
-                user_data = await self._retry_with_backoff(fetch_user)
-                if user_data:
-                    users.append(user_data)
-            except ODataError as e:
-                # User not found or no permissions - log and continue
-                logger.warning(str(f"Could not fetch user {user_id}: {e}"))
-                continue
-
+        users = await self._get_by_ids("users", user_ids, self.USER_SELECT)
         logger.info(str(f"Fetched {len(users)} users out of {len(user_ids)} requested"))
         return users
 
@@ -247,60 +343,9 @@ class AADGraphService:
         if not self.client:
             raise RuntimeError("Graph client not initialized")
 
-        async def fetch_groups():
-            groups = []
-
-            # Configure request to get all pages
-            query_params = GroupsRequestBuilder.GroupsRequestBuilderGetQueryParameters(
-                select=["id", "displayName", "mail", "description"]
-            )
-            request_config = RequestConfiguration(query_parameters=query_params)
-
-            # Get first page
-            if not self.client:
-                raise RuntimeError("Graph client not initialized")
-            groups_page = await self.client.groups.get(
-                request_configuration=request_config
-            )
-
-            if groups_page and groups_page.value:
-                for group in groups_page.value:
-                    groups.append(
-                        {
-                            "id": group.id,
-                            "displayName": group.display_name,
-                            "mail": group.mail,
-                            "description": group.description,
-                        }
-                    )
-
-            # Handle pagination
-            while groups_page and groups_page.odata_next_link:
-                logger.info(
-                    f"Fetching next page of groups (current count: {len(groups)})"
-                )
-                if not self.client:
-                    raise RuntimeError("Graph client not initialized")
-                groups_page = await self.client.groups.with_url(
-                    groups_page.odata_next_link
-                ).get()
-
-                if groups_page and groups_page.value:
-                    for group in groups_page.value:
-                        groups.append(
-                            {
-                                "id": group.id,
-                                "displayName": group.display_name,
-                                "mail": group.mail,
-                                "description": group.description,
-                            }
-                        )
-
-            logger.info(str(f"Fetched {len(groups)} groups from Microsoft Graph"))
-            return groups
-
-        result = await self._retry_with_backoff(fetch_groups)
-        return result if result is not None else []
+        groups = [group async for page in self._iter_pages("groups") for group in page]
+        logger.info(str(f"Fetched {len(groups)} groups from Microsoft Graph"))
+        return groups
 
     async def get_groups_by_ids(self, group_ids: Set[str]) -> List[Dict[str, Any]]:
         """
@@ -326,33 +371,7 @@ class AADGraphService:
         if not self.client:
             raise RuntimeError("Graph client not initialized")
 
-        groups = []
-
-        # Fetch each group individually
-        for group_id in group_ids:
-            try:
-
-                async def fetch_group(gid=group_id):
-                    if not self.client:
-                        raise RuntimeError("Graph client not initialized")
-                    group = await self.client.groups.by_group_id(gid).get()
-                    if group:
-                        return {
-                            "id": group.id,
-                            "displayName": group.display_name,
-                            "mail": group.mail,
-                            "description": group.description,
-                        }
-                    return None
-
-                group_data = await self._retry_with_backoff(fetch_group)
-                if group_data:
-                    groups.append(group_data)
-            except ODataError as e:
-                # Group not found or no permissions - log and continue
-                logger.warning(str(f"Could not fetch group {group_id}: {e}"))
-                continue
-
+        groups = await self._get_by_ids("groups", group_ids, self.GROUP_SELECT)
         logger.info(
             str(f"Fetched {len(groups)} groups out of {len(group_ids)} requested")
         )
@@ -372,62 +391,13 @@ class AADGraphService:
         if not self.client:
             raise RuntimeError("Graph client not initialized")
 
-        async def fetch_service_principals():
-            service_principals = []
-
-            # Configure request
-            query_params = ServicePrincipalsRequestBuilder.ServicePrincipalsRequestBuilderGetQueryParameters(
-                select=["id", "displayName", "appId", "servicePrincipalType"]
-            )
-            request_config = RequestConfiguration(query_parameters=query_params)
-
-            # Get first page
-            if not self.client:
-                raise RuntimeError("Graph client not initialized")
-            sp_page = await self.client.service_principals.get(
-                request_configuration=request_config
-            )
-
-            if sp_page and sp_page.value:
-                for sp in sp_page.value:
-                    service_principals.append(
-                        {
-                            "id": sp.id,
-                            "displayName": sp.display_name,
-                            "appId": sp.app_id,
-                            "servicePrincipalType": sp.service_principal_type,
-                        }
-                    )
-
-            # Handle pagination
-            while sp_page and sp_page.odata_next_link:
-                logger.info(
-                    f"Fetching next page of service principals (current count: {len(service_principals)})"
-                )
-                if not self.client:
-                    raise RuntimeError("Graph client not initialized")
-                sp_page = await self.client.service_principals.with_url(
-                    sp_page.odata_next_link
-                ).get()
-
-                if sp_page and sp_page.value:
-                    for sp in sp_page.value:
-                        service_principals.append(
-                            {
-                                "id": sp.id,
-                                "displayName": sp.display_name,
-                                "appId": sp.app_id,
-                                "servicePrincipalType": sp.service_principal_type,
-                            }
-                        )
-
-            logger.info(
-                f"Fetched {len(service_principals)} service principals from Microsoft Graph"
-            )
-            return service_principals
-
-        result = await self._retry_with_backoff(fetch_service_principals)
-        return result if result is not None else []
+        service_principals = [
+            sp async for page in self._iter_pages("service_principals") for sp in page
+        ]
+        logger.info(
+            f"Fetched {len(service_principals)} service principals from Microsoft Graph"
+        )
+        return service_principals
 
     async def get_service_principals_by_ids(
         self, principal_ids: Set[str]
@@ -455,35 +425,9 @@ class AADGraphService:
         if not self.client:
             raise RuntimeError("Graph client not initialized")
 
-        service_principals = []
-
-        # Fetch each service principal individually
-        for sp_id in principal_ids:
-            try:
-
-                async def fetch_sp(spid=sp_id):
-                    if not self.client:
-                        raise RuntimeError("Graph client not initialized")
-                    sp = await self.client.service_principals.by_service_principal_id(
-                        spid
-                    ).get()
-                    if sp:
-                        return {
-                            "id": sp.id,
-                            "displayName": sp.display_name,
-                            "appId": sp.app_id,
-                            "servicePrincipalType": sp.service_principal_type,
-                        }
-                    return None
-
-                sp_data = await self._retry_with_backoff(fetch_sp)
-                if sp_data:
-                    service_principals.append(sp_data)
-            except ODataError as e:
-                # Service principal not found or no permissions - log and continue
-                logger.warning(str(f"Could not fetch service principal {sp_id}: {e}"))
-                continue
-
+        service_principals = await self._get_by_ids(
+            "servicePrincipals", principal_ids, self.SERVICE_PRINCIPAL_SELECT
+        )
         logger.info(
             f"Fetched {len(service_principals)} service principals out of {len(principal_ids)} requested"
         )
@@ -553,95 +497,41 @@ class AADGraphService:
     async def ingest_into_graph(self, db_ops: Any, dry_run: bool = False) -> None:
         """
         Ingests AAD users, groups, and service principals into the graph.
-        - Upserts User, IdentityGroup, and ServicePrincipal nodes.
-        - Upserts MEMBER_OF edges for group memberships.
+        - Streams each collection page by page and upserts User, IdentityGroup,
+          and ServicePrincipal nodes in UNWIND batches per label.
+        - Upserts MEMBER_OF edges for group memberships in batches.
         - db_ops: DatabaseOperations instance (from resource_processor).
         - dry_run: If True, skips DB operations (for tests).
         """
         logger.info("Starting AAD graph ingestion")
+        writer = AADIdentityWriter(db_ops, dry_run=dry_run)
+        groups: List[Dict[str, Any]] = []
+
+        async def ingest_users() -> None:
+            async for page in self.iter_user_pages():
+                writer.add_nodes("User", (_user_node_props(u) for u in page))
+
+        async def ingest_groups() -> None:
+            async for page in self.iter_group_pages():
+                groups.extend(g for g in page if g.get("id"))
+                writer.add_nodes("IdentityGroup", (_group_node_props(g) for g in page))
+
+        async def ingest_service_principals() -> None:
+            async for page in self.iter_service_principal_pages():
+                writer.add_nodes(
+                    "ServicePrincipal",
+                    (_service_principal_node_props(sp) for sp in page),
+                )
 
-        # Fetch users, groups, and service principals concurrently if not using mock
-        if self.use_mock:
-            users = await self.get_users()
-            groups = await self.get_groups()
-            service_principals = await self.get_service_principals()
-        else:
-            import asyncio
-
-            users, groups, service_principals = await asyncio.gather(
-                self.get_users(), self.get_groups(), self.get_service_principals()
-            )
-
-        logger.info(
-            f"Ingesting {len(users)} users, {len(groups)} groups, and {len(service_principals)} service principals"
+        # Stream the three collections concurrently; the writer is only
+        # touched from the event loop thread
+        await asyncio.gather(
+            ingest_users(), ingest_groups(), ingest_service_principals()
         )
 
-        # Upsert User nodes with IaC-standard properties
-        for user in users:
-            user_id = user.get("id")
-            if not user_id:
-                continue
-            display_name = user.get("displayName", user_id)
-            props = {
-                "id": user_id,
-                "display_name": display_name,
-                "user_principal_name": user.get("userPrincipalName"),
-                "mail": user.get("mail"),
-                "type": "Microsoft.Graph/users",
-                "name": display_name,
-                "displayName": display_name,
-                "location": "global",
-                "resourceGroup": "identity-resources",
-            }
-            if not dry_run:
-                db_ops.upsert_generic("User", "id", user_id, props)
-
-        # Upsert Group nodes with IaC-standard properties
-        for group in groups:
-            group_id = group.get("id")
-            if not group_id:
-                continue
-            display_name = group.get("displayName", group_id)
-            props = {
-                "id": group_id,
-                "display_name": display_name,
-                "mail": group.get("mail"),
-                "description": group.get("description"),
-                "type": "Microsoft.Graph/groups",
-                "name": display_name,
-                "displayName": display_name,
-                "location": "global",
-                "resourceGroup": "identity-resources",
-            }
-            if not dry_run:
-                db_ops.upsert_generic("IdentityGroup", "id", group_id, props)
-
-        # Upsert ServicePrincipal nodes with IaC-standard properties
-        for sp in service_principals:
-            sp_id = sp.get("id")
-            if not sp_id:
-                continue
-            display_name = sp.get("displayName", sp_id)
-            props = {
-                "id": sp_id,
-                "display_name": display_name,
-                "app_id": sp.get("appId"),
-                "service_principal_type": sp.get("servicePrincipalType"),
-                "type": "Microsoft.Graph/servicePrincipals",
-                "name": display_name,
-                "displayName": display_name,
-                "location": "global",
-                "resourceGroup": "identity-resources",
-            }
-            if not dry_run:
-                db_ops.upsert_generic("ServicePrincipal", "id", sp_id, props)
-
         # Upsert group memberships (MEMBER_OF edges)
         for group in groups:
-            group_id = group.get("id")
-            if not group_id:
-                continue
-
+            group_id = group["id"]
             logger.info(
                 f"Fetching memberships for group {group_id} ({group.get('displayName', 'Unknown')})"
             )
@@ -653,17 +543,14 @@ class AADGraphService:
                     continue
                 # Only create edge if member is a User or Group
                 odata_type = member.get("@odata.type", "")
-                if odata_type.endswith("user") or odata_type.endswith("group"):
-                    # MEMBER_OF: (User|IdentityGroup)-[:MEMBER_OF]->(IdentityGroup)
-                    if not dry_run:
-                        db_ops.create_generic_rel(
-                            src_id=member_id,
-                            rel_type="MEMBER_OF",
-                            tgt_key_value=group_id,
-                            tgt_label="IdentityGroup",
-                            tgt_key_prop="id",
-                        )
-
+                if odata_type.endswith("user"):
+                    writer.add_member_of("user", member_id, group_id)
+                elif odata_type.endswith("group"):
+                    writer.add_member_of("group", member_id, group_id)
+
+        # Nodes are flushed before edges so both ends exist
+        writer.flush()
+        writer.log_metrics()
         logger.info("Completed AAD graph ingestion")
 
     async def ingest_filtered_identities(
@@ -692,8 +579,6 @@ class AADGraphService:
         )
 
         # Fetch identities concurrently
-        import asyncio
-
         users, groups, service_principals = await asyncio.gather(
             self.get_users_by_ids(user_ids),
             self.get_groups_by_ids(group_ids),
@@ -705,65 +590,13 @@ class AADGraphService:
             f"{len(service_principals)} service principals"
         )
 
-        # Upsert User nodes with IaC-standard properties
-        for user in users:
-            user_id = user.get("id")
-            if not user_id:
-                continue
-            display_name = user.get("displayName", user_id)
-            props = {
-                "id": user_id,
-                "display_name": display_name,
-                "user_principal_name": user.get("userPrincipalName"),
-                "mail": user.get("mail"),
-                "type": "Microsoft.Graph/users",
-                "name": display_name,
-                "displayName": display_name,
-                "location": "global",
-                "resourceGroup": "identity-resources",
-            }
-            if not dry_run:
-                db_ops.upsert_generic("User", "id", user_id, props)
-
-        # Upsert Group nodes with IaC-standard properties
-        for group in groups:
-            group_id = group.get("id")
-            if not group_id:
-                continue
-            display_name = group.get("displayName", group_id)
-            props = {
-                "id": group_id,
-                "display_name": display_name,
-                "mail": group.get("mail"),
-                "description": group.get("description"),
-                "type": "Microsoft.Graph/groups",
-                "name": display_name,
-                "displayName": display_name,
-                "location": "global",
-                "resourceGroup": "identity-resources",
-            }
-            if not dry_run:
-                db_ops.upsert_generic("IdentityGroup", "id", group_id, props)
-
-        # Upsert ServicePrincipal nodes with IaC-standard properties
-        for sp in service_principals:
-            sp_id = sp.get("id")
-            if not sp_id:
-                continue
-            display_name = sp.get("displayName", sp_id)
-            props = {
-                "id": sp_id,
-                "display_name": display_name,
-                "app_id": sp.get("appId"),
-                "service_principal_type": sp.get("servicePrincipalType"),
-                "type": "Microsoft.Graph/servicePrincipals",
-                "name": display_name,
-                "displayName": display_name,
-                "location": "global",
-                "resourceGroup": "identity-resources",
-            }
-            if not dry_run:
-                db_ops.upsert_generic("ServicePrincipal", "id", sp_id, props)
+        writer = AADIdentityWriter(db_ops, dry_run=dry_run)
+        writer.add_nodes("User", (_user_node_props(u) for u in users))
+        writer.add_nodes("IdentityGroup", (_group_node_props(g) for g in groups))
+        writer.add_nodes(
+            "ServicePrincipal",
+            (_service_principal_node_props(sp) for sp in service_principals),
+        )
 
         # Fetch and create group memberships only for the filtered groups
         for group in groups:
@@ -784,37 +617,15 @@ class AADGraphService:
                 # Only create edge if member is in our filtered sets
                 odata_type = member.get("@odata.type", "")
                 if odata_type.endswith("user") and member_id in user_ids:
-                    # MEMBER_OF: User-[:MEMBER_OF]->IdentityGroup
-                    if not dry_run:
-                        db_ops.create_generic_rel(
-                            src_id=member_id,
-                            rel_type="MEMBER_OF",
-                            tgt_key_value=group_id,
-                            tgt_label="IdentityGroup",
-                            tgt_key_prop="id",
-                        )
+                    writer.add_member_of("user", member_id, group_id)
                 elif odata_type.endswith("group") and member_id in group_ids:
-                    # MEMBER_OF: IdentityGroup-[:MEMBER_OF]->IdentityGroup
-                    if not dry_run:
-                        db_ops.create_generic_rel(
-                            src_id=member_id,
-                            rel_type="MEMBER_OF",
-                            tgt_key_value=group_id,
-                            tgt_label="IdentityGroup",
-                            tgt_key_prop="id",
-                        )
+                    writer.add_member_of("group", member_id, group_id)
                 elif (
                     odata_type.endswith("servicePrincipal")
                     and member_id in service_principal_ids
                 ):
-                    # MEMBER_OF: ServicePrincipal-[:MEMBER_OF]->IdentityGroup
-                    if not dry_run:
-                        db_ops.create_generic_rel(
-                            src_id=member_id,
-                            rel_type="MEMBER_OF",
-                            tgt_key_value=group_id,
-                            tgt_label="IdentityGroup",
-                            tgt_key_prop="id",
-                        )
+                    writer.add_member_of("servicePrincipal", member_id, group_id)
 
+        writer.flush()
+        writer.log_metrics()
         logger.info("Completed filtered AAD graph ingestion")
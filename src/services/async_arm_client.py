@@ -0,0 +1,317 @@
+"""
+Async ARM Client
+
+Native asyncio client for Azure Resource Manager (ARM) REST calls used by the
+"aiohttp" discovery backend. All requests share a single aiohttp connection
+pool, are bounded by a per-host concurrency limit and back off adaptively when
+ARM throttles (HTTP 429/503 with ``Retry-After``) or when the
+``x-ms-ratelimit-remaining-*`` headers report that the read budget is nearly
+exhausted.
+
+The endpoint is configurable so the client can be exercised against a local
+mock ARM server in tests.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, Optional
+from urllib.parse import urlparse
+
+from ..exceptions import AzureDiscoveryError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ARM_ENDPOINT = "https://management.azure.com"
+ARM_SCOPE = "https://management.azure.com/.default"
+
+# Status codes that ARM uses to signal throttling or transient unavailability
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Prefix of the ARM headers that report the remaining request budget
+RATELIMIT_REMAINING_PREFIX = "x-ms-ratelimit-remaining-"
+
+
+class _HostState:
+    """Concurrency and back-off state shared by all requests to one host."""
+
+    def __init__(self, concurrency: int) -> None:
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.resume_at: float = 0.0
+        self.throttle_count: int = 0
+
+    def pause_until(self, resume_at: float) -> None:
+        """Extend the shared pause window; never shortens an existing pause."""
+        if resume_at > self.resume_at:
+            self.resume_at = resume_at
+
+    async def wait_if_paused(self) -> None:
+        delay = self.resume_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class AsyncArmClient:
+    """
+    Pooled, throttle-aware async client for ARM GET requests.
+
+    Usage::
+
+        async with AsyncArmClient(credential) as client:
+            resource = await client.get_resource_by_id(resource_id, "2023-03-01")
+    """
+
+    def __init__(
+        self,
+        credential: Any,
+        endpoint: str = DEFAULT_ARM_ENDPOINT,
+        max_connections: int = 100,
+        per_host_concurrency: int = 50,
+        max_retries: int = 3,
+        base_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        ratelimit_low_watermark: int = 50,
+        request_timeout: float = 60.0,
+    ) -> None:
+        """
+        Initialize the client.
+
+        Args:
+            credential: Azure credential exposing ``get_token`` (sync)
+            endpoint: ARM base URL (override to point at a mock server)
+            max_connections: Size of the shared connection pool
+            per_host_concurrency: Maximum in-flight requests per host
+            max_retries: Retries for throttled or transient failures
+            base_backoff: Initial back-off when no ``Retry-After`` is given
+            max_backoff: Upper bound for any single back-off
+            ratelimit_low_watermark: Remaining-request count below which
+                requests to a host are paced
+            request_timeout: Total timeout for a single request in seconds
+        """
+        self.credential = credential
+        self.endpoint = endpoint.rstrip("/")
+        self.max_connections = max(1, max_connections)
+        self.per_host_concurrency = max(1, per_host_concurrency)
+        self.max_retries = max(0, max_retries)
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.ratelimit_low_watermark = ratelimit_low_watermark
+        self.request_timeout = request_timeout
+
+        self._session: Optional[Any] = None
+        self._hosts: Dict[str, _HostState] = {}
+        self._token: Optional[str] = None
+        self._token_expires_on: float = 0.0
+        self._token_lock: Optional[asyncio.Lock] = None
+
+        # Counters surfaced through get_stats()
+        self.request_count = 0
+        self.retry_count = 0
+        self.throttled_count = 0
+
+    async def __aenter__(self) -> "AsyncArmClient":
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.close()
+
+    async def open(self) -> None:
+        """Create the shared aiohttp session (idempotent)."""
+        if self._session is not None:
+            return
+        import aiohttp
+
+        connector = aiohttp.TCPConnector(
+            limit=self.max_connections,
+            limit_per_host=self.per_host_concurrency,
+            ttl_dns_cache=300,
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.request_timeout),
+        )
+        self._token_lock = asyncio.Lock()
+
+    async def close(self) -> None:
+        """Close the shared session and release pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return request/retry/throttle counters for logging."""
+        return {
+            "requests": self.request_count,
+            "retries": self.retry_count,
+            "throttled": self.throttled_count,
+        }
+
+    async def _get_token(self) -> str:
+        """Return a cached bearer token, refreshing it shortly before expiry."""
+        assert self._token_lock is not None
+        async with self._token_lock:
+            if self._token and time.time() < self._token_expires_on - 300:
+                return self._token
+            # Credentials are synchronous; keep the event loop responsive
+            access_token = await asyncio.to_thread(self.credential.get_token, ARM_SCOPE)
+            self._token = access_token.token
+            self._token_expires_on = float(access_token.expires_on)
+            return self._token
+
+    def _host_state(self, url: str) -> _HostState:
+        host = urlparse(url).netloc
+        state = self._hosts.get(host)
+        if state is None:
+            state = _HostState(self.per_host_concurrency)
+            self._hosts[host] = state
+        return state
+
+    def _compute_backoff(self, headers: Any, attempt: int) -> float:
+        """Back-off in seconds, preferring the server's ``Retry-After`` hint."""
+        retry_after = headers.get("Retry-After") if headers else None
+        if retry_after:
+            try:
+                return min(float(retry_after), self.max_backoff)
+            except ValueError:
+                logger.debug(f"Ignoring non-numeric Retry-After header: {retry_after}")
+        return min(self.base_backoff * (2**attempt), self.max_backoff)
+
+    def _apply_ratelimit_headers(self, state: _HostState, headers: Any) -> None:
+        """Pace a host when ARM reports its remaining read budget is low."""
+        remaining: Optional[int] = None
+        for name, value in headers.items():
+            if not name.lower().startswith(RATELIMIT_REMAINING_PREFIX):
+                continue
+            try:
+                count = int(value)
+            except (TypeError, ValueError):
+                continue
+            remaining = count if remaining is None else min(remaining, count)
+
+        if remaining is None or remaining >= self.ratelimit_low_watermark:
+            return
+
+        # Scale the pause with how close we are to the limit
+        deficit = (self.ratelimit_low_watermark - remaining) / max(
+            1, self.ratelimit_low_watermark
+        )
+        state.pause_until(time.monotonic() + self.base_backoff * deficit)
+        logger.debug(f"ARM read budget low ({remaining} remaining); pacing requests")
+
+    async def get_json(
+        self, path_or_url: str, params: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Issue a GET request and return the decoded JSON body.
+
+        Args:
+            path_or_url: ARM path (``/subscriptions/...``) or absolute URL
+            params: Optional query parameters
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            AzureDiscoveryError: If the request fails after all retries
+        """
+        if self._session is None:
+            await self.open()
+        assert self._session is not None
+
+        url = (
+            path_or_url
+            if path_or_url.startswith(("http://", "https://"))
+            else f"{self.endpoint}{path_or_url}"
+        )
+        state = self._host_state(url)
+
+        for attempt in range(self.max_retries + 1):
+            await state.wait_if_paused()
+            token = await self._get_token()
+            async with state.semaphore:
+                self.request_count += 1
+                try:
+                    async with self._session.get(
+                        url,
+                        params=params,
+                        headers={"Authorization": f"Bearer {token}"},
+                    ) as response:
+                        self._apply_ratelimit_headers(state, response.headers)
+                        if response.status < 400:
+                            return await response.json(content_type=None)
+
+                        body = await response.text()
+                        if (
+                            response.status not in RETRYABLE_STATUS_CODES
+                            or attempt >= self.max_retries
+                        ):
+                            raise AzureDiscoveryError(
+                                f"ARM request failed with HTTP {response.status}: {body[:200]}",
+                                context={"url": url, "status": response.status},
+                            )
+
+                        delay = self._compute_backoff(response.headers, attempt)
+                        if response.status == 429:
+                            self.throttled_count += 1
+                            state.throttle_count += 1
+                            # Throttling is per host: pause every request to it
+                            state.pause_until(time.monotonic() + delay)
+                except AzureDiscoveryError:
+                    raise
+                except (asyncio.TimeoutError, OSError) as exc:
+                    if attempt >= self.max_retries:
+                        raise AzureDiscoveryError(
+                            f"ARM request failed: {exc}", context={"url": url}
+                        ) from exc
+                    delay = self._compute_backoff(None, attempt)
+                except Exception as exc:
+                    # aiohttp.ClientError and friends
+                    if attempt >= self.max_retries:
+                        raise AzureDiscoveryError(
+                            f"ARM request failed: {exc}", context={"url": url}
+                        ) from exc
+                    delay = self._compute_backoff(None, attempt)
+
+            self.retry_count += 1
+            logger.debug(
+                f"Retrying ARM request (attempt {attempt + 1}/{self.max_retries}) in {delay:.1f}s: {url}"
+            )
+            await asyncio.sleep(delay)
+
+        # Unreachable: the loop either returns or raises
+        raise AzureDiscoveryError("ARM request failed", context={"url": url})
+
+    async def list_paged(
+        self, path_or_url: str, params: Optional[Dict[str, str]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over all items of a paged ARM list response, following ``nextLink``.
+
+        Args:
+            path_or_url: ARM list path or absolute URL
+            params: Query parameters for the first page (``nextLink`` carries its own)
+        """
+        next_url: Optional[str] = path_or_url
+        next_params = params
+        while next_url:
+            page = await self.get_json(next_url, next_params)
+            for item in page.get("value", []) or []:
+                yield item
+            next_url = page.get("nextLink")
+            next_params = None
+
+    async def get_resource_by_id(
+        self, resource_id: str, api_version: str
+    ) -> Dict[str, Any]:
+        """Fetch a resource by its full ARM ID."""
+        return await self.get_json(resource_id, {"api-version": api_version})
+
+    async def get_provider(
+        self, subscription_id: str, provider_namespace: str
+    ) -> Dict[str, Any]:
+        """Fetch resource provider metadata (resource types and API versions)."""
+        return await self.get_json(
+            f"/subscriptions/{subscription_id}/providers/{provider_namespace}",
+            {"api-version": "2021-04-01"},
+        )
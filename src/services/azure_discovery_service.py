@@ -9,7 +9,8 @@ proper error handling and dependency injection patterns.
 import asyncio
 import logging
 import os
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+import threading
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
 
 from azure.core.credentials import AccessToken  # type: ignore[import-untyped]
 from azure.core.exceptions import AzureError  # type: ignore[import-untyped]
@@ -38,9 +39,16 @@ from ..utils.console_icons import (
     ICON_SUCCESS,
     ICON_WARNING,
 )
+from .async_arm_client import DEFAULT_ARM_ENDPOINT, AsyncArmClient
+from .discovery_budget import DiscoveryBudget
+from .relationship_dependency_collector import is_throttling_error
+from .resource_graph_hydrator import HydrationReport, ResourceGraphHydrator
 
 logger = logging.getLogger(__name__)
 
+# Receives batches of hydrated resources as discovery completes them
+ResourceSink = Callable[[List[Dict[str, Any]]], Awaitable[Any]]
+
 
 class StaticTokenCredential:
     """
@@ -107,6 +115,7 @@ class AzureDiscoveryService:
         authorization_client_factory: Optional[Callable[[Any, str], Any]] = None,
         monitor_client_factory: Optional[Callable[[Any, str], Any]] = None,
         change_feed_ingestion_service: Optional[Any] = None,
+        resource_graph_client_factory: Optional[Callable[[Any], Any]] = None,
     ) -> None:
         """
         Initialize the Azure Discovery Service.
@@ -119,6 +128,7 @@ class AzureDiscoveryService:
             authorization_client_factory: Optional factory for AuthorizationManagementClient (for testing)
             monitor_client_factory: Optional factory for MonitorManagementClient (for testing)
             change_feed_ingestion_service: Optional ChangeFeedIngestionService for delta ingestion (for testing)
+            resource_graph_client_factory: Optional factory for ResourceGraphClient (for testing)
         """
         self.config = config
 
@@ -151,6 +161,7 @@ class AzureDiscoveryService:
         )
         self.monitor_client_factory = monitor_client_factory or MonitorManagementClient
         self.change_feed_ingestion_service = change_feed_ingestion_service
+        self.resource_graph_client_factory = resource_graph_client_factory
         # Maximum retry attempts for transient Azure errors (default 3)
         self._max_retries: int = (
             getattr(getattr(config, "processing", None), "max_retries", 3) or 3
@@ -159,8 +170,32 @@ class AzureDiscoveryService:
         self._max_build_threads: int = (
             getattr(getattr(config, "processing", None), "max_build_threads", 20) or 20
         )
+        # Property hydration backend: "sdk" (threaded) or "aiohttp" (native async)
+        self._discovery_backend: str = str(
+            getattr(getattr(config, "processing", None), "discovery_backend", "sdk")
+            or "sdk"
+        )
+        # Property hydration mode: "arm" (per-resource GET) or "resource_graph" (bulk)
+        self._property_hydration: str = str(
+            getattr(getattr(config, "processing", None), "property_hydration", "arm")
+            or "arm"
+        )
+        # Optional global ARM budget shared across subscriptions and phases.
+        # Set by callers that discover many subscriptions concurrently.
+        self.budget: Optional[DiscoveryBudget] = None
+        # Resource Graph coverage reports keyed by subscription ID
+        self.hydration_reports: Dict[str, HydrationReport] = {}
         # Cache for resource provider API versions
         self._api_version_cache: Dict[str, str] = {}
+        # In-flight provider lookups so concurrent tasks share one request
+        self._api_version_lookups: Dict[str, asyncio.Future[str]] = {}
+        # fetch_resource_by_id state, used from worker threads: one resource
+        # client per subscription, and provider lookups serialized so
+        # concurrent fetches of one type resolve its API version once
+        self._resource_clients: Dict[str, Any] = {}
+        self._resource_clients_lock = threading.Lock()
+        self._api_version_misses: Set[str] = set()
+        self._api_version_lock = threading.Lock()
         self._subscriptions: List[Dict[str, Any]] = []
 
     @property
@@ -302,6 +337,7 @@ class AzureDiscoveryService:
         subscription_id: str,
         filter_config: Optional[FilterConfig] = None,
         resource_limit: Optional[int] = None,
+        resource_sink: Optional[ResourceSink] = None,
     ) -> List[Dict[str, Any]]:
         """
         Discover all resources in a specific subscription with optional parallel property fetching.
@@ -310,9 +346,16 @@ class AzureDiscoveryService:
             subscription_id: Azure subscription ID
             filter_config: Optional FilterConfig to filter resources
             resource_limit: Optional limit on number of resources to discover per subscription
+            resource_sink: Optional async callable that receives hydrated
+                resources in batches as soon as each batch completes. When
+                given, resources are not accumulated and an empty list is
+                returned; a slow sink applies back-pressure to discovery.
+                Batches may repeat if a discovery attempt is retried, so the
+                sink should de-duplicate on ID.
 
         Returns:
             List of resource dictionaries with full properties if max_build_threads > 0
+            (empty when resource_sink is given)
 
         Raises:
             AzureDiscoveryError: If resource discovery fails
@@ -327,39 +370,19 @@ class AzureDiscoveryService:
 
                 # Phase 1: List all resources (lightweight)
                 logger.info(f"{ICON_INFO} Phase 1: Listing all resource IDs...")
-                resource_basics: List[Dict[str, Any]] = []
-                pager = resource_client.resources.list()
-                for resource in pager:
-                    res: Any = resource
-                    res_id: Optional[str] = getattr(res, "id", None)
-
-                    # Parse resource ID to extract subscription_id and resource_group
-                    parsed_info = self._parse_resource_id(res_id) if res_id else {}
-
-                    resource_dict: Dict[str, Any] = {
-                        "id": res_id,
-                        "name": getattr(res, "name", None),
-                        "type": getattr(res, "type", None),
-                        "location": getattr(res, "location", None),
-                        "tags": dict(getattr(res, "tags", {}) or {}),
-                        # Start with existing properties if available (usually None from list),
-                        # will be populated by parallel fetching if enabled
-                        "properties": getattr(res, "properties", {}) or {},
-                        "subscription_id": parsed_info.get(
-                            "subscription_id", subscription_id
-                        ),
-                        "resource_group": parsed_info.get("resource_group"),
-                    }
-                    # Apply resource filter if provided
-                    if filter_config:
-                        if filter_config.should_include_resource(resource_dict):
-                            resource_basics.append(resource_dict)
-                        else:
-                            logger.debug(
-                                f"🚫 Filtering out resource: {resource_dict.get('name')} in RG {resource_dict.get('resource_group')}"
-                            )
-                    else:
-                        resource_basics.append(resource_dict)
+                if self.budget is not None:
+                    resource_basics = await self.budget.run_blocking(
+                        subscription_id,
+                        "listing",
+                        self._list_resource_basics,
+                        resource_client,
+                        subscription_id,
+                        filter_config,
+                    )
+                else:
+                    resource_basics = self._list_resource_basics(
+                        resource_client, subscription_id, filter_config
+                    )
 
                 logger.info(
                     f"{ICON_SUCCESS} Found {len(resource_basics)} resources in subscription {subscription_id} after filtering"
@@ -518,21 +541,70 @@ class AzureDiscoveryService:
                         f"Failed to discover diagnostic settings (continuing): {diagnostic_error}"
                     )
 
+                # Phase 1.9: Bulk property hydration through Resource Graph
+                # Only resources Resource Graph can't fully describe go on to Phase 2
+                bulk_hydrated: List[Dict[str, Any]] = []
+                if self._property_hydration == "resource_graph" and resource_basics:
+                    logger.info(
+                        f"{ICON_ITERATION} Phase 1.9: Bulk-hydrating {len(resource_basics)} resources via Resource Graph..."
+                    )
+                    hydrator = ResourceGraphHydrator(
+                        self.credential,
+                        resource_graph_client_factory=self.resource_graph_client_factory,
+                    )
+                    if self.budget is not None:
+                        async with self.budget.acquire(
+                            subscription_id, "resource_graph"
+                        ):
+                            (
+                                bulk_hydrated,
+                                resource_basics,
+                                report,
+                            ) = await hydrator.hydrate(
+                                resource_basics, [subscription_id]
+                            )
+                    else:
+                        (
+                            bulk_hydrated,
+                            resource_basics,
+                            report,
+                        ) = await hydrator.hydrate(resource_basics, [subscription_id])
+                    report.log_summary()
+                    self.hydration_reports[subscription_id] = report
+                    if resource_sink is not None and bulk_hydrated:
+                        await resource_sink(bulk_hydrated)
+                        bulk_hydrated = []
+                    if not resource_basics:
+                        return bulk_hydrated
+
                 # Phase 2: Fetch full properties in parallel if enabled
+                if self._discovery_backend == "aiohttp" and resource_basics:
+                    logger.info(
+                        f"{ICON_ITERATION} Phase 2: Fetching full properties for {len(resource_basics)} resources "
+                        "(native async backend, shared connection pool)..."
+                    )
+                    return bulk_hydrated + (
+                        await self._fetch_resources_with_properties_async(
+                            resource_basics, subscription_id, resource_sink
+                        )
+                    )
                 if self._max_build_threads > 0 and resource_basics:
                     logger.info(
                         f"{ICON_ITERATION} Phase 2: Fetching full properties for {len(resource_basics)} resources "
                         f"(max {self._max_build_threads} concurrent threads)..."
                     )
                     enriched_resources = await self._fetch_resources_with_properties(
-                        resource_basics, resource_client, subscription_id
+                        resource_basics, resource_client, subscription_id, resource_sink
                     )
-                    return enriched_resources
+                    return bulk_hydrated + enriched_resources
                 else:
                     logger.info(
                         "Skipping property enrichment (disabled or no resources)"
                     )
-                    return resource_basics
+                    if resource_sink is not None and resource_basics:
+                        await resource_sink(resource_basics)
+                        return []
+                    return bulk_hydrated + resource_basics
             except AzureError:
                 # Log and propagate so outer retry loop can handle
                 logger.exception("AzureError during resource discovery")
@@ -604,6 +676,94 @@ class AzureDiscoveryService:
                     ) from exc
         return []
 
+    async def _list_arm(
+        self,
+        subscription_id: str,
+        phase: str,
+        list_call: Callable[..., Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> List[Any]:
+        """
+        Read every page of an SDK list call, holding a budget token when set.
+
+        Under a budget each call runs on a worker thread with its own token,
+        as budget.run_blocking does, so discovery phases of other
+        subscriptions interleave with this one call by call. Without a budget
+        the pager is read inline.
+
+        Args:
+            subscription_id: Azure subscription ID
+            phase: Phase name for budget accounting
+            list_call: SDK method returning a pager
+            *args, **kwargs: Arguments for list_call
+
+        Returns:
+            Every item the pager yields
+        """
+
+        def read_all() -> List[Any]:
+            return list(list_call(*args, **kwargs))
+
+        if self.budget is None:
+            return read_all()
+        return await self.budget.run_blocking(subscription_id, phase, read_all)
+
+    def _list_resource_basics(
+        self,
+        resource_client: Any,
+        subscription_id: str,
+        filter_config: Optional[FilterConfig] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        List resources in a subscription (Phase 1) without full properties.
+
+        This is a blocking SDK pager walk; callers running many subscriptions
+        concurrently execute it in a worker thread.
+
+        Args:
+            resource_client: ResourceManagementClient instance
+            subscription_id: Azure subscription ID
+            filter_config: Optional FilterConfig to filter resources
+
+        Returns:
+            List of basic resource dictionaries
+        """
+        resource_basics: List[Dict[str, Any]] = []
+        pager = resource_client.resources.list()
+        for resource in pager:
+            res: Any = resource
+            res_id: Optional[str] = getattr(res, "id", None)
+
+            # Parse resource ID to extract subscription_id and resource_group
+            parsed_info = self._parse_resource_id(res_id) if res_id else {}
+
+            resource_dict: Dict[str, Any] = {
+                "id": res_id,
+                "name": getattr(res, "name", None),
+                "type": getattr(res, "type", None),
+                "location": getattr(res, "location", None),
+                "tags": dict(getattr(res, "tags", {}) or {}),
+                # Start with existing properties if available (usually None from list),
+                # will be populated by parallel fetching if enabled
+                "properties": getattr(res, "properties", {}) or {},
+                "subscription_id": parsed_info.get(
+                    "subscription_id", subscription_id
+                ),
+                "resource_group": parsed_info.get("resource_group"),
+            }
+            # Apply resource filter if provided
+            if filter_config:
+                if filter_config.should_include_resource(resource_dict):
+                    resource_basics.append(resource_dict)
+                else:
+                    logger.debug(
+                        f"🚫 Filtering out resource: {resource_dict.get('name')} in RG {resource_dict.get('resource_group')}"
+                    )
+            else:
+                resource_basics.append(resource_dict)
+        return resource_basics
+
     async def discover_resources_across_subscriptions(
         self,
         subscription_ids: List[str],
@@ -687,7 +847,11 @@ class AzureDiscoveryService:
             # List all role assignments in the subscription
             # This requires Reader + User Access Administrator roles or equivalent
             try:
-                pager = authorization_client.role_assignments.list_for_subscription()
+                pager = await self._list_arm(
+                    subscription_id,
+                    "role_assignments",
+                    authorization_client.role_assignments.list_for_subscription,
+                )
 
                 for assignment in pager:
                     # Extract role assignment properties
@@ -849,7 +1013,10 @@ class AzureDiscoveryService:
 
                     # Fetch role assignments scoped to this specific resource
                     # Azure API: GET {resourceId}/providers/Microsoft.Authorization/roleAssignments
-                    pager = authorization_client.role_assignments.list_for_resource(
+                    pager = await self._list_arm(
+                        subscription_id,
+                        "role_assignments",
+                        authorization_client.role_assignments.list_for_resource,
                         resource_group_name=resource.get("resource_group", ""),
                         resource_provider_namespace=self._extract_provider(
                             resource.get("type", "")
@@ -1033,7 +1200,13 @@ class AzureDiscoveryService:
                             continue
 
                         # Fetch subnets for this VNet
-                        subnets_pager = network_client.subnets.list(rg, vnet_name)
+                        subnets_pager = await self._list_arm(
+                            subscription_id,
+                            "child_resources",
+                            network_client.subnets.list,
+                            rg,
+                            vnet_name,
+                        )
 
                         for subnet in subnets_pager:
                             # FIX Issue #563: Include scan_id and tenant_id to ensure SCAN_SOURCE_NODE relationships are created
@@ -1088,10 +1261,12 @@ class AzureDiscoveryService:
                             continue
 
                         # Fetch runbooks for this account
-                        runbooks_pager = (
-                            automation_client.runbook.list_by_automation_account(
-                                rg, account_name
-                            )
+                        runbooks_pager = await self._list_arm(
+                            subscription_id,
+                            "child_resources",
+                            automation_client.runbook.list_by_automation_account,
+                            rg,
+                            account_name,
                         )
 
                         for runbook in runbooks_pager:
@@ -1150,8 +1325,12 @@ class AzureDiscoveryService:
                             continue
 
                         # Fetch virtual network links for this DNS zone
-                        links_pager = network_client.virtual_network_links.list(
-                            rg, zone_name
+                        links_pager = await self._list_arm(
+                            subscription_id,
+                            "child_resources",
+                            network_client.virtual_network_links.list,
+                            rg,
+                            zone_name,
                         )
 
                         for link in links_pager:
@@ -1212,8 +1391,12 @@ class AzureDiscoveryService:
                             continue
 
                         # Fetch extensions for this VM
-                        extensions_pager = (
-                            compute_client.virtual_machine_extensions.list(rg, vm_name)
+                        extensions_pager = await self._list_arm(
+                            subscription_id,
+                            "child_resources",
+                            compute_client.virtual_machine_extensions.list,
+                            rg,
+                            vm_name,
                         )
 
                         for ext in extensions_pager:
@@ -1276,8 +1459,12 @@ class AzureDiscoveryService:
                             continue
 
                         # Fetch databases for this server
-                        databases_pager = sql_client.databases.list_by_server(
-                            rg, server_name
+                        databases_pager = await self._list_arm(
+                            subscription_id,
+                            "child_resources",
+                            sql_client.databases.list_by_server,
+                            rg,
+                            server_name,
                         )
 
                         for db in databases_pager:
@@ -1347,8 +1534,12 @@ class AzureDiscoveryService:
 
                         # Fetch configurations for this server
                         try:
-                            configs_pager = pg_client.configurations.list_by_server(
-                                rg, server_name
+                            configs_pager = await self._list_arm(
+                                subscription_id,
+                                "child_resources",
+                                pg_client.configurations.list_by_server,
+                                rg,
+                                server_name,
                             )
 
                             for config in configs_pager:
@@ -1419,7 +1610,13 @@ class AzureDiscoveryService:
                         if not rg or not registry_name:
                             continue
 
-                        webhooks_pager = acr_client.webhooks.list(rg, registry_name)
+                        webhooks_pager = await self._list_arm(
+                            subscription_id,
+                            "child_resources",
+                            acr_client.webhooks.list,
+                            rg,
+                            registry_name,
+                        )
 
                         for webhook in webhooks_pager:
                             # FIX Issue #563: Include scan_id and tenant_id to ensure SCAN_SOURCE_NODE relationships are created
@@ -1482,8 +1679,12 @@ class AzureDiscoveryService:
 
                         # Discover Virtual Machines
                         try:
-                            vms_pager = devtest_client.virtual_machines.list(
-                                rg, lab_name
+                            vms_pager = await self._list_arm(
+                                subscription_id,
+                                "child_resources",
+                                devtest_client.virtual_machines.list,
+                                rg,
+                                lab_name,
                             )
 
                             for vm in vms_pager:
@@ -1507,8 +1708,13 @@ class AzureDiscoveryService:
 
                         # Discover Policies
                         try:
-                            policies_pager = devtest_client.policies.list(
-                                rg, lab_name, "default"
+                            policies_pager = await self._list_arm(
+                                subscription_id,
+                                "child_resources",
+                                devtest_client.policies.list,
+                                rg,
+                                lab_name,
+                                "default",
                             )
 
                             for policy in policies_pager:
@@ -1532,8 +1738,12 @@ class AzureDiscoveryService:
 
                         # Discover Schedules
                         try:
-                            schedules_pager = devtest_client.schedules.list(
-                                rg, lab_name
+                            schedules_pager = await self._list_arm(
+                                subscription_id,
+                                "child_resources",
+                                devtest_client.schedules.list,
+                                rg,
+                                lab_name,
                             )
 
                             for schedule in schedules_pager:
@@ -1557,8 +1767,12 @@ class AzureDiscoveryService:
 
                         # Discover Virtual Networks
                         try:
-                            vnets_pager = devtest_client.virtual_networks.list(
-                                rg, lab_name
+                            vnets_pager = await self._list_arm(
+                                subscription_id,
+                                "child_resources",
+                                devtest_client.virtual_networks.list,
+                                rg,
+                                lab_name,
                             )
 
                             for vnet in vnets_pager:
@@ -1712,8 +1926,11 @@ class AzureDiscoveryService:
 
                     # Fetch diagnostic settings for this resource
                     # Azure API: GET /subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/{resourceProviderNamespace}/{resourceType}/{resourceName}/providers/microsoft.insights/diagnosticSettings
-                    settings_pager = monitor_client.diagnostic_settings.list(
-                        resource_uri=resource_id
+                    settings_pager = await self._list_arm(
+                        subscription_id,
+                        "diagnostics",
+                        monitor_client.diagnostic_settings.list,
+                        resource_uri=resource_id,
                     )
 
                     for setting in settings_pager:
@@ -1990,9 +2207,18 @@ class AzureDiscoveryService:
 
                 # Fetch full resource details
                 # Note: Azure SDK handles retries automatically with exponential backoff
-                full_resource = await asyncio.to_thread(
-                    resource_client.resources.get_by_id, resource_id, api_version
-                )
+                if self.budget is not None:
+                    full_resource = await self.budget.run_blocking(
+                        resource.get("subscription_id") or "",
+                        "properties",
+                        resource_client.resources.get_by_id,
+                        resource_id,
+                        api_version,
+                    )
+                else:
+                    full_resource = await asyncio.to_thread(
+                        resource_client.resources.get_by_id, resource_id, api_version
+                    )
 
                 # Update resource with full properties
                 props = getattr(full_resource, "properties", {})
@@ -2043,6 +2269,7 @@ class AzureDiscoveryService:
         resources: List[Dict[str, Any]],
         resource_client: Any,
         subscription_id: str,
+        resource_sink: Optional[ResourceSink] = None,
     ) -> List[Dict[str, Any]]:
         """
         Fetch full properties for all resources in parallel.
@@ -2051,9 +2278,11 @@ class AzureDiscoveryService:
             resources: List of basic resource dictionaries
             resource_client: ResourceManagementClient instance
             subscription_id: Azure subscription ID
+            resource_sink: Optional async callable that receives each completed
+                batch instead of it being accumulated
 
         Returns:
-            List of resources with full properties
+            List of resources with full properties (empty when resource_sink is given)
         """
         # Create semaphore for concurrency control
         semaphore = asyncio.Semaphore(self._max_build_threads)
@@ -2069,6 +2298,8 @@ class AzureDiscoveryService:
         # Process in batches to manage memory for large subscriptions
         batch_size = 100
         all_resources = []
+        success_count = 0
+        total_count = 0
 
         for i in range(0, len(tasks), batch_size):
             batch = tasks[i : i + batch_size]
@@ -2076,6 +2307,7 @@ class AzureDiscoveryService:
             total_batches = (len(tasks) + batch_size - 1) // batch_size
 
             logger.info(str(f"Processing batch {batch_num}/{total_batches}"))
+            batch_resources = []
 
             try:
                 # Execute batch with timeout
@@ -2089,24 +2321,207 @@ class AzureDiscoveryService:
                     if isinstance(result, Exception):
                         logger.warning(str(f"Task failed with exception: {result}"))
                         # Still include the resource with empty properties
-                        all_resources.append({"properties": {}})
+                        batch_resources.append({"properties": {}})
                     elif result:
-                        all_resources.append(result)
+                        batch_resources.append(result)
 
             except asyncio.TimeoutError:
                 logger.error(str(f"Batch {batch_num} timed out after 5 minutes"))
                 # Add resources from timed-out batch with empty properties
                 for _ in batch:
-                    all_resources.append({"properties": {}})
+                    batch_resources.append({"properties": {}})
+
+            success_count += len([r for r in batch_resources if r.get("properties")])
+            total_count += len(batch_resources)
+            if resource_sink is not None:
+                await resource_sink(batch_resources)
+            else:
+                all_resources.extend(batch_resources)
 
-        success_count = len([r for r in all_resources if r.get("properties")])
         logger.info(
             f"{ICON_SUCCESS} Successfully fetched properties for {success_count} "
-            f"out of {len(all_resources)} resources"
+            f"out of {total_count} resources"
         )
 
         return all_resources
 
+    def _create_async_arm_client(self) -> AsyncArmClient:
+        """Create the pooled async ARM client from processing configuration."""
+        processing = getattr(self.config, "processing", None)
+        return AsyncArmClient(
+            self.credential,
+            endpoint=getattr(processing, "arm_endpoint", None)
+            or DEFAULT_ARM_ENDPOINT,
+            max_connections=getattr(processing, "arm_max_connections", 100) or 100,
+            per_host_concurrency=getattr(processing, "arm_per_host_concurrency", 50)
+            or 50,
+            max_retries=self._max_retries,
+        )
+
+    async def _get_api_version_async(
+        self, resource_id: str, subscription_id: str, arm_client: AsyncArmClient
+    ) -> str:
+        """
+        Async counterpart of _get_api_version_for_resource using the pooled client.
+
+        Concurrent callers for the same provider/type share a single lookup.
+
+        Args:
+            resource_id: Azure resource ID
+            subscription_id: Subscription used to query the provider
+            arm_client: Open AsyncArmClient
+
+        Returns:
+            API version string
+        """
+        if "/providers/Microsoft.Authorization/roleAssignments/" in resource_id:
+            return "2022-04-01"
+
+        parsed = self._parse_resource_id(resource_id)
+        if not parsed.get("provider") or not parsed.get("resource_type"):
+            return "2021-04-01"
+
+        provider = parsed["provider"]
+        resource_type = parsed["resource_type"]
+        cache_key = f"{provider}/{resource_type}"
+
+        if cache_key in self._api_version_cache:
+            return self._api_version_cache[cache_key]
+
+        pending = self._api_version_lookups.get(cache_key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self._api_version_lookups[cache_key] = future
+        api_version = "2021-04-01"
+        try:
+            provider_info = await arm_client.get_provider(subscription_id, provider)
+            for rt in provider_info.get("resourceTypes", []) or []:
+                if str(rt.get("resourceType", "")).lower() == resource_type.lower():
+                    versions = rt.get("apiVersions") or []
+                    if versions:
+                        api_version = versions[0]
+                    break
+        except Exception as e:
+            logger.warning(str(f"Failed to get API version for {cache_key}: {e}"))
+        finally:
+            self._api_version_cache[cache_key] = api_version
+            future.set_result(api_version)
+            self._api_version_lookups.pop(cache_key, None)
+        return api_version
+
+    async def _fetch_single_resource_async(
+        self,
+        resource: Dict[str, Any],
+        subscription_id: str,
+        arm_client: AsyncArmClient,
+    ) -> Dict[str, Any]:
+        """
+        Fetch full properties for a single resource with the async ARM client.
+
+        Concurrency and throttling are handled by the client, so no semaphore
+        is needed here.
+
+        Args:
+            resource: Basic resource dictionary
+            subscription_id: Azure subscription ID
+            arm_client: Open AsyncArmClient
+
+        Returns:
+            Resource dictionary with full properties
+        """
+        resource_id = resource.get("id")
+        if not resource_id:
+            return resource
+
+        # Bug #95: role assignments already have full properties from Phase 1.5
+        if resource.get("type", "") == "Microsoft.Authorization/roleAssignments":
+            return resource
+
+        try:
+            api_version = await self._get_api_version_async(
+                resource_id, subscription_id, arm_client
+            )
+            if self.budget is not None:
+                async with self.budget.acquire(subscription_id, "properties"):
+                    full_resource = await arm_client.get_resource_by_id(
+                        resource_id, api_version
+                    )
+            else:
+                full_resource = await arm_client.get_resource_by_id(
+                    resource_id, api_version
+                )
+            props = full_resource.get("properties", {})
+            resource["properties"] = props if isinstance(props, dict) else {}
+        except Exception as e:
+            logger.error(str(f"Failed to fetch {resource_id}: {str(e)[:200]}"))
+        return resource
+
+    async def _fetch_resources_with_properties_async(
+        self,
+        resources: List[Dict[str, Any]],
+        subscription_id: str,
+        resource_sink: Optional[ResourceSink] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch full properties for all resources using the native async backend.
+
+        All requests share one connection pool with per-host concurrency limits
+        and adaptive 429 back-off, instead of one thread (and connection) per
+        in-flight request.
+
+        Args:
+            resources: List of basic resource dictionaries
+            subscription_id: Azure subscription ID
+            resource_sink: Optional async callable that receives each completed
+                chunk instead of it being accumulated
+
+        Returns:
+            List of resources with full properties (empty when resource_sink is given)
+        """
+        # Bound the number of coroutines alive at once for very large subscriptions
+        chunk_size = 1000
+        all_resources: List[Dict[str, Any]] = []
+        success_count = 0
+
+        async with self._create_async_arm_client() as arm_client:
+            for i in range(0, len(resources), chunk_size):
+                chunk = resources[i : i + chunk_size]
+                results = await asyncio.gather(
+                    *[
+                        self._fetch_single_resource_async(
+                            resource, subscription_id, arm_client
+                        )
+                        for resource in chunk
+                    ],
+                    return_exceptions=True,
+                )
+                chunk_resources: List[Dict[str, Any]] = []
+                for resource, result in zip(chunk, results):
+                    if isinstance(result, BaseException):
+                        logger.warning(str(f"Task failed with exception: {result}"))
+                        chunk_resources.append(resource)
+                    else:
+                        chunk_resources.append(result)
+                success_count += len(
+                    [r for r in chunk_resources if r.get("properties")]
+                )
+                if resource_sink is not None:
+                    await resource_sink(chunk_resources)
+                else:
+                    all_resources.extend(chunk_resources)
+
+            stats = arm_client.get_stats()
+
+        logger.info(
+            f"{ICON_SUCCESS} Successfully fetched properties for {success_count} "
+            f"out of {len(resources)} resources "
+            f"({stats['requests']} requests, {stats['retries']} retries, "
+            f"{stats['throttled']} throttled)"
+        )
+        return all_resources
+
     def _parse_resource_id(self, resource_id: Optional[str]) -> Dict[str, str]:
         """
         Parse an Azure resource ID to extract subscription_id, resource_group, provider, and resource_type.
@@ -2196,6 +2611,8 @@ class AzureDiscoveryService:
 
         This method is used by RelationshipDependencyCollector to fetch
         cross-RG dependencies that weren't included in the initial filtered scan.
+        The blocking SDK calls run in a worker thread (holding a budget token
+        when a budget is set), so many fetches can be in flight at once.
 
         Args:
             resource_id: Full Azure resource ID (e.g., /subscriptions/.../resourceGroups/.../providers/...)
@@ -2203,62 +2620,91 @@ class AzureDiscoveryService:
         Returns:
             Resource dictionary with full properties, or None if fetch fails
 
+        Raises:
+            HttpResponseError: If ARM is still throttling (HTTP 429) after the
+                SDK's own retries, so callers can back off and retry
+
         Example:
             >>> resource_id = "/subscriptions/sub1/resourceGroups/rg-network/providers/Microsoft.Network/networkInterfaces/nic1"
             >>> resource = await service.fetch_resource_by_id(resource_id)
             >>> print(resource["name"])  # "nic1"
         """
-        try:
-            # Parse resource ID to extract subscription and resource group
-            parsed = self._parse_resource_id(resource_id)
-            subscription_id = parsed.get("subscription_id")
-            resource_group = parsed.get("resource_group")
-
-            if not subscription_id or not resource_group:
-                logger.warning(
-                    f"Could not parse subscription/RG from resource ID: {resource_id}"
-                )
-                return None
+        # Parse resource ID to extract subscription and resource group
+        parsed = self._parse_resource_id(resource_id)
+        subscription_id = parsed.get("subscription_id")
+        resource_group = parsed.get("resource_group")
 
-            # Create resource client for this subscription
-            resource_client = self.resource_client_factory(
-                self.credential, subscription_id
+        if not subscription_id or not resource_group:
+            logger.warning(
+                f"Could not parse subscription/RG from resource ID: {resource_id}"
             )
+            return None
 
-            # Get API version for this resource type
-            api_version = self._get_api_version_for_resource_id(
-                resource_client, resource_id
+        try:
+            if self.budget is not None:
+                return await self.budget.run_blocking(
+                    subscription_id,
+                    "dependencies",
+                    self._fetch_resource_by_id_sync,
+                    resource_id,
+                    subscription_id,
+                    resource_group,
+                )
+            return await asyncio.to_thread(
+                self._fetch_resource_by_id_sync,
+                resource_id,
+                subscription_id,
+                resource_group,
             )
+        except Exception as e:
+            if is_throttling_error(e):
+                raise
+            logger.warning(f"Failed to fetch resource by ID {resource_id}: {e}")
+            return None
 
-            if not api_version:
-                logger.warning(
-                    f"Could not determine API version for resource: {resource_id}"
+    def _fetch_resource_by_id_sync(
+        self, resource_id: str, subscription_id: str, resource_group: str
+    ) -> Optional[Dict[str, Any]]:
+        """Blocking part of fetch_resource_by_id, run in a worker thread."""
+        # Reuse one resource client per subscription
+        with self._resource_clients_lock:
+            resource_client = self._resource_clients.get(subscription_id)
+            if resource_client is None:
+                resource_client = self.resource_client_factory(
+                    self.credential, subscription_id
                 )
-                return None
+                self._resource_clients[subscription_id] = resource_client
 
-            # Fetch the resource using generic GET
-            resource = resource_client.resources.get_by_id(
-                resource_id, api_version=api_version
-            )
+        # Get API version for this resource type
+        api_version = self._get_api_version_for_resource_id(
+            resource_client, resource_id
+        )
 
-            # Convert to dictionary format consistent with discovery
-            resource_dict: Dict[str, Any] = {
-                "id": resource_id,
-                "name": getattr(resource, "name", None),
-                "type": getattr(resource, "type", None),
-                "location": getattr(resource, "location", None),
-                "tags": dict(getattr(resource, "tags", {}) or {}),
-                "properties": getattr(resource, "properties", {}) or {},
-                "subscription_id": subscription_id,
-                "resource_group": resource_group,
-            }
+        if not api_version:
+            logger.warning(
+                f"Could not determine API version for resource: {resource_id}"
+            )
+            return None
 
-            logger.debug(f"Successfully fetched resource: {resource_id}")
-            return resource_dict
+        # Fetch the resource using generic GET
+        resource = resource_client.resources.get_by_id(
+            resource_id, api_version=api_version
+        )
 
-        except Exception as e:
-            logger.warning(f"Failed to fetch resource by ID {resource_id}: {e}")
-            return None
+        # Convert to dictionary format consistent with discovery
+        resource_dict: Dict[str, Any] = {
+            "id": resource_id,
+            "name": getattr(resource, "name", None),
+            "type": getattr(resource, "type", None),
+            "location": getattr(resource, "location", None),
+            "tags": dict(getattr(resource, "tags", {}) or {}),
+            "properties": getattr(resource, "properties", {}) or {},
+            "subscription_id": subscription_id,
+            "resource_group": resource_group,
+        }
+
+        logger.debug(f"Successfully fetched resource: {resource_id}")
+        return resource_dict
 
     def _get_api_version_for_resource_id(
         self, resource_client: Any, resource_id: str
@@ -2266,7 +2712,10 @@ class AzureDiscoveryService:
         """
         Get the appropriate API version for a resource ID.
 
-        Uses caching to avoid repeated provider API calls.
+        Uses caching to avoid repeated provider API calls. Safe to call from
+        worker threads: lookups are serialized, so concurrent fetches of one
+        type query the provider once, and types the provider does not list
+        are remembered as misses.
 
         Args:
             resource_client: ResourceManagementClient instance
@@ -2289,9 +2738,22 @@ class AzureDiscoveryService:
                 if full_type in self._api_version_cache:
                     return self._api_version_cache[full_type]
 
-                # Fetch from Azure Resource Provider
-                try:
-                    provider = resource_client.providers.get(provider_namespace)
+                with self._api_version_lock:
+                    # Another thread may have resolved it while we waited
+                    if full_type in self._api_version_cache:
+                        return self._api_version_cache[full_type]
+                    if full_type in self._api_version_misses:
+                        return None
+
+                    # Fetch from Azure Resource Provider
+                    try:
+                        provider = resource_client.providers.get(provider_namespace)
+                    except Exception as e:
+                        logger.debug(
+                            f"Failed to get API version for {full_type} from provider: {e}"
+                        )
+                        return None
+
                     for resource_type_info in provider.resource_types:
                         if resource_type_info.resource_type == resource_type:
                             # Get latest non-preview API version
@@ -2309,10 +2771,7 @@ class AzureDiscoveryService:
                                 api_version = resource_type_info.api_versions[0]
                                 self._api_version_cache[full_type] = api_version
                                 return api_version
-                except Exception as e:
-                    logger.debug(
-                        f"Failed to get API version for {full_type} from provider: {e}"
-                    )
+                    self._api_version_misses.add(full_type)
 
         except (ValueError, IndexError) as e:
             logger.debug(f"Failed to parse resource type from ID {resource_id}: {e}")
@@ -2347,6 +2806,7 @@ def create_azure_discovery_service(
     authorization_client_factory: Optional[Callable[[Any, str], Any]] = None,
     monitor_client_factory: Optional[Callable[[Any, str], Any]] = None,
     change_feed_ingestion_service: Optional[Any] = None,
+    resource_graph_client_factory: Optional[Callable[[Any], Any]] = None,
 ) -> AzureDiscoveryService:
     """
     Factory function to create an Azure Discovery Service.
@@ -2359,6 +2819,7 @@ def create_azure_discovery_service(
         authorization_client_factory: Optional factory for AuthorizationManagementClient (for testing)
         monitor_client_factory: Optional factory for MonitorManagementClient (for testing)
         change_feed_ingestion_service: Optional ChangeFeedIngestionService for delta ingestion (for testing)
+        resource_graph_client_factory: Optional factory for ResourceGraphClient (for testing)
 
     Returns:
         AzureDiscoveryService: Configured service instance
@@ -2371,4 +2832,5 @@ def create_azure_discovery_service(
         authorization_client_factory=authorization_client_factory,
         monitor_client_factory=monitor_client_factory,
         change_feed_ingestion_service=change_feed_ingestion_service,
+        resource_graph_client_factory=resource_graph_client_factory,
     )
@@ -7,14 +7,20 @@ in the Neo4j graph. It is designed for efficient delta ingestion and minimal API
 
 Implements the requirements of Issue #54 and docs/ARCHITECTURE_IMPROVEMENTS.md section 1.
 
+Each sync pages through every change since the subscription's watermark,
+coalesces repeated changes to the same resource into its final state, and
+re-evaluates relationship rules only for the changed resources and their
+1-hop neighbours. watch() repeats the sync on an interval (``atg sync --watch``).
+
 Future: May be extended to support Event Grid for near-real-time updates.
 """
 
 import asyncio
 import logging
 import re
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from azure.identity import DefaultAzureCredential  # type: ignore[import-untyped]
 from azure.mgmt.resourcegraph import ResourceGraphClient  # type: ignore[import-untyped]
@@ -34,6 +40,46 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Resource Graph returns at most 1000 rows per page
+DEFAULT_PAGE_SIZE = 1000
+# IDs per UNWIND statement for deletes and relationship clean-up
+DEFAULT_WRITE_BATCH_SIZE = 1000
+DEFAULT_WATCH_INTERVAL = 300.0
+
+# IDs are passed lowercased; ARM IDs are case-insensitive, so a delete must
+# match the node however its ID was cased when it was written
+MARK_DELETED_QUERY = """
+MATCH (r:Resource)
+WHERE toLower(r.id) IN $ids
+SET r.state = 'deleted', r.updated_at = datetime()
+"""
+
+# Rule-derived edges leaving a changed resource (Original and Abstracted
+# node) are dropped before its rules are re-evaluated, so references removed
+# from the resource do not leave stale edges behind
+CLEAR_OUTGOING_RELATIONSHIPS_QUERY = """
+UNWIND $ids AS id
+MATCH (orig:Resource:Original {id: id})
+OPTIONAL MATCH (abs:Resource)-[:SCAN_SOURCE_NODE]->(orig)
+WITH [orig] + collect(abs) AS nodes
+UNWIND nodes AS node
+MATCH (node)-[rel]->(:Resource)
+WHERE NOT type(rel) IN ['CONTAINS', 'SCAN_SOURCE_NODE']
+DELETE rel
+"""
+
+# The changed resources plus every resource one relationship away
+CHANGED_AND_NEIGHBOURS_QUERY = """
+UNWIND $ids AS id
+MATCH (r:Resource:Original {id: id})
+OPTIONAL MATCH (r)-[rel]-(n:Resource:Original)
+WHERE type(rel) <> 'CONTAINS'
+WITH collect(DISTINCT r) + collect(DISTINCT n) AS nodes
+UNWIND nodes AS node
+WITH DISTINCT node
+RETURN node {.*} AS resource
+"""
+
 
 def validate_subscription_id(subscription_id: str) -> None:
     """
@@ -94,6 +140,96 @@ def validate_iso8601_timestamp(timestamp: str) -> None:
         ) from e
 
 
+def _parse_change_time(value: Any) -> datetime:
+    """Parse a change timestamp; missing or malformed values sort first."""
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        try:
+            text = str(value)
+            if text.endswith("Z"):
+                text = text[:-1] + "+00:00"
+            parsed = datetime.fromisoformat(text)
+        except (TypeError, ValueError):
+            return datetime.min.replace(tzinfo=timezone.utc)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def latest_change_time(changes: Iterable[Dict[str, Any]]) -> Optional[str]:
+    """
+    ISO8601 timestamp of the newest change, used as the next watermark.
+
+    Args:
+        changes: Change records with a changeTime
+
+    Returns:
+        The newest changeTime, or None if no change has one
+    """
+    times = [
+        _parse_change_time(change["changeTime"])
+        for change in changes
+        if change.get("changeTime")
+    ]
+    return max(times).isoformat() if times else None
+
+
+def coalesce_changes(
+    changes: Iterable[Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Reduce a stream of change records to the final state of each resource.
+
+    Changes are applied in changeTime order, input order breaking ties, and
+    resource IDs are compared case-insensitively as Azure does. A resource
+    created, updated and deleted within the window is only deleted; one
+    deleted and re-created is only upserted, from its latest state.
+
+    Args:
+        changes: Records with id, changeType, changeTime and after/before state
+
+    Returns:
+        Tuple of (resources to upsert, resource IDs to mark deleted)
+    """
+    latest: Dict[str, Tuple[Tuple[datetime, int], Dict[str, Any]]] = {}
+    for seq, change in enumerate(changes):
+        resource_id = change.get("id")
+        if not resource_id:
+            continue
+        key = str(resource_id).lower()
+        stamp = (_parse_change_time(change.get("changeTime")), seq)
+        if key not in latest or stamp >= latest[key][0]:
+            latest[key] = (stamp, change)
+
+    upserts: List[Dict[str, Any]] = []
+    deletes: List[str] = []
+    for _, change in latest.values():
+        if change.get("changeType") == "Delete":
+            deletes.append(change["id"])
+        else:
+            # Use 'after' state if present, else 'before'
+            resource = dict(change.get("after") or change.get("before") or {})
+            resource["id"] = change["id"]
+            upserts.append(resource)
+    return upserts, deletes
+
+
+def _complete_resource(resource: Dict[str, Any], subscription_id: str) -> None:
+    """Fill the scope fields processing needs from the resource ID."""
+    segments = resource["id"].strip("/").split("/")
+    lowered = [segment.lower() for segment in segments]
+    if "resourcegroups" in lowered:
+        rg_index = lowered.index("resourcegroups") + 1
+        if rg_index < len(segments):
+            resource.setdefault("resource_group", segments[rg_index])
+    resource.setdefault("subscription_id", subscription_id)
+    resource.setdefault("name", segments[-1])
+
+
+def _chunks(items: Sequence[str], size: int) -> Iterable[List[str]]:
+    for start in range(0, len(items), size):
+        yield list(items[start : start + size])
+
+
 class ChangeFeedIngestionService:
     """
     Service for ingesting resource change events and synchronizing the graph.
@@ -102,6 +238,7 @@ class ChangeFeedIngestionService:
     - Query Azure Resource Graph's resourcechanges and ARM Activity Logs for each subscription.
     - Maintain a LastSyncedTimestamp per subscription.
     - Upsert changed resources; mark deleted resources as state="deleted" (or optionally remove).
+    - Re-evaluate relationships for changed resources and their neighbours.
     - Designed for extension to support Event Grid in the future.
     """
 
@@ -110,6 +247,8 @@ class ChangeFeedIngestionService:
         config: Any,
         neo4j_session_manager: Any,
         resource_processing_service: Any = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        write_batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
     ):
         """
         Initialize the ChangeFeedIngestionService.
@@ -118,10 +257,108 @@ class ChangeFeedIngestionService:
             config: Configuration object with Azure and processing settings.
             neo4j_session_manager: Neo4j session manager for database operations.
             resource_processing_service: ResourceProcessingService for upserting resources.
+            page_size: Change records requested per Resource Graph page.
+            write_batch_size: Resource IDs per batched delete or clean-up statement.
         """
         self.config = config
         self.neo4j_session_manager = neo4j_session_manager
         self.resource_processing_service = resource_processing_service
+        self.page_size = max(1, page_size)
+        self.write_batch_size = max(1, write_batch_size)
+        # Created on first use and shared by every sync
+        self._credential: Any = None
+        self._resource_graph_client: Any = None
+
+    @property
+    def tenant_id(self) -> Optional[str]:
+        return getattr(self.config, "tenant_id", None)
+
+    def _get_credential(self) -> Any:
+        if self._credential is None:
+            self._credential = DefaultAzureCredential()
+        return self._credential
+
+    def _get_resource_graph_client(self) -> Any:
+        if self._resource_graph_client is None:
+            self._resource_graph_client = ResourceGraphClient(self._get_credential())
+        return self._resource_graph_client
+
+    def fetch_changes(
+        self, subscription_id: str, since_timestamp: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Read every Resource Graph change since the timestamp, following skip tokens.
+
+        Both arguments must already be validated; they are interpolated into
+        the KQL query.
+
+        Args:
+            subscription_id: Azure subscription ID
+            since_timestamp: ISO8601 timestamp; only later changes are returned
+
+        Returns:
+            Change records in changeTime order
+        """
+        client = self._get_resource_graph_client()
+        query = f"""
+        ResourceChanges
+        | where subscriptionId == '{subscription_id}'
+        | where changeTime > datetime('{since_timestamp}')
+        | project id, changeType, changeTime, after, before
+        | order by changeTime asc
+        """
+        changes: List[Dict[str, Any]] = []
+        skip_token: Optional[str] = None
+        while True:
+            query_options = QueryRequestOptions(
+                result_format="objectArray", top=self.page_size, skip_token=skip_token
+            )
+            query_request = QueryRequest(
+                query=query, subscriptions=[subscription_id], options=query_options
+            )
+            response = client.resources(query=query_request)
+            changes.extend(getattr(response, "data", None) or [])
+            skip_token = getattr(response, "skip_token", None)
+            if not skip_token:
+                return changes
+
+    def fetch_deletions(
+        self, subscription_id: str, since_timestamp: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Read resource deletions from the ARM Activity Log as change records.
+
+        Args:
+            subscription_id: Azure subscription ID
+            since_timestamp: ISO8601 timestamp; only later events are returned
+
+        Returns:
+            Delete change records (id, changeType, changeTime)
+        """
+        if MonitorClient is None:
+            logger.warning(
+                "MonitorClient is not available; skipping activity log deletion detection."
+            )
+            return []
+        monitor_client = MonitorClient(self._get_credential(), subscription_id)
+        activity_logs = monitor_client.activity_logs.list(
+            filter=f"eventTimestamp ge '{since_timestamp}' and (operationName/value eq 'Microsoft.Resources/subscriptions/resourceGroups/delete' or operationName/value eq 'Microsoft.Resources/delete')"
+        )
+        deletions = []
+        for event in activity_logs:
+            resource_id = getattr(event, "resource_id", None) or getattr(
+                event, "resourceId", None
+            )
+            if resource_id:
+                event_time = getattr(event, "event_timestamp", None)
+                deletions.append(
+                    {
+                        "id": resource_id,
+                        "changeType": "Delete",
+                        "changeTime": event_time.isoformat() if event_time else None,
+                    }
+                )
+        return deletions
 
     async def ingest_changes_for_subscription(
         self, subscription_id: str, since_timestamp: Optional[str] = None
@@ -129,12 +366,16 @@ class ChangeFeedIngestionService:
         """
         Ingest resource changes for a given subscription since the provided timestamp.
 
+        The subscription's watermark advances to the newest change applied,
+        and only when every page was read, so no change is skipped after a
+        failed or partial read.
+
         Args:
             subscription_id: Azure subscription ID (must be valid GUID format).
             since_timestamp: ISO8601 timestamp string; if None, will use stored LastSyncedTimestamp.
 
         Returns:
-            List of upserted or marked resources.
+            List of upserted resources.
 
         Raises:
             ValueError: If subscription_id or since_timestamp have invalid formats
@@ -161,89 +402,51 @@ class ChangeFeedIngestionService:
         # 3. Validate timestamp to prevent KQL injection
         validate_iso8601_timestamp(since_timestamp)
 
-        # 4. Query Azure Resource Graph for resourcechanges
-        # Note: After validation, these values are safe to use in query construction
-        credential = DefaultAzureCredential()
-        resourcegraph_client = ResourceGraphClient(credential)
-        query = f"""
-        ResourceChanges
-        | where subscriptionId == '{subscription_id}'
-        | where changeTime > datetime('{since_timestamp}')
-        | project id, changeType, changeTime, after, before
-        """
+        # 4. Read all changes and deletions (blocking SDK calls, off the loop)
         try:
-            query_options = QueryRequestOptions(result_format="objectArray")
-            query_request = QueryRequest(
-                query=query, subscriptions=[subscription_id], options=query_options
+            changes = await asyncio.to_thread(
+                self.fetch_changes, subscription_id, since_timestamp
             )
-            response = resourcegraph_client.resources(query=query_request)
-            changes = response.data if hasattr(response, "data") else []
         except Exception as e:
             logger.error(str(f"Failed to query Resource Graph: {e}"))
-            changes = []
-
-        # 5. Query ARM Activity Logs for deletions
-        deleted_ids = set()
-        if MonitorClient is not None:
-            monitor_client = MonitorClient(credential, subscription_id)
-            try:
-                activity_logs = monitor_client.activity_logs.list(
-                    filter=f"eventTimestamp ge '{since_timestamp}' and (operationName/value eq 'Microsoft.Resources/subscriptions/resourceGroups/delete' or operationName/value eq 'Microsoft.Resources/delete')"
-                )
-                for event in activity_logs:
-                    resource_id = getattr(event, "resourceId", None)
-                    if resource_id:
-                        deleted_ids.add(resource_id)
-            except Exception as e:
-                logger.error(str(f"Failed to query Activity Logs: {e}"))
-        else:
-            logger.warning(
-                "MonitorClient is not available; skipping activity log deletion detection."
+            return []
+        try:
+            changes += await asyncio.to_thread(
+                self.fetch_deletions, subscription_id, since_timestamp
             )
+        except Exception as e:
+            # Nothing is applied, so the next sync re-reads from the same watermark
+            logger.error(str(f"Failed to query Activity Logs: {e}"))
+            return []
 
-        # 6. Upsert changed resources
-        upsert_resources = []
-        for change in changes:
-            if change.get("changeType") == "Delete":
-                deleted_ids.add(change.get("id"))
-            else:
-                # Use 'after' state if present, else 'before'
-                resource_data = change.get("after") or change.get("before") or {}
-                resource_data["id"] = change.get("id")
-                upsert_resources.append(resource_data)
+        # 5. One final state per resource
+        upsert_resources, deleted_ids = coalesce_changes(changes)
+        for resource in upsert_resources:
+            _complete_resource(resource, subscription_id)
 
-        # Use ResourceProcessingService to upsert
+        # 6. Upsert changed resources without their relationship rules, which
+        # run once below for them and their neighbours
         if self.resource_processing_service and upsert_resources:
-            import asyncio
-
-            asyncio.get_event_loop()
-            try:
-                asyncio.run(
-                    self.resource_processing_service.process_resources(upsert_resources)
-                )
-            except RuntimeError:
-                # Already in event loop (e.g., in test), use create_task
-                import nest_asyncio  # type: ignore[import-untyped]
-
-                nest_asyncio.apply()
-                asyncio.get_event_loop().create_task(
-                    self.resource_processing_service.process_resources(upsert_resources)
-                )
+            await self.resource_processing_service.process_resources(
+                upsert_resources,
+                tenant_id=self.tenant_id,
+                evaluate_relationships=False,
+            )
+            await asyncio.to_thread(
+                self.refresh_relationships, [r["id"] for r in upsert_resources]
+            )
 
         # 7. Mark deleted resources as state="deleted"
-        with self.neo4j_session_manager.session() as session:
-            for resource_id in deleted_ids:
-                session.run(
-                    "MATCH (r:Resource {id: $id}) SET r.state = 'deleted', r.updated_at = datetime()",
-                    {"id": resource_id},
-                )
+        self.mark_deleted(deleted_ids)
 
-        # 8. Update LastSyncedTimestamp
-        now_iso = datetime.datetime.now(datetime.timezone.utc).isoformat()
-        self.set_last_synced_timestamp(subscription_id, now_iso)
+        # 8. Advance the watermark to the newest change applied
+        self.set_last_synced_timestamp(
+            subscription_id, latest_change_time(changes) or since_timestamp
+        )
 
         logger.info(
-            f"Delta ingestion complete for subscription {subscription_id}. Upserted: {len(upsert_resources)}, Deleted: {len(deleted_ids)}"
+            f"Delta ingestion complete for subscription {subscription_id}. "
+            f"Changes: {len(changes)}, Upserted: {len(upsert_resources)}, Deleted: {len(deleted_ids)}"
         )
         return upsert_resources
 
@@ -325,3 +528,106 @@ class ChangeFeedIngestionService:
             f"Completed change feed ingestion for {len(all_results)} subscriptions"
         )
         return all_results
+
+    def _run_batched(self, query: str, ids: Sequence[str]) -> List[Any]:
+        """Run an UNWIND $ids query over write_batch_size chunks of IDs."""
+        records: List[Any] = []
+        with self.neo4j_session_manager.session() as session:
+            for chunk in _chunks(ids, self.write_batch_size):
+                records.extend(session.run(query, {"ids": chunk}))
+        return records
+
+    def mark_deleted(self, resource_ids: Sequence[str]) -> int:
+        """
+        Mark resources as state="deleted" in batches.
+
+        IDs are matched case-insensitively, as coalesce_changes groups them.
+
+        Args:
+            resource_ids: IDs of deleted resources
+
+        Returns:
+            Number of IDs submitted
+        """
+        if resource_ids:
+            self._run_batched(
+                MARK_DELETED_QUERY, sorted({rid.lower() for rid in resource_ids})
+            )
+        return len(resource_ids)
+
+    def refresh_relationships(self, resource_ids: Sequence[str]) -> int:
+        """
+        Re-evaluate relationship rules for changed resources and their neighbours.
+
+        The changed resources and every resource one relationship away are
+        read from the graph before the changed resources' outgoing rule edges
+        are dropped; the rules then run over just that set.
+
+        Args:
+            resource_ids: IDs of resources that changed
+
+        Returns:
+            Number of relationships queued by the rules
+        """
+        if not resource_ids or not self.resource_processing_service:
+            return 0
+        resources = [
+            dict(record["resource"])
+            for record in self._run_batched(CHANGED_AND_NEIGHBOURS_QUERY, resource_ids)
+        ]
+        if not resources:
+            return 0
+        self._run_batched(CLEAR_OUTGOING_RELATIONSHIPS_QUERY, resource_ids)
+        logger.info(
+            f"Re-evaluating relationships for {len(resource_ids)} changed resources "
+            f"({len(resources)} including neighbours)"
+        )
+        return self.resource_processing_service.reevaluate_relationships(
+            resources, tenant_id=self.tenant_id
+        )
+
+    def list_subscription_ids(self) -> List[str]:
+        """IDs of the subscriptions in the graph."""
+        with self.neo4j_session_manager.session() as session:
+            result = session.run("MATCH (s:Subscription) RETURN s.id AS id")
+            return [record["id"] for record in result if record["id"]]
+
+    async def watch(
+        self,
+        subscription_ids: Optional[Sequence[str]] = None,
+        interval: float = DEFAULT_WATCH_INTERVAL,
+        max_cycles: Optional[int] = None,
+    ) -> None:
+        """
+        Sync every subscription, then repeat every interval seconds.
+
+        Subscriptions are synced one at a time so Resource Graph throttling
+        applies to one query stream; a failing subscription is logged and
+        retried on the next cycle from its unchanged watermark.
+
+        Args:
+            subscription_ids: Subscriptions to sync (default: all in the graph)
+            interval: Seconds from the start of one cycle to the next
+            max_cycles: Stop after this many cycles (default: run until cancelled)
+        """
+        cycle = 0
+        while max_cycles is None or cycle < max_cycles:
+            cycle += 1
+            started = time.monotonic()
+            targets = list(subscription_ids or self.list_subscription_ids())
+            upserted = 0
+            for subscription_id in targets:
+                try:
+                    upserted += len(
+                        await self.ingest_changes_for_subscription(subscription_id)
+                    )
+                except Exception as e:
+                    logger.error(f"Error syncing subscription {subscription_id}: {e}")
+            elapsed = time.monotonic() - started
+            logger.info(
+                f"Sync cycle {cycle}: {len(targets)} subscriptions, "
+                f"{upserted} resources upserted in {elapsed:.1f}s"
+            )
+            if max_cycles is not None and cycle >= max_cycles:
+                break
+            await asyncio.sleep(max(0.0, interval - elapsed))
@@ -4,6 +4,7 @@ This package provides modular components for Azure cost tracking and analysis.
 Each module handles a specific responsibility:
 - data_fetch: Azure Cost API integration
 - storage: Neo4j persistence
+- columnar: Month-partitioned columnar store for daily cost rows
 - query: Cost data retrieval
 - forecasting: Linear regression predictions
 - anomaly_detection: Z-score analysis
@@ -11,6 +12,7 @@ Each module handles a specific responsibility:
 """
 
 from .anomaly_detection import AnomalyDetector
+from .columnar import ColumnarCostStore, CostSeries
 from .data_fetch import CostDataFetcher
 from .forecasting import CostForecaster
 from .query import CostQueryService
@@ -19,9 +21,11 @@ from .storage import CostStorageService
 
 __all__ = [
     "AnomalyDetector",
+    "ColumnarCostStore",
     "CostDataFetcher",
     "CostForecaster",
     "CostQueryService",
     "CostReporter",
+    "CostSeries",
     "CostStorageService",
 ]
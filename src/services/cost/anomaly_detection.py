@@ -2,13 +2,22 @@
 
 This module provides anomaly detection capabilities for cost data
 using statistical Z-score method to identify unusual spending patterns.
+Statistics are computed with NumPy across all resources at once on a
+CostSeries matrix.
 """
 
 import statistics
 from datetime import date
-from typing import Optional
+from typing import Optional, Union
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 from ...models.cost_models import CostAnomaly, SeverityLevel
+from .columnar import CostSeries
+
+# Upper bound on window elements materialized per chunk of resources
+_WINDOW_CHUNK_ELEMENTS = 4_000_000
 
 
 class DataValidationError(Exception):
@@ -37,14 +46,15 @@ class AnomalyDetector:
 
     def detect_anomalies(
         self,
-        costs_by_resource: dict[str, list[tuple[date, float]]],
+        costs_by_resource: Union[dict[str, list[tuple[date, float]]], CostSeries],
         sensitivity: float = 2.0,
     ) -> list[CostAnomaly]:
         """Detect cost anomalies using Z-score method.
 
         Args:
-            costs_by_resource: Daily costs by resource as dict mapping
-                               resource IDs to list of (date, cost) tuples
+            costs_by_resource: Daily costs by resource, either as a dict
+                               mapping resource IDs to list of (date, cost)
+                               tuples or as a CostSeries matrix
             sensitivity: Z-score threshold (default: 2.0 standard deviations)
 
         Returns:
@@ -56,45 +66,35 @@ class AnomalyDetector:
         if sensitivity <= 0:
             raise DataValidationError("sensitivity must be positive")
 
-        anomalies = []
-
-        for resource_id, daily_costs in costs_by_resource.items():
-            if len(daily_costs) < self.MIN_LOOKBACK_DAYS:
-                continue
-
-            costs = [cost for _, cost in daily_costs]
-
-            # Calculate mean and standard deviation
-            mean_cost = statistics.mean(costs)
-            std_cost = statistics.stdev(costs) if len(costs) > 1 else 0
-
-            if std_cost == 0:
-                continue
-
-            # Detect anomalies
-            for cost_date, actual_cost in daily_costs:
-                z_score = abs((actual_cost - mean_cost) / std_cost)
-
-                if z_score > sensitivity:
-                    deviation_percent = ((actual_cost - mean_cost) / mean_cost) * 100
-                    severity = self._determine_severity(z_score)
-
-                    anomalies.append(
-                        CostAnomaly(
-                            resource_id=resource_id,
-                            date=cost_date,
-                            expected_cost=mean_cost,
-                            actual_cost=actual_cost,
-                            deviation_percent=deviation_percent,
-                            severity=severity,
-                        )
-                    )
-
-        return anomalies
+        series = self._as_series(costs_by_resource)
+        rows = np.flatnonzero(series.lengths >= self.MIN_LOOKBACK_DAYS)
+        if not len(rows):
+            return []
+
+        values = series.values[rows]
+        mean = np.nanmean(values, axis=1)
+        std = np.nanstd(values, axis=1, ddof=1)
+        # Constant series have no spread; compare exactly rather than
+        # trusting a floating-point std of zero
+        varying = np.nanmax(values, axis=1) > np.nanmin(values, axis=1)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z_scores = np.abs((values - mean[:, None]) / std[:, None])
+        hits = (z_scores > sensitivity) & varying[:, None]
+
+        return self._build_anomalies(
+            series,
+            rows,
+            hits,
+            expected=np.broadcast_to(mean[:, None], values.shape),
+            actual=values,
+            z_scores=z_scores,
+            offset=0,
+        )
 
     def detect_anomalies_with_window(
         self,
-        costs_by_resource: dict[str, list[tuple[date, float]]],
+        costs_by_resource: Union[dict[str, list[tuple[date, float]]], CostSeries],
         window_size: int = 7,
         sensitivity: float = 2.0,
     ) -> list[CostAnomaly]:
@@ -104,7 +104,7 @@ class AnomalyDetector:
         of previous days, which can better detect recent changes in spending patterns.
 
         Args:
-            costs_by_resource: Daily costs by resource
+            costs_by_resource: Daily costs by resource (dict or CostSeries)
             window_size: Size of rolling window in days
             sensitivity: Z-score threshold
 
@@ -119,44 +119,94 @@ class AnomalyDetector:
         if sensitivity <= 0:
             raise DataValidationError("sensitivity must be positive")
 
-        anomalies = []
-
-        for resource_id, daily_costs in costs_by_resource.items():
-            if len(daily_costs) < window_size + 1:
-                continue
+        series = self._as_series(costs_by_resource)
+        eligible = np.flatnonzero(series.lengths >= window_size + 1)
+        if not len(eligible):
+            return []
 
-            for i in range(window_size, len(daily_costs)):
-                # Get rolling window
-                window_costs = [daily_costs[j][1] for j in range(i - window_size, i)]
-                current_date, current_cost = daily_costs[i]
+        # Windows are materialized per chunk to bound memory on wide matrices
+        width = series.values.shape[1]
+        chunk = max(1, _WINDOW_CHUNK_ELEMENTS // (width * window_size))
 
-                # Calculate statistics for window
-                mean_cost = statistics.mean(window_costs)
-                std_cost = (
-                    statistics.stdev(window_costs) if len(window_costs) > 1 else 0
+        anomalies = []
+        for begin in range(0, len(eligible), chunk):
+            rows = eligible[begin : begin + chunk]
+            values = series.values[rows]
+            # windows[:, k] covers days k .. k + window_size - 1 and is
+            # compared against day k + window_size
+            windows = sliding_window_view(values, window_size, axis=1)[:, :-1]
+            current = values[:, window_size:]
+
+            mean = windows.mean(axis=2)
+            std = windows.std(axis=2, ddof=1)
+            varying = windows.max(axis=2) > windows.min(axis=2)
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                z_scores = np.abs((current - mean) / std)
+            hits = (z_scores > sensitivity) & varying
+
+            anomalies.extend(
+                self._build_anomalies(
+                    series,
+                    rows,
+                    hits,
+                    expected=mean,
+                    actual=current,
+                    z_scores=z_scores,
+                    offset=window_size,
                 )
+            )
 
-                if std_cost == 0:
-                    continue
+        return anomalies
 
-                # Check if current cost is anomalous
-                z_score = abs((current_cost - mean_cost) / std_cost)
+    @staticmethod
+    def _as_series(
+        costs_by_resource: Union[dict[str, list[tuple[date, float]]], CostSeries],
+    ) -> CostSeries:
+        if isinstance(costs_by_resource, CostSeries):
+            return costs_by_resource
+        return CostSeries.from_mapping(costs_by_resource)
 
-                if z_score > sensitivity:
-                    deviation_percent = ((current_cost - mean_cost) / mean_cost) * 100
-                    severity = self._determine_severity(z_score)
+    def _build_anomalies(
+        self,
+        series: CostSeries,
+        rows: np.ndarray,
+        hits: np.ndarray,
+        expected: np.ndarray,
+        actual: np.ndarray,
+        z_scores: np.ndarray,
+        offset: int,
+    ) -> list[CostAnomaly]:
+        """Turn a boolean hit matrix into CostAnomaly objects.
 
-                    anomalies.append(
-                        CostAnomaly(
-                            resource_id=resource_id,
-                            date=current_date,
-                            expected_cost=mean_cost,
-                            actual_cost=current_cost,
-                            deviation_percent=deviation_percent,
-                            severity=severity,
-                        )
-                    )
+        Args:
+            series: Series the matrices were computed from
+            rows: Series row for each matrix row
+            hits: Anomaly mask
+            expected: Expected cost per cell
+            actual: Observed cost per cell
+            z_scores: Z-score per cell
+            offset: Day index of matrix column 0 within the series
 
+        Returns:
+            List of CostAnomaly objects in resource, then date, order
+        """
+        anomalies = []
+        for i, j in zip(*np.nonzero(hits)):
+            row = rows[i]
+            expected_cost = float(expected[i, j])
+            actual_cost = float(actual[i, j])
+            anomalies.append(
+                CostAnomaly(
+                    resource_id=series.resource_ids[row],
+                    date=date.fromordinal(int(series.days[row, j + offset])),
+                    expected_cost=expected_cost,
+                    actual_cost=actual_cost,
+                    deviation_percent=((actual_cost - expected_cost) / expected_cost)
+                    * 100,
+                    severity=self._determine_severity(float(z_scores[i, j])),
+                )
+            )
         return anomalies
 
     def calculate_z_score(
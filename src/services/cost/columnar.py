@@ -0,0 +1,443 @@
+"""Columnar cost storage module.
+
+This module keeps daily cost rows outside the graph, in month partitions
+of NumPy column files that are memory-mapped on read. Forecasting and
+anomaly detection consume the data as dense per-resource matrices
+(CostSeries) so they can be vectorized across all resources at once,
+while the graph only holds monthly aggregates.
+
+Partition layout (one directory per month, e.g. ``2026-01/``)::
+
+    index.json          resource vocabulary (id, subscription, group, tags, ...)
+    resource.npy        int32   row -> vocabulary index
+    day.npy             int32   row -> date ordinal
+    actual_cost.npy     float64
+    amortized_cost.npy  float64
+    usage_quantity.npy  float64
+
+Rows are unique per (resource, day) - the latest write wins, matching the
+MERGE semantics of the graph store - and sorted by resource then day.
+Descriptive attributes (service, meter, tags, ...) are kept per resource in
+the vocabulary rather than per row.
+"""
+
+import json
+import os
+import shutil
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import numpy as np
+
+from ...models.cost_models import CostData
+
+VALUE_COLUMNS = ("actual_cost", "amortized_cost", "usage_quantity")
+
+# Date ordinals fit comfortably below this; used to build (resource, day) keys
+_DAY_SPAN = 10_000_000
+
+
+def month_key(day: date) -> str:
+    """Partition name (``YYYY-MM``) holding a day's rows."""
+    return f"{day.year:04d}-{day.month:02d}"
+
+
+def _in_scope(resource: dict[str, Any], scope: str) -> bool:
+    """Scope filter matching CostQueryService's Cypher filters."""
+    if "/subscriptions/" in scope:
+        subscription_id = scope.split("/subscriptions/")[1].split("/")[0]
+        return resource.get("subscription_id") == subscription_id
+    return resource["resource_id"].startswith(scope)
+
+
+@dataclass
+class CostFrame:
+    """Cost rows loaded from one or more month partitions.
+
+    Attributes:
+        resources: Resource vocabulary; ``resource`` indexes into it
+        resource: Vocabulary index per row
+        day: Date ordinal per row
+        actual_cost: Actual cost per row
+        amortized_cost: Amortized cost per row
+        usage_quantity: Usage quantity per row
+    """
+
+    resources: list[dict[str, Any]]
+    resource: np.ndarray
+    day: np.ndarray
+    actual_cost: np.ndarray
+    amortized_cost: np.ndarray
+    usage_quantity: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.resource)
+
+    @classmethod
+    def empty(cls) -> "CostFrame":
+        return cls(
+            resources=[],
+            resource=np.empty(0, dtype=np.int32),
+            day=np.empty(0, dtype=np.int32),
+            actual_cost=np.empty(0),
+            amortized_cost=np.empty(0),
+            usage_quantity=np.empty(0),
+        )
+
+
+@dataclass
+class CostSeries:
+    """Daily costs of many resources as one left-aligned matrix.
+
+    Row ``i`` holds the ``lengths[i]`` observed daily costs of
+    ``resource_ids[i]`` in date order, padded with NaN (values) and -1
+    (days) up to the longest series.
+
+    Attributes:
+        resource_ids: Resource ID per row
+        days: Date ordinals, shape (resources, max_days)
+        values: Daily costs, shape (resources, max_days)
+        lengths: Number of observed days per row
+    """
+
+    resource_ids: list[str]
+    days: np.ndarray
+    values: np.ndarray
+    lengths: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.resource_ids)
+
+    @classmethod
+    def from_mapping(
+        cls, costs_by_resource: dict[str, list[tuple[date, float]]]
+    ) -> "CostSeries":
+        """Build a series matrix from a resource -> [(date, cost)] mapping."""
+        resource_ids = list(costs_by_resource)
+        lengths = np.array(
+            [len(costs_by_resource[r]) for r in resource_ids], dtype=np.int64
+        )
+        width = int(lengths.max()) if len(lengths) else 0
+        days = np.full((len(resource_ids), width), -1, dtype=np.int64)
+        values = np.full((len(resource_ids), width), np.nan)
+        for row, resource_id in enumerate(resource_ids):
+            daily_costs = costs_by_resource[resource_id]
+            if daily_costs:
+                days[row, : len(daily_costs)] = [d.toordinal() for d, _ in daily_costs]
+                values[row, : len(daily_costs)] = [c for _, c in daily_costs]
+        return cls(resource_ids, days, values, lengths)
+
+    @classmethod
+    def from_frame(cls, frame: CostFrame) -> "CostSeries":
+        """Build a series matrix of actual costs from loaded rows."""
+        order = np.lexsort((frame.day, frame.resource))
+        resource = frame.resource[order]
+        present, rows, lengths = np.unique(
+            resource, return_inverse=True, return_counts=True
+        )
+        starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        rank = np.arange(len(resource)) - starts[rows]
+        width = int(lengths.max()) if len(lengths) else 0
+
+        days = np.full((len(present), width), -1, dtype=np.int64)
+        values = np.full((len(present), width), np.nan)
+        days[rows, rank] = frame.day[order]
+        values[rows, rank] = frame.actual_cost[order]
+        resource_ids = [frame.resources[i]["resource_id"] for i in present]
+        return cls(resource_ids, days, values, lengths)
+
+    def dates(self, row: int) -> list[date]:
+        """Observed dates of one row."""
+        return [date.fromordinal(int(d)) for d in self.days[row, : self.lengths[row]]]
+
+    def to_mapping(self) -> dict[str, list[tuple[date, float]]]:
+        """Convert back to a resource -> [(date, cost)] mapping."""
+        return {
+            resource_id: list(
+                zip(
+                    self.dates(row),
+                    self.values[row, : self.lengths[row]].tolist(),
+                )
+            )
+            for row, resource_id in enumerate(self.resource_ids)
+        }
+
+
+class ColumnarCostStore:
+    """Month-partitioned columnar store for daily cost rows.
+
+    Partitions are rewritten whole on append (into a temporary directory
+    that is swapped into place) and memory-mapped on read.
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        """Initialize the columnar cost store.
+
+        Args:
+            root: Directory holding the month partitions
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def months(self) -> list[str]:
+        """List stored months (``YYYY-MM``) in order."""
+        return sorted(
+            p.name
+            for p in self.root.iterdir()
+            if p.is_dir() and not p.name.startswith(".") and (p / "index.json").exists()
+        )
+
+    def append(self, costs: list[CostData]) -> int:
+        """Write cost rows, replacing existing rows for the same resource and day.
+
+        Args:
+            costs: CostData rows to store
+
+        Returns:
+            Number of rows written
+        """
+        by_month: dict[str, list[CostData]] = {}
+        for cost in costs:
+            by_month.setdefault(month_key(cost.date), []).append(cost)
+
+        for month, month_costs in by_month.items():
+            self._append_month(month, month_costs)
+        return len(costs)
+
+    def load(
+        self,
+        scope: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        subscription_ids: Optional[list[str]] = None,
+    ) -> CostFrame:
+        """Load rows within a scope and date range.
+
+        Args:
+            scope: Optional Azure scope (subscription or resource ID prefix)
+            start_date: Optional first day (inclusive)
+            end_date: Optional last day (inclusive)
+            subscription_ids: Optional subscription filter
+
+        Returns:
+            CostFrame with a vocabulary covering the loaded rows
+        """
+        first = month_key(start_date) if start_date else None
+        last = month_key(end_date) if end_date else None
+        lo = start_date.toordinal() if start_date else None
+        hi = end_date.toordinal() if end_date else None
+
+        resources: list[dict[str, Any]] = []
+        positions: dict[str, int] = {}
+        parts: list[tuple[np.ndarray, np.ndarray, list[np.ndarray]]] = []
+
+        for month in self.months():
+            if (first and month < first) or (last and month > last):
+                continue
+            vocabulary, columns = self._read_month(month)
+
+            wanted = np.array(
+                [
+                    (scope is None or _in_scope(r, scope))
+                    and (
+                        subscription_ids is None
+                        or r.get("subscription_id") in subscription_ids
+                    )
+                    for r in vocabulary
+                ],
+                dtype=bool,
+            )
+            mask = wanted[columns["resource"]] if len(wanted) else np.zeros(0, bool)
+            if lo is not None:
+                mask &= columns["day"] >= lo
+            if hi is not None:
+                mask &= columns["day"] <= hi
+            if not mask.any():
+                continue
+
+            # Remap partition-local vocabulary indices to the frame vocabulary
+            remap = np.empty(len(vocabulary), dtype=np.int32)
+            for local, resource in enumerate(vocabulary):
+                index = positions.get(resource["resource_id"])
+                if index is None:
+                    index = positions[resource["resource_id"]] = len(resources)
+                    resources.append(resource)
+                else:
+                    resources[index] = resource
+                remap[local] = index
+
+            parts.append(
+                (
+                    remap[columns["resource"][mask]],
+                    np.asarray(columns["day"][mask]),
+                    [np.asarray(columns[c][mask]) for c in VALUE_COLUMNS],
+                )
+            )
+
+        if not parts:
+            return CostFrame.empty()
+
+        return CostFrame(
+            resources,
+            np.concatenate([p[0] for p in parts]),
+            np.concatenate([p[1] for p in parts]),
+            *(np.concatenate([p[2][i] for p in parts]) for i in range(3)),
+        )
+
+    def series(self, scope: str, start_date: date, end_date: date) -> CostSeries:
+        """Load daily actual costs per resource as a CostSeries."""
+        return CostSeries.from_frame(self.load(scope, start_date, end_date))
+
+    def daily_totals(
+        self, scope: str, start_date: date, end_date: date
+    ) -> list[tuple[date, float]]:
+        """Sum actual costs per day within a scope.
+
+        Returns:
+            List of (date, cost) tuples for days with data, in date order
+        """
+        frame = self.load(scope, start_date, end_date)
+        days, inverse = np.unique(frame.day, return_inverse=True)
+        totals = np.bincount(inverse, weights=frame.actual_cost, minlength=len(days))
+        return [(date.fromordinal(int(d)), float(t)) for d, t in zip(days, totals)]
+
+    def monthly_totals(
+        self, months: list[str], resource_ids: Optional[set[str]] = None
+    ) -> list[dict[str, Any]]:
+        """Aggregate each resource's costs per month.
+
+        Args:
+            months: Months (``YYYY-MM``) to aggregate
+            resource_ids: Optional resources to restrict the result to
+
+        Returns:
+            One dict per (resource, month) with summed value columns, day
+            count and the resource's descriptive attributes
+        """
+        totals = []
+        for month in months:
+            vocabulary, columns = self._read_month(month)
+            count = len(vocabulary)
+            days = np.bincount(columns["resource"], minlength=count)
+            sums = {
+                c: np.bincount(columns["resource"], weights=columns[c], minlength=count)
+                for c in VALUE_COLUMNS
+            }
+            for index, resource in enumerate(vocabulary):
+                if (
+                    resource_ids is not None
+                    and resource["resource_id"] not in resource_ids
+                ):
+                    continue
+                if not days[index]:
+                    continue
+                totals.append(
+                    {
+                        **resource,
+                        "month": month,
+                        "days": int(days[index]),
+                        **{c: float(sums[c][index]) for c in VALUE_COLUMNS},
+                    }
+                )
+        return totals
+
+    def _partition(self, month: str) -> Path:
+        return self.root / month
+
+    def _read_month(
+        self, month: str
+    ) -> tuple[list[dict[str, Any]], dict[str, np.ndarray]]:
+        partition = self._partition(month)
+        with open(partition / "index.json") as f:
+            vocabulary = json.load(f)["resources"]
+        columns = {
+            name: np.load(partition / f"{name}.npy", mmap_mode="r")
+            for name in ("resource", "day", *VALUE_COLUMNS)
+        }
+        return vocabulary, columns
+
+    def _append_month(self, month: str, costs: list[CostData]) -> None:
+        if (self._partition(month) / "index.json").exists():
+            vocabulary, existing = self._read_month(month)
+            columns = {name: np.array(col) for name, col in existing.items()}
+        else:
+            vocabulary = []
+            columns = {
+                "resource": np.empty(0, dtype=np.int32),
+                "day": np.empty(0, dtype=np.int32),
+                **{c: np.empty(0) for c in VALUE_COLUMNS},
+            }
+
+        positions = {r["resource_id"]: i for i, r in enumerate(vocabulary)}
+        new_resource = np.empty(len(costs), dtype=np.int32)
+        for row, cost in enumerate(costs):
+            attributes = {
+                "resource_id": cost.resource_id,
+                "subscription_id": cost.subscription_id,
+                "resource_group": cost.resource_group,
+                "service_name": cost.service_name,
+                "meter_category": cost.meter_category,
+                "meter_name": cost.meter_name,
+                "currency": cost.currency,
+                "tags": cost.tags,
+            }
+            index = positions.get(cost.resource_id)
+            if index is None:
+                index = positions[cost.resource_id] = len(vocabulary)
+                vocabulary.append(attributes)
+            else:
+                vocabulary[index] = attributes
+            new_resource[row] = index
+
+        resource = np.concatenate([columns["resource"], new_resource])
+        day = np.concatenate(
+            [
+                columns["day"],
+                np.array([c.date.toordinal() for c in costs], dtype=np.int32),
+            ]
+        )
+        values = {
+            c: np.concatenate(
+                [columns[c], np.array([getattr(cost, c) for cost in costs], float)]
+            )
+            for c in VALUE_COLUMNS
+        }
+
+        # Keep the last write per (resource, day); np.unique also sorts by key
+        keys = resource.astype(np.int64) * _DAY_SPAN + day
+        _, last = np.unique(keys[::-1], return_index=True)
+        keep = len(keys) - 1 - last
+
+        self._write_month(
+            month,
+            vocabulary,
+            {
+                "resource": resource[keep],
+                "day": day[keep],
+                **{c: values[c][keep] for c in VALUE_COLUMNS},
+            },
+        )
+
+    def _write_month(
+        self,
+        month: str,
+        vocabulary: list[dict[str, Any]],
+        columns: dict[str, np.ndarray],
+    ) -> None:
+        partition = self._partition(month)
+        staging = self.root / f".{month}.tmp"
+        retired = self.root / f".{month}.old"
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir()
+
+        for name, column in columns.items():
+            np.save(staging / f"{name}.npy", column)
+        with open(staging / "index.json", "w") as f:
+            json.dump({"month": month, "resources": vocabulary}, f)
+
+        if partition.exists():
+            os.replace(partition, retired)
+        os.replace(staging, partition)
+        shutil.rmtree(retired, ignore_errors=True)
@@ -2,13 +2,17 @@
 
 This module provides cost forecasting capabilities using
 linear regression on historical cost data with confidence intervals.
+Regressions are solved in closed form with NumPy, so a CostSeries matrix
+of many resources is fitted in one batch.
 """
 
-import statistics
 from datetime import date, timedelta
 from typing import Optional
 
+import numpy as np
+
 from ...models.cost_models import ForecastData
+from .columnar import CostSeries
 
 
 class DataValidationError(Exception):
@@ -58,52 +62,109 @@ class CostForecaster:
                 f"{len(historical_costs)} days (minimum {self.MIN_HISTORICAL_DAYS})"
             )
 
-        # Prepare data for linear regression
-        x = list(range(len(historical_costs)))
-        y = [cost for _, cost in historical_costs]
+        series = CostSeries.from_mapping({scope: historical_costs})
+        return self.generate_forecasts_batch(series, forecast_days).get(scope, [])
 
-        # Calculate linear regression parameters
-        n = len(x)
-        sum_x = sum(x)
-        sum_y = sum(y)
-        sum_xy = sum(xi * yi for xi, yi in zip(x, y))
-        sum_x2 = sum(xi * xi for xi in x)
-
-        # Calculate slope and intercept
-        slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x)
-        intercept = (sum_y - slope * sum_x) / n
+    def generate_forecasts_batch(
+        self,
+        series: CostSeries,
+        forecast_days: int,
+    ) -> dict[str, list[ForecastData]]:
+        """Generate forecasts for every row of a CostSeries at once.
 
-        # Calculate standard error for confidence intervals
-        predictions = [slope * xi + intercept for xi in x]
-        residuals = [yi - pred for yi, pred in zip(y, predictions)]
-        std_error = statistics.stdev(residuals) if len(residuals) > 1 else 0
+        Each row is fitted independently against its own day index, as
+        generate_forecasts does for a single series. Rows with fewer than
+        MIN_HISTORICAL_DAYS observations are skipped.
 
-        # Generate forecasts
-        forecasts = []
-        last_date = historical_costs[-1][0]
+        Args:
+            series: Daily costs of many scopes (usually resources)
+            forecast_days: Number of days to forecast
 
-        for i in range(1, forecast_days + 1):
-            forecast_date = last_date + timedelta(days=i)
-            x_value = len(historical_costs) + i - 1
-            predicted_cost = max(0, slope * x_value + intercept)
+        Returns:
+            Dictionary mapping each forecast row's resource ID to its
+            ForecastData list; the resource ID is also the forecast scope
 
-            # Calculate confidence interval (95% = ~2 std errors)
-            confidence_range = 2 * std_error
-            confidence_lower = max(0, predicted_cost - confidence_range)
-            confidence_upper = predicted_cost + confidence_range
+        Raises:
+            DataValidationError: If forecast_days is invalid
+        """
+        if forecast_days <= 0:
+            raise DataValidationError("forecast_days must be positive")
 
-            forecasts.append(
+        rows = np.flatnonzero(series.lengths >= self.MIN_HISTORICAL_DAYS)
+        if not len(rows):
+            return {}
+
+        values = series.values[rows]
+        n = series.lengths[rows].astype(float)
+        x = np.arange(values.shape[1], dtype=float)
+        observed = x[None, :] < n[:, None]
+
+        slope, intercept = self._fit_lines(x, values, n, observed)
+
+        # Sample standard deviation of the residuals
+        residuals = np.where(
+            observed, values - (slope[:, None] * x + intercept[:, None]), 0.0
+        )
+        residual_mean = residuals.sum(axis=1) / n
+        squared = np.where(observed, (residuals - residual_mean[:, None]) ** 2, 0.0)
+        std_error = np.sqrt(squared.sum(axis=1) / (n - 1))
+
+        # Forecast day i of a row sits at x = n + i - 1
+        steps = np.arange(forecast_days, dtype=float)
+        predicted = np.maximum(
+            0.0, slope[:, None] * (n[:, None] + steps) + intercept[:, None]
+        )
+        # Confidence interval (95% = ~2 std errors)
+        confidence_range = 2 * std_error[:, None]
+        lower = np.maximum(0.0, predicted - confidence_range)
+        upper = predicted + confidence_range
+
+        forecasts = {}
+        for i, row in enumerate(rows):
+            scope = series.resource_ids[row]
+            last_date = date.fromordinal(int(series.days[row, series.lengths[row] - 1]))
+            forecasts[scope] = [
                 ForecastData(
                     scope=scope,
-                    forecast_date=forecast_date,
-                    predicted_cost=predicted_cost,
-                    confidence_lower=confidence_lower,
-                    confidence_upper=confidence_upper,
+                    forecast_date=last_date + timedelta(days=step + 1),
+                    predicted_cost=float(predicted[i, step]),
+                    confidence_lower=float(lower[i, step]),
+                    confidence_upper=float(upper[i, step]),
                 )
-            )
+                for step in range(forecast_days)
+            ]
 
         return forecasts
 
+    @staticmethod
+    def _fit_lines(
+        x: np.ndarray,
+        values: np.ndarray,
+        n: np.ndarray,
+        observed: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Least-squares slope and intercept per row of a padded matrix.
+
+        Args:
+            x: Day index per column
+            values: Costs, NaN-padded past each row's length
+            n: Number of observations per row
+            observed: Mask of the observed cells
+
+        Returns:
+            Tuple of (slopes, intercepts)
+        """
+        y = np.where(observed, values, 0.0)
+        # Closed forms of sum(x) and sum(x^2) over x = 0 .. n-1
+        sum_x = n * (n - 1) / 2
+        sum_x2 = (n - 1) * n * (2 * n - 1) / 6
+        sum_y = y.sum(axis=1)
+        sum_xy = (y * x).sum(axis=1)
+
+        slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x)
+        intercept = (sum_y - slope * sum_x) / n
+        return slope, intercept
+
     def calculate_trend(
         self, historical_costs: list[tuple[date, float]]
     ) -> tuple[float, float]:
@@ -2,14 +2,19 @@
 
 This module handles querying cost data from Neo4j, including
 cost summaries, historical data retrieval, and tag-based allocation.
+When a ColumnarCostStore is configured, daily costs are read from it
+instead of from Cost nodes.
 """
 
+import asyncio
 from datetime import date, datetime
 from typing import Optional
 
+import numpy as np
 from neo4j import AsyncDriver
 
 from ...models.cost_models import CostSummary
+from .columnar import ColumnarCostStore, CostFrame, CostSeries
 
 
 class CostManagementError(Exception):
@@ -25,13 +30,19 @@ class CostQueryService:
     from the graph database with various grouping and filtering options.
     """
 
-    def __init__(self, neo4j_driver: AsyncDriver):
+    def __init__(
+        self,
+        neo4j_driver: AsyncDriver,
+        columnar_store: Optional[ColumnarCostStore] = None,
+    ):
         """Initialize the cost query service.
 
         Args:
             neo4j_driver: Neo4j async driver for database operations
+            columnar_store: Optional columnar store holding daily cost rows
         """
         self.neo4j_driver = neo4j_driver
+        self.columnar_store = columnar_store
 
     async def query_costs(
         self,
@@ -56,6 +67,19 @@ class CostQueryService:
         Raises:
             CostManagementError: If query fails
         """
+        if self.columnar_store is not None:
+            try:
+                frame = await asyncio.to_thread(
+                    self.columnar_store.load, scope, start_date, end_date
+                )
+                return self._summarize_frame(
+                    frame, scope, start_date, end_date, group_by
+                )
+            except Exception as e:
+                raise CostManagementError(
+                    f"Failed to query costs from columnar store: {e}"
+                ) from e
+
         try:
             async with self.neo4j_driver.session() as session:
                 result = await session.execute_read(
@@ -89,6 +113,16 @@ class CostQueryService:
         Raises:
             CostManagementError: If query fails
         """
+        if self.columnar_store is not None:
+            try:
+                return await asyncio.to_thread(
+                    self.columnar_store.daily_totals, scope, start_date, end_date
+                )
+            except Exception as e:
+                raise CostManagementError(
+                    f"Failed to fetch historical costs: {e}"
+                ) from e
+
         try:
             async with self.neo4j_driver.session() as session:
                 costs = await session.execute_read(
@@ -120,6 +154,10 @@ class CostQueryService:
         Raises:
             CostManagementError: If query fails
         """
+        if self.columnar_store is not None:
+            series = await self.fetch_cost_series(scope, start_date, end_date)
+            return series.to_mapping()
+
         try:
             async with self.neo4j_driver.session() as session:
                 costs = await session.execute_read(
@@ -134,6 +172,44 @@ class CostQueryService:
                 f"Failed to fetch daily costs by resource: {e}"
             ) from e
 
+    async def fetch_cost_series(
+        self,
+        scope: str,
+        start_date: date,
+        end_date: date,
+    ) -> CostSeries:
+        """Fetch daily costs of all resources in a scope as a CostSeries.
+
+        This is the matrix form consumed by the vectorized forecaster and
+        anomaly detector; it is read directly from the columnar store when
+        one is configured.
+
+        Args:
+            scope: Azure scope
+            start_date: Start date
+            end_date: End date
+
+        Returns:
+            CostSeries with one row per resource
+
+        Raises:
+            CostManagementError: If query fails
+        """
+        if self.columnar_store is None:
+            costs_by_resource = await self.fetch_daily_costs_by_resource(
+                scope, start_date, end_date
+            )
+            return CostSeries.from_mapping(costs_by_resource)
+
+        try:
+            return await asyncio.to_thread(
+                self.columnar_store.series, scope, start_date, end_date
+            )
+        except Exception as e:
+            raise CostManagementError(
+                f"Failed to fetch daily costs by resource: {e}"
+            ) from e
+
     async def allocate_by_tags(
         self,
         tag_key: str,
@@ -155,6 +231,21 @@ class CostQueryService:
         Raises:
             CostManagementError: If allocation fails
         """
+        if self.columnar_store is not None:
+            try:
+                frame = await asyncio.to_thread(
+                    self.columnar_store.load,
+                    None,
+                    start_date,
+                    end_date,
+                    subscription_ids or None,
+                )
+                return self._allocate_frame_by_tag(frame, tag_key)
+            except Exception as e:
+                raise CostManagementError(
+                    f"Failed to allocate costs by tags: {e}"
+                ) from e
+
         try:
             async with self.neo4j_driver.session() as session:
                 allocation = await session.execute_read(
@@ -168,6 +259,78 @@ class CostQueryService:
         except Exception as e:
             raise CostManagementError(f"Failed to allocate costs by tags: {e}") from e
 
+    @staticmethod
+    def _summarize_frame(
+        frame: CostFrame,
+        scope: str,
+        start_date: date,
+        end_date: date,
+        group_by: Optional[str],
+    ) -> CostSummary:
+        """Build a CostSummary from columnar rows.
+
+        Args:
+            frame: Rows loaded for the scope and period
+            scope: Azure scope
+            start_date: Start date
+            end_date: End date
+            group_by: Grouping field
+
+        Returns:
+            CostSummary object
+        """
+        present = np.unique(frame.resource)
+        currency = frame.resources[present[0]]["currency"] if len(present) else None
+
+        service_breakdown: dict[str, float] = {}
+        if group_by == "service_name" and len(frame):
+            per_resource = np.bincount(
+                frame.resource,
+                weights=frame.actual_cost,
+                minlength=len(frame.resources),
+            )
+            for index in present:
+                service = frame.resources[index]["service_name"]
+                service_breakdown[service] = service_breakdown.get(
+                    service, 0.0
+                ) + float(per_resource[index])
+            service_breakdown = dict(
+                sorted(service_breakdown.items(), key=lambda kv: kv[1], reverse=True)
+            )
+
+        return CostSummary(
+            scope=scope,
+            start_date=start_date,
+            end_date=end_date,
+            total_cost=float(frame.actual_cost.sum()),
+            currency=str(currency or "USD"),
+            resource_count=len(present),
+            service_breakdown=service_breakdown,
+        )
+
+    @staticmethod
+    def _allocate_frame_by_tag(frame: CostFrame, tag_key: str) -> dict[str, float]:
+        """Allocate columnar rows by tag value.
+
+        Args:
+            frame: Rows loaded for the period
+            tag_key: Tag key to allocate by
+
+        Returns:
+            Dictionary mapping tag values to costs, highest first
+        """
+        per_resource = np.bincount(
+            frame.resource, weights=frame.actual_cost, minlength=len(frame.resources)
+        )
+        allocation: dict[str, float] = {}
+        for index in np.unique(frame.resource):
+            tags = frame.resources[index].get("tags") or {}
+            tag_value = tags.get(tag_key, "untagged")
+            allocation[tag_value] = allocation.get(tag_value, 0.0) + float(
+                per_resource[index]
+            )
+        return dict(sorted(allocation.items(), key=lambda kv: kv[1], reverse=True))
+
     @staticmethod
     def _convert_neo4j_date(neo4j_date) -> date:
         """Convert Neo4j Date object to Python date.
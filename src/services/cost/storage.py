@@ -2,13 +2,20 @@
 
 This module handles persisting cost data, forecasts, and anomalies
 to Neo4j graph database with proper relationship management.
+
+When a ColumnarCostStore is configured, daily cost rows are written to it
+instead of the graph, and the graph only receives one MonthlyCost
+aggregate per resource and month.
 """
 
+import asyncio
 import json
+from typing import Optional
 
 from neo4j import AsyncDriver
 
 from ...models.cost_models import CostAnomaly, CostData, ForecastData
+from .columnar import ColumnarCostStore, month_key
 
 
 class CostManagementError(Exception):
@@ -24,13 +31,19 @@ class CostStorageService:
     Resources, ResourceGroups, and Subscriptions in the graph database.
     """
 
-    def __init__(self, neo4j_driver: AsyncDriver):
+    def __init__(
+        self,
+        neo4j_driver: AsyncDriver,
+        columnar_store: Optional[ColumnarCostStore] = None,
+    ):
         """Initialize the cost storage service.
 
         Args:
             neo4j_driver: Neo4j async driver for database operations
+            columnar_store: Optional columnar store for daily cost rows
         """
         self.neo4j_driver = neo4j_driver
+        self.columnar_store = columnar_store
 
     async def store_costs(self, costs: list[CostData]) -> int:
         """Store cost data in Neo4j.
@@ -47,6 +60,9 @@ class CostStorageService:
         if not costs:
             return 0
 
+        if self.columnar_store is not None:
+            return await self._store_costs_columnar(self.columnar_store, costs)
+
         try:
             async with self.neo4j_driver.session() as session:
                 count = await session.execute_write(self._create_cost_nodes, costs)
@@ -54,6 +70,44 @@ class CostStorageService:
         except Exception as e:
             raise CostManagementError(f"Failed to store costs in Neo4j: {e}") from e
 
+    async def _store_costs_columnar(
+        self, store: ColumnarCostStore, costs: list[CostData]
+    ) -> int:
+        """Append rows to the columnar store and refresh monthly aggregates.
+
+        Args:
+            store: Columnar store receiving the daily rows
+            costs: List of CostData objects
+
+        Returns:
+            Number of cost records stored
+
+        Raises:
+            CostManagementError: If storage fails
+        """
+        months = sorted({month_key(c.date) for c in costs})
+        resource_ids = {c.resource_id for c in costs}
+
+        try:
+            count = await asyncio.to_thread(store.append, costs)
+            aggregates = await asyncio.to_thread(
+                store.monthly_totals, months, resource_ids
+            )
+        except Exception as e:
+            raise CostManagementError(
+                f"Failed to store costs in columnar store: {e}"
+            ) from e
+
+        try:
+            async with self.neo4j_driver.session() as session:
+                await session.execute_write(self._create_monthly_cost_nodes, aggregates)
+        except Exception as e:
+            raise CostManagementError(
+                f"Failed to store cost aggregates in Neo4j: {e}"
+            ) from e
+
+        return count
+
     async def store_forecasts(self, forecasts: list[ForecastData]) -> None:
         """Store forecast data in Neo4j.
 
@@ -160,6 +214,69 @@ class CostStorageService:
         record = await result.single()
         return record["count"] if record else 0
 
+    @staticmethod
+    async def _create_monthly_cost_nodes(tx, aggregates: list[dict]) -> int:
+        """Create MonthlyCost aggregate nodes in Neo4j.
+
+        Args:
+            tx: Neo4j transaction
+            aggregates: Per-resource monthly totals from the columnar store
+
+        Returns:
+            Number of nodes written
+        """
+        query = """
+        UNWIND $aggregates AS agg
+        MERGE (m:MonthlyCost {
+            id: agg.resource_id + '_' + agg.month
+        })
+        SET m.resource_id = agg.resource_id,
+            m.month = agg.month,
+            m.days = agg.days,
+            m.actual_cost = agg.actual_cost,
+            m.amortized_cost = agg.amortized_cost,
+            m.usage_quantity = agg.usage_quantity,
+            m.currency = agg.currency,
+            m.service_name = agg.service_name,
+            m.meter_category = agg.meter_category,
+            m.meter_name = agg.meter_name,
+            m.tags = agg.tags,
+            m.subscription_id = agg.subscription_id,
+            m.resource_group = agg.resource_group,
+            m.updated_at = datetime()
+        SET m.created_at = coalesce(m.created_at, datetime())
+
+        WITH m, agg
+        OPTIONAL MATCH (r:Resource {id: agg.resource_id})
+        FOREACH (ignoreMe IN CASE WHEN r IS NOT NULL THEN [1] ELSE [] END |
+            MERGE (r)-[:INCURS_COST]->(m)
+        )
+
+        WITH m, agg
+        WHERE agg.resource_group IS NOT NULL
+        OPTIONAL MATCH (rg:ResourceGroup {name: agg.resource_group})
+        FOREACH (ignoreMe IN CASE WHEN rg IS NOT NULL THEN [1] ELSE [] END |
+            MERGE (rg)-[:INCURS_COST]->(m)
+        )
+
+        WITH m, agg
+        WHERE agg.subscription_id IS NOT NULL
+        OPTIONAL MATCH (s:Subscription {subscription_id: agg.subscription_id})
+        FOREACH (ignoreMe IN CASE WHEN s IS NOT NULL THEN [1] ELSE [] END |
+            MERGE (s)-[:INCURS_COST]->(m)
+        )
+
+        RETURN count(m) AS count
+        """
+
+        aggregate_dicts = [
+            {**a, "tags": json.dumps(a.get("tags") or {})} for a in aggregates
+        ]
+
+        result = await tx.run(query, aggregates=aggregate_dicts)
+        record = await result.single()
+        return record["count"] if record else 0
+
     @staticmethod
     async def _create_forecast_nodes(tx, forecasts: list[ForecastData]) -> None:
         """Create CostForecast nodes in Neo4j.
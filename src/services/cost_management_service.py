@@ -11,6 +11,7 @@ Philosophy:
 - Zero breaking changes to existing interface
 """
 
+import os
 from datetime import date, timedelta
 from typing import Optional
 
@@ -26,6 +27,7 @@ from ..models.cost_models import (
     TimeFrame,
 )
 from .cost.anomaly_detection import AnomalyDetector
+from .cost.columnar import ColumnarCostStore
 from .cost.data_fetch import (
     APIRateLimitError,
     CostDataFetcher,
@@ -70,20 +72,34 @@ class CostManagementService:
         self,
         neo4j_driver: AsyncDriver,
         credential: TokenCredential,
+        cost_store_dir: Optional[str] = None,
     ):
         """Initialize the cost management service orchestrator.
 
         Args:
             neo4j_driver: Neo4j async driver for database operations
             credential: Azure credential for authentication
+            cost_store_dir: Optional directory for the columnar cost store
+                (defaults to the COST_STORE_DIR environment variable). When
+                set, daily costs are kept there and only monthly aggregates
+                are written to Neo4j.
         """
         self.neo4j_driver = neo4j_driver
         self.credential = credential
 
+        cost_store_dir = cost_store_dir or os.getenv("COST_STORE_DIR")
+        self.columnar_store = (
+            ColumnarCostStore(cost_store_dir) if cost_store_dir else None
+        )
+
         # Initialize specialized modules
         self.fetcher = CostDataFetcher(credential=credential)
-        self.storage = CostStorageService(neo4j_driver=neo4j_driver)
-        self.query = CostQueryService(neo4j_driver=neo4j_driver)
+        self.storage = CostStorageService(
+            neo4j_driver=neo4j_driver, columnar_store=self.columnar_store
+        )
+        self.query = CostQueryService(
+            neo4j_driver=neo4j_driver, columnar_store=self.columnar_store
+        )
         self.forecaster = CostForecaster()
         self.anomaly_detector = AnomalyDetector()
         self.reporter = CostReporter()
@@ -245,6 +261,56 @@ class CostManagementService:
         except Exception as e:
             raise CostManagementError(f"Failed to forecast costs: {e}") from e
 
+    async def forecast_resource_costs(
+        self,
+        scope: str,
+        forecast_days: int = 30,
+    ) -> dict[str, list[ForecastData]]:
+        """Forecast future costs of every resource in a scope.
+
+        All resources are fitted in one batched regression. Resources with
+        less than 14 days of history are left out.
+
+        Args:
+            scope: Azure scope whose resources to forecast
+            forecast_days: Number of days to forecast
+
+        Returns:
+            Dictionary mapping resource IDs to their ForecastData lists
+
+        Raises:
+            CostManagementError: If forecasting fails
+            DataValidationError: If forecast_days is invalid
+        """
+        if forecast_days <= 0:
+            raise DataValidationError("forecast_days must be positive")
+
+        try:
+            end_date = date.today()
+            start_date = end_date - timedelta(days=90)
+
+            cost_series = await self.query.fetch_cost_series(
+                scope=scope,
+                start_date=start_date,
+                end_date=end_date,
+            )
+
+            forecasts = self.forecaster.generate_forecasts_batch(
+                series=cost_series,
+                forecast_days=forecast_days,
+            )
+
+            all_forecasts = [f for fs in forecasts.values() for f in fs]
+            if all_forecasts:
+                await self.storage.store_forecasts(all_forecasts)
+
+            return forecasts
+
+        except DataValidationError:
+            raise
+        except Exception as e:
+            raise CostManagementError(f"Failed to forecast resource costs: {e}") from e
+
     async def detect_anomalies(
         self,
         scope: str,
@@ -275,18 +341,18 @@ class CostManagementService:
             end_date = date.today()
             start_date = end_date - timedelta(days=lookback_days)
 
-            costs_by_resource = await self.query.fetch_daily_costs_by_resource(
+            cost_series = await self.query.fetch_cost_series(
                 scope=scope,
                 start_date=start_date,
                 end_date=end_date,
             )
 
-            if not costs_by_resource:
+            if not len(cost_series):
                 return []
 
-            # Detect anomalies using Z-score
+            # Detect anomalies using Z-score across all resources at once
             anomalies = self.anomaly_detector.detect_anomalies(
-                costs_by_resource=costs_by_resource,
+                costs_by_resource=cost_series,
                 sensitivity=sensitivity,
             )
 
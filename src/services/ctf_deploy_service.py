@@ -36,6 +36,7 @@ Usage:
 Issue #552: CTF Overlay System Implementation
 """
 
+import json
 import subprocess
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -43,6 +44,7 @@ from typing import Any, Dict, List, Optional
 import structlog
 
 from .ctf_import_service import CTFImportService
+from .layer.models import LayerNotMaterializedError
 
 logger = structlog.get_logger(__name__)
 
@@ -92,6 +94,7 @@ class CTFDeployService:
 
         Raises:
             ValueError: If required parameters missing
+            LayerNotMaterializedError: If the layer is copy-on-write
         """
         if not layer_id:
             raise ValueError("layer_id is required")
@@ -179,7 +182,12 @@ class CTFDeployService:
 
         Returns:
             List of resource dictionaries
+
+        Raises:
+            LayerNotMaterializedError: If the layer is copy-on-write
         """
+        self._ensure_standalone_layer(layer_id)
+
         query = """
         MATCH (r:Resource {layer_id: $layer_id})
         WHERE r.ctf_exercise = $ctf_exercise
@@ -222,6 +230,29 @@ class CTFDeployService:
 
         return resources
 
+    def _ensure_standalone_layer(self, layer_id: str) -> None:
+        """Refuse copy-on-write layers, whose own nodes are only a delta.
+
+        Args:
+            layer_id: Layer identifier
+
+        Raises:
+            LayerNotMaterializedError: If the layer reads through a parent
+        """
+        records, _, _ = self.neo4j_driver.execute_query(
+            """
+            MATCH (l:Layer {layer_id: $layer_id})
+            RETURN l.parent_layer_id AS parent_layer_id, l.metadata AS metadata
+            """,
+            layer_id=layer_id,
+        )
+        for record in records:
+            metadata = record["metadata"] or "{}"
+            if isinstance(metadata, str):
+                metadata = json.loads(metadata)
+            if record["parent_layer_id"] and metadata.get("copy_on_write"):
+                raise LayerNotMaterializedError(layer_id, "deploying CTF scenarios")
+
     def _export_to_terraform(
         self,
         resources: List[Dict[str, Any]],
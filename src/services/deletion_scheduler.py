@@ -0,0 +1,362 @@
+"""
+Dependency-graph deletion scheduler for tenant reset (Issue #627).
+
+Resources are deleted in an order derived from a DAG rather than fixed waves:
+an edge ``a -> b`` means ``a`` must be gone before ``b`` is deleted. Edges come
+from three sources:
+
+- ARM ID containment: a child resource (``.../virtualNetworks/v/subnets/s``,
+  anything under ``/resourceGroups/rg``) is deleted before its parent.
+- Type ordering within a resource group (VMs, then NICs, then disks, then
+  VNets, then everything else), linked through zero-cost barrier nodes so the
+  edge count stays linear.
+- Graph relationships from Neo4j: ``(a)-[r]->(b)`` means ``a`` depends on
+  ``b``, so ``a`` is deleted first.
+
+The scheduler starts each delete as soon as everything that must precede it
+has finished, preferring resources on the longest remaining chain, and polls
+long-running operations with ``asyncio.sleep`` so in-flight deletes overlap.
+"""
+
+import asyncio
+import heapq
+import logging
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+logger = logging.getLogger(__name__)
+
+# Deletion order inside a resource group; types not listed go last
+_TYPE_RANKS: Tuple[str, ...] = (
+    "/virtualmachines/",
+    "/networkinterfaces/",
+    "/disks/",
+    "/virtualnetworks/",
+)
+
+RESOURCE_DEPENDENCIES_QUERY = """
+MATCH (a:Resource)-[r]->(b:Resource)
+WHERE a.id IN $ids AND b.id IN $ids AND a <> b
+  AND NOT type(r) IN ['CONTAINS', 'SCAN_SOURCE_NODE']
+RETURN DISTINCT a.id AS dependent, b.id AS dependency
+"""
+
+
+def _type_rank(resource_id: str) -> int:
+    lowered = resource_id.lower()
+    for rank, marker in enumerate(_TYPE_RANKS):
+        if marker in lowered:
+            return rank
+    return len(_TYPE_RANKS)
+
+
+def _resource_group_key(resource_id: str) -> Optional[str]:
+    """Lower-cased ``/subscriptions/s/resourcegroups/rg`` prefix of a resource."""
+    parts = resource_id.lower().split("/")
+    if len(parts) > 5 and parts[3] == "resourcegroups":
+        return "/".join(parts[:5])
+    return None
+
+
+async def wait_for_poller(poller: Any, poll_interval: float) -> Any:
+    """Wait for an Azure ``LROPoller`` without blocking the event loop."""
+    while not poller.done():
+        await asyncio.sleep(poll_interval)
+    return poller.result()
+
+
+class DeletionGraph:
+    """DAG of resources to delete; ``None`` ids are ordering barriers."""
+
+    def __init__(self):
+        self.ids: List[Optional[str]] = []
+        self.index: Dict[str, int] = {}
+        self.successors: List[List[int]] = []
+        self.indegree: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def _add_node(self, resource_id: Optional[str] = None) -> int:
+        node = len(self.ids)
+        self.ids.append(resource_id)
+        self.successors.append([])
+        self.indegree.append(0)
+        if resource_id is not None:
+            self.index[resource_id] = node
+        return node
+
+    def _add_edge(self, before: int, after: int) -> None:
+        self.successors[before].append(after)
+        self.indegree[after] += 1
+
+    @classmethod
+    def from_resources(
+        cls,
+        resource_ids: Iterable[str],
+        dependencies: Iterable[Tuple[str, str]] = (),
+    ) -> "DeletionGraph":
+        """
+        Build the deletion DAG for a set of resources.
+
+        Args:
+            resource_ids: Azure resource IDs to delete
+            dependencies: ``(dependent, dependency)`` pairs; the dependent is
+                deleted first. Pairs that would close a cycle are dropped.
+
+        Returns:
+            DeletionGraph
+        """
+        graph = cls()
+        for resource_id in resource_ids:
+            if resource_id not in graph.index:
+                graph._add_node(resource_id)
+        real = list(graph.index.items())
+        by_lower = {resource_id.lower(): node for resource_id, node in real}
+
+        # Containment: child before its nearest ancestor in the set
+        for resource_id, node in real:
+            parts = resource_id.lower().split("/")
+            for end in range(len(parts) - 1, 2, -1):
+                parent = by_lower.get("/".join(parts[:end]))
+                if parent is not None and parent != node:
+                    graph._add_edge(node, parent)
+                    break
+
+        # Type ordering inside each resource group, chained through barriers
+        groups: Dict[str, Dict[int, List[int]]] = defaultdict(lambda: defaultdict(list))
+        for resource_id, node in real:
+            group = _resource_group_key(resource_id)
+            if group is not None:
+                groups[group][_type_rank(resource_id)].append(node)
+        for ranks in groups.values():
+            ordered = [ranks[rank] for rank in sorted(ranks)]
+            for earlier, later in zip(ordered, ordered[1:]):
+                barrier = graph._add_node()
+                for node in earlier:
+                    graph._add_edge(node, barrier)
+                for node in later:
+                    graph._add_edge(barrier, node)
+
+        graph._add_dependencies(dependencies)
+        return graph
+
+    @classmethod
+    def from_waves(cls, waves: Sequence[Sequence[str]]) -> "DeletionGraph":
+        """Build a DAG where every resource in a wave precedes the next wave."""
+        graph = cls()
+        previous: Optional[int] = None
+        for wave in waves:
+            nodes = [
+                graph._add_node(resource_id)
+                for resource_id in wave
+                if resource_id not in graph.index
+            ]
+            if previous is not None:
+                for node in nodes:
+                    graph._add_edge(previous, node)
+            barrier = graph._add_node()
+            for node in nodes:
+                graph._add_edge(node, barrier)
+            previous = barrier
+        return graph
+
+    def _add_dependencies(self, dependencies: Iterable[Tuple[str, str]]) -> None:
+        edges = [
+            (self.index[dependent], self.index[dependency])
+            for dependent, dependency in dependencies
+            if dependent in self.index
+            and dependency in self.index
+            and dependent != dependency
+        ]
+        for before, after in edges:
+            self._add_edge(before, after)
+
+        # Structural edges are acyclic, so every cycle uses a relationship
+        # edge between nodes Kahn's algorithm cannot reach
+        blocked = set(range(len(self.ids))) - set(self.topological_order())
+        if blocked:
+            dropped = 0
+            for before, after in edges:
+                if before in blocked and after in blocked:
+                    self.successors[before].remove(after)
+                    self.indegree[after] -= 1
+                    dropped += 1
+            logger.warning(
+                f"Dropped {dropped} cyclic dependencies among {len(blocked)} nodes"
+            )
+
+    def topological_order(self) -> List[int]:
+        """Nodes in topological order (nodes on a cycle are omitted)."""
+        remaining = list(self.indegree)
+        order = [node for node, degree in enumerate(remaining) if degree == 0]
+        for node in order:
+            for successor in self.successors[node]:
+                remaining[successor] -= 1
+                if remaining[successor] == 0:
+                    order.append(successor)
+        return order
+
+    def _weight(self, node: int) -> int:
+        return 0 if self.ids[node] is None else 1
+
+    def levels(self) -> List[List[str]]:
+        """
+        Group resources by depth: each level only depends on earlier levels.
+
+        Returns:
+            List of waves (lists of resource IDs)
+        """
+        depth = [0] * len(self.ids)
+        for node in self.topological_order():
+            reached = depth[node] + self._weight(node)
+            for successor in self.successors[node]:
+                depth[successor] = max(depth[successor], reached)
+
+        waves: Dict[int, List[str]] = defaultdict(list)
+        for node, resource_id in enumerate(self.ids):
+            if resource_id is not None:
+                waves[depth[node]].append(resource_id)
+        return [waves[level] for level in sorted(waves)]
+
+    def remaining_path_lengths(self) -> List[int]:
+        """Resources on the longest chain starting at each node (inclusive)."""
+        length = [0] * len(self.ids)
+        for node in reversed(self.topological_order()):
+            tail = max((length[s] for s in self.successors[node]), default=0)
+            length[node] = tail + self._weight(node)
+        return length
+
+    def critical_path_length(self) -> int:
+        """Number of resources on the longest dependency chain."""
+        return max(self.remaining_path_lengths(), default=0)
+
+
+@dataclass
+class DeletionStats:
+    """Throughput and parallelism figures for a deletion run."""
+
+    total: int
+    deleted: int
+    failed: int
+    elapsed_seconds: float
+    max_in_flight: int
+    critical_path_length: int
+
+    @property
+    def throughput(self) -> float:
+        """Resources processed per second."""
+        if self.elapsed_seconds <= 0:
+            return float(self.deleted + self.failed)
+        return (self.deleted + self.failed) / self.elapsed_seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "throughput": self.throughput}
+
+
+class DeletionScheduler:
+    """Run deletes over a DeletionGraph with bounded concurrency."""
+
+    def __init__(
+        self,
+        delete: Callable[[str], Awaitable[None]],
+        concurrency: int = 10,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            delete: Coroutine function deleting one resource; raises on failure
+            concurrency: Maximum deletes in flight
+        """
+        self.delete = delete
+        self.concurrency = max(1, concurrency)
+
+    async def run(self, graph: DeletionGraph) -> Dict[str, Any]:
+        """
+        Delete every resource in the graph.
+
+        A failed delete still releases the resources after it: Azure rejects
+        deletes that would break a live dependent, so they fail on their own
+        instead of being silently skipped.
+
+        Args:
+            graph: Deletion DAG
+
+        Returns:
+            {"deleted": [...], "failed": [...], "errors": {...}, "stats": {...}}
+        """
+        deleted: List[str] = []
+        failed: List[str] = []
+        errors: Dict[str, str] = {}
+
+        priority = graph.remaining_path_lengths()
+        remaining = list(graph.indegree)
+        ready = [(-priority[n], n) for n, degree in enumerate(remaining) if not degree]
+        heapq.heapify(ready)
+        running: Dict[asyncio.Task, int] = {}
+        max_in_flight = 0
+        start = time.perf_counter()
+
+        def release(node: int) -> None:
+            for successor in graph.successors[node]:
+                remaining[successor] -= 1
+                if remaining[successor] == 0:
+                    heapq.heappush(ready, (-priority[successor], successor))
+
+        while ready or running:
+            while ready and len(running) < self.concurrency:
+                _, node = heapq.heappop(ready)
+                resource_id = graph.ids[node]
+                if resource_id is None:
+                    release(node)
+                    continue
+                running[asyncio.create_task(self.delete(resource_id))] = node
+            max_in_flight = max(max_in_flight, len(running))
+            if not running:
+                continue
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                node = running.pop(task)
+                resource_id = graph.ids[node]
+                error = task.exception()
+                if error is None:
+                    deleted.append(resource_id)
+                else:
+                    failed.append(resource_id)
+                    errors[resource_id] = str(error)
+                release(node)
+
+        stats = DeletionStats(
+            total=len(graph),
+            deleted=len(deleted),
+            failed=len(failed),
+            elapsed_seconds=time.perf_counter() - start,
+            max_in_flight=max_in_flight,
+            critical_path_length=max(priority, default=0),
+        )
+        logger.info(
+            f"Deleted {stats.deleted}/{stats.total} resources in "
+            f"{stats.elapsed_seconds:.1f}s ({stats.throughput:.1f}/s, "
+            f"critical path {stats.critical_path_length}, "
+            f"max in flight {stats.max_in_flight})"
+        )
+        return {
+            "deleted": deleted,
+            "failed": failed,
+            "errors": errors,
+            "stats": stats.to_dict(),
+        }
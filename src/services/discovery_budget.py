@@ -0,0 +1,187 @@
+"""
+Discovery Budget
+
+A global ARM request budget shared by every subscription and discovery phase
+(listing, role assignments, child resources, diagnostics, property
+hydration). Tokens are handed out with per-subscription fair sharing: while
+other subscriptions are waiting, no subscription may hold more than its equal
+share of the budget, so one very large subscription cannot starve the rest.
+
+The budget also records per-subscription, per-phase timings (time spent
+holding tokens and time spent waiting for them) for the end-of-scan report.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class SubscriptionTiming:
+    """Timing summary for one subscription's discovery."""
+
+    subscription_id: str
+    display_name: str = ""
+    wall_seconds: float = 0.0
+    resource_count: int = 0
+    error: Optional[str] = None
+    # phase -> seconds holding budget tokens (summed across concurrent requests)
+    phase_seconds: Dict[str, float] = field(default_factory=dict)
+    # phase -> seconds waiting for budget tokens
+    wait_seconds: Dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "subscription_id": self.subscription_id,
+            "display_name": self.display_name,
+            "wall_seconds": round(self.wall_seconds, 3),
+            "resource_count": self.resource_count,
+            "error": self.error,
+            "phase_seconds": {k: round(v, 3) for k, v in self.phase_seconds.items()},
+            "wait_seconds": {k: round(v, 3) for k, v in self.wait_seconds.items()},
+        }
+
+
+class DiscoveryBudget:
+    """
+    Fair-share token budget for ARM calls across subscriptions and phases.
+    """
+
+    def __init__(self, total_tokens: int) -> None:
+        """
+        Initialize the budget.
+
+        Args:
+            total_tokens: Maximum number of ARM operations in flight across
+                all subscriptions and phases
+        """
+        self.total_tokens = max(1, total_tokens)
+        self._condition = asyncio.Condition()
+        self._in_use = 0
+        self._held: Dict[str, int] = defaultdict(int)
+        self._waiting: Dict[str, int] = defaultdict(int)
+        self._phase_seconds: Dict[str, Dict[str, float]] = defaultdict(
+            lambda: defaultdict(float)
+        )
+        self._wait_seconds: Dict[str, Dict[str, float]] = defaultdict(
+            lambda: defaultdict(float)
+        )
+
+    @property
+    def in_use(self) -> int:
+        return self._in_use
+
+    def _active_subscriptions(self) -> Set[str]:
+        return {s for s, n in self._held.items() if n} | {
+            s for s, n in self._waiting.items() if n
+        }
+
+    def fair_share(self) -> int:
+        """Tokens each active subscription may hold while others are waiting."""
+        active = len(self._active_subscriptions())
+        return max(1, math.ceil(self.total_tokens / max(1, active)))
+
+    def _can_acquire(self, subscription_id: str) -> bool:
+        if self._in_use >= self.total_tokens:
+            return False
+        others_waiting = any(
+            n for s, n in self._waiting.items() if n and s != subscription_id
+        )
+        if not others_waiting:
+            return True
+        return self._held[subscription_id] < self.fair_share()
+
+    @asynccontextmanager
+    async def acquire(self, subscription_id: str, phase: str) -> AsyncIterator[None]:
+        """
+        Hold one budget token for the duration of the block.
+
+        Args:
+            subscription_id: Subscription the work belongs to
+            phase: Discovery phase name, used for timing
+        """
+        wait_start = time.perf_counter()
+        async with self._condition:
+            self._waiting[subscription_id] += 1
+            try:
+                await self._condition.wait_for(
+                    lambda: self._can_acquire(subscription_id)
+                )
+            finally:
+                self._waiting[subscription_id] -= 1
+            self._in_use += 1
+            self._held[subscription_id] += 1
+
+        start = time.perf_counter()
+        self._wait_seconds[subscription_id][phase] += start - wait_start
+        try:
+            yield
+        finally:
+            self._phase_seconds[subscription_id][phase] += time.perf_counter() - start
+            async with self._condition:
+                self._in_use -= 1
+                self._held[subscription_id] -= 1
+                self._condition.notify_all()
+
+    async def run_blocking(
+        self,
+        subscription_id: str,
+        phase: str,
+        func: Callable[..., T],
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """
+        Run a blocking SDK call in a worker thread while holding one token.
+
+        Args:
+            subscription_id: Subscription the work belongs to
+            phase: Discovery phase name
+            func: Blocking callable
+            *args, **kwargs: Arguments for func
+
+        Returns:
+            The callable's result
+        """
+        async with self.acquire(subscription_id, phase):
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+    def timing_for(self, subscription_id: str) -> SubscriptionTiming:
+        """Build a SubscriptionTiming pre-filled with recorded phase timings."""
+        return SubscriptionTiming(
+            subscription_id=subscription_id,
+            phase_seconds=dict(self._phase_seconds.get(subscription_id, {})),
+            wait_seconds=dict(self._wait_seconds.get(subscription_id, {})),
+        )
+
+
+def log_subscription_timings(timings: List[SubscriptionTiming]) -> None:
+    """Log a per-subscription timing table, slowest subscriptions first."""
+    if not timings:
+        return
+    logger.info("=" * 70)
+    logger.info("Per-subscription discovery timing (slowest first)")
+    logger.info("=" * 70)
+    for timing in sorted(timings, key=lambda t: t.wall_seconds, reverse=True):
+        phases = ", ".join(
+            f"{phase}={seconds:.1f}s"
+            for phase, seconds in sorted(timing.phase_seconds.items())
+        )
+        waited = sum(timing.wait_seconds.values())
+        status = f" ERROR: {timing.error}" if timing.error else ""
+        logger.info(
+            f"  {timing.display_name or timing.subscription_id}: "
+            f"{timing.wall_seconds:.1f}s, {timing.resource_count} resources, "
+            f"waited {waited:.1f}s for budget"
+            + (f" [{phases}]" if phases else "")
+            + status
+        )
@@ -0,0 +1,367 @@
+"""
+Graph Batch Client
+
+Native asyncio client for fetching Azure AD principals by ID through the
+Microsoft Graph JSON ``$batch`` endpoint. IDs are grouped into
+``id in (...)`` filter queries, up to 20 queries are packed into one batch,
+and several batches run concurrently under a limit. Throttling is honoured at
+both levels: a throttled batch (HTTP 429/503 with ``Retry-After``) pauses every
+in-flight batch, and throttled sub-requests inside a successful batch are
+retried in a later batch after their own ``Retry-After``.
+
+The endpoint is configurable so the client can be exercised against a local
+stub of the Graph endpoint in tests.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, TypeVar
+
+from ..exceptions import AzureDiscoveryError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_GRAPH_ENDPOINT = "https://graph.microsoft.com"
+GRAPH_SCOPE = "https://graph.microsoft.com/.default"
+
+# Graph limits: 20 requests per $batch, 15 values per "in" filter clause
+MAX_BATCH_REQUESTS = 20
+MAX_FILTER_IDS = 15
+
+# Status codes that Graph uses to signal throttling or transient unavailability
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Directory object IDs are GUIDs; they are interpolated into $filter clauses,
+# so anything else is dropped before a query is built
+OBJECT_ID_PATTERN = re.compile(
+    r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+)
+
+
+T = TypeVar("T")
+
+
+def _chunks(items: Sequence[T], size: int) -> Iterable[List[T]]:
+    for start in range(0, len(items), size):
+        yield list(items[start : start + size])
+
+
+class GraphBatchClient:
+    """
+    Pooled, throttle-aware async client for Graph ``$batch`` lookups.
+
+    Usage::
+
+        async with GraphBatchClient(credential) as client:
+            users = await client.get_by_ids("users", user_ids, ["id", "displayName"])
+    """
+
+    def __init__(
+        self,
+        credential: Any,
+        endpoint: str = DEFAULT_GRAPH_ENDPOINT,
+        max_concurrent_batches: int = 4,
+        max_retries: int = 5,
+        base_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        request_timeout: float = 60.0,
+    ) -> None:
+        """
+        Initialize the client.
+
+        Args:
+            credential: Azure credential exposing ``get_token`` (sync)
+            endpoint: Graph base URL (override to point at a local stub)
+            max_concurrent_batches: Maximum ``$batch`` requests in flight
+            max_retries: Retries for throttled or transient failures, applied
+                to whole batches and to individual sub-requests
+            base_backoff: Initial back-off when no ``Retry-After`` is given
+            max_backoff: Upper bound for any single back-off
+            request_timeout: Total timeout for a single batch in seconds
+        """
+        self.credential = credential
+        self.endpoint = endpoint.rstrip("/")
+        self.max_concurrent_batches = max(1, max_concurrent_batches)
+        self.max_retries = max(0, max_retries)
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.request_timeout = request_timeout
+
+        self._session: Optional[Any] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._resume_at: float = 0.0
+        self._token: Optional[str] = None
+        self._token_expires_on: float = 0.0
+        self._token_lock: Optional[asyncio.Lock] = None
+
+        # Counters surfaced through get_stats()
+        self.batch_count = 0
+        self.retry_count = 0
+        self.throttled_count = 0
+
+    async def __aenter__(self) -> "GraphBatchClient":
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.close()
+
+    async def open(self) -> None:
+        """Create the shared aiohttp session (idempotent)."""
+        if self._session is not None:
+            return
+        import aiohttp
+
+        connector = aiohttp.TCPConnector(
+            limit=self.max_concurrent_batches, ttl_dns_cache=300
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.request_timeout),
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrent_batches)
+        self._token_lock = asyncio.Lock()
+
+    async def close(self) -> None:
+        """Close the shared session and release pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return batch/retry/throttle counters for logging."""
+        return {
+            "batches": self.batch_count,
+            "retries": self.retry_count,
+            "throttled": self.throttled_count,
+        }
+
+    async def _get_token(self) -> str:
+        """Return a cached bearer token, refreshing it shortly before expiry."""
+        assert self._token_lock is not None
+        async with self._token_lock:
+            if self._token and time.time() < self._token_expires_on - 300:
+                return self._token
+            # Credentials are synchronous; keep the event loop responsive
+            access_token = await asyncio.to_thread(
+                self.credential.get_token, GRAPH_SCOPE
+            )
+            self._token = access_token.token
+            self._token_expires_on = float(access_token.expires_on)
+            return self._token
+
+    def _compute_backoff(
+        self, headers: Optional[Dict[str, Any]], attempt: int
+    ) -> float:
+        """Back-off in seconds, preferring the server's ``Retry-After`` hint."""
+        retry_after = None
+        if headers:
+            for name, value in headers.items():
+                if name.lower() == "retry-after":
+                    retry_after = value
+                    break
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), self.max_backoff)
+            except (TypeError, ValueError):
+                logger.debug(f"Ignoring non-numeric Retry-After header: {retry_after}")
+        return min(self.base_backoff * (2**attempt), self.max_backoff)
+
+    def _pause_until(self, resume_at: float) -> None:
+        """Extend the shared pause window; never shortens an existing pause."""
+        if resume_at > self._resume_at:
+            self._resume_at = resume_at
+
+    async def _wait_if_paused(self) -> None:
+        delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def _post_batch(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        POST one ``$batch`` request, retrying the whole batch when it is throttled.
+
+        Returns:
+            The sub-responses from the batch body
+
+        Raises:
+            AzureDiscoveryError: If the batch fails after all retries
+        """
+        if self._session is None:
+            await self.open()
+        assert self._session is not None and self._semaphore is not None
+        url = f"{self.endpoint}/v1.0/$batch"
+
+        for attempt in range(self.max_retries + 1):
+            await self._wait_if_paused()
+            token = await self._get_token()
+            async with self._semaphore:
+                self.batch_count += 1
+                try:
+                    async with self._session.post(
+                        url,
+                        json={"requests": requests},
+                        headers={"Authorization": f"Bearer {token}"},
+                    ) as response:
+                        if response.status < 400:
+                            body = await response.json(content_type=None)
+                            return list(body.get("responses", []) or [])
+
+                        text = await response.text()
+                        if (
+                            response.status not in RETRYABLE_STATUS_CODES
+                            or attempt >= self.max_retries
+                        ):
+                            raise AzureDiscoveryError(
+                                f"Graph batch request failed with HTTP {response.status}: {text[:200]}",
+                                context={"url": url, "status": response.status},
+                            )
+
+                        delay = self._compute_backoff(dict(response.headers), attempt)
+                        if response.status == 429:
+                            self.throttled_count += 1
+                            # Throttling is per tenant: pause every batch
+                            self._pause_until(time.monotonic() + delay)
+                except AzureDiscoveryError:
+                    raise
+                except Exception as exc:
+                    # Timeouts, connection errors and other aiohttp.ClientError
+                    if attempt >= self.max_retries:
+                        raise AzureDiscoveryError(
+                            f"Graph batch request failed: {exc}", context={"url": url}
+                        ) from exc
+                    delay = self._compute_backoff(None, attempt)
+
+            self.retry_count += 1
+            logger.debug(
+                f"Retrying Graph batch (attempt {attempt + 1}/{self.max_retries}) in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+
+        # Unreachable: the loop either returns or raises
+        raise AzureDiscoveryError("Graph batch request failed", context={"url": url})
+
+    async def _run_batch(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run one batch of sub-requests to completion and return their items.
+
+        Throttled or transiently failing sub-requests are retried in a smaller
+        follow-up batch; other sub-request errors are logged and skipped.
+        """
+        items: List[Dict[str, Any]] = []
+        pending = requests
+        for attempt in range(self.max_retries + 1):
+            by_id = {req["id"]: req for req in pending}
+            retry: List[Dict[str, Any]] = []
+            delay = 0.0
+            for sub in await self._post_batch(pending):
+                request = by_id.get(str(sub.get("id")))
+                if request is None:
+                    continue
+                status = int(sub.get("status", 500))
+                if status < 400:
+                    items.extend((sub.get("body") or {}).get("value", []) or [])
+                elif status in RETRYABLE_STATUS_CODES and attempt < self.max_retries:
+                    retry.append(request)
+                    delay = max(
+                        delay, self._compute_backoff(sub.get("headers"), attempt)
+                    )
+                    if status == 429:
+                        self.throttled_count += 1
+                else:
+                    error = (sub.get("body") or {}).get("error", {})
+                    logger.warning(
+                        f"Graph request {request['url'][:120]} failed with HTTP {status}: "
+                        f"{error.get('message', error)}"
+                    )
+            if not retry:
+                break
+            self.retry_count += len(retry)
+            logger.debug(
+                f"Retrying {len(retry)} throttled Graph requests in {delay:.1f}s"
+            )
+            self._pause_until(time.monotonic() + delay)
+            await self._wait_if_paused()
+            pending = retry
+        return items
+
+    async def get_by_ids(
+        self, collection: str, ids: Iterable[str], select: Sequence[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch directory objects of one collection by ID.
+
+        Args:
+            collection: Graph collection (``users``, ``groups``,
+                ``servicePrincipals``)
+            ids: Object IDs to fetch; duplicates are ignored, and IDs that
+                are not GUIDs are logged and skipped
+            select: Properties to return for each object
+
+        Returns:
+            The objects that were found, in no particular order. IDs that do
+            not exist (or cannot be read) are simply absent, as are the IDs
+            of batches that failed while others succeeded.
+
+        Raises:
+            AzureDiscoveryError: If every batch failed
+        """
+        unique_ids = sorted({str(i) for i in ids if i})
+        invalid = [i for i in unique_ids if not OBJECT_ID_PATTERN.match(i)]
+        if invalid:
+            logger.warning(
+                f"Skipping {len(invalid)} {collection} IDs that are not GUIDs: "
+                f"{invalid[:5]}"
+            )
+            unique_ids = [i for i in unique_ids if OBJECT_ID_PATTERN.match(i)]
+        if not unique_ids:
+            return []
+
+        select_clause = ",".join(select)
+        requests = []
+        for chunk in _chunks(unique_ids, MAX_FILTER_IDS):
+            id_list = ",".join(f"'{i}'" for i in chunk)
+            requests.append(
+                {
+                    "id": str(len(requests)),
+                    "method": "GET",
+                    "url": f"/{collection}?$filter=id in ({id_list})&$select={select_clause}",
+                }
+            )
+
+        batches = list(_chunks(requests, MAX_BATCH_REQUESTS))
+        results = await asyncio.gather(
+            *(self._run_batch(b) for b in batches), return_exceptions=True
+        )
+
+        # One failed batch only loses its own IDs
+        failures = []
+        for index, result in enumerate(results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                failures.append(result)
+                logger.warning(
+                    f"Graph batch {index + 1}/{len(batches)} for {collection} "
+                    f"failed ({len(batches[index])} queries): {result}"
+                )
+        if len(failures) == len(batches):
+            raise failures[0]
+
+        seen = set()
+        objects = []
+        for batch_items in results:
+            if isinstance(batch_items, BaseException):
+                continue
+            for item in batch_items:
+                if item.get("id") in seen:
+                    continue
+                seen.add(item.get("id"))
+                objects.append(item)
+        logger.info(
+            f"Fetched {len(objects)} of {len(unique_ids)} {collection} in "
+            f"{len(batches)} Graph batches"
+        )
+        return objects
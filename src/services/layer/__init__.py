@@ -12,6 +12,8 @@ Architecture:
 - stats.py: Statistics and metrics operations
 - validation.py: Validation and comparison operations
 - export.py: Export, import, copy, archive, and restore operations
+- archive.py: Chunked, checksummed archive file format
+- cow.py: Copy-on-write layers (delta storage, chain resolution, materialize)
 
 Philosophy:
 - Modular design with clear separation of concerns
@@ -33,18 +35,21 @@ Public API (the "studs"):
 import logging
 from typing import Any, Callable, Dict, List, Optional
 
+from src.services.layer.cow import LayerCopyOnWriteOperations
 from src.services.layer.crud import LayerCrudOperations
 from src.services.layer.export import LayerExportOperations
 from src.services.layer.models import (
     CrossLayerRelationshipError,
     InvalidLayerIdError,
     LayerAlreadyExistsError,
+    LayerArchiveError,
     LayerDiff,
     LayerError,
     LayerIntegrityError,
     LayerLockedError,
     LayerMetadata,
     LayerNotFoundError,
+    LayerNotMaterializedError,
     LayerProtectedError,
     LayerType,
     LayerValidationReport,
@@ -91,6 +96,9 @@ class LayerManagementService:
         self.export = LayerExportOperations(
             session_manager, crud_operations=self.crud, stats_operations=self.stats
         )
+        self.cow = LayerCopyOnWriteOperations(
+            session_manager, crud_operations=self.crud, stats_operations=self.stats
+        )
 
         # Ensure schema on initialization
         self._ensure_layer_schema()
@@ -367,6 +375,7 @@ class LayerManagementService:
         copy_metadata: bool = True,
         batch_size: int = 1000,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        copy_on_write: bool = False,
     ) -> LayerMetadata:
         """
         Copy an entire layer (nodes + relationships).
@@ -379,6 +388,8 @@ class LayerManagementService:
             copy_metadata: Copy metadata dict from source
             batch_size: Nodes per batch
             progress_callback: Called with (current, total)
+            copy_on_write: Create a delta layer over the source instead of
+                copying its nodes (see materialize_layer)
 
         Returns:
             LayerMetadata for new layer
@@ -387,6 +398,14 @@ class LayerManagementService:
             LayerNotFoundError: If source doesn't exist
             LayerAlreadyExistsError: If target exists
         """
+        if copy_on_write:
+            return await self.cow.create_layer(
+                source_layer_id=source_layer_id,
+                target_layer_id=target_layer_id,
+                name=name,
+                description=description,
+                copy_metadata=copy_metadata,
+            )
         return await self.export.copy_layer(
             source_layer_id=source_layer_id,
             target_layer_id=target_layer_id,
@@ -397,19 +416,62 @@ class LayerManagementService:
             progress_callback=progress_callback,
         )
 
+    async def get_layer_chain(self, layer_id: str) -> List[str]:
+        """
+        Resolve the read chain of a layer.
+
+        Args:
+            layer_id: Layer to resolve
+
+        Returns:
+            [layer_id, parent, ...]; a single entry unless copy-on-write
+
+        Raises:
+            LayerNotFoundError: If layer doesn't exist
+        """
+        return await self.cow.get_layer_chain(layer_id)
+
+    async def materialize_layer(
+        self,
+        layer_id: str,
+        batch_size: int = 1000,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> LayerMetadata:
+        """
+        Copy inherited nodes into a copy-on-write layer so it stands alone.
+
+        Args:
+            layer_id: Copy-on-write layer
+            batch_size: Nodes per batch
+            progress_callback: Called with (current, total)
+
+        Returns:
+            Updated LayerMetadata
+
+        Raises:
+            LayerNotFoundError: If layer doesn't exist
+        """
+        return await self.cow.materialize_layer(
+            layer_id=layer_id,
+            batch_size=batch_size,
+            progress_callback=progress_callback,
+        )
+
     async def archive_layer(
         self,
         layer_id: str,
         output_path: str,
         include_original: bool = False,
+        archive_format: Optional[str] = None,
     ) -> str:
         """
-        Export layer to JSON file.
+        Export layer to an archive file.
 
         Args:
             layer_id: Layer to archive
-            output_path: File path for JSON output
+            output_path: File path for the archive
             include_original: Include :Original nodes
+            archive_format: "chunked" or "json" (default: by file extension)
 
         Returns:
             Path to created archive file
@@ -421,28 +483,37 @@ class LayerManagementService:
             layer_id=layer_id,
             output_path=output_path,
             include_original=include_original,
+            archive_format=archive_format,
         )
 
     async def restore_layer(
         self,
         archive_path: str,
         target_layer_id: Optional[str] = None,
+        resume: bool = False,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
     ) -> LayerMetadata:
         """
-        Restore layer from JSON archive.
+        Restore layer from an archive (chunked or JSON).
 
         Args:
             archive_path: Path to archive file
             target_layer_id: Override layer ID
+            resume: Continue an interrupted restore of the same archive
+            progress_callback: Called with (chunks restored, total chunks)
 
         Returns:
             LayerMetadata of restored layer
 
         Raises:
             LayerAlreadyExistsError: If target layer already exists
+            LayerArchiveError: If the archive is truncated or corrupt
         """
         return await self.export.restore_layer(
-            archive_path=archive_path, target_layer_id=target_layer_id
+            archive_path=archive_path,
+            target_layer_id=target_layer_id,
+            resume=resume,
+            progress_callback=progress_callback,
         )
 
 
@@ -451,6 +522,7 @@ __all__ = [
     "CrossLayerRelationshipError",
     "InvalidLayerIdError",
     "LayerAlreadyExistsError",
+    "LayerArchiveError",
     "LayerDiff",
     "LayerError",
     "LayerIntegrityError",
@@ -458,6 +530,7 @@ __all__ = [
     "LayerManagementService",
     "LayerMetadata",
     "LayerNotFoundError",
+    "LayerNotMaterializedError",
     "LayerProtectedError",
     "LayerType",
     "LayerValidationReport",
@@ -0,0 +1,390 @@
+"""
+Chunked Layer Archive Format Module
+
+Streaming on-disk format for layer archives, written and read one chunk at a
+time so neither archiving nor restoring holds a whole layer in memory.
+
+Format (version 3.0):
+    MAGIC                      b"ATGLAYER\\x03\\n"
+    frame*                     4-byte big-endian header length
+                               header (JSON object)
+                               payload (header["size"] bytes)
+
+Frames, in order:
+- ``metadata``: payload is the gzip-compressed layer metadata JSON object
+- ``nodes`` / ``relationships``: payload is gzip-compressed JSON lines,
+  ``count`` records each; nodes always precede relationships
+- ``end``: no payload; carries totals and marks the archive complete
+
+Every payload frame carries ``seq`` (chunk number) and a ``sha256`` of the
+compressed payload, so a reader can verify a chunk before applying it and a
+restore can resume after the last applied chunk without re-reading the rest.
+
+Philosophy:
+- Standard library only (gzip, hashlib, json, struct)
+- Writers publish the archive atomically (write to ``.partial``, then rename)
+- Readers verify completeness up front by seeking through frame headers
+
+The legacy single-document JSON layout (version 2.0) is still supported:
+``JsonArchiveWriter`` streams it record by record, and
+``iter_json_archive_chunks`` slices a loaded document into the same chunks.
+
+Public API (the "studs"):
+    ARCHIVE_VERSION: Version string written by LayerArchiveWriter
+    ArchiveChunk: One verified chunk of records
+    ArchiveManifest: Frame headers and totals of a complete archive
+    LayerArchiveWriter: Incremental chunked archive writer
+    JsonArchiveWriter: Incremental writer for the JSON (2.0) layout
+    is_chunked_archive: Detect the chunked format by its magic bytes
+    read_archive_manifest: Verify an archive is complete and load its metadata
+    read_archive_metadata: Layer metadata of an archive in either format
+    iter_archive_chunks: Stream verified chunks, optionally from a given seq
+    iter_json_archive_chunks: Chunk a loaded JSON archive the same way
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import struct
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+from src.services.layer.models import LayerArchiveError
+
+ARCHIVE_VERSION = "3.0"
+MAGIC = b"ATGLAYER\x03\n"
+_LENGTH = struct.Struct(">I")
+
+
+@dataclass
+class ArchiveChunk:
+    """One verified chunk of node or relationship records."""
+
+    kind: str
+    seq: int
+    records: List[Dict[str, Any]]
+
+
+@dataclass
+class ArchiveManifest:
+    """Frame headers, metadata and totals of a complete archive."""
+
+    version: str
+    metadata: Dict[str, Any]
+    chunks: List[Dict[str, Any]] = field(default_factory=list)
+    node_count: int = 0
+    relationship_count: int = 0
+
+
+class LayerArchiveWriter:
+    """
+    Write a chunked layer archive incrementally.
+
+    Usage:
+        with LayerArchiveWriter(path) as writer:
+            writer.write_metadata(layer.to_dict())
+            for node in nodes:
+                writer.add_node(node)
+            for rel in relationships:
+                writer.add_relationship(rel)
+    """
+
+    def __init__(self, path: str, chunk_size: int = 5000, compresslevel: int = 6):
+        """
+        Initialize the writer.
+
+        Args:
+            path: Final archive path (written via ``<path>.partial``)
+            chunk_size: Records per chunk
+            compresslevel: gzip level for chunk payloads
+        """
+        self.path = path
+        self.chunk_size = max(1, chunk_size)
+        self.compresslevel = compresslevel
+        self._partial_path = f"{path}.partial"
+        self._file = open(self._partial_path, "wb")
+        self._file.write(MAGIC)
+        self._seq = 0
+        self._kind: Optional[str] = None
+        self._buffer: List[Dict[str, Any]] = []
+        self._totals = {"nodes": 0, "relationships": 0}
+
+    def __enter__(self) -> "LayerArchiveWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._file.close()
+            os.remove(self._partial_path)
+
+    def _write_frame(self, header: Dict[str, Any], payload: bytes = b"") -> None:
+        header_bytes = json.dumps(header, separators=(",", ":")).encode()
+        self._file.write(_LENGTH.pack(len(header_bytes)))
+        self._file.write(header_bytes)
+        self._file.write(payload)
+
+    def _write_payload(self, kind: str, data: bytes, count: int) -> None:
+        payload = gzip.compress(data, compresslevel=self.compresslevel, mtime=0)
+        self._write_frame(
+            {
+                "kind": kind,
+                "seq": self._seq,
+                "count": count,
+                "size": len(payload),
+                "sha256": hashlib.sha256(payload).hexdigest(),
+            },
+            payload,
+        )
+        self._seq += 1
+
+    def write_metadata(self, metadata: Dict[str, Any]) -> None:
+        """Write the layer metadata frame (must come first)."""
+        if self._seq:
+            raise ValueError("Metadata must be written before any records")
+        self._write_payload(
+            "metadata", json.dumps(metadata, default=str).encode(), count=1
+        )
+
+    def _add(self, kind: str, record: Dict[str, Any]) -> None:
+        if self._seq == 0:
+            raise ValueError("Metadata must be written before any records")
+        if kind != self._kind:
+            if kind == "nodes" and self._kind == "relationships":
+                raise ValueError("Nodes must be written before relationships")
+            self.flush()
+            self._kind = kind
+        self._buffer.append(record)
+        self._totals[kind] += 1
+        if len(self._buffer) >= self.chunk_size:
+            self.flush()
+
+    def add_node(self, node: Dict[str, Any]) -> None:
+        """Append a node record."""
+        self._add("nodes", node)
+
+    def add_relationship(self, relationship: Dict[str, Any]) -> None:
+        """Append a relationship record."""
+        self._add("relationships", relationship)
+
+    def flush(self) -> None:
+        """Write buffered records as one chunk."""
+        if not self._buffer:
+            return
+        lines = "\n".join(json.dumps(r, default=str) for r in self._buffer)
+        self._write_payload(self._kind, lines.encode(), len(self._buffer))  # type: ignore[arg-type]
+        self._buffer = []
+
+    def close(self) -> None:
+        """Flush, write the end frame and publish the archive."""
+        self.flush()
+        self._write_frame(
+            {
+                "kind": "end",
+                "version": ARCHIVE_VERSION,
+                "chunks": self._seq,
+                "node_count": self._totals["nodes"],
+                "relationship_count": self._totals["relationships"],
+            }
+        )
+        self._file.close()
+        os.replace(self._partial_path, self.path)
+
+
+class JsonArchiveWriter:
+    """Write the JSON (2.0) archive layout one record at a time."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "w")
+        self._section: Optional[str] = None
+        self._first = True
+
+    def __enter__(self) -> "JsonArchiveWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._file.close()
+            os.remove(self.path)
+
+    def write_metadata(self, metadata: Dict[str, Any]) -> None:
+        """Write the document head (must come first)."""
+        self._file.write('{"version": "2.0", "includes_scan_source_node": true, ')
+        self._file.write('"metadata": ' + json.dumps(metadata, default=str))
+        self._section = "metadata"
+
+    def _add(self, section: str, record: Dict[str, Any]) -> None:
+        if section != self._section:
+            if section == "relationships" and self._section == "metadata":
+                self._add_section("nodes")
+            self._add_section(section)
+        self._file.write(
+            ("\n" if self._first else ",\n") + json.dumps(record, default=str)
+        )
+        self._first = False
+
+    def _add_section(self, section: str) -> None:
+        if self._section in ("nodes", "relationships"):
+            self._file.write("\n]")
+        self._file.write(f', "{section}": [')
+        self._section = section
+        self._first = True
+
+    def add_node(self, node: Dict[str, Any]) -> None:
+        """Append a node record."""
+        self._add("nodes", node)
+
+    def add_relationship(self, relationship: Dict[str, Any]) -> None:
+        """Append a relationship record."""
+        self._add("relationships", relationship)
+
+    def close(self) -> None:
+        """Close any open sections and the document."""
+        if self._file.closed:
+            return
+        if self._section == "metadata":
+            self._add_section("nodes")
+        if self._section == "nodes":
+            self._add_section("relationships")
+        self._file.write("\n]}\n")
+        self._file.close()
+
+
+def is_chunked_archive(path: str) -> bool:
+    """True if the file starts with the chunked archive magic bytes."""
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def _iter_frames(path: str, f) -> Iterator[Dict[str, Any]]:
+    """Yield frame headers, leaving the file positioned at the payload."""
+    if f.read(len(MAGIC)) != MAGIC:
+        raise LayerArchiveError(path, "not a chunked layer archive")
+    while True:
+        length_bytes = f.read(_LENGTH.size)
+        if not length_bytes:
+            return
+        if len(length_bytes) < _LENGTH.size:
+            raise LayerArchiveError(path, "truncated frame header")
+        (length,) = _LENGTH.unpack(length_bytes)
+        try:
+            header = json.loads(f.read(length))
+        except ValueError as e:
+            raise LayerArchiveError(path, f"corrupt frame header: {e}") from e
+        yield header
+
+
+def _read_payload(path: str, f, header: Dict[str, Any]) -> bytes:
+    payload = f.read(header["size"])
+    if len(payload) < header["size"]:
+        raise LayerArchiveError(path, f"chunk {header['seq']} is truncated")
+    if hashlib.sha256(payload).hexdigest() != header["sha256"]:
+        raise LayerArchiveError(path, f"chunk {header['seq']} checksum mismatch")
+    return gzip.decompress(payload)
+
+
+def read_archive_manifest(path: str) -> ArchiveManifest:
+    """
+    Verify an archive is complete and load its metadata.
+
+    Only the metadata payload is read; other payloads are skipped by seeking.
+
+    Raises:
+        LayerArchiveError: If the archive is truncated or malformed
+    """
+    manifest: Optional[ArchiveManifest] = None
+    with open(path, "rb") as f:
+        for header in _iter_frames(path, f):
+            kind = header.get("kind")
+            if kind == "metadata":
+                metadata = json.loads(_read_payload(path, f, header))
+                manifest = ArchiveManifest(version=ARCHIVE_VERSION, metadata=metadata)
+            elif kind == "end":
+                if manifest is None or header["chunks"] != len(manifest.chunks) + 1:
+                    raise LayerArchiveError(path, "chunk count mismatch")
+                manifest.version = header["version"]
+                manifest.node_count = header["node_count"]
+                manifest.relationship_count = header["relationship_count"]
+                return manifest
+            elif manifest is None:
+                raise LayerArchiveError(path, "metadata frame missing")
+            else:
+                manifest.chunks.append(header)
+                f.seek(header["size"], os.SEEK_CUR)
+    raise LayerArchiveError(path, "archive is incomplete (no end frame)")
+
+
+def iter_archive_chunks(path: str, start_seq: int = 1) -> Iterator[ArchiveChunk]:
+    """
+    Stream verified node and relationship chunks.
+
+    Args:
+        path: Archive path
+        start_seq: First chunk to read; earlier chunks are skipped unread
+            (seq 0 is the metadata frame)
+
+    Yields:
+        ArchiveChunk per node/relationship frame, after checksum verification
+
+    Raises:
+        LayerArchiveError: On a truncated or corrupt chunk
+    """
+    with open(path, "rb") as f:
+        for header in _iter_frames(path, f):
+            kind = header.get("kind")
+            if kind == "end":
+                return
+            if kind == "metadata" or header["seq"] < start_seq:
+                f.seek(header["size"], os.SEEK_CUR)
+                continue
+            lines = _read_payload(path, f, header).decode().splitlines()
+            yield ArchiveChunk(
+                kind=kind, seq=header["seq"], records=[json.loads(x) for x in lines]
+            )
+
+
+def read_archive_metadata(path: str) -> Dict[str, Any]:
+    """Layer metadata of an archive in either format."""
+    if is_chunked_archive(path):
+        return read_archive_manifest(path).metadata
+    with open(path) as f:
+        return json.load(f)["metadata"]
+
+
+def iter_json_archive_chunks(
+    archive_data: Dict[str, Any], chunk_size: int, start_seq: int = 1
+) -> Iterator[ArchiveChunk]:
+    """
+    Slice a loaded JSON archive into chunks numbered like a chunked archive.
+
+    Args:
+        archive_data: Parsed JSON archive
+        chunk_size: Records per chunk
+        start_seq: First chunk to yield
+    """
+    seq = 1
+    for kind in ("nodes", "relationships"):
+        records = archive_data.get(kind, [])
+        for start in range(0, len(records), chunk_size):
+            if seq >= start_seq:
+                yield ArchiveChunk(kind, seq, records[start : start + chunk_size])
+            seq += 1
+
+
+__all__ = [
+    "ARCHIVE_VERSION",
+    "ArchiveChunk",
+    "ArchiveManifest",
+    "JsonArchiveWriter",
+    "LayerArchiveWriter",
+    "is_chunked_archive",
+    "iter_archive_chunks",
+    "iter_json_archive_chunks",
+    "read_archive_manifest",
+    "read_archive_metadata",
+]
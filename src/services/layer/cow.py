@@ -0,0 +1,649 @@
+"""
+Copy-on-Write Layer Operations Module
+
+A copy-on-write (CoW) layer stores only its delta over a parent layer, so
+creating one is a single metadata write and storage grows with the changes
+instead of with the baseline.
+
+Storage model:
+- The layer is a normal :Layer node with parent_layer_id set and
+  ``metadata["copy_on_write"] = True``.
+- Added or overridden resources are ordinary :Resource nodes carrying the
+  child's layer_id. A resource is copied up from the parent (properties and
+  outgoing relationships) the first time it is written.
+- A resource's outgoing relationships belong to its effective node; the
+  relationship target is resolved by ``id`` through the chain, so it may
+  physically point at a node owned by an ancestor layer.
+- Deleted resources are (:LayerTombstone {layer_id, id}) nodes, which hide
+  the id in every layer further up the chain.
+
+Reads resolve an id against the layer chain [child, parent, ..., full layer]:
+the nearest layer holding a node or tombstone for the id wins.
+``materialize_layer`` turns a CoW layer into a self-contained layer.
+
+Philosophy:
+- Layer creation is O(1); storage and writes are O(delta)
+- Resolution happens in Cypher where it can, in Python where Cypher cannot
+  express it cheaply (relationship endpoint checks)
+- Thread-safe via Neo4j transactions
+
+Public API (the "studs"):
+    LayerCopyOnWriteOperations: CoW layer creation, delta writes, materialize
+    get_layer_chain: Resolve the [layer, parent, ...] read chain of a layer
+    resolved_resources_query: Cypher prefix binding ``r`` to effective nodes
+    resolve_layers: Map resource ids to the layer holding their effective node
+    effective_relationships: Relationships visible through a layer chain
+    count_resources: Number of resources visible through a layer chain
+    count_relationships: Number of relationships visible through a layer chain
+    copy_resources: Copy resource nodes from their owning layers into a layer
+"""
+
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.services.layer.models import (
+    LayerAlreadyExistsError,
+    LayerIntegrityError,
+    LayerMetadata,
+    LayerNotFoundError,
+    LayerType,
+)
+from src.utils.session_manager import Neo4jSessionManager
+
+logger = logging.getLogger(__name__)
+
+_RESOLVED_RESOURCES = """
+MATCH (r:Resource)
+WHERE NOT r:Original AND r.layer_id IN $chain{id_filter}
+WITH r ORDER BY $depths[r.layer_id]
+WITH r.id AS rid, head(collect(r)) AS r
+OPTIONAL MATCH (t:LayerTombstone {{id: rid}})
+WHERE t.layer_id IN $chain
+WITH r, min($depths[t.layer_id]) AS tombstone_depth
+WHERE tombstone_depth IS NULL OR tombstone_depth > $depths[r.layer_id]
+WITH r
+"""
+
+
+def resolved_resources_query(chain: List[str], by_ids: bool = False) -> str:
+    """
+    Cypher prefix that binds ``r`` to the effective resource nodes of a chain.
+
+    Single-layer chains use a plain ``layer_id`` match. Parameters are built by
+    ``chain_params``; with ``by_ids`` the query also expects ``$resource_ids``.
+
+    Args:
+        chain: Layer chain from ``get_layer_chain``
+        by_ids: Restrict to ``$resource_ids``
+
+    Returns:
+        Query text ending in ``WITH r``
+    """
+    id_filter = " AND r.id IN $resource_ids" if by_ids else ""
+    if len(chain) == 1:
+        return (
+            "MATCH (r:Resource)\n"
+            f"WHERE NOT r:Original AND r.layer_id = $layer_id{id_filter}\n"
+            "WITH r\n"
+        )
+    return _RESOLVED_RESOURCES.format(id_filter=id_filter)
+
+
+def chain_params(chain: List[str]) -> Dict[str, Any]:
+    """Query parameters for ``resolved_resources_query``."""
+    return {
+        "layer_id": chain[0],
+        "chain": chain,
+        "depths": {layer_id: depth for depth, layer_id in enumerate(chain)},
+    }
+
+
+async def get_layer_chain(crud_operations: Any, layer_id: str) -> List[str]:
+    """
+    Resolve the read chain of a layer.
+
+    Args:
+        crud_operations: CRUD operations handler (for ``get_layer``)
+        layer_id: Layer to resolve
+
+    Returns:
+        [layer_id, parent, ...] ending at the first non-CoW layer
+
+    Raises:
+        LayerNotFoundError: If the layer doesn't exist
+        LayerIntegrityError: If a parent is missing or the chain loops
+    """
+    layer = await crud_operations.get_layer(layer_id)
+    if not layer:
+        raise LayerNotFoundError(layer_id)
+
+    chain = [layer_id]
+    while layer.is_copy_on_write:
+        parent_id = layer.parent_layer_id
+        if not parent_id or parent_id in chain:
+            raise LayerIntegrityError(
+                layer_id, [f"Broken copy-on-write chain: {[*chain, parent_id]}"]
+            )
+        layer = await crud_operations.get_layer(parent_id)
+        if not layer:
+            raise LayerIntegrityError(
+                layer_id, [f"Copy-on-write parent not found: {parent_id}"]
+            )
+        chain.append(parent_id)
+    return chain
+
+
+def resolve_layers(
+    session: Any, chain: List[str], ids: Optional[Iterable[str]] = None
+) -> Dict[str, str]:
+    """
+    Map resource ids to the layer holding their effective node.
+
+    Args:
+        session: Neo4j session
+        chain: Layer chain
+        ids: Restrict to these ids (None = every resource in the chain)
+
+    Returns:
+        {resource_id: layer_id} for resources visible in chain[0]
+    """
+    params = chain_params(chain)
+    if ids is not None:
+        params["resource_ids"] = list(ids)
+    query = resolved_resources_query(chain, by_ids=ids is not None)
+    result = session.run(query + "RETURN r.id AS id, r.layer_id AS layer_id", params)
+    return {record["id"]: record["layer_id"] for record in result}
+
+
+def effective_relationships(
+    session: Any,
+    chain: List[str],
+    relationship_type: Optional[str] = None,
+    source_ids: Optional[Iterable[str]] = None,
+    target_ids: Optional[Iterable[str]] = None,
+) -> Set[Tuple[str, str, str]]:
+    """
+    Relationships visible through a layer chain (SCAN_SOURCE_NODE excluded).
+
+    A relationship counts when it leaves the effective node of its source and
+    its target id resolves to a visible resource.
+
+    Args:
+        session: Neo4j session
+        chain: Layer chain
+        relationship_type: Only this relationship type
+        source_ids: Only relationships leaving these ids
+        target_ids: Only relationships entering these ids
+
+    Returns:
+        Set of (source_id, relationship_type, target_id)
+    """
+    where = [
+        "NOT u:Original AND NOT t:Original",
+        "u.layer_id IN $chain AND t.layer_id IN $chain",
+        "type(rel) <> 'SCAN_SOURCE_NODE'",
+    ]
+    params: Dict[str, Any] = {"chain": chain}
+    if relationship_type:
+        where.append("type(rel) = $relationship_type")
+        params["relationship_type"] = relationship_type
+    if source_ids is not None:
+        where.append("u.id IN $source_ids")
+        params["source_ids"] = list(source_ids)
+    if target_ids is not None:
+        where.append("t.id IN $target_ids")
+        params["target_ids"] = list(target_ids)
+
+    result = session.run(
+        f"""
+        MATCH (u:Resource)-[rel]->(t:Resource)
+        WHERE {" AND ".join(where)}
+        RETURN DISTINCT u.id AS source, u.layer_id AS source_layer,
+               type(rel) AS rel_type, t.id AS target
+        """,
+        params,
+    )
+    candidates = [
+        (record["source"], record["source_layer"], record["rel_type"], record["target"])
+        for record in result
+    ]
+
+    if source_ids is None and target_ids is None:
+        layers = resolve_layers(session, chain)
+    else:
+        endpoints = {c[0] for c in candidates} | {c[3] for c in candidates}
+        layers = resolve_layers(session, chain, endpoints)
+
+    return {
+        (source, rel_type, target)
+        for source, source_layer, rel_type, target in candidates
+        if layers.get(source) == source_layer and target in layers
+    }
+
+
+def count_resources(session: Any, chain: List[str]) -> int:
+    """Number of resources visible through a layer chain."""
+    result = session.run(
+        resolved_resources_query(chain) + "RETURN count(r) as count",
+        chain_params(chain),
+    )
+    return result.single()["count"]
+
+
+def count_relationships(session: Any, chain: List[str]) -> int:
+    """
+    Number of relationships visible through a layer chain.
+
+    Single-layer chains count relationships between the layer's own nodes;
+    longer chains count ``effective_relationships``. SCAN_SOURCE_NODE
+    relationships are excluded either way.
+    """
+    if len(chain) > 1:
+        return len(effective_relationships(session, chain))
+    result = session.run(
+        """
+        MATCH (r1:Resource)-[rel]->(r2:Resource)
+        WHERE NOT r1:Original AND NOT r2:Original
+          AND r1.layer_id = $layer_id
+          AND r2.layer_id = $layer_id
+          AND type(rel) <> 'SCAN_SOURCE_NODE'
+        RETURN count(rel) as count
+        """,
+        {"layer_id": chain[0]},
+    )
+    return result.single()["count"]
+
+
+def copy_resources(
+    session: Any,
+    owners: List[Tuple[str, str]],
+    layer_id: str,
+    batch_size: int = 1000,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+) -> None:
+    """
+    Copy resource nodes (without relationships) into a layer in UNWIND batches.
+
+    Args:
+        session: Neo4j session
+        owners: (resource_id, owning layer_id) pairs, e.g. from ``resolve_layers``
+        layer_id: Layer receiving the copies
+        batch_size: Nodes per batch
+        progress_callback: Called with (current, total)
+    """
+    total = len(owners)
+    for start in range(0, total, batch_size):
+        session.run(
+            """
+            UNWIND $rows AS row
+            MATCH (src:Resource {id: row.id, layer_id: row.owner})
+            WHERE NOT src:Original
+            CREATE (new:Resource)
+            SET new = properties(src), new.layer_id = $layer_id
+            """,
+            {
+                "rows": [
+                    {"id": rid, "owner": owner}
+                    for rid, owner in owners[start : start + batch_size]
+                ],
+                "layer_id": layer_id,
+            },
+        )
+        if progress_callback:
+            progress_callback(min(start + batch_size, total), total)
+
+
+class LayerCopyOnWriteOperations:
+    """
+    Handles copy-on-write layers: O(1) creation, delta writes, materialize.
+
+    Responsibilities:
+    - Create CoW child layers
+    - Record resource and relationship overrides, additions and deletions
+    - Materialize a CoW layer into a self-contained layer
+
+    Thread Safety: All methods are thread-safe via Neo4j transactions
+    """
+
+    def __init__(
+        self,
+        session_manager: Neo4jSessionManager,
+        crud_operations: Optional[object] = None,
+        stats_operations: Optional[object] = None,
+    ):
+        """
+        Initialize copy-on-write operations handler.
+
+        Args:
+            session_manager: Neo4j session manager for database operations
+            crud_operations: CRUD operations handler for layer metadata
+            stats_operations: Stats operations handler for refreshing stats
+        """
+        self.session_manager = session_manager
+        self.crud_operations = crud_operations
+        self.stats_operations = stats_operations
+        self.logger = logging.getLogger(__name__)
+
+    async def create_layer(
+        self,
+        source_layer_id: str,
+        target_layer_id: str,
+        name: str,
+        description: str,
+        copy_metadata: bool = True,
+    ) -> LayerMetadata:
+        """
+        Create a copy-on-write child of a layer without copying any nodes.
+
+        Args:
+            source_layer_id: Parent layer
+            target_layer_id: New layer ID
+            name: Name for new layer
+            description: Description for new layer
+            copy_metadata: Copy metadata dict from source
+
+        Returns:
+            LayerMetadata for new layer
+
+        Raises:
+            LayerNotFoundError: If source doesn't exist
+            LayerAlreadyExistsError: If target exists
+        """
+        source_layer = await self.crud_operations.get_layer(source_layer_id)  # type: ignore[attr-defined]
+        if not source_layer:
+            raise LayerNotFoundError(source_layer_id)
+
+        if await self.crud_operations.get_layer(target_layer_id):  # type: ignore[attr-defined]
+            raise LayerAlreadyExistsError(target_layer_id)
+
+        metadata = dict(source_layer.metadata) if copy_metadata else {}
+        metadata["copy_on_write"] = True
+
+        layer = await self.crud_operations.create_layer(  # type: ignore[attr-defined]
+            layer_id=target_layer_id,
+            name=name,
+            description=description,
+            created_by="copy_layer",
+            parent_layer_id=source_layer_id,
+            layer_type=LayerType.EXPERIMENTAL,
+            tenant_id=source_layer.tenant_id,
+            metadata=metadata,
+            make_active=False,
+        )
+
+        self.logger.info(
+            f"Created copy-on-write layer {target_layer_id} over {source_layer_id}"
+        )
+        return layer
+
+    async def get_layer_chain(self, layer_id: str) -> List[str]:
+        """Resolve the [layer, parent, ...] read chain of a layer."""
+        return await get_layer_chain(self.crud_operations, layer_id)
+
+    def _copy_up(self, session: Any, chain: List[str], resource_id: str) -> bool:
+        """
+        Ensure chain[0] owns a node for resource_id, copying it from an ancestor.
+
+        Returns:
+            False if the resource is not visible in the layer
+        """
+        owner = resolve_layers(session, chain, [resource_id]).get(resource_id)
+        if owner is None:
+            return False
+        if owner == chain[0]:
+            return True
+
+        session.run(
+            """
+            MATCH (src:Resource {id: $resource_id, layer_id: $owner})
+            WHERE NOT src:Original
+            CREATE (new:Resource)
+            SET new = properties(src), new.layer_id = $layer_id
+            WITH src, new
+            MATCH (src)-[rel]->(target:Resource)
+            CALL apoc.create.relationship(new, type(rel), properties(rel), target)
+            YIELD rel AS new_rel
+            RETURN count(new_rel)
+            """,
+            {"resource_id": resource_id, "owner": owner, "layer_id": chain[0]},
+        )
+        return True
+
+    async def upsert_resource(
+        self, layer_id: str, resource_id: str, properties: Dict[str, Any]
+    ) -> None:
+        """
+        Add a resource to a CoW layer or override its properties.
+
+        Args:
+            layer_id: CoW layer
+            resource_id: Resource ID
+            properties: Properties to set (merged into the inherited ones)
+        """
+        chain = await self.get_layer_chain(layer_id)
+        with self.session_manager.session() as session:
+            session.run(
+                "MATCH (t:LayerTombstone {layer_id: $layer_id, id: $resource_id}) "
+                "DELETE t",
+                {"layer_id": layer_id, "resource_id": resource_id},
+            )
+            if not self._copy_up(session, chain, resource_id):
+                session.run(
+                    "CREATE (:Resource {id: $resource_id, layer_id: $layer_id})",
+                    {"resource_id": resource_id, "layer_id": layer_id},
+                )
+            session.run(
+                """
+                MATCH (r:Resource {id: $resource_id, layer_id: $layer_id})
+                WHERE NOT r:Original
+                SET r += $properties, r.id = $resource_id, r.layer_id = $layer_id
+                """,
+                {
+                    "resource_id": resource_id,
+                    "layer_id": layer_id,
+                    "properties": properties,
+                },
+            )
+
+    async def delete_resource(self, layer_id: str, resource_id: str) -> None:
+        """Delete a resource from a CoW layer, hiding any inherited copy."""
+        chain = await self.get_layer_chain(layer_id)
+        with self.session_manager.session() as session:
+            session.run(
+                """
+                MATCH (r:Resource {id: $resource_id, layer_id: $layer_id})
+                WHERE NOT r:Original
+                DETACH DELETE r
+                """,
+                {"resource_id": resource_id, "layer_id": layer_id},
+            )
+            if len(chain) > 1 and resolve_layers(session, chain[1:], [resource_id]):
+                session.run(
+                    "MERGE (:LayerTombstone {layer_id: $layer_id, id: $resource_id})",
+                    {"layer_id": layer_id, "resource_id": resource_id},
+                )
+
+    async def add_relationship(
+        self,
+        layer_id: str,
+        source_id: str,
+        relationship_type: str,
+        target_id: str,
+        properties: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Add a relationship between two resources visible in a CoW layer.
+
+        Raises:
+            ValueError: If either endpoint is not visible in the layer
+        """
+        chain = await self.get_layer_chain(layer_id)
+        with self.session_manager.session() as session:
+            layers = resolve_layers(session, chain, [source_id, target_id])
+            missing = [rid for rid in (source_id, target_id) if rid not in layers]
+            if missing:
+                raise ValueError(f"Resources not found in layer {layer_id}: {missing}")
+
+            self._copy_up(session, chain, source_id)
+            session.run(
+                """
+                MATCH (s:Resource {id: $source_id, layer_id: $layer_id})
+                MATCH (t:Resource {id: $target_id, layer_id: $target_layer})
+                WHERE NOT s:Original AND NOT t:Original
+                CALL apoc.create.relationship(s, $relationship_type, $properties, t)
+                YIELD rel
+                RETURN count(rel)
+                """,
+                {
+                    "source_id": source_id,
+                    "target_id": target_id,
+                    "layer_id": layer_id,
+                    "target_layer": layers[target_id],
+                    "relationship_type": relationship_type,
+                    "properties": properties or {},
+                },
+            )
+
+    async def delete_relationship(
+        self,
+        layer_id: str,
+        source_id: str,
+        relationship_type: str,
+        target_id: str,
+    ) -> None:
+        """Delete a relationship as seen from a CoW layer."""
+        chain = await self.get_layer_chain(layer_id)
+        with self.session_manager.session() as session:
+            if not self._copy_up(session, chain, source_id):
+                return
+            session.run(
+                """
+                MATCH (s:Resource {id: $source_id, layer_id: $layer_id})-[rel]->(t:Resource)
+                WHERE NOT s:Original AND NOT t:Original
+                  AND type(rel) = $relationship_type AND t.id = $target_id
+                DELETE rel
+                """,
+                {
+                    "source_id": source_id,
+                    "target_id": target_id,
+                    "layer_id": layer_id,
+                    "relationship_type": relationship_type,
+                },
+            )
+
+    async def materialize_layer(
+        self,
+        layer_id: str,
+        batch_size: int = 1000,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> LayerMetadata:
+        """
+        Copy every inherited resource into a CoW layer and detach it from
+        its parent's storage. The layer keeps parent_layer_id as lineage.
+
+        Args:
+            layer_id: CoW layer to materialize
+            batch_size: Nodes per batch
+            progress_callback: Called with (current, total)
+
+        Returns:
+            Updated LayerMetadata
+
+        Raises:
+            LayerNotFoundError: If the layer doesn't exist
+        """
+        chain = await self.get_layer_chain(layer_id)
+        if len(chain) == 1:
+            return await self.crud_operations.get_layer(layer_id)  # type: ignore[attr-defined]
+
+        with self.session_manager.session() as session:
+            inherited = sorted(
+                (resource_id, owner)
+                for resource_id, owner in resolve_layers(session, chain).items()
+                if owner != layer_id
+            )
+            total = len(inherited)
+
+            # Copy nodes first so every relationship target exists locally
+            copy_resources(session, inherited, layer_id, batch_size, progress_callback)
+
+            # Copy the inherited nodes' relationships, re-targeted to local
+            # nodes (tombstoned targets have no local node and are dropped)
+            for start in range(0, total, batch_size):
+                session.run(
+                    """
+                    UNWIND $rows AS row
+                    MATCH (src:Resource {id: row.id, layer_id: row.owner})-[rel]->(target:Resource)
+                    WHERE NOT src:Original
+                    MATCH (new:Resource {id: row.id, layer_id: $layer_id})
+                    WHERE NOT new:Original
+                    OPTIONAL MATCH (local:Resource {id: target.id, layer_id: $layer_id})
+                    WHERE NOT target:Original AND NOT local:Original
+                    WITH new, rel,
+                         CASE WHEN target:Original THEN target ELSE local END AS dest
+                    WHERE dest IS NOT NULL
+                    CALL apoc.create.relationship(new, type(rel), properties(rel), dest)
+                    YIELD rel AS new_rel
+                    RETURN count(new_rel)
+                    """,
+                    {
+                        "rows": [
+                            {"id": rid, "owner": owner}
+                            for rid, owner in inherited[start : start + batch_size]
+                        ],
+                        "layer_id": layer_id,
+                    },
+                )
+
+            # Re-target the layer's own relationships that point at ancestors
+            session.run(
+                """
+                MATCH (r:Resource {layer_id: $layer_id})-[rel]->(target:Resource)
+                WHERE NOT r:Original AND NOT target:Original
+                  AND target.layer_id <> $layer_id
+                MATCH (local:Resource {id: target.id, layer_id: $layer_id})
+                WHERE NOT local:Original
+                CALL apoc.create.relationship(r, type(rel), properties(rel), local)
+                YIELD rel AS new_rel
+                RETURN count(new_rel)
+                """,
+                {"layer_id": layer_id},
+            )
+            session.run(
+                """
+                MATCH (r:Resource {layer_id: $layer_id})-[rel]->(target:Resource)
+                WHERE NOT r:Original AND NOT target:Original
+                  AND target.layer_id <> $layer_id
+                DELETE rel
+                """,
+                {"layer_id": layer_id},
+            )
+
+            session.run(
+                "MATCH (t:LayerTombstone {layer_id: $layer_id}) DELETE t",
+                {"layer_id": layer_id},
+            )
+
+        await self.crud_operations.update_layer(  # type: ignore[attr-defined]
+            layer_id, metadata={"copy_on_write": False}
+        )
+        if self.stats_operations:
+            await self.stats_operations.refresh_layer_stats(layer_id)  # type: ignore[attr-defined]
+
+        self.logger.info(
+            f"Materialized layer {layer_id} ({total} inherited nodes copied)"
+        )
+        return await self.crud_operations.get_layer(layer_id)  # type: ignore[attr-defined]
+
+
+__all__ = [
+    "LayerCopyOnWriteOperations",
+    "chain_params",
+    "copy_resources",
+    "count_relationships",
+    "count_resources",
+    "effective_relationships",
+    "get_layer_chain",
+    "resolve_layers",
+    "resolved_resources_query",
+]
@@ -533,6 +533,22 @@ class LayerCrudOperations:
             )
 
         with self.session_manager.session() as session:
+            # Copy-on-write children read through this layer's nodes
+            children = [
+                self.node_to_layer_metadata(record["l"])
+                for record in session.run(
+                    "MATCH (l:Layer {parent_layer_id: $layer_id}) RETURN l",
+                    {"layer_id": layer_id},
+                )
+            ]
+            cow_children = [c.layer_id for c in children if c.is_copy_on_write]
+            if cow_children:
+                raise LayerProtectedError(
+                    layer_id,
+                    f"Copy-on-write layers depend on it: {', '.join(cow_children)}; "
+                    "materialize them first",
+                )
+
             # Delete all Resource nodes with this layer_id
             session.run(
                 """
@@ -543,6 +559,12 @@ class LayerCrudOperations:
                 {"layer_id": layer_id},
             )
 
+            # Delete copy-on-write tombstones
+            session.run(
+                "MATCH (t:LayerTombstone {layer_id: $layer_id}) DELETE t",
+                {"layer_id": layer_id},
+            )
+
             # Delete Layer metadata node
             session.run(
                 "MATCH (l:Layer {layer_id: $layer_id}) DETACH DELETE l",
@@ -9,6 +9,7 @@ Philosophy:
 - Thread-safe via Neo4j transactions
 - Clear error handling
 - Standard library only (no external dependencies beyond Neo4j)
+- Archives stream to and from disk chunk by chunk (see archive.py)
 
 Public API (the "studs"):
     LayerExportOperations: Class handling export/import operations for layers
@@ -16,8 +17,25 @@ Public API (the "studs"):
 
 import json
 import logging
-from typing import Callable, Optional
-
+import os
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from src.services.layer.archive import (
+    ArchiveChunk,
+    JsonArchiveWriter,
+    LayerArchiveWriter,
+    is_chunked_archive,
+    iter_archive_chunks,
+    iter_json_archive_chunks,
+    read_archive_manifest,
+)
+from src.services.layer.cow import (
+    chain_params,
+    copy_resources,
+    get_layer_chain,
+    resolve_layers,
+    resolved_resources_query,
+)
 from src.services.layer.models import (
     LayerAlreadyExistsError,
     LayerMetadata,
@@ -35,8 +53,8 @@ class LayerExportOperations:
 
     Responsibilities:
     - Copy layers (nodes + relationships)
-    - Archive layers to JSON files
-    - Restore layers from JSON archives
+    - Archive layers to chunked or JSON archive files
+    - Restore layers from archives, resuming interrupted restores
 
     Thread Safety: All methods are thread-safe via Neo4j transactions
     """
@@ -73,6 +91,9 @@ class LayerExportOperations:
         """
         Copy an entire layer (nodes + relationships).
 
+        A copy-on-write source is copied as seen through its parent chain, so
+        the target is a standalone layer.
+
         Args:
             source_layer_id: Layer to copy from
             target_layer_id: New layer ID
@@ -90,6 +111,7 @@ class LayerExportOperations:
             LayerAlreadyExistsError: If target exists
         """
         # Validate source exists and target doesn't exist
+        chain = [source_layer_id]
         if self.crud_operations:
             source_layer = await self.crud_operations.get_layer(source_layer_id)  # type: ignore[attr-defined]
             if not source_layer:
@@ -98,8 +120,15 @@ class LayerExportOperations:
             if await self.crud_operations.get_layer(target_layer_id):  # type: ignore[attr-defined]
                 raise LayerAlreadyExistsError(target_layer_id)
 
-            # Create target layer metadata
-            target_metadata = source_layer.metadata if copy_metadata else {}
+            if source_layer.is_copy_on_write:
+                chain = await get_layer_chain(self.crud_operations, source_layer_id)
+
+            # Create target layer metadata (the copy holds every node itself)
+            target_metadata = (
+                {k: v for k, v in source_layer.metadata.items() if k != "copy_on_write"}
+                if copy_metadata
+                else {}
+            )
 
             await self.crud_operations.create_layer(  # type: ignore[attr-defined]
                 layer_id=target_layer_id,
@@ -115,46 +144,21 @@ class LayerExportOperations:
 
         # Copy nodes in batches
         with self.session_manager.session() as session:
-            # Count total nodes
-            result = session.run(
-                """
-                MATCH (r:Resource)
-                WHERE NOT r:Original AND r.layer_id = $source_layer_id
-                RETURN count(r) as total
-                """,
-                {"source_layer_id": source_layer_id},
-            )
-            total_nodes = result.single()["total"]  # type: ignore[misc]
-
-            copied_nodes = 0
-            skip = 0
-
-            while skip < total_nodes:
-                # Copy batch of nodes
-                session.run(
-                    """
-                    MATCH (r:Resource)
-                    WHERE NOT r:Original AND r.layer_id = $source_layer_id
-                    WITH r
-                    SKIP $skip
-                    LIMIT $batch_size
-                    CREATE (new:Resource)
-                    SET new = properties(r),
-                        new.layer_id = $target_layer_id
-                    """,
-                    {
-                        "source_layer_id": source_layer_id,
-                        "target_layer_id": target_layer_id,
-                        "skip": skip,
-                        "batch_size": batch_size,
-                    },
+            if len(chain) > 1:
+                # Copy-on-write source: copy each effective node from its owner
+                owners = sorted(resolve_layers(session, chain).items())
+                copy_resources(
+                    session, owners, target_layer_id, batch_size, progress_callback
+                )
+                copied_nodes = len(owners)
+            else:
+                copied_nodes = self._copy_layer_nodes(
+                    session,
+                    source_layer_id,
+                    target_layer_id,
+                    batch_size,
+                    progress_callback,
                 )
-
-                copied_nodes += min(batch_size, total_nodes - skip)
-                skip += batch_size
-
-                if progress_callback:
-                    progress_callback(copied_nodes, total_nodes)
 
             # Copy relationships
             # NOTE: SCAN_SOURCE_NODE relationships are preserved to enable
@@ -166,27 +170,24 @@ class LayerExportOperations:
             # Two types of relationships are copied:
             # 1. Within-layer relationships: Both nodes are layer nodes
             # 2. SCAN_SOURCE_NODE relationships: Source is layer node, target is Original
+            #
+            # Targets are matched by id among the copied nodes, so targets a
+            # copy-on-write source inherits or has deleted resolve correctly.
             session.run(
-                """
-                MATCH (r1:Resource)-[rel]->(r2:Resource)
-                WHERE NOT r1:Original AND r1.layer_id = $source_layer_id
-                  AND (
-                    (NOT r2:Original AND r2.layer_id = $source_layer_id)
-                    OR (r2:Original)
-                  )
-                WITH r1, r2, rel, type(rel) as rel_type
-                MATCH (new1:Resource {id: r1.id, layer_id: $target_layer_id})
-                WITH new1, r2, rel, rel_type, properties(rel) as rel_props
+                resolved_resources_query(chain)
+                + """
+                MATCH (r)-[rel]->(r2:Resource)
+                WHERE r2:Original OR r2.layer_id IN $chain
+                MATCH (new1:Resource {id: r.id, layer_id: $target_layer_id})
                 OPTIONAL MATCH (new2:Resource {id: r2.id, layer_id: $target_layer_id})
                 WHERE NOT r2:Original
-                WITH new1, COALESCE(new2, r2) as target_node, rel_type, rel_props
+                WITH new1, type(rel) as rel_type, properties(rel) as rel_props,
+                     CASE WHEN r2:Original THEN r2 ELSE new2 END AS target_node
+                WHERE target_node IS NOT NULL
                 CALL apoc.create.relationship(new1, rel_type, rel_props, target_node) YIELD rel as new_rel
                 RETURN count(new_rel)
                 """,
-                {
-                    "source_layer_id": source_layer_id,
-                    "target_layer_id": target_layer_id,
-                },
+                {**chain_params(chain), "target_layer_id": target_layer_id},
             )
 
         # Refresh stats
@@ -211,19 +212,80 @@ class LayerExportOperations:
             created_at=datetime.utcnow(),
         )
 
+    @staticmethod
+    def _copy_layer_nodes(
+        session,
+        source_layer_id: str,
+        target_layer_id: str,
+        batch_size: int,
+        progress_callback: Optional[Callable[[int, int], None]],
+    ) -> int:
+        """Copy a standalone layer's nodes in SKIP/LIMIT batches."""
+        # Count total nodes
+        result = session.run(
+            """
+            MATCH (r:Resource)
+            WHERE NOT r:Original AND r.layer_id = $source_layer_id
+            RETURN count(r) as total
+            """,
+            {"source_layer_id": source_layer_id},
+        )
+        total_nodes = result.single()["total"]  # type: ignore[misc]
+
+        copied_nodes = 0
+        skip = 0
+
+        while skip < total_nodes:
+            # Copy batch of nodes
+            session.run(
+                """
+                MATCH (r:Resource)
+                WHERE NOT r:Original AND r.layer_id = $source_layer_id
+                WITH r
+                SKIP $skip
+                LIMIT $batch_size
+                CREATE (new:Resource)
+                SET new = properties(r),
+                    new.layer_id = $target_layer_id
+                """,
+                {
+                    "source_layer_id": source_layer_id,
+                    "target_layer_id": target_layer_id,
+                    "skip": skip,
+                    "batch_size": batch_size,
+                },
+            )
+
+            copied_nodes += min(batch_size, total_nodes - skip)
+            skip += batch_size
+
+            if progress_callback:
+                progress_callback(copied_nodes, total_nodes)
+
+        return copied_nodes
+
     async def archive_layer(
         self,
         layer_id: str,
         output_path: str,
         include_original: bool = False,
+        archive_format: Optional[str] = None,
+        chunk_size: int = 5000,
     ) -> str:
         """
-        Export layer to JSON file.
+        Export layer to an archive file, streaming records to disk.
+
+        A copy-on-write layer is archived as seen through its parent chain,
+        so the archive restores to a standalone layer.
 
         Args:
             layer_id: Layer to archive
-            output_path: File path for JSON output
+            output_path: File path for the archive
             include_original: Include :Original nodes
+            archive_format: "chunked" (compressed, checksummed chunks) or
+                "json" (single JSON document); default is "json" for
+                ``.json`` paths and "chunked" otherwise
+            chunk_size: Records per chunk (chunked format)
 
         Returns:
             Path to created archive file
@@ -233,29 +295,35 @@ class LayerExportOperations:
         """
         # Check if layer exists
         layer = None
+        chain = [layer_id]
         if self.crud_operations:
             layer = await self.crud_operations.get_layer(layer_id)  # type: ignore[attr-defined]
             if not layer:
                 raise LayerNotFoundError(layer_id)
+            if layer.is_copy_on_write:
+                chain = await get_layer_chain(self.crud_operations, layer_id)
+
+        if archive_format is None:
+            archive_format = (
+                "json" if output_path.lower().endswith(".json") else "chunked"
+            )
+        if archive_format == "chunked":
+            writer = LayerArchiveWriter(output_path, chunk_size=chunk_size)
+        elif archive_format == "json":
+            writer = JsonArchiveWriter(output_path)  # type: ignore[assignment]
+        else:
+            raise ValueError(f"Unknown archive format: {archive_format}")
 
-        # Collect nodes and relationships
-        nodes = []
-        relationships = []
+        with writer, self.session_manager.session() as session:
+            writer.write_metadata(layer.to_dict() if layer else {})
 
-        with self.session_manager.session() as session:
             # Get nodes
             node_result = session.run(
-                """
-                MATCH (r:Resource)
-                WHERE NOT r:Original AND r.layer_id = $layer_id
-                RETURN r
-                """,
-                {"layer_id": layer_id},
+                resolved_resources_query(chain) + "RETURN r", chain_params(chain)
             )
 
             for record in node_result:
-                node = record["r"]
-                nodes.append(dict(node))
+                writer.add_node(dict(record["r"]))
 
             # Get relationships
             # NOTE: SCAN_SOURCE_NODE relationships are included in archives
@@ -265,22 +333,28 @@ class LayerExportOperations:
             # Two types of relationships are archived:
             # 1. Within-layer relationships: Both nodes are layer nodes
             # 2. SCAN_SOURCE_NODE relationships: Source is layer node, target is Original
+            #
+            # Copy-on-write targets must still be visible (not deleted)
+            visible = set(resolve_layers(session, chain)) if len(chain) > 1 else None
             rel_result = session.run(
-                """
-                MATCH (r1:Resource)-[rel]->(r2:Resource)
-                WHERE NOT r1:Original AND r1.layer_id = $layer_id
-                  AND (
-                    (NOT r2:Original AND r2.layer_id = $layer_id)
-                    OR (r2:Original)
-                  )
-                RETURN r1.id as source, r2.id as target,
+                resolved_resources_query(chain)
+                + """
+                MATCH (r)-[rel]->(r2:Resource)
+                WHERE r2:Original OR r2.layer_id IN $chain
+                RETURN r.id as source, r2.id as target, r2:Original as original,
                        type(rel) as type, properties(rel) as props
                 """,
-                {"layer_id": layer_id},
+                chain_params(chain),
             )
 
             for record in rel_result:
-                relationships.append(
+                if (
+                    visible is not None
+                    and not record["original"]
+                    and record["target"] not in visible
+                ):
+                    continue
+                writer.add_relationship(
                     {
                         "source": record["source"],
                         "target": record["target"],
@@ -289,19 +363,9 @@ class LayerExportOperations:
                     }
                 )
 
-        # Write to file
-        archive_data = {
-            "version": "2.0",  # Version 2.0 includes SCAN_SOURCE_NODE
-            "includes_scan_source_node": True,  # Flag for backward compat
-            "metadata": layer.to_dict() if layer else {},
-            "nodes": nodes,
-            "relationships": relationships,
-        }
-
-        with open(output_path, "w") as f:
-            json.dump(archive_data, f, indent=2, default=str)
-
-        self.logger.info(str(f"Archived layer {layer_id} to {output_path}"))
+        self.logger.info(
+            str(f"Archived layer {layer_id} to {output_path} ({archive_format})")
+        )
 
         return output_path
 
@@ -309,46 +373,77 @@ class LayerExportOperations:
         self,
         archive_path: str,
         target_layer_id: Optional[str] = None,
+        batch_size: int = 5000,
+        resume: bool = False,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
     ) -> LayerMetadata:
         """
-        Restore layer from JSON archive.
+        Restore layer from an archive (chunked or JSON).
+
+        Chunks are applied in order with one UNWIND query each. After every
+        chunk the next chunk number is recorded in ``<archive>.<layer>.restore``;
+        with ``resume=True`` an interrupted restore continues from there.
 
         Args:
             archive_path: Path to archive file
             target_layer_id: Override layer ID
+            batch_size: Records per chunk for JSON archives
+            resume: Continue an interrupted restore of the same archive
+            progress_callback: Called with (chunks restored, total chunks)
 
         Returns:
             LayerMetadata of restored layer
 
         Raises:
             LayerAlreadyExistsError: If target layer already exists
+            LayerArchiveError: If the archive is truncated or corrupt
         """
-        # Load archive
-        with open(archive_path) as f:
-            archive_data = json.load(f)
+        # Load archive metadata (chunked archives are verified, not loaded)
+        if is_chunked_archive(archive_path):
+            manifest = read_archive_manifest(archive_path)
+            archive_version = manifest.version
+            includes_scan_source = True
+            metadata_dict = manifest.metadata
+            total_chunks = len(manifest.chunks)
+
+            def chunks(start_seq: int) -> Iterator[ArchiveChunk]:
+                return iter_archive_chunks(archive_path, start_seq)
+
+        else:
+            with open(archive_path) as f:
+                archive_data = json.load(f)
+            archive_version = archive_data.get("version", "1.0")
+            includes_scan_source = archive_data.get("includes_scan_source_node", False)
+            metadata_dict = archive_data["metadata"]
+            total_chunks = sum(
+                -(-len(archive_data.get(kind, [])) // batch_size)
+                for kind in ("nodes", "relationships")
+            )
 
-        archive_version = archive_data.get("version", "1.0")
-        includes_scan_source = archive_data.get("includes_scan_source_node", False)
+            def chunks(start_seq: int) -> Iterator[ArchiveChunk]:
+                return iter_json_archive_chunks(archive_data, batch_size, start_seq)
 
         logger.info(
             f"Restoring layer from archive version {archive_version}, "
             f"includes_scan_source_node={includes_scan_source}"
         )
 
-        metadata_dict = archive_data["metadata"]
-        nodes = archive_data["nodes"]
-        relationships = archive_data["relationships"]
-
         # Override layer_id if specified
         if target_layer_id:
             metadata_dict["layer_id"] = target_layer_id
 
-        # Create layer
         layer_metadata = LayerMetadata.from_dict(metadata_dict)
-
-        if self.crud_operations:
+        layer_id = layer_metadata.layer_id
+        journal_path = f"{archive_path}.{layer_id}.restore"
+
+        start_seq = 1
+        if resume and os.path.exists(journal_path):
+            with open(journal_path) as f:
+                start_seq = json.load(f)["next_seq"]
+            logger.info(f"Resuming restore of {layer_id} at chunk {start_seq}")
+        elif self.crud_operations:
             await self.crud_operations.create_layer(  # type: ignore[attr-defined]
-                layer_id=layer_metadata.layer_id,
+                layer_id=layer_id,
                 name=layer_metadata.name,
                 description=f"Restored from {archive_path}",
                 created_by="restore_layer",
@@ -357,80 +452,69 @@ class LayerExportOperations:
                 metadata=layer_metadata.metadata,
             )
 
-        # Restore nodes
         with self.session_manager.session() as session:
-            for node in nodes:
-                # Update layer_id if overridden
-                if target_layer_id:
-                    node["layer_id"] = target_layer_id
-
-                # Create node
-                session.run(
-                    """
-                    CREATE (r:Resource)
-                    SET r = $props
-                    """,
-                    {"props": node},
-                )
-
-            # Restore relationships
-            # NOTE: SCAN_SOURCE_NODE relationships need special handling
-            # because they target Original nodes (no layer_id filter)
-            for rel in relationships:
-                if rel["type"] == "SCAN_SOURCE_NODE":
-                    # Special handling: target is Original node, no layer_id filter
-                    session.run(
-                        """
-                        MATCH (r1:Resource {id: $source, layer_id: $layer_id})
-                        MATCH (r2:Resource:Original {id: $target})
-                        WITH r1, r2
-                        CALL apoc.create.relationship(r1, $rel_type, $props, r2) YIELD rel
-                        RETURN rel
-                        """,
-                        {
-                            "source": rel["source"],
-                            "target": rel["target"],
-                            "layer_id": target_layer_id
-                            if target_layer_id
-                            else layer_metadata.layer_id,
-                            "rel_type": rel["type"],
-                            "props": rel["properties"],
-                        },
-                    )
+            for chunk in chunks(start_seq):
+                if chunk.kind == "nodes":
+                    self._restore_nodes(session, chunk.records, layer_id)
                 else:
-                    # Regular within-layer relationships
-                    session.run(
-                        """
-                        MATCH (r1:Resource {id: $source, layer_id: $layer_id})
-                        MATCH (r2:Resource {id: $target, layer_id: $layer_id})
-                        WITH r1, r2
-                        CALL apoc.create.relationship(r1, $rel_type, $props, r2) YIELD rel
-                        RETURN rel
-                        """,
-                        {
-                            "source": rel["source"],
-                            "target": rel["target"],
-                            "layer_id": target_layer_id
-                            if target_layer_id
-                            else layer_metadata.layer_id,
-                            "rel_type": rel["type"],
-                            "props": rel["properties"],
-                        },
-                    )
+                    self._restore_relationships(session, chunk.records, layer_id)
+
+                with open(journal_path, "w") as f:
+                    json.dump({"next_seq": chunk.seq + 1}, f)
+                if progress_callback:
+                    progress_callback(chunk.seq, total_chunks)
+
+        if os.path.exists(journal_path):
+            os.remove(journal_path)
 
         # Refresh stats
         if self.stats_operations:
-            await self.stats_operations.refresh_layer_stats(layer_metadata.layer_id)  # type: ignore[attr-defined]
+            await self.stats_operations.refresh_layer_stats(layer_id)  # type: ignore[attr-defined]
 
-        self.logger.info(
-            f"Restored layer {layer_metadata.layer_id} from {archive_path}"
-        )
+        self.logger.info(f"Restored layer {layer_id} from {archive_path}")
 
         # Return restored layer
         if self.crud_operations:
-            return await self.crud_operations.get_layer(layer_metadata.layer_id)  # type: ignore[attr-defined]
+            return await self.crud_operations.get_layer(layer_id)  # type: ignore[attr-defined]
 
         return layer_metadata
 
+    @staticmethod
+    def _restore_nodes(session, nodes: List[Dict[str, Any]], layer_id: str) -> None:
+        """Restore one chunk of nodes (MERGE keeps re-applied chunks idempotent)."""
+        session.run(
+            """
+            UNWIND $nodes AS props
+            MERGE (r:Resource {id: props.id, layer_id: $layer_id})
+            SET r = props, r.layer_id = $layer_id
+            """,
+            {"nodes": nodes, "layer_id": layer_id},
+        )
+
+    @staticmethod
+    def _restore_relationships(
+        session, relationships: List[Dict[str, Any]], layer_id: str
+    ) -> None:
+        """Restore one chunk of relationships."""
+        # NOTE: SCAN_SOURCE_NODE relationships need special handling
+        # because they target Original nodes (no layer_id filter)
+        session.run(
+            """
+            UNWIND $relationships AS row
+            MATCH (r1:Resource {id: row.source, layer_id: $layer_id})
+            WHERE NOT r1:Original
+            OPTIONAL MATCH (orig:Resource:Original {id: row.target})
+            WHERE row.type = 'SCAN_SOURCE_NODE'
+            OPTIONAL MATCH (peer:Resource {id: row.target, layer_id: $layer_id})
+            WHERE row.type <> 'SCAN_SOURCE_NODE' AND NOT peer:Original
+            WITH r1, row, coalesce(orig, peer) AS r2
+            WHERE r2 IS NOT NULL
+            CALL apoc.merge.relationship(r1, row.type, {}, row.properties, r2, {})
+            YIELD rel
+            RETURN count(rel) AS restored
+            """,
+            {"relationships": relationships, "layer_id": layer_id},
+        )
+
 
 __all__ = ["LayerExportOperations"]
@@ -22,6 +22,7 @@ Public API (the "studs"):
     LayerLockedError: Layer is locked for modifications
     InvalidLayerIdError: Layer ID format invalid
     LayerIntegrityError: Layer integrity validation failed
+    LayerArchiveError: Layer archive is truncated, corrupt, or unknown
     CrossLayerRelationshipError: Attempted to create relationship across layers
 """
 
@@ -89,6 +90,11 @@ class LayerMetadata:
         self.metadata = metadata or {}
         self.tags = tags or []
 
+    @property
+    def is_copy_on_write(self) -> bool:
+        """True if the layer stores only a delta over its parent."""
+        return bool(self.metadata.get("copy_on_write")) and bool(self.parent_layer_id)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation."""
         return {
@@ -311,6 +317,27 @@ class LayerIntegrityError(LayerError):
         self.issues = issues
 
 
+class LayerArchiveError(LayerError):
+    """Layer archive is truncated, corrupt, or in an unknown format."""
+
+    def __init__(self, archive_path: str, reason: str):
+        super().__init__(f"Invalid layer archive '{archive_path}': {reason}")
+        self.archive_path = archive_path
+        self.reason = reason
+
+
+class LayerNotMaterializedError(LayerError):
+    """Operation needs a standalone layer but the layer is copy-on-write."""
+
+    def __init__(self, layer_id: str, operation: str):
+        super().__init__(
+            f"Layer {layer_id} is a copy-on-write layer; materialize it first "
+            f"(atg layer materialize {layer_id}) before {operation}"
+        )
+        self.layer_id = layer_id
+        self.operation = operation
+
+
 class CrossLayerRelationshipError(LayerError):
     """Attempted to create relationship across layers."""
 
@@ -324,12 +351,14 @@ __all__ = [
     "CrossLayerRelationshipError",
     "InvalidLayerIdError",
     "LayerAlreadyExistsError",
+    "LayerArchiveError",
     "LayerDiff",
     "LayerError",
     "LayerIntegrityError",
     "LayerLockedError",
     "LayerMetadata",
     "LayerNotFoundError",
+    "LayerNotMaterializedError",
     "LayerProtectedError",
     "LayerType",
     "LayerValidationReport",
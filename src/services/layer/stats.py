@@ -17,6 +17,11 @@ Public API (the "studs"):
 import logging
 from typing import Optional
 
+from src.services.layer.cow import (
+    count_relationships,
+    count_resources,
+    get_layer_chain,
+)
 from src.services.layer.models import LayerMetadata, LayerNotFoundError
 from src.utils.session_manager import Neo4jSessionManager
 
@@ -55,6 +60,9 @@ class LayerStatsOperations:
         """
         Recalculate node_count and relationship_count.
 
+        Copy-on-write layers count everything visible through their parent
+        chain, not only their own delta.
+
         Args:
             layer_id: Layer to refresh
 
@@ -65,34 +73,17 @@ class LayerStatsOperations:
             LayerNotFoundError: If layer doesn't exist
         """
         # Check if layer exists
+        chain = [layer_id]
         if self.crud_operations:
             layer = await self.crud_operations.get_layer(layer_id)  # type: ignore[attr-defined]
             if not layer:
                 raise LayerNotFoundError(layer_id)
+            if layer.is_copy_on_write:
+                chain = await get_layer_chain(self.crud_operations, layer_id)
 
         with self.session_manager.session() as session:
-            # Count nodes
-            node_count = session.run(  # type: ignore[misc]
-                """
-                MATCH (r:Resource)
-                WHERE NOT r:Original AND r.layer_id = $layer_id
-                RETURN count(r) as count
-                """,
-                {"layer_id": layer_id},
-            ).single()["count"]
-
-            # Count relationships
-            rel_count = session.run(  # type: ignore[misc]
-                """
-                MATCH (r1:Resource)-[rel]->(r2:Resource)
-                WHERE NOT r1:Original AND NOT r2:Original
-                  AND r1.layer_id = $layer_id
-                  AND r2.layer_id = $layer_id
-                  AND type(rel) <> 'SCAN_SOURCE_NODE'
-                RETURN count(rel) as count
-                """,
-                {"layer_id": layer_id},
-            ).single()["count"]
+            node_count = count_resources(session, chain)
+            rel_count = count_relationships(session, chain)
 
             # Update layer metadata
             session.run(
@@ -16,8 +16,15 @@ Public API (the "studs"):
 
 import logging
 from datetime import datetime
-from typing import Optional
-
+from typing import List, Optional
+
+from src.services.layer.cow import (
+    chain_params,
+    count_relationships,
+    count_resources,
+    get_layer_chain,
+    resolved_resources_query,
+)
 from src.services.layer.models import (
     LayerDiff,
     LayerNotFoundError,
@@ -69,6 +76,9 @@ class LayerValidationOperations:
         """
         Compare two layers to find differences.
 
+        Copy-on-write layers are compared by everything visible through their
+        parent chain.
+
         Args:
             layer_a_id: Baseline layer
             layer_b_id: Comparison layer
@@ -82,6 +92,7 @@ class LayerValidationOperations:
             LayerNotFoundError: If either layer doesn't exist
         """
         # Validate both layers exist
+        chain_a, chain_b = [layer_a_id], [layer_b_id]
         if self.crud_operations:
             layer_a = await self.crud_operations.get_layer(layer_a_id)  # type: ignore[attr-defined]
             layer_b = await self.crud_operations.get_layer(layer_b_id)  # type: ignore[attr-defined]
@@ -91,29 +102,24 @@ class LayerValidationOperations:
             if not layer_b:
                 raise LayerNotFoundError(layer_b_id)
 
+            chain_a = await self._layer_chain(layer_a)
+            chain_b = await self._layer_chain(layer_b)
+
         with self.session_manager.session() as session:
-            # Count nodes in each layer
-            nodes_a_result = session.run(
-                """
-                MATCH (r:Resource)
-                WHERE NOT r:Original AND r.layer_id = $layer_id
-                RETURN collect(r.id) as ids, count(r) as count
-                """,
-                {"layer_id": layer_a_id},
-            )
-            nodes_a_record = nodes_a_result.single()
+            # Collect the resource ids visible in each layer
+            nodes_a_record = session.run(
+                resolved_resources_query(chain_a)
+                + "RETURN collect(r.id) as ids, count(r) as count",
+                chain_params(chain_a),
+            ).single()
             nodes_a_ids = set(nodes_a_record["ids"])  # type: ignore[misc]
             nodes_a_count = nodes_a_record["count"]  # type: ignore[misc]
 
-            nodes_b_result = session.run(
-                """
-                MATCH (r:Resource)
-                WHERE NOT r:Original AND r.layer_id = $layer_id
-                RETURN collect(r.id) as ids, count(r) as count
-                """,
-                {"layer_id": layer_b_id},
-            )
-            nodes_b_record = nodes_b_result.single()
+            nodes_b_record = session.run(
+                resolved_resources_query(chain_b)
+                + "RETURN collect(r.id) as ids, count(r) as count",
+                chain_params(chain_b),
+            ).single()
             nodes_b_ids = set(nodes_b_record["ids"])  # type: ignore[misc]
             nodes_b_count = nodes_b_record["count"]  # type: ignore[misc]
 
@@ -123,29 +129,8 @@ class LayerValidationOperations:
             common_ids = nodes_a_ids & nodes_b_ids
 
             # Count relationships
-            rels_a = session.run(  # type: ignore[misc]
-                """
-                MATCH (r1:Resource)-[rel]->(r2:Resource)
-                WHERE NOT r1:Original AND NOT r2:Original
-                  AND r1.layer_id = $layer_id
-                  AND r2.layer_id = $layer_id
-                  AND type(rel) <> 'SCAN_SOURCE_NODE'
-                RETURN count(rel) as count
-                """,
-                {"layer_id": layer_a_id},
-            ).single()["count"]
-
-            rels_b = session.run(  # type: ignore[misc]
-                """
-                MATCH (r1:Resource)-[rel]->(r2:Resource)
-                WHERE NOT r1:Original AND NOT r2:Original
-                  AND r1.layer_id = $layer_id
-                  AND r2.layer_id = $layer_id
-                  AND type(rel) <> 'SCAN_SOURCE_NODE'
-                RETURN count(rel) as count
-                """,
-                {"layer_id": layer_b_id},
-            ).single()["count"]
+            rels_a = count_relationships(session, chain_a)
+            rels_b = count_relationships(session, chain_b)
 
         # Calculate change percentage
         total_nodes = max(nodes_a_count, nodes_b_count)
@@ -195,6 +180,11 @@ class LayerValidationOperations:
             if not layer:
                 raise LayerNotFoundError(layer_id)
 
+        # Copy-on-write layers are validated through their parent chain and
+        # may point at nodes owned by their ancestors
+        chain = await self._layer_chain(layer) if layer else [layer_id]
+        params = chain_params(chain)
+
         report = LayerValidationReport(
             layer_id=layer_id,
             validated_at=datetime.utcnow(),
@@ -204,13 +194,12 @@ class LayerValidationOperations:
         with self.session_manager.session() as session:
             # Check 1: All Resource nodes have SCAN_SOURCE_NODE links
             missing_scan_source = session.run(  # type: ignore[misc]
-                """
-                MATCH (r:Resource)
-                WHERE NOT r:Original AND r.layer_id = $layer_id
-                  AND NOT (r)-[:SCAN_SOURCE_NODE]->()
+                resolved_resources_query(chain)
+                + """
+                WHERE NOT (r)-[:SCAN_SOURCE_NODE]->()
                 RETURN count(r) as count
                 """,
-                {"layer_id": layer_id},
+                params,
             ).single()["count"]
 
             if missing_scan_source > 0:
@@ -223,15 +212,15 @@ class LayerValidationOperations:
 
             # Check 2: No cross-layer relationships
             cross_layer_rels = session.run(  # type: ignore[misc]
-                """
-                MATCH (r1:Resource)-[rel]->(r2:Resource)
-                WHERE NOT r1:Original AND NOT r2:Original
-                  AND r1.layer_id = $layer_id
-                  AND r2.layer_id <> $layer_id
+                resolved_resources_query(chain)
+                + """
+                MATCH (r)-[rel]->(r2:Resource)
+                WHERE NOT r2:Original
+                  AND NOT r2.layer_id IN $chain
                   AND type(rel) <> 'SCAN_SOURCE_NODE'
                 RETURN count(rel) as count
                 """,
-                {"layer_id": layer_id},
+                params,
             ).single()["count"]
 
             if cross_layer_rels > 0:
@@ -243,33 +232,28 @@ class LayerValidationOperations:
                 report.cross_layer_relationships = cross_layer_rels
 
                 if fix_issues:
-                    # Delete cross-layer relationships
-                    session.run(
+                    # Delete cross-layer relationships; only the layer's own
+                    # nodes are touched; ancestors are fixed by validating them
+                    deleted = session.run(  # type: ignore[misc]
                         """
                         MATCH (r1:Resource)-[rel]->(r2:Resource)
                         WHERE NOT r1:Original AND NOT r2:Original
                           AND r1.layer_id = $layer_id
-                          AND r2.layer_id <> $layer_id
+                          AND NOT r2.layer_id IN $chain
                           AND type(rel) <> 'SCAN_SOURCE_NODE'
                         DELETE rel
+                        RETURN count(rel) as count
                         """,
-                        {"layer_id": layer_id},
-                    )
+                        {"layer_id": layer_id, "chain": chain},
+                    ).single()["count"]
                     report.add_warning(
                         "CROSS_LAYER_RELS_FIXED",
-                        f"Deleted {cross_layer_rels} cross-layer relationships",
+                        f"Deleted {deleted} cross-layer relationships",
                     )
 
             # Check 3: Node count matches metadata (only if we have layer metadata)
             if layer:
-                actual_node_count = session.run(  # type: ignore[misc]
-                    """
-                    MATCH (r:Resource)
-                    WHERE NOT r:Original AND r.layer_id = $layer_id
-                    RETURN count(r) as count
-                    """,
-                    {"layer_id": layer_id},
-                ).single()["count"]
+                actual_node_count = count_resources(session, chain)
 
                 if actual_node_count != layer.node_count:
                     report.add_warning(
@@ -292,5 +276,11 @@ class LayerValidationOperations:
 
         return report
 
+    async def _layer_chain(self, layer) -> List[str]:
+        """Read chain of a layer: [layer_id] unless it is copy-on-write."""
+        if layer.is_copy_on_write:
+            return await get_layer_chain(self.crud_operations, layer.layer_id)
+        return [layer.layer_id]
+
 
 __all__ = ["LayerValidationOperations"]
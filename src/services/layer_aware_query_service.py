@@ -9,6 +9,7 @@ Key Features:
 - Relationship traversal within layers
 - Access to Original nodes for cross-reference
 - Layer isolation guarantees
+- Copy-on-write layers resolve reads through their parent chain
 
 Thread Safety: All methods are thread-safe via Neo4j sessions
 """
@@ -22,6 +23,12 @@ from src.services.layer import (
     LayerManagementService,
     LayerNotFoundError,
 )
+from src.services.layer.cow import (
+    chain_params,
+    effective_relationships,
+    resolve_layers,
+    resolved_resources_query,
+)
 from src.utils.session_manager import Neo4jSessionManager
 
 logger = logging.getLogger(__name__)
@@ -82,6 +89,19 @@ class LayerAwareQueryService:
 
         return active_layer.layer_id
 
+    async def _get_layer_chain(self, layer_id: Optional[str] = None) -> List[str]:
+        """
+        Get the read chain of the effective layer.
+
+        Args:
+            layer_id: Explicit layer ID or None for active
+
+        Returns:
+            [layer_id, parent, ...]; a single entry unless copy-on-write
+        """
+        effective_layer_id = await self._get_effective_layer_id(layer_id)
+        return await self.layer_service.get_layer_chain(effective_layer_id)
+
     async def get_resource(
         self,
         resource_id: str,
@@ -104,20 +124,17 @@ class LayerAwareQueryService:
             # From specific layer
             resource = await service.get_resource("vm-a1b2c3d4", layer_id="scaled-v1")
         """
-        effective_layer_id = await self._get_effective_layer_id(layer_id)
+        chain = await self._get_layer_chain(layer_id)
 
-        query = """
-        MATCH (r:Resource)
-        WHERE NOT r:Original
-          AND r.id = $resource_id
-          AND r.layer_id = $layer_id
-        RETURN properties(r) as props
-        """
+        query = (
+            resolved_resources_query(chain, by_ids=True)
+            + "RETURN properties(r) as props"
+        )
 
         with self.session_manager.session() as session:
             result = session.run(
                 query,
-                {"resource_id": resource_id, "layer_id": effective_layer_id},
+                {**chain_params(chain), "resource_ids": [resource_id]},
             )
             record = result.single()
 
@@ -157,14 +174,11 @@ class LayerAwareQueryService:
                 filters={"location": "eastus"}
             )
         """
-        effective_layer_id = await self._get_effective_layer_id(layer_id)
+        chain = await self._get_layer_chain(layer_id)
 
         # Build query dynamically
-        where_clauses = [
-            "NOT r:Original",
-            "r.layer_id = $layer_id",
-        ]
-        params: Dict[str, Any] = {"layer_id": effective_layer_id}
+        where_clauses: List[str] = []
+        params: Dict[str, Any] = chain_params(chain)
 
         if resource_type:
             where_clauses.append("r.type = $resource_type")
@@ -200,13 +214,10 @@ class LayerAwareQueryService:
                 where_clauses.append(f"r.{key} = ${param_name}")
                 params[param_name] = value
 
-        where_clause = " AND ".join(where_clauses)
-
-        query = f"""
-        MATCH (r:Resource)
-        WHERE {where_clause}
-        RETURN properties(r) as props
-        """
+        query = resolved_resources_query(chain)
+        if where_clauses:
+            query += f"WHERE {' AND '.join(where_clauses)}\n"
+        query += "RETURN properties(r) as props"
 
         # Add pagination (safe - using integer values, not user input in query string)
         if offset > 0:
@@ -249,7 +260,8 @@ class LayerAwareQueryService:
 
         Guarantees:
             - Never crosses layer boundaries
-            - All returned nodes have same layer_id
+            - All returned nodes have same layer_id (copy-on-write layers:
+              nodes resolved through the layer chain)
 
         Example:
             # Find all VMs in a VNet
@@ -259,7 +271,8 @@ class LayerAwareQueryService:
                 depth=2  # VNet -> Subnet -> VM
             )
         """
-        effective_layer_id = await self._get_effective_layer_id(layer_id)
+        chain = await self._get_layer_chain(layer_id)
+        effective_layer_id = chain[0]
 
         # Build relationship pattern based on direction
         if direction == "outgoing":
@@ -271,6 +284,11 @@ class LayerAwareQueryService:
         else:
             raise ValueError(f"Invalid direction: {direction}")
 
+        if len(chain) > 1:
+            return self._traverse_chain(
+                chain, start_resource_id, relationship_type, direction, depth
+            )
+
         # Build variable-length pattern for depth
         if depth > 1:
             rel_pattern = rel_pattern.replace("]", f"*1..{depth}]")
@@ -300,6 +318,51 @@ class LayerAwareQueryService:
 
         return resources
 
+    def _traverse_chain(
+        self,
+        chain: List[str],
+        start_resource_id: str,
+        relationship_type: str,
+        direction: str,
+        depth: int,
+    ) -> List[Dict[str, Any]]:
+        """Breadth-first traversal over relationships resolved through a chain."""
+        visited = {start_resource_id}
+        frontier = {start_resource_id}
+        reached: List[str] = []
+
+        with self.session_manager.session() as session:
+            for _ in range(depth):
+                neighbors = set()
+                if direction in ("outgoing", "both"):
+                    neighbors |= {
+                        target
+                        for _, _, target in effective_relationships(
+                            session, chain, relationship_type, source_ids=frontier
+                        )
+                    }
+                if direction in ("incoming", "both"):
+                    neighbors |= {
+                        source
+                        for source, _, _ in effective_relationships(
+                            session, chain, relationship_type, target_ids=frontier
+                        )
+                    }
+                frontier = neighbors - visited
+                if not frontier:
+                    break
+                visited |= frontier
+                reached.extend(sorted(frontier))
+
+            if not reached:
+                return []
+            result = session.run(
+                resolved_resources_query(chain, by_ids=True)
+                + "RETURN properties(r) as props",
+                {**chain_params(chain), "resource_ids": reached},
+            )
+            return [dict(record["props"]) for record in result]
+
     async def get_resource_original(
         self,
         resource_id: str,
@@ -324,20 +387,17 @@ class LayerAwareQueryService:
             original = await service.get_resource_original("vm-a1b2c3d4")
             azure_id = original["id"]  # Real Azure resource ID
         """
-        effective_layer_id = await self._get_effective_layer_id(layer_id)
+        chain = await self._get_layer_chain(layer_id)
 
-        query = """
-        MATCH (r:Resource)-[:SCAN_SOURCE_NODE]->(orig:Original)
-        WHERE NOT r:Original
-          AND r.id = $resource_id
-          AND r.layer_id = $layer_id
-        RETURN properties(orig) as props
-        """
+        query = resolved_resources_query(chain, by_ids=True) + (
+            "MATCH (r)-[:SCAN_SOURCE_NODE]->(orig:Original)\n"
+            "RETURN properties(orig) as props"
+        )
 
         with self.session_manager.session() as session:
             result = session.run(
                 query,
-                {"resource_id": resource_id, "layer_id": effective_layer_id},
+                {**chain_params(chain), "resource_ids": [resource_id]},
             )
             record = result.single()
 
@@ -365,25 +425,16 @@ class LayerAwareQueryService:
             total = await service.count_resources()
             vms = await service.count_resources(resource_type="VirtualMachine")
         """
-        effective_layer_id = await self._get_effective_layer_id(layer_id)
+        chain = await self._get_layer_chain(layer_id)
 
-        where_clauses = [
-            "NOT r:Original",
-            "r.layer_id = $layer_id",
-        ]
-        params: Dict[str, Any] = {"layer_id": effective_layer_id}
+        params: Dict[str, Any] = chain_params(chain)
+        query = resolved_resources_query(chain)
 
         if resource_type:
-            where_clauses.append("r.type = $resource_type")
+            query += "WHERE r.type = $resource_type\n"
             params["resource_type"] = resource_type
 
-        where_clause = " AND ".join(where_clauses)
-
-        query = f"""
-        MATCH (r:Resource)
-        WHERE {where_clause}
-        RETURN count(r) as count
-        """
+        query += "RETURN count(r) as count"
 
         with self.session_manager.session() as session:
             result = session.run(query, params)  # type: ignore[arg-type]
@@ -413,22 +464,40 @@ class LayerAwareQueryService:
             print(f"Layer has {stats['total_nodes']} resources")
             print(f"Most common type: {max(stats['resource_types'].items(), key=lambda x: x[1])}")
         """
-        effective_layer_id = await self._get_effective_layer_id(layer_id)
+        chain = await self._get_layer_chain(layer_id)
+        effective_layer_id = chain[0]
 
         stats = {}
 
         with self.session_manager.session() as session:
             # Total nodes
             result = session.run(
-                """
-                MATCH (r:Resource)
-                WHERE NOT r:Original AND r.layer_id = $layer_id
-                RETURN count(r) as count
-                """,
-                {"layer_id": effective_layer_id},
+                resolved_resources_query(chain) + "RETURN count(r) as count",
+                chain_params(chain),
             )
             stats["total_nodes"] = result.single()["count"]  # type: ignore[misc]
 
+            # Resource type distribution
+            result = session.run(
+                resolved_resources_query(chain)
+                + "RETURN r.type as type, count(r) as count ORDER BY count DESC",
+                chain_params(chain),
+            )
+            stats["resource_types"] = {
+                record["type"]: record["count"] for record in result
+            }
+
+            if len(chain) > 1:
+                relationships = effective_relationships(session, chain)
+                type_counts: Dict[str, int] = {}
+                for _, rel_type, _ in relationships:
+                    type_counts[rel_type] = type_counts.get(rel_type, 0) + 1
+                stats["total_relationships"] = len(relationships)
+                stats["relationship_types"] = dict(
+                    sorted(type_counts.items(), key=lambda item: -item[1])
+                )
+                return self._with_avg_degree(stats)
+
             # Total relationships
             result = session.run(
                 """
@@ -443,20 +512,6 @@ class LayerAwareQueryService:
             )
             stats["total_relationships"] = result.single()["count"]  # type: ignore[misc]
 
-            # Resource type distribution
-            result = session.run(
-                """
-                MATCH (r:Resource)
-                WHERE NOT r:Original AND r.layer_id = $layer_id
-                RETURN r.type as type, count(r) as count
-                ORDER BY count DESC
-                """,
-                {"layer_id": effective_layer_id},
-            )
-            stats["resource_types"] = {
-                record["type"]: record["count"] for record in result
-            }
-
             # Relationship type distribution
             result = session.run(
                 """
@@ -474,14 +529,17 @@ class LayerAwareQueryService:
                 record["type"]: record["count"] for record in result
             }
 
-            # Average degree
-            if stats["total_nodes"] > 0:
-                stats["avg_degree"] = (stats["total_relationships"] * 2) / stats[
-                    "total_nodes"
-                ]
-            else:
-                stats["avg_degree"] = 0.0
+        return self._with_avg_degree(stats)
 
+    @staticmethod
+    def _with_avg_degree(stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Add avg_degree to a statistics dict."""
+        if stats["total_nodes"] > 0:
+            stats["avg_degree"] = (stats["total_relationships"] * 2) / stats[
+                "total_nodes"
+            ]
+        else:
+            stats["avg_degree"] = 0.0
         return stats
 
     async def exists_in_layer(
@@ -523,7 +581,11 @@ class LayerAwareQueryService:
             print(str(f"Found {len(components)} connected components"))
             print(str(f"Largest component has {len(components[0])} resources"))
         """
-        effective_layer_id = await self._get_effective_layer_id(layer_id)
+        chain = await self._get_layer_chain(layer_id)
+        effective_layer_id = chain[0]
+
+        if len(chain) > 1:
+            return self._chain_connected_components(chain)
 
         # Use Neo4j's connected components algorithm if available
         # Otherwise fall back to manual traversal
@@ -611,6 +673,28 @@ class LayerAwareQueryService:
 
         return components
 
+    def _chain_connected_components(self, chain: List[str]) -> List[List[str]]:
+        """Weakly connected components of a copy-on-write layer (union-find)."""
+        with self.session_manager.session() as session:
+            parent = {rid: rid for rid in resolve_layers(session, chain)}
+            relationships = effective_relationships(session, chain)
+
+        def find(rid: str) -> str:
+            while parent[rid] != rid:
+                parent[rid] = parent[parent[rid]]
+                rid = parent[rid]
+            return rid
+
+        for source, _, target in relationships:
+            root_source, root_target = find(source), find(target)
+            if root_source != root_target:
+                parent[root_source] = root_target
+
+        components: Dict[str, List[str]] = {}
+        for rid in parent:
+            components.setdefault(find(rid), []).append(rid)
+        return sorted(components.values(), key=len, reverse=True)
+
     async def get_resources_by_ids(
         self,
         resource_ids: List[str],
@@ -631,22 +715,24 @@ class LayerAwareQueryService:
                 "vm-1", "vm-2", "vm-3"
             ])
         """
-        effective_layer_id = await self._get_effective_layer_id(layer_id)
-
-        query = """
-        UNWIND $resource_ids as rid
-        OPTIONAL MATCH (r:Resource {id: rid, layer_id: $layer_id})
-        WHERE NOT r:Original
-        RETURN rid, properties(r) as props
-        """
+        chain = await self._get_layer_chain(layer_id)
+
+        if len(chain) == 1:
+            query = """
+            UNWIND $resource_ids as rid
+            OPTIONAL MATCH (r:Resource {id: rid, layer_id: $layer_id})
+            WHERE NOT r:Original
+            RETURN rid, properties(r) as props
+            """
+        else:
+            query = resolved_resources_query(chain, by_ids=True) + (
+                "RETURN r.id as rid, properties(r) as props"
+            )
 
         with self.session_manager.session() as session:
             result = session.run(
                 query,
-                {
-                    "resource_ids": resource_ids,
-                    "layer_id": effective_layer_id,
-                },
+                {**chain_params(chain), "resource_ids": resource_ids},
             )
 
             # Build result map
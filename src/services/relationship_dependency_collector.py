@@ -5,30 +5,130 @@ Collects missing cross-RG dependencies by analyzing relationship rules.
 
 When filtering scans by resource group, this service ensures that resources
 referenced by relationships are included even if they're in different RGs.
+Dependencies are followed transitively: the resources fetched for one hop
+form the frontier whose references are collected on the next, up to a
+configurable depth.
 
 Example:
     VM in RG-compute references NIC in RG-network
     → Service fetches NIC from Azure and includes it in the scan
+    NIC references a subnet in RG-hub (second hop)
+    → Service fetches the subnet as well
 """
 
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Set
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
 
 from ..models.filter_config import FilterConfig
 
 logger = logging.getLogger(__name__)
 
+# One hop unless configured otherwise (ProcessingConfig.dependency_max_depth)
+DEFAULT_MAX_DEPTH = 1
+DEFAULT_FETCH_CONCURRENCY = 20
+# Attempts per resource when ARM keeps throttling
+DEFAULT_THROTTLE_RETRIES = 3
+DEFAULT_THROTTLE_BACKOFF = 2.0
+MAX_THROTTLE_BACKOFF = 60.0
+
+
+def is_throttling_error(error: BaseException) -> bool:
+    """Whether an ARM error is throttling (HTTP 429 / TooManyRequests)."""
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status == 429 or "TooManyRequests" in str(error)
+
+
+def throttle_delay(error: BaseException, attempt: int) -> Optional[float]:
+    """
+    Seconds to back off after a throttling error, or None if not throttled.
+
+    Prefers the server's Retry-After hint over exponential back-off.
+
+    Args:
+        error: Exception raised by a fetch
+        attempt: Zero-based attempt number for this resource
+    """
+    if not is_throttling_error(error):
+        return None
+
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        try:
+            return min(float(retry_after), MAX_THROTTLE_BACKOFF)
+        except ValueError:
+            pass
+    return min(DEFAULT_THROTTLE_BACKOFF * (2**attempt), MAX_THROTTLE_BACKOFF)
+
+
+class AdaptiveFetchLimit:
+    """
+    Concurrency limit for dependency fetches that reacts to throttling.
+
+    Throttling halves the limit and pauses every fetch until the back-off
+    has passed; each run of successful fetches as long as the limit raises
+    it by one, back up to the configured maximum.
+    """
+
+    def __init__(self, maximum: int) -> None:
+        self.maximum = max(1, maximum)
+        self.limit = self.maximum
+        self.resume_at = 0.0
+        self._in_flight = 0
+        self._successes = 0
+        self._condition = asyncio.Condition()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one fetch slot, waiting out any throttling pause first."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        try:
+            delay = self.resume_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            yield
+        finally:
+            async with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def succeeded(self) -> None:
+        if self.limit >= self.maximum:
+            return
+        self._successes += 1
+        if self._successes >= self.limit:
+            self.limit += 1
+            self._successes = 0
+
+    def throttled(self, delay: float) -> None:
+        self.limit = max(1, self.limit // 2)
+        self._successes = 0
+        self.resume_at = max(self.resume_at, time.monotonic() + delay)
+        logger.warning(
+            f"Dependency fetches throttled; pausing {delay:.1f}s "
+            f"and limiting to {self.limit} in flight"
+        )
+
 
 class RelationshipDependencyCollector:
     """
     Collects missing cross-RG dependencies by analyzing relationship rules.
 
-    This service implements Phase 2.6 of the scan process:
-    1. Extract target resource IDs from relationship rules
-    2. Check which targets already exist in Neo4j
-    3. Fetch missing resources from Azure in parallel
-    4. Return missing resources to be added to the scan
+    This service implements Phase 2.6 of the scan process, one frontier
+    (hop) at a time up to max_depth:
+    1. Extract target resource IDs from relationship rules for the frontier
+    2. Drop targets already in the scan or seen on an earlier hop
+    3. Check which remaining targets already exist in Neo4j (one query)
+    4. Fetch the missing resources from Azure through a bounded pool
+    5. The fetched resources become the next frontier
     """
 
     def __init__(
@@ -36,6 +136,9 @@ class RelationshipDependencyCollector:
         discovery_service: Any,
         db_ops: Any,
         relationship_rules: List[Any],
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        fetch_concurrency: int = DEFAULT_FETCH_CONCURRENCY,
+        throttle_retries: int = DEFAULT_THROTTLE_RETRIES,
     ):
         """
         Initialize the dependency collector.
@@ -44,10 +147,16 @@ class RelationshipDependencyCollector:
             discovery_service: AzureDiscoveryService for fetching resources
             db_ops: DatabaseOperations for checking existing nodes
             relationship_rules: List of RelationshipRule instances
+            max_depth: Hops to follow references out of the filtered resources
+            fetch_concurrency: Maximum fetches in flight
+            throttle_retries: Attempts per resource while ARM is throttling
         """
         self.discovery_service = discovery_service
         self.db_ops = db_ops
         self.relationship_rules = relationship_rules
+        self.max_depth = max(1, max_depth)
+        self.fetch_concurrency = max(1, fetch_concurrency)
+        self.throttle_retries = max(1, throttle_retries)
 
     async def collect_missing_dependencies(
         self,
@@ -58,6 +167,9 @@ class RelationshipDependencyCollector:
         Collect missing cross-RG dependencies for filtered resources.
 
         This is the main entry point for Phase 2.6 dependency collection.
+        Resource IDs are compared case-insensitively, as ARM IDs are, so a
+        dependency referenced from several resources or hops is checked and
+        fetched once.
 
         Args:
             filtered_resources: Resources from the filtered RGs
@@ -76,42 +188,65 @@ class RelationshipDependencyCollector:
         logger.info("Phase 2.6: Collecting cross-RG dependencies from relationships")
         logger.info("=" * 70)
 
-        # Step 1: Extract all target IDs from relationship rules
-        target_ids = self._extract_all_target_ids(filtered_resources)
+        # Everything already in the scan, plus every target considered so far
+        seen: Set[str] = {
+            resource["id"].lower()
+            for resource in filtered_resources
+            if resource.get("id")
+        }
+        collected: List[Dict[str, Any]] = []
+        frontier_resources = filtered_resources
+
+        for depth in range(1, self.max_depth + 1):
+            # Step 1: Extract target IDs from relationship rules
+            frontier: Set[str] = set()
+            for target_id in self._extract_all_target_ids(frontier_resources):
+                key = target_id.lower()
+                if key not in seen:
+                    seen.add(key)
+                    frontier.add(target_id)
+
+            if not frontier:
+                if depth == 1:
+                    logger.info("No cross-RG dependencies found in relationship rules")
+                break
 
-        if not target_ids:
-            logger.info("No cross-RG dependencies found in relationship rules")
-            return []
+            logger.info(
+                f"Hop {depth}: found {len(frontier)} potential cross-RG dependencies "
+                f"from relationships"
+            )
 
-        logger.info(
-            f"Found {len(target_ids)} potential cross-RG dependencies from relationships"
-        )
+            # Step 2: Check which targets already exist in Neo4j
+            existing_ids = self.check_existing_nodes(frontier)
+            missing_ids = frontier - existing_ids
 
-        # Step 2: Check which targets already exist in Neo4j
-        existing_ids = self.check_existing_nodes(target_ids)
-        missing_ids = target_ids - existing_ids
+            if not missing_ids:
+                logger.info(
+                    f"Hop {depth}: all dependency targets already exist in graph, "
+                    f"no fetch needed"
+                )
+                break
 
-        if not missing_ids:
             logger.info(
-                "All dependency targets already exist in graph, no fetch needed"
+                f"Hop {depth}: already in graph: {len(existing_ids)}, "
+                f"fetching {len(missing_ids)} missing from Azure"
             )
-            return []
 
-        logger.info(
-            f"Fetching {len(missing_ids)} missing dependency resources from Azure"
-        )
-        logger.info(
-            f"Already in graph: {len(existing_ids)}, Missing: {len(missing_ids)}"
-        )
+            # Step 3: Fetch missing resources; they are the next frontier
+            frontier_resources = await self.fetch_resources_by_ids(missing_ids)
+            collected.extend(frontier_resources)
+            for resource in frontier_resources:
+                if resource.get("id"):
+                    seen.add(resource["id"].lower())
 
-        # Step 3: Fetch missing resources from Azure in parallel
-        missing_resources = await self.fetch_resources_by_ids(missing_ids)
+            if not frontier_resources:
+                break
 
         logger.info(
-            f"✅ Successfully fetched {len(missing_resources)} cross-RG dependency resources"
+            f"✅ Successfully fetched {len(collected)} cross-RG dependency resources"
         )
 
-        return missing_resources
+        return collected
 
     def _extract_all_target_ids(self, resources: List[Dict[str, Any]]) -> Set[str]:
         """
@@ -144,14 +279,15 @@ class RelationshipDependencyCollector:
         """
         Check which target resource IDs already exist in Neo4j.
 
-        Uses efficient batch query with UNWIND to check all IDs in one query.
+        Checks all IDs in one query, comparing them case-insensitively as ARM
+        does, so a node written with different casing counts as existing.
         Supports both production (session_manager) and test (check_resource_exists) APIs.
 
         Args:
             target_ids: Set of resource IDs to check
 
         Returns:
-            Set of resource IDs that exist in Neo4j
+            Set of resource IDs (as given) that exist in Neo4j
         """
         if not target_ids:
             return set()
@@ -174,15 +310,21 @@ class RelationshipDependencyCollector:
 
         try:
             query = """
-            UNWIND $target_ids AS target_id
-            MATCH (r:Resource {id: target_id})
-            RETURN r.id AS id
+            MATCH (r:Resource)
+            WHERE toLower(r.id) IN $target_ids
+            RETURN DISTINCT toLower(r.id) AS id
             """
+            # Lowered ID -> ID as the caller passed it
+            by_key = {target_id.lower(): target_id for target_id in target_ids}
 
             try:
                 with self.db_ops.session_manager.session() as session:
-                    result = session.run(query, target_ids=list(target_ids))
-                    existing_ids = {record["id"] for record in result.data()}
+                    result = session.run(query, target_ids=sorted(by_key))
+                    existing_ids = {
+                        by_key[record["id"].lower()]
+                        for record in result.data()
+                        if record["id"] and record["id"].lower() in by_key
+                    }
             except (AttributeError, TypeError) as e:
                 logger.debug(f"Session manager error (likely test mock): {e}")
                 return set()
@@ -205,7 +347,12 @@ class RelationshipDependencyCollector:
         self, resource_ids: Set[str]
     ) -> List[Dict[str, Any]]:
         """
-        Fetch multiple resources by ID from Azure in parallel.
+        Fetch multiple resources by ID from Azure through a bounded pool.
+
+        At most fetch_concurrency workers run, so only that many fetches
+        (and coroutines) are alive however large the frontier is. Throttled
+        fetches are retried after a shared back-off, with fewer fetches in
+        flight until ARM recovers.
 
         Args:
             resource_ids: Set of Azure resource IDs to fetch
@@ -216,25 +363,39 @@ class RelationshipDependencyCollector:
         if not resource_ids:
             return []
 
-        # Create tasks for parallel fetching
-        tasks = [
-            self.discovery_service.fetch_resource_by_id(resource_id)
-            for resource_id in resource_ids
-        ]
-
-        # Fetch all in parallel
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Filter out failures and None results
-        resources = []
-        for resource_id, result in zip(resource_ids, results):
-            if isinstance(result, Exception):
-                logger.warning(
-                    f"Failed to fetch dependency resource {resource_id}: {result}"
-                )
-            elif result is not None:
-                resources.append(result)
-            else:
-                logger.debug(f"Resource {resource_id} returned None (may not exist)")
+        limit = AdaptiveFetchLimit(self.fetch_concurrency)
+        # (resource ID, attempt)
+        pending = deque((resource_id, 0) for resource_id in sorted(resource_ids))
+        fetched: Dict[str, Dict[str, Any]] = {}
+
+        async def worker() -> None:
+            while pending:
+                resource_id, attempt = pending.popleft()
+                async with limit.slot():
+                    try:
+                        result = await self.discovery_service.fetch_resource_by_id(
+                            resource_id
+                        )
+                    except Exception as e:
+                        delay = throttle_delay(e, attempt)
+                        if delay is not None and attempt + 1 < self.throttle_retries:
+                            limit.throttled(delay)
+                            pending.append((resource_id, attempt + 1))
+                        else:
+                            logger.warning(
+                                f"Failed to fetch dependency resource {resource_id}: {e}"
+                            )
+                        continue
+                limit.succeeded()
+                if result is not None:
+                    fetched[resource_id] = result
+                else:
+                    logger.debug(
+                        f"Resource {resource_id} returned None (may not exist)"
+                    )
+
+        await asyncio.gather(
+            *(worker() for _ in range(min(self.fetch_concurrency, len(pending))))
+        )
 
-        return resources
+        return [fetched[rid] for rid in sorted(fetched)]
@@ -0,0 +1,315 @@
+"""
+Resource Graph Hydrator
+
+Bulk property hydration through Azure Resource Graph. Instead of issuing one
+``resources.get_by_id`` per resource (plus a provider lookup for the API
+version), full ``properties`` for up to 1000 resources are pulled per
+Resource Graph call with skip-token paging. Resources that Resource Graph does
+not return, or whose types it is known to truncate, are handed back so the
+caller can fall back to the per-resource ARM path.
+
+A per-type coverage report records how many resources each path handled, so
+the remaining slow-path types are visible.
+"""
+
+import asyncio
+import logging
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from azure.mgmt.resourcegraph import ResourceGraphClient  # type: ignore[import-untyped]
+from azure.mgmt.resourcegraph.models import (  # type: ignore[import-untyped]
+    QueryRequest,
+    QueryRequestOptions,
+)
+
+from .change_feed_ingestion_service import validate_subscription_id
+
+logger = logging.getLogger(__name__)
+
+# Resource Graph returns at most 1000 rows per page
+RESOURCE_GRAPH_PAGE_SIZE = 1000
+
+# Resource Graph accepts at most 1000 subscriptions per request
+MAX_SUBSCRIPTIONS_PER_QUERY = 1000
+
+# Above this many resource groups the RG filter is dropped and results are
+# matched client-side (keeps the KQL text small)
+MAX_RESOURCE_GROUPS_IN_FILTER = 200
+
+# Types whose Resource Graph projection omits configuration that ARM GET
+# returns (e.g. App Service siteConfig), so they always take the slow path
+RESOURCE_GRAPH_TRUNCATED_TYPES: Set[str] = {
+    "microsoft.web/sites",
+    "microsoft.web/sites/slots",
+}
+
+# Resource group names: alphanumerics, underscore, parentheses, hyphen, period
+_RESOURCE_GROUP_PATTERN = re.compile(r"^[-\w\.\(\)]{1,90}$")
+
+
+@dataclass
+class TypeCoverage:
+    """Hydration counts for a single resource type."""
+
+    total: int = 0
+    resource_graph: int = 0
+    fallback: int = 0
+
+    @property
+    def coverage(self) -> float:
+        """Fraction of resources hydrated by Resource Graph."""
+        return self.resource_graph / self.total if self.total else 0.0
+
+
+@dataclass
+class HydrationReport:
+    """Per-type coverage of a Resource Graph hydration run."""
+
+    by_type: Dict[str, TypeCoverage] = field(
+        default_factory=lambda: defaultdict(TypeCoverage)
+    )
+    pages: int = 0
+
+    @property
+    def total(self) -> int:
+        return sum(c.total for c in self.by_type.values())
+
+    @property
+    def hydrated(self) -> int:
+        return sum(c.resource_graph for c in self.by_type.values())
+
+    @property
+    def fallback(self) -> int:
+        return sum(c.fallback for c in self.by_type.values())
+
+    def slow_path_types(self) -> List[Tuple[str, int]]:
+        """Types that still need per-resource GETs, most frequent first."""
+        return sorted(
+            ((t, c.fallback) for t, c in self.by_type.items() if c.fallback),
+            key=lambda item: (-item[1], item[0]),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total": self.total,
+            "resource_graph": self.hydrated,
+            "fallback": self.fallback,
+            "pages": self.pages,
+            "by_type": {
+                t: {
+                    "total": c.total,
+                    "resource_graph": c.resource_graph,
+                    "fallback": c.fallback,
+                    "coverage": round(c.coverage, 4),
+                }
+                for t, c in sorted(self.by_type.items())
+            },
+        }
+
+    def log_summary(self, top_n: int = 10) -> None:
+        logger.info(
+            f"Resource Graph hydration: {self.hydrated}/{self.total} resources "
+            f"in {self.pages} page(s), {self.fallback} need per-resource GET"
+        )
+        for resource_type, count in self.slow_path_types()[:top_n]:
+            logger.info(f"  slow path: {resource_type} ({count})")
+
+
+class ResourceGraphHydrator:
+    """
+    Hydrates resource properties in bulk using Azure Resource Graph.
+    """
+
+    def __init__(
+        self,
+        credential: Any,
+        resource_graph_client_factory: Optional[Callable[[Any], Any]] = None,
+        page_size: int = RESOURCE_GRAPH_PAGE_SIZE,
+        truncated_types: Optional[Iterable[str]] = None,
+    ) -> None:
+        """
+        Initialize the hydrator.
+
+        Args:
+            credential: Azure credential
+            resource_graph_client_factory: Optional factory for ResourceGraphClient (for testing)
+            page_size: Rows per Resource Graph page (max 1000)
+            truncated_types: Resource types that always use the per-resource fallback
+        """
+        self.credential = credential
+        self.resource_graph_client_factory = (
+            resource_graph_client_factory or ResourceGraphClient
+        )
+        self.page_size = max(1, min(page_size, RESOURCE_GRAPH_PAGE_SIZE))
+        self.truncated_types = {
+            t.lower()
+            for t in (
+                truncated_types
+                if truncated_types is not None
+                else RESOURCE_GRAPH_TRUNCATED_TYPES
+            )
+        }
+
+    @staticmethod
+    def build_query(
+        subscription_ids: List[str], resource_groups: Optional[Iterable[str]] = None
+    ) -> str:
+        """
+        Build the KQL query for the given subscriptions.
+
+        Inputs are validated before interpolation to prevent KQL injection.
+
+        Args:
+            subscription_ids: Subscription GUIDs
+            resource_groups: Optional resource group names to narrow the scan
+
+        Returns:
+            KQL query string
+
+        Raises:
+            ValueError: If a subscription ID or resource group name is invalid
+        """
+        for subscription_id in subscription_ids:
+            validate_subscription_id(subscription_id)
+        subs = ", ".join(f"'{s}'" for s in subscription_ids)
+        query = f"Resources | where subscriptionId in ({subs})"
+
+        if resource_groups:
+            groups = sorted(set(resource_groups))
+            for rg in groups:
+                if not _RESOURCE_GROUP_PATTERN.match(rg):
+                    raise ValueError(f"Invalid resource group name: {rg}")
+            rgs = ", ".join(f"'{rg}'" for rg in groups)
+            query += f" | where resourceGroup in~ ({rgs})"
+
+        # Stable ordering keeps skip-token paging deterministic
+        return query + " | project id, type, properties | order by id asc"
+
+    def _query_page(
+        self,
+        client: Any,
+        query: str,
+        subscription_ids: List[str],
+        skip_token: Optional[str],
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        options = QueryRequestOptions(
+            result_format="objectArray", top=self.page_size, skip_token=skip_token
+        )
+        request = QueryRequest(
+            query=query, subscriptions=subscription_ids, options=options
+        )
+        response = client.resources(query=request)
+        data = getattr(response, "data", None) or []
+        return list(data), getattr(response, "skip_token", None)
+
+    async def fetch_properties(
+        self,
+        subscription_ids: List[str],
+        resource_groups: Optional[Iterable[str]] = None,
+        report: Optional[HydrationReport] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Page through Resource Graph and return properties keyed by lower-cased ID.
+
+        Args:
+            subscription_ids: Subscriptions to query
+            resource_groups: Optional resource groups to narrow the scan
+            report: Optional report that receives the page count
+
+        Returns:
+            Mapping of lower-cased resource ID to its properties dict
+        """
+        client = self.resource_graph_client_factory(self.credential)
+        properties_by_id: Dict[str, Dict[str, Any]] = {}
+
+        for i in range(0, len(subscription_ids), MAX_SUBSCRIPTIONS_PER_QUERY):
+            chunk = subscription_ids[i : i + MAX_SUBSCRIPTIONS_PER_QUERY]
+            query = self.build_query(chunk, resource_groups)
+            skip_token: Optional[str] = None
+            while True:
+                # The SDK client is synchronous; keep the event loop responsive
+                rows, skip_token = await asyncio.to_thread(
+                    self._query_page, client, query, chunk, skip_token
+                )
+                if report is not None:
+                    report.pages += 1
+                for row in rows:
+                    row_id = row.get("id")
+                    props = row.get("properties")
+                    if row_id and isinstance(props, dict):
+                        properties_by_id[row_id.lower()] = props
+                if not skip_token:
+                    break
+
+        return properties_by_id
+
+    async def hydrate(
+        self, resources: List[Dict[str, Any]], subscription_ids: List[str]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], HydrationReport]:
+        """
+        Fill in ``properties`` for resources from Resource Graph.
+
+        Resources are updated in place. Role assignments are left untouched
+        because they already carry full properties from discovery.
+
+        Args:
+            resources: Resource dictionaries from the listing phase
+            subscription_ids: Subscriptions the resources belong to
+
+        Returns:
+            Tuple of (hydrated resources, resources needing per-resource GET, report)
+        """
+        report = HydrationReport()
+        candidates: List[Dict[str, Any]] = []
+        hydrated: List[Dict[str, Any]] = []
+        fallback: List[Dict[str, Any]] = []
+
+        for resource in resources:
+            if resource.get("type") == "Microsoft.Authorization/roleAssignments":
+                hydrated.append(resource)
+            else:
+                candidates.append(resource)
+
+        if not candidates:
+            return hydrated, fallback, report
+
+        resource_groups = {
+            r["resource_group"] for r in candidates if r.get("resource_group")
+        }
+        rg_filter: Optional[Set[str]] = None
+        if (
+            resource_groups
+            and len(resource_groups) <= MAX_RESOURCE_GROUPS_IN_FILTER
+            and all(_RESOURCE_GROUP_PATTERN.match(rg) for rg in resource_groups)
+            and all(r.get("resource_group") for r in candidates)
+        ):
+            rg_filter = resource_groups
+
+        try:
+            properties_by_id = await self.fetch_properties(
+                subscription_ids, rg_filter, report
+            )
+        except Exception as e:
+            logger.warning(
+                f"Resource Graph hydration failed, falling back to per-resource GET: {e}"
+            )
+            properties_by_id = {}
+
+        for resource in candidates:
+            resource_type = str(resource.get("type") or "unknown")
+            coverage = report.by_type[resource_type]
+            coverage.total += 1
+            resource_id = str(resource.get("id") or "").lower()
+            props = properties_by_id.get(resource_id)
+            if props is not None and resource_type.lower() not in self.truncated_types:
+                resource["properties"] = props
+                coverage.resource_graph += 1
+                hydrated.append(resource)
+            else:
+                coverage.fallback += 1
+                fallback.append(resource)
+
+        return hydrated, fallback, report
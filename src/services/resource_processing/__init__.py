@@ -14,6 +14,10 @@ Public Interface:
     BatchProcessor - Handles retry queue and worker scheduling
     LLMIntegration - Handles LLM description generation
     ResourceState - Manages resource state checking
+    ResourceStream - Bounded, de-duplicating queue from discovery to processing
+    DescriptionCache - Persistent content-addressed LLM description cache
+    GraphWriter - Dedicated-thread batched resource node writer
+    ProgressJournal - Write-ahead journal of resource processing progress
     DatabaseOperations - Backward compatibility alias for NodeManager
     serialize_value - Safe value serialization for Neo4j
     validate_resource_data - Input validation
@@ -23,15 +27,19 @@ Public Interface:
 
 # Core classes
 from .batch_processor import BatchProcessor, BatchResult
+from .description_cache import DescriptionCache, description_fingerprint
+from .graph_writer import GraphWriter
 from .llm_integration import LLMIntegration
 from .node_manager import DatabaseOperations, NodeManager
 from .processor import ResourceProcessor, create_resource_processor
+from .progress_journal import ProgressJournal
 from .relationship_emitter import RelationshipEmitter
 
 # Utilities
 from .serialization import serialize_value
 from .state import ResourceState
 from .stats import ProcessingStats
+from .stream import ResourceStream
 from .validation import (
     GLOBAL_RESOURCE_TYPES,
     extract_identity_fields,
@@ -44,13 +52,18 @@ __all__ = [
     "BatchProcessor",
     "BatchResult",
     "DatabaseOperations",
+    "DescriptionCache",
+    "GraphWriter",
     "LLMIntegration",
     "NodeManager",
     "ProcessingStats",
+    "ProgressJournal",
     "RelationshipEmitter",
     "ResourceProcessor",
     "ResourceState",
+    "ResourceStream",
     "create_resource_processor",
+    "description_fingerprint",
     "extract_identity_fields",
     "get_required_fields",
     "serialize_value",
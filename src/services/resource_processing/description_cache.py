@@ -0,0 +1,189 @@
+"""
+Description Cache Module
+
+This module provides a content-addressed cache of LLM resource descriptions.
+Descriptions are keyed by a stable fingerprint of the fields the description
+prompt is built from, so a rescan of an unchanged resource reuses the stored
+description instead of calling the LLM again. The cache is a local SQLite
+file, which survives graph resets and is shared by every scan on the host.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Union
+
+import structlog  # type: ignore[import-untyped]
+
+logger = structlog.get_logger(__name__)
+
+# Fields passed to the description prompt (see
+# AzureLLMDescriptionGenerator.generate_resource_description)
+FINGERPRINT_FIELDS = ("name", "type", "location", "sku", "kind", "properties", "tags")
+
+# Property keys that change without changing what a resource is
+VOLATILE_PROPERTY_KEYS = frozenset(
+    {
+        "etag",
+        "provisioningState",
+        "changedTime",
+        "createdTime",
+        "creationTime",
+        "lastModified",
+        "lastModifiedTime",
+        "lastModifiedAt",
+        "timeCreated",
+    }
+)
+
+# SQLite limits the number of host parameters per statement
+_LOOKUP_CHUNK = 500
+
+
+def _strip_volatile(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            k: _strip_volatile(v)
+            for k, v in value.items()
+            if k not in VOLATILE_PROPERTY_KEYS
+        }
+    if isinstance(value, list):
+        return [_strip_volatile(v) for v in value]
+    return value
+
+
+def description_fingerprint(resource: Dict[str, Any]) -> str:
+    """
+    Stable hash of the resource fields an LLM description depends on.
+
+    Properties may arrive as a dict or as the JSON string stored on the
+    node; both produce the same fingerprint.
+
+    Args:
+        resource: Resource dictionary
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    content: Dict[str, Any] = {}
+    for field in FINGERPRINT_FIELDS:
+        value = resource.get(field)
+        if isinstance(value, str) and field in ("properties", "sku", "tags"):
+            try:
+                value = json.loads(value)
+            except ValueError:
+                pass
+        content[field] = _strip_volatile(value)
+    encoded = json.dumps(content, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def is_real_description(description: Optional[str]) -> bool:
+    """True for an LLM-generated description, False for empty or fallback text."""
+    return bool(
+        description and description.strip() and not description.startswith("Azure ")
+    )
+
+
+class DescriptionCache:
+    """Persistent fingerprint -> description store backed by SQLite."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """
+        Open (creating if needed) the cache file.
+
+        Args:
+            path: SQLite file path; ":memory:" keeps the cache in-process
+        """
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).expanduser().parent.mkdir(parents=True, exist_ok=True)
+            self.path = str(Path(self.path).expanduser())
+        # Workers run on the event loop thread, but blocking callers may use
+        # threads; a single connection guarded by a lock serves both
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS descriptions (
+                fingerprint TEXT PRIMARY KEY,
+                resource_type TEXT,
+                description TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get_many(self, fingerprints: Iterable[str]) -> Dict[str, str]:
+        """
+        Look up descriptions for many fingerprints at once.
+
+        Args:
+            fingerprints: Fingerprints to look up
+
+        Returns:
+            Mapping of fingerprint to description for the hits
+        """
+        keys = list(dict.fromkeys(fingerprints))
+        found: Dict[str, str] = {}
+        with self._lock:
+            for start in range(0, len(keys), _LOOKUP_CHUNK):
+                chunk = keys[start : start + _LOOKUP_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    "SELECT fingerprint, description FROM descriptions "
+                    f"WHERE fingerprint IN ({placeholders})",
+                    chunk,
+                )
+                found.update(rows)
+        return found
+
+    def get(self, fingerprint: str) -> Optional[str]:
+        """Description stored for a fingerprint, or None."""
+        return self.get_many([fingerprint]).get(fingerprint)
+
+    def put_many(self, entries: Iterable[tuple[str, Optional[str], str]]) -> int:
+        """
+        Store descriptions, replacing any existing entry for a fingerprint.
+
+        Args:
+            entries: (fingerprint, resource_type, description) tuples
+
+        Returns:
+            Number of entries written
+        """
+        now = time.time()
+        rows = [(fp, rtype, desc, now) for fp, rtype, desc in entries]
+        if not rows:
+            return 0
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO descriptions "
+                "(fingerprint, resource_type, description, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+        return len(rows)
+
+    def put(
+        self, fingerprint: str, description: str, resource_type: Optional[str] = None
+    ) -> None:
+        """Store the description for a fingerprint."""
+        self.put_many([(fingerprint, resource_type, description)])
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(
+                self._conn.execute("SELECT count(*) FROM descriptions").fetchone()[0]
+            )
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
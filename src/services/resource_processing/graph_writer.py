@@ -0,0 +1,197 @@
+"""
+Graph Writer Module
+
+This module moves resource node writes off the event loop. Workers prepare
+each resource's row (validation, ID abstraction, serialization) and hand it
+to a GraphWriter, whose dedicated thread groups rows into batches and writes
+each batch, containment included, in one Neo4j transaction. LLM and ARM I/O
+on the event loop therefore overlap database I/O instead of waiting on it.
+
+After a batch commits the writer calls back with the written resources, so
+work that needs the nodes to exist (relationship rules, journaling) follows
+the write without another round trip from the event loop. Resources whose
+write failed are held for the caller to collect with take_failed() and retry.
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import structlog  # type: ignore[import-untyped]
+
+from .node_manager import NodeManager
+
+logger = structlog.get_logger(__name__)
+
+# (resource, context passed to submit) for every resource in a committed batch
+WrittenCallback = Callable[[List[Tuple[Dict[str, Any], Any]]], None]
+
+_STOP = object()
+
+
+class _Flush:
+    """Queue marker: write the current batch, then signal the waiting caller."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+
+
+class GraphWriter:
+    """Dedicated thread that writes queued resource rows in batches."""
+
+    def __init__(
+        self,
+        node_manager: NodeManager,
+        batch_size: int = 500,
+        flush_interval: float = 5.0,
+        max_pending: Optional[int] = None,
+        on_written: Optional[WrittenCallback] = None,
+    ) -> None:
+        """
+        Initialize the writer; its thread starts on the first submit().
+
+        Args:
+            node_manager: NodeManager that prepares and writes the rows
+            batch_size: Rows per transaction
+            flush_interval: Maximum seconds a row waits for its batch
+            max_pending: Rows queued before submit() waits for the writer
+                (default: four batches)
+            on_written: Called on the writer thread after each commit
+        """
+        self.node_manager = node_manager
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.on_written = on_written
+        self._queue: queue.Queue[Any] = queue.Queue(
+            maxsize=max_pending or self.batch_size * 4
+        )
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self.written = 0
+        # (resource, context) for rows whose write failed
+        self.failed: List[Tuple[Dict[str, Any], Any]] = []
+        self._failed_lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start the writer thread if it is not running."""
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="graph-writer", daemon=True
+                )
+                self._thread.start()
+
+    async def submit(
+        self,
+        resource: Dict[str, Any],
+        processing_status: str = "completed",
+        context: Any = None,
+    ) -> bool:
+        """
+        Prepare a resource's row and queue it for the writer thread.
+
+        The row is built immediately, so an invalid resource is reported to
+        the caller and later changes to the dict do not affect the write.
+        When the queue is full the caller waits (without blocking the event
+        loop) until the writer catches up.
+
+        Args:
+            resource: Resource dictionary
+            processing_status: Status written on the node
+            context: Passed back to on_written with the resource
+
+        Returns:
+            bool: True if queued, False if the resource is invalid
+        """
+        row = self.node_manager.prepare_resource_row(
+            resource, processing_status, with_containment=True
+        )
+        if row is None:
+            return False
+        self.start()
+        item = (row, resource, context)
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            await asyncio.to_thread(self._queue.put, item)
+        return True
+
+    def flush(self) -> None:
+        """Write everything queued so far, leaving the thread running (blocking)."""
+        if self._thread is None or not self._thread.is_alive():
+            return
+        marker = _Flush()
+        self._queue.put(marker)
+        marker.done.wait()
+
+    def take_failed(self) -> List[Tuple[Dict[str, Any], Any]]:
+        """Remove and return (resource, context) for every failed row so far."""
+        with self._failed_lock:
+            failed, self.failed = self.failed, []
+        return failed
+
+    def close(self) -> None:
+        """Write everything queued and stop the thread (blocking)."""
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        batch: List[Tuple[Dict[str, Any], Dict[str, Any], Any]] = []
+        deadline = 0.0
+        while True:
+            timeout = max(0.0, deadline - time.monotonic()) if batch else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            if item is _STOP:
+                self._write(batch)
+                return
+            if isinstance(item, _Flush):
+                self._write(batch)
+                batch = []
+                item.done.set()
+                continue
+            if item is not None:
+                if not batch:
+                    deadline = time.monotonic() + self.flush_interval
+                batch.append(item)
+            if batch and (
+                len(batch) >= self.batch_size or time.monotonic() >= deadline
+            ):
+                self._write(batch)
+                batch = []
+
+    def _write(self, batch: List[Tuple[Dict[str, Any], Dict[str, Any], Any]]) -> None:
+        if not batch:
+            return
+        try:
+            written_ids = set(
+                self.node_manager.write_rows([row for row, _, _ in batch])
+            )
+        except Exception as exc:
+            logger.exception(f"Graph writer failed to write {len(batch)} rows: {exc}")
+            written_ids = set()
+
+        committed = []
+        failed = []
+        for row, resource, context in batch:
+            if row["original_id"] in written_ids:
+                committed.append((resource, context))
+            else:
+                failed.append((resource, context))
+        if failed:
+            with self._failed_lock:
+                self.failed.extend(failed)
+        self.written += len(committed)
+
+        if committed and self.on_written is not None:
+            try:
+                self.on_written(committed)
+            except Exception as exc:
+                logger.exception(f"Graph writer callback failed: {exc}")
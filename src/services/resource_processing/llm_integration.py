@@ -13,6 +13,11 @@ from src.llm_descriptions import (
     should_generate_description,
 )
 
+from .description_cache import (
+    DescriptionCache,
+    description_fingerprint,
+    is_real_description,
+)
 from .relationship_emitter import run_neo4j_query_with_retry
 
 logger = structlog.get_logger(__name__)
@@ -26,6 +31,7 @@ class LLMIntegration:
         llm_generator: Optional[AzureLLMDescriptionGenerator],
         session_manager: Any,
         state_checker: Any = None,
+        description_cache: Optional[DescriptionCache] = None,
     ) -> None:
         """
         Initialize the LLMIntegration.
@@ -34,10 +40,118 @@ class LLMIntegration:
             llm_generator: Optional LLM description generator
             session_manager: Neo4jSessionManager instance
             state_checker: Optional ResourceState for checking existing descriptions
+            description_cache: Optional persistent cache of descriptions keyed
+                by resource content fingerprint
         """
         self.llm_generator = llm_generator
         self.session_manager = session_manager
         self._state_checker = state_checker
+        self.description_cache = description_cache
+
+    @staticmethod
+    def _attach(resource: Dict[str, Any], fingerprint: str, description: str) -> None:
+        resource["llm_description"] = description
+        resource["llm_description_hash"] = fingerprint
+
+    @staticmethod
+    def has_description(resource: Dict[str, Any]) -> bool:
+        """
+        Check if a resource carries a description that matches its content.
+
+        Only descriptions attached from the cache or freshly generated carry
+        an llm_description_hash, so this never trusts a stale description.
+        """
+        return bool(resource.get("llm_description_hash")) and is_real_description(
+            resource.get("llm_description")
+        )
+
+    def prefetch_descriptions(
+        self,
+        resources: List[Dict[str, Any]],
+        snapshots: Dict[str, Dict[str, Any]],
+    ) -> int:
+        """
+        Attach known descriptions to a batch of resources in bulk.
+
+        A description is known if the cache holds one for the resource's
+        content fingerprint, or if the graph node (from a bulk snapshot, see
+        ResourceState.get_resource_snapshots) has a real description recorded
+        for the same fingerprint. Graph descriptions without a recorded
+        fingerprint predate the cache and are adopted as-is. Adopted
+        descriptions are written back to the cache.
+
+        Args:
+            resources: Resource dictionaries, updated in place
+            snapshots: Resource ID -> node state for resources in the graph
+
+        Returns:
+            Number of resources that received a description
+        """
+        fingerprints = [description_fingerprint(r) for r in resources]
+        cached = (
+            self.description_cache.get_many(fingerprints)
+            if self.description_cache is not None
+            else {}
+        )
+
+        attached = 0
+        adopted: List[Tuple[str, Optional[str], str]] = []
+        for resource, fingerprint in zip(resources, fingerprints):
+            description = cached.get(fingerprint)
+            if description is None:
+                snapshot = snapshots.get(resource.get("id", "")) or {}
+                stored = snapshot.get("llm_description")
+                if is_real_description(stored) and snapshot.get(
+                    "llm_description_hash"
+                ) in (None, fingerprint):
+                    description = stored
+                    adopted.append((fingerprint, resource.get("type"), stored))
+            if description:
+                self._attach(resource, fingerprint, description)
+                attached += 1
+
+        if adopted and self.description_cache is not None:
+            self.description_cache.put_many(adopted)
+        logger.debug(
+            f"Description prefetch: {attached}/{len(resources)} known "
+            f"({len(cached)} from cache, {len(adopted)} adopted from graph)"
+        )
+        return attached
+
+    def attach_cached_description(self, resource: Dict[str, Any]) -> bool:
+        """
+        Attach a cached description to a single resource if one is known.
+
+        Args:
+            resource: Resource dictionary, updated in place
+
+        Returns:
+            bool: True if the resource now carries a matching description
+        """
+        if self.has_description(resource):
+            return True
+        if self.description_cache is None:
+            return False
+        fingerprint = description_fingerprint(resource)
+        description = self.description_cache.get(fingerprint)
+        if not description:
+            return False
+        self._attach(resource, fingerprint, description)
+        return True
+
+    def remember_description(self, resource: Dict[str, Any], description: str) -> None:
+        """Record a generated description on the resource and in the cache."""
+        fingerprint = description_fingerprint(resource)
+        self._attach(resource, fingerprint, description)
+        if self.description_cache is not None:
+            try:
+                self.description_cache.put(
+                    fingerprint, description, resource.get("type")
+                )
+            except Exception:
+                logger.exception(
+                    f"Failed to cache description for {resource.get('id', 'Unknown')}"
+                )
 
     def should_skip_llm(self, resource: Dict[str, Any]) -> bool:
         """
@@ -56,13 +170,15 @@ class LLMIntegration:
             return not should_generate_description(resource, session)
 
     async def generate_resource_description(
-        self, resource: Dict[str, Any]
+        self, resource: Dict[str, Any], check_graph: bool = True
     ) -> Tuple[bool, str]:
         """
         Generate LLM description for a single resource, with skip logic.
 
         Args:
             resource: Resource dictionary
+            check_graph: Query the graph for an existing description first.
+                Callers that already checked in bulk pass False.
 
         Returns:
             Tuple of (success, description)
@@ -72,28 +188,34 @@ class LLMIntegration:
 
         # Check if we should skip
         resource_id = resource.get("id")
-        with self.session_manager.session() as session:
-            if not should_generate_description(resource, session):
-                # Fetch existing description from DB
-                desc = None
-                if resource_id and self._state_checker:
-                    metadata = self._state_checker.get_processing_metadata(resource_id)
-                    desc = metadata.get("llm_description")
-                if desc:
-                    logger.info(
-                        f"Skipping LLM for {resource_id}: using cached description."
-                    )
-                    return False, desc
-                else:
-                    logger.info(
-                        f"Skipping LLM for {resource_id}: no cached description, using fallback."
-                    )
-                    return False, f"Azure {resource.get('type', 'Resource')} resource."
+        if check_graph:
+            with self.session_manager.session() as session:
+                skip = not should_generate_description(resource, session)
+        else:
+            skip = False
+        if skip:
+            # Fetch existing description from DB
+            desc = None
+            if resource_id and self._state_checker:
+                metadata = self._state_checker.get_processing_metadata(resource_id)
+                desc = metadata.get("llm_description")
+            if desc:
+                logger.info(
+                    f"Skipping LLM for {resource_id}: using cached description."
+                )
+                return False, desc
+            else:
+                logger.info(
+                    f"Skipping LLM for {resource_id}: no cached description, using fallback."
+                )
+                return False, f"Azure {resource.get('type', 'Resource')} resource."
 
         try:
             description = await self.llm_generator.generate_resource_description(
                 resource
             )
+            if is_real_description(description):
+                self.remember_description(resource, description)
             return True, description
         except Exception:
             logger.exception(
@@ -8,7 +8,7 @@ Creates both Original and Abstracted nodes for each resource.
 import hashlib
 import json
 import re
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import structlog  # type: ignore[import-untyped]
 
@@ -19,6 +19,56 @@ from .validation import validate_resource_data
 
 logger = structlog.get_logger(__name__)
 
+# Batched dual-graph upsert: Original node, Abstracted node and the
+# SCAN_SOURCE_NODE edge for every row in one statement
+BATCH_UPSERT_RESOURCES_QUERY = """
+UNWIND $rows AS row
+MERGE (orig:Resource:Original {id: row.original_id})
+SET orig += row.props,
+    orig.id = row.original_id,
+    orig.abstracted_id = row.abstracted_id,
+    orig.updated_at = datetime()
+MERGE (abs:Resource {id: row.abstracted_id})
+SET abs += row.abstracted_props,
+    abs.id = row.abstracted_id,
+    abs.original_id = row.original_id,
+    abs.abstracted_id = row.abstracted_id,
+    abs.abstraction_type = row.abstraction_type,
+    abs.updated_at = datetime()
+MERGE (abs)-[rel:SCAN_SOURCE_NODE]->(orig)
+SET rel.created_at = datetime(),
+    rel.scan_id = row.scan_id,
+    rel.tenant_id = row.tenant_id,
+    rel.confidence = 'exact'
+"""
+
+BATCH_UPSERT_SUBSCRIPTIONS_QUERY = """
+UNWIND $ids AS sid
+MERGE (s:Subscription {id: sid})
+SET s.name = '',
+    s.updated_at = datetime()
+"""
+
+# Containment for rows queued with_containment: Subscription CONTAINS
+# Resource and, when the resource has a group, the ResourceGroup node plus
+# Subscription CONTAINS ResourceGroup CONTAINS Resource
+BATCH_UPSERT_CONTAINMENT_QUERY = """
+UNWIND $rows AS row
+MATCH (s:Subscription {id: row.subscription_id})
+MATCH (r:Resource {id: row.original_id})
+MERGE (s)-[:CONTAINS]->(r)
+WITH s, r, row
+WHERE row.rg_id IS NOT NULL
+MERGE (rg:ResourceGroup {id: row.rg_id})
+SET rg.name = row.rg_name,
+    rg.subscription_id = row.subscription_id,
+    rg.type = 'ResourceGroup',
+    rg.updated_at = datetime(),
+    rg.llm_description = coalesce(rg.llm_description, '')
+MERGE (s)-[:CONTAINS]->(rg)
+MERGE (rg)-[:CONTAINS]->(r)
+"""
+
 
 class NodeManager:
     """Handles all database operations for resources using dual-graph architecture."""
@@ -208,103 +258,34 @@ class NodeManager:
             bool: True if successful, False otherwise
         """
         try:
-            # Validate resource data
-            try:
-                validate_resource_data(resource)
-            except ResourceDataValidationError as e:
-                missing_fields = e.context.get("missing_fields", [])
-                logger.exception(
-                    f"Resource data missing/null for required fields: {missing_fields} (resource: {resource})"
-                )
+            row = self._prepare_dual_graph_row(resource, processing_status)
+            if row is None:
                 return False
 
             # Upsert Subscription node before relationships
             self.upsert_subscription(resource["subscription_id"])
 
-            # Generate abstracted ID
-            if not self._id_abstraction_service:
-                raise ValueError("ID abstraction service not initialized")
-
-            original_id = resource["id"]
-            abstracted_id = self._id_abstraction_service.abstract_resource_id(
-                original_id
-            )
-
-            logger.debug(
-                f"Dual-graph: original_id={original_id}, abstracted_id={abstracted_id}"
-            )
-
-            # Prepare resource data (common properties)
-            resource_data = resource.copy()
-            resource_data["llm_description"] = resource.get("llm_description", "")
-            resource_data["processing_status"] = processing_status
-
-            # Extract critical VNet properties BEFORE serialization
-            if resource_data.get("type") == "Microsoft.Network/virtualNetworks":
-                properties_raw = resource_data.get("properties")
-                if properties_raw:
-                    try:
-                        if isinstance(properties_raw, dict):
-                            props_dict = properties_raw
-                        elif isinstance(properties_raw, str):
-                            props_dict = json.loads(properties_raw)
-                        else:
-                            props_dict = {}
-
-                        address_space = props_dict.get("addressSpace", {})
-                        if address_space:
-                            address_prefixes = address_space.get("addressPrefixes", [])
-                            if address_prefixes:
-                                resource_data["addressSpace"] = json.dumps(
-                                    address_prefixes
-                                )
-                                logger.debug(
-                                    f"Extracted addressSpace for VNet '{resource.get('name')}': {address_prefixes}"
-                                )
-                    except (json.JSONDecodeError, AttributeError, TypeError) as e:
-                        logger.warning(
-                            f"Failed to extract addressSpace from VNet '{resource.get('name')}': {e}"
-                        )
-
-            # Prevent empty properties from overwriting existing data
-            if resource_data.get("properties") == {}:
-                logger.debug(
-                    f"Skipping empty properties update for {resource.get('id')} to preserve existing data"
-                )
-                resource_data.pop("properties", None)
-
-            # Serialize all values for Neo4j compatibility
-            try:
-                serialized_data = {}
-                for k, v in resource_data.items():
-                    serialized_data[k] = serialize_value(v)
-            except Exception as ser_exc:
-                logger.exception(
-                    f"Serialization error for resource {resource.get('id', 'Unknown')}: {ser_exc}"
-                )
-                return False
-
             # Create both nodes in a single transaction for atomicity
             try:
                 with self.session_manager.session() as session:
                     with session.begin_transaction() as tx:
                         # Create Original node
                         self._create_original_node(
-                            tx, original_id, abstracted_id, serialized_data
+                            tx, row["original_id"], row["abstracted_id"], row["props"]
                         )
 
                         # Create Abstracted node
                         self._create_abstracted_node(
-                            tx, abstracted_id, original_id, serialized_data
+                            tx, row["abstracted_id"], row["original_id"], row["props"]
                         )
 
                         # Create SCAN_SOURCE_NODE relationship
                         self._create_scan_source_relationship(
                             tx,
-                            abstracted_id,
-                            original_id,
-                            resource.get("scan_id"),
-                            resource.get("tenant_id"),
+                            row["abstracted_id"],
+                            row["original_id"],
+                            row["scan_id"],
+                            row["tenant_id"],
                         )
 
                         tx.commit()
@@ -333,6 +314,211 @@ class NodeManager:
             )
             return False
 
+    def _prepare_dual_graph_row(
+        self, resource: Dict[str, Any], processing_status: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Validate, abstract and serialize a resource for a dual-graph write.
+
+        Args:
+            resource: Resource dictionary
+            processing_status: Status of processing
+
+        Returns:
+            Row with original_id, abstracted_id, props (serialized properties),
+            scan_id, tenant_id and subscription_id; None if the resource is invalid
+        """
+        # Validate resource data
+        try:
+            validate_resource_data(resource)
+        except ResourceDataValidationError as e:
+            missing_fields = e.context.get("missing_fields", [])
+            logger.exception(
+                f"Resource data missing/null for required fields: {missing_fields} (resource: {resource})"
+            )
+            return None
+
+        # Generate abstracted ID
+        if not self._id_abstraction_service:
+            raise ValueError("ID abstraction service not initialized")
+
+        original_id = resource["id"]
+        abstracted_id = self._id_abstraction_service.abstract_resource_id(original_id)
+
+        logger.debug(
+            f"Dual-graph: original_id={original_id}, abstracted_id={abstracted_id}"
+        )
+
+        # Prepare resource data (common properties)
+        resource_data = resource.copy()
+        resource_data["llm_description"] = resource.get("llm_description", "")
+        resource_data["processing_status"] = processing_status
+
+        # Extract critical VNet properties BEFORE serialization
+        if resource_data.get("type") == "Microsoft.Network/virtualNetworks":
+            properties_raw = resource_data.get("properties")
+            if properties_raw:
+                try:
+                    if isinstance(properties_raw, dict):
+                        props_dict = properties_raw
+                    elif isinstance(properties_raw, str):
+                        props_dict = json.loads(properties_raw)
+                    else:
+                        props_dict = {}
+
+                    address_space = props_dict.get("addressSpace", {})
+                    if address_space:
+                        address_prefixes = address_space.get("addressPrefixes", [])
+                        if address_prefixes:
+                            resource_data["addressSpace"] = json.dumps(address_prefixes)
+                            logger.debug(
+                                f"Extracted addressSpace for VNet '{resource.get('name')}': {address_prefixes}"
+                            )
+                except (json.JSONDecodeError, AttributeError, TypeError) as e:
+                    logger.warning(
+                        f"Failed to extract addressSpace from VNet '{resource.get('name')}': {e}"
+                    )
+
+        # Prevent empty properties from overwriting existing data
+        if resource_data.get("properties") == {}:
+            logger.debug(
+                f"Skipping empty properties update for {resource.get('id')} to preserve existing data"
+            )
+            resource_data.pop("properties", None)
+
+        # Serialize all values for Neo4j compatibility
+        try:
+            serialized_data = {}
+            for k, v in resource_data.items():
+                serialized_data[k] = serialize_value(v)
+        except Exception as ser_exc:
+            logger.exception(
+                f"Serialization error for resource {resource.get('id', 'Unknown')}: {ser_exc}"
+            )
+            return None
+
+        return {
+            "original_id": original_id,
+            "abstracted_id": abstracted_id,
+            "props": serialized_data,
+            "scan_id": resource.get("scan_id"),
+            "tenant_id": resource.get("tenant_id"),
+            "subscription_id": resource["subscription_id"],
+        }
+
+    def prepare_resource_row(
+        self,
+        resource: Dict[str, Any],
+        processing_status: str = "completed",
+        with_containment: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build the row a batched write sends for a resource.
+
+        Args:
+            resource: Resource dictionary
+            processing_status: Status of processing
+            with_containment: Also write the resource's Subscription and
+                ResourceGroup containment in the same transaction
+
+        Returns:
+            Row for write_rows(), or None if the resource is invalid
+        """
+        try:
+            row = self._prepare_dual_graph_row(resource, processing_status)
+            if row is None:
+                return None
+            row["abstracted_props"], row["abstraction_type"] = (
+                self._build_abstracted_props(
+                    row["abstracted_id"], row["original_id"], row["props"]
+                )
+            )
+        except Exception as exc:
+            logger.exception(
+                f"Error preparing dual-graph resource {resource.get('id', 'Unknown')}: {exc}"
+            )
+            return None
+
+        if with_containment:
+            rg_name = resource.get("resource_group")
+            row["containment"] = {
+                "original_id": row["original_id"],
+                "subscription_id": row["subscription_id"],
+                "rg_id": (
+                    f"/subscriptions/{row['subscription_id']}/resourceGroups/{rg_name}"
+                    if rg_name
+                    else None
+                ),
+                "rg_name": rg_name,
+            }
+        return row
+
+    def write_rows(self, rows: List[Dict[str, Any]]) -> List[str]:
+        """
+        Write prepared rows (see prepare_resource_row) in one transaction.
+
+        A single statement upserts the batch's Subscription nodes, one writes
+        every row's Original node, Abstracted node and SCAN_SOURCE_NODE edge,
+        and, for rows prepared with containment, one more creates their
+        containment edges. If the batched transaction fails the rows are
+        retried one at a time so a single bad row cannot drop the whole batch.
+
+        Args:
+            rows: Rows from prepare_resource_row
+
+        Returns:
+            Original IDs of the rows that were written
+        """
+        if not rows:
+            return []
+
+        subscription_ids = sorted({row["subscription_id"] for row in rows})
+        try:
+            with self.session_manager.session() as session:
+                with session.begin_transaction() as tx:
+                    self._run_row_statements(tx, rows, subscription_ids)
+                    tx.commit()
+            logger.debug(f"Flushed {len(rows)} batched dual-graph upserts")
+            return [row["original_id"] for row in rows]
+        except Exception as exc:
+            logger.warning(
+                f"Batched upsert of {len(rows)} resources failed, retrying row by row: {exc}"
+            )
+
+        written = []
+        for row in rows:
+            try:
+                self.upsert_subscription(row["subscription_id"])
+                with self.session_manager.session() as session:
+                    with session.begin_transaction() as tx:
+                        self._run_row_statements(tx, [row])
+                        tx.commit()
+                written.append(row["original_id"])
+            except Exception as row_exc:
+                wrapped_exc = wrap_neo4j_exception(
+                    row_exc, context={"resource_id": row["original_id"]}
+                )
+                logger.error(str(wrapped_exc))
+        return written
+
+    @staticmethod
+    def _run_row_statements(
+        tx: Any,
+        rows: List[Dict[str, Any]],
+        subscription_ids: Optional[List[str]] = None,
+    ) -> None:
+        if subscription_ids:
+            tx.run(BATCH_UPSERT_SUBSCRIPTIONS_QUERY, ids=subscription_ids)
+        containment = [row["containment"] for row in rows if row.get("containment")]
+        if not containment:
+            tx.run(BATCH_UPSERT_RESOURCES_QUERY, rows=rows)
+            return
+        tx.run(
+            BATCH_UPSERT_RESOURCES_QUERY,
+            rows=[{k: v for k, v in row.items() if k != "containment"} for row in rows],
+        )
+        tx.run(BATCH_UPSERT_CONTAINMENT_QUERY, rows=containment)
+
     def _create_original_node(
         self, tx: Any, original_id: str, abstracted_id: str, properties: Dict[str, Any]
     ) -> None:
@@ -355,6 +541,31 @@ class NodeManager:
         self, tx: Any, abstracted_id: str, original_id: str, properties: Dict[str, Any]
     ) -> None:
         """Create the Abstracted node with hash IDs."""
+        abstracted_props, prefix = self._build_abstracted_props(
+            abstracted_id, original_id, properties
+        )
+
+        query = """
+        MERGE (r:Resource {id: $abstracted_id})
+        SET r += $props,
+            r.id = $abstracted_id,
+            r.original_id = $original_id,
+            r.abstracted_id = $abstracted_id,
+            r.abstraction_type = $abstraction_type,
+            r.updated_at = datetime()
+        """
+        tx.run(
+            query,
+            abstracted_id=abstracted_id,
+            original_id=original_id,
+            abstraction_type=prefix,
+            props=abstracted_props,
+        )
+
+    def _build_abstracted_props(
+        self, abstracted_id: str, original_id: str, properties: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], str]:
+        """Build the Abstracted node's properties and abstraction type prefix."""
         # Create a copy of properties with abstracted ID
         abstracted_props = properties.copy()
 
@@ -382,22 +593,7 @@ class NodeManager:
         if resource_type == "Microsoft.Authorization/roleAssignments":
             self._abstract_role_assignment_properties(abstracted_id, abstracted_props)
 
-        query = """
-        MERGE (r:Resource {id: $abstracted_id})
-        SET r += $props,
-            r.id = $abstracted_id,
-            r.original_id = $original_id,
-            r.abstracted_id = $abstracted_id,
-            r.abstraction_type = $abstraction_type,
-            r.updated_at = datetime()
-        """
-        tx.run(
-            query,
-            abstracted_id=abstracted_id,
-            original_id=original_id,
-            abstraction_type=prefix,
-            props=abstracted_props,
-        )
+        return abstracted_props, prefix
 
     def _abstract_role_assignment_properties(
         self, abstracted_id: str, abstracted_props: Dict[str, Any]
@@ -595,6 +791,93 @@ class NodeManager:
             )
             return False
 
+    def upsert_generic_batch(
+        self, label: str, key_prop: str, rows: List[Dict[str, Any]]
+    ) -> int:
+        """
+        Create or update many generic nodes with a single UNWIND statement.
+
+        Args:
+            label: Node label (e.g., "User", "IdentityGroup")
+            key_prop: Property name to use as unique key; every row must have it
+            rows: Property dicts, one per node
+
+        Returns:
+            int: Number of rows written, or -1 if the batch failed
+        """
+        params = []
+        for properties in rows:
+            key_value = serialize_value(properties.get(key_prop))
+            if key_value is None:
+                continue
+            # Same None filtering as upsert_generic
+            props = {}
+            for k, v in properties.items():
+                serialized_val = serialize_value(v)
+                if serialized_val is not None:
+                    props[k] = serialized_val
+            params.append({"key": key_value, "props": props})
+        if not params:
+            return 0
+
+        query = f"""
+        UNWIND $rows AS row
+        MERGE (n:{label} {{{key_prop}: row.key}})
+        SET n += row.props,
+            n.updated_at = datetime()
+        """
+        try:
+            with self.session_manager.session() as session:
+                session.run(query, rows=params)
+            return len(params)
+        except Exception:
+            logger.exception(f"Error upserting batch of {len(params)} {label} nodes")
+            return -1
+
+    def create_generic_rels_batch(
+        self,
+        src_label: str,
+        rel_type: str,
+        tgt_label: str,
+        tgt_key_prop: str,
+        pairs: List[Tuple[str, str]],
+    ) -> int:
+        """
+        Create many relationships between generic nodes with a single UNWIND statement.
+
+        Args:
+            src_label: Source node label; sources are matched on ``id``
+            rel_type: Relationship type (e.g., "MEMBER_OF")
+            tgt_label: Target node label
+            tgt_key_prop: Target node key property
+            pairs: (source id, target key value) tuples
+
+        Returns:
+            int: Number of pairs submitted, or -1 if the batch failed
+        """
+        if not pairs:
+            return 0
+
+        query = f"""
+        UNWIND $rows AS row
+        MATCH (src:{src_label} {{id: row.src_id}})
+        MATCH (tgt:{tgt_label} {{{tgt_key_prop}: row.tgt_key}})
+        MERGE (src)-[:{rel_type}]->(tgt)
+        """
+        try:
+            with self.session_manager.session() as session:
+                session.run(
+                    query,
+                    rows=[{"src_id": s, "tgt_key": t} for s, t in pairs],
+                )
+            return len(pairs)
+        except Exception:
+            logger.exception(
+                f"Error creating batch of {len(pairs)} {rel_type} relationships "
+                f"from {src_label} to {tgt_label}"
+            )
+            return -1
+
 
 # Backward compatibility alias
 DatabaseOperations = NodeManager
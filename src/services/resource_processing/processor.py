@@ -6,20 +6,28 @@ with improved error handling, progress tracking, and resumable operations.
 Uses dual-graph architecture for all resources.
 """
 
+import asyncio
 import threading
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import structlog  # type: ignore[import-untyped]
 
 from src.llm_descriptions import AzureLLMDescriptionGenerator
 
+from .description_cache import DescriptionCache
+from .graph_writer import GraphWriter
 from .llm_integration import LLMIntegration
 from .node_manager import NodeManager
+from .progress_journal import ProgressJournal
 from .relationship_emitter import RelationshipEmitter
 from .state import ResourceState
 from .stats import ProcessingStats
+from .stream import ResourceStream
 from .validation import extract_identity_fields
 
+if TYPE_CHECKING:
+    from src.relationship_rules.relationship_buffer import SpillingRelationshipBuffer
+
 logger = structlog.get_logger(__name__)
 
 
@@ -73,11 +81,127 @@ class ResourceProcessor:
         self._seen_ids: set[str] = set()
         self._seen_lock = threading.Lock()
 
+        # Node writes go to a dedicated writer thread in UNWIND batches when
+        # enabled (see enable_batched_writes)
+        self._writer: Optional[GraphWriter] = None
+        # Write-ahead record of started/written resources (see
+        # enable_progress_journal)
+        self._journal: Optional[ProgressJournal] = None
+
+        # Node state fetched in bulk by prefetch_resource_state, consumed by
+        # _should_process_resource; None marks a resource not in the graph
+        self._snapshots: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._relationship_spill: Optional[SpillingRelationshipBuffer] = None
+        # Cleared by callers that evaluate relationship rules themselves
+        # afterwards (e.g. incremental sync), so the rules run once
+        self.relationship_rules_enabled = True
+
         logger.info(
             f"Initialized ResourceProcessor with LLM: {'enabled' if llm_generator else 'disabled'}, "
             f"max_retries: {max_retries}, dual-graph: enabled"
         )
 
+    def enable_batched_writes(
+        self, batch_size: int, flush_interval: float = 5.0
+    ) -> None:
+        """
+        Write resource nodes from a dedicated thread in batched transactions.
+
+        Each resource's single node write, with its containment edges, is
+        queued to a GraphWriter instead of running on the event loop. Once a
+        batch commits, the writer thread evaluates the resources' relationship
+        rules, as their nodes now exist. Queued writes are drained at the end
+        of processing before buffered relationships are flushed.
+
+        Args:
+            batch_size: Rows per transaction
+            flush_interval: Maximum seconds a queued row waits for its batch
+        """
+        self._writer = GraphWriter(
+            self.db_ops,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+            on_written=self._on_resources_written,
+        )
+
+    def enable_description_cache(self, path: str) -> None:
+        """
+        Reuse LLM descriptions across scans from a persistent cache.
+
+        Descriptions are keyed by a fingerprint of the resource content the
+        prompt is built from, so unchanged resources never reach the LLM.
+
+        Args:
+            path: SQLite file for the cache
+        """
+        self._llm_integration.description_cache = DescriptionCache(path)
+
+    def enable_relationship_spill(self, path: str, window_size: int = 10_000) -> None:
+        """
+        Spill buffered relationships to disk instead of holding them in memory.
+
+        Each rule keeps at most window_size relationships in memory; the rest
+        go to a SQLite file that is replayed when relationships are flushed.
+        Relationships left in the file by an interrupted run are replayed too.
+
+        Args:
+            path: SQLite file for spilled relationships
+            window_size: Relationships a rule holds before spilling
+        """
+        from src.relationship_rules import (
+            ALL_RELATIONSHIP_RULES,
+            SpillingRelationshipBuffer,
+        )
+
+        self._relationship_spill = SpillingRelationshipBuffer(path, window_size)
+        for rule in ALL_RELATIONSHIP_RULES:
+            rule.attach_spill_buffer(self._relationship_spill)
+        pending = len(self._relationship_spill)
+        if pending:
+            logger.info(
+                f"Resuming with {pending} spilled relationships from a previous run"
+            )
+
+    def enable_progress_journal(self, path: str) -> None:
+        """
+        Journal processing progress to a local file for crash recovery.
+
+        Resources are journaled as started before any work and as written
+        once their node write commits. Resources a previous run started but
+        never wrote are reprocessed even if the graph has a node for them.
+
+        Args:
+            path: Journal file
+        """
+        self._journal = ProgressJournal(path)
+        if self._journal.interrupted:
+            logger.info(
+                f"Resuming {len(self._journal.interrupted)} resources interrupted "
+                f"in a previous run"
+            )
+
+    def prefetch_resource_state(self, resources: List[Dict[str, Any]]) -> None:
+        """
+        Look up the graph state and known descriptions for a batch in bulk.
+
+        One UNWIND query per chunk replaces the per-resource existence,
+        description and status lookups, and known descriptions are attached
+        to the resources so they skip the LLM. Resources whose state could
+        not be fetched fall back to per-resource lookups.
+
+        Args:
+            resources: Resources about to be processed, updated in place
+        """
+        ids = [str(r["id"]) for r in resources if r.get("id")]
+        if not ids:
+            return
+        snapshots = self.state.get_resource_snapshots(ids)
+        if snapshots is None:
+            return
+        for rid in ids:
+            self._snapshots[rid] = snapshots.get(rid)
+        self._llm_integration.prefetch_descriptions(resources, snapshots)
+
     def _should_process_resource(self, resource: Dict[str, Any]) -> Tuple[bool, str]:
         """
         Determine if a resource should be processed based on its current state.
@@ -90,6 +214,24 @@ class ResourceProcessor:
         """
         resource_id = resource["id"]
 
+        # Started but never written by a previous run: the node, if any, is stale
+        if self._journal is not None and resource_id in self._journal.interrupted:
+            self._snapshots.pop(resource_id, None)
+            return True, "resume_interrupted"
+
+        # Prefetched state; consumed so a retry re-reads the graph
+        if resource_id in self._snapshots:
+            snapshot = self._snapshots.pop(resource_id)
+            if snapshot is None:
+                return True, "new_resource"
+            if self.llm_generator and not self._llm_integration.has_description(
+                resource
+            ):
+                return True, "needs_llm_description"
+            if snapshot.get("processing_status") == "failed":
+                return True, "retry_failed"
+            return False, "already_processed"
+
         # Check if resource exists
         exists = self.state.resource_exists(resource_id)
         if not exists:
@@ -109,21 +251,24 @@ class ResourceProcessor:
         return False, "already_processed"
 
     async def _process_single_resource_llm(
-        self, resource: Dict[str, Any]
+        self, resource: Dict[str, Any], check_graph: bool = True
     ) -> Tuple[bool, str]:
         """
         Generate LLM description for a single resource, with skip logic.
 
         Args:
             resource: Resource dictionary
+            check_graph: Query the graph for an existing description first
 
         Returns:
             Tuple of (success, description)
         """
-        return await self._llm_integration.generate_resource_description(resource)
+        return await self._llm_integration.generate_resource_description(
+            resource, check_graph=check_graph
+        )
 
     async def process_single_resource(
-        self, resource: Dict[str, Any], resource_index: int
+        self, resource: Dict[str, Any], resource_index: int, dedupe: bool = True
     ) -> bool:
         """
         Process a single resource with comprehensive error handling and state management.
@@ -131,6 +276,8 @@ class ResourceProcessor:
         Args:
             resource: Resource dictionary
             resource_index: Index of resource being processed
+            dedupe: Skip resources already seen by this processor. Disabled when
+                the caller (e.g. a ResourceStream) has already de-duplicated.
 
         Returns:
             bool: True if successful, False if failed
@@ -143,18 +290,24 @@ class ResourceProcessor:
         resource_type = resource.get("type", "Unknown")
 
         # Thread-safe seen guard (Phase 1 efficiency improvement)
-        with self._seen_lock:
-            if resource_id in self._seen_ids:
-                logger.info(
-                    f"Resource {resource_index + 1}/{self.stats.total_resources}: {resource_name} - SKIPPED (intra-run duplicate)"
-                )
-                self.stats.skipped += 1
-                return True
-            self._seen_ids.add(resource_id)
+        if dedupe:
+            with self._seen_lock:
+                if resource_id in self._seen_ids:
+                    logger.info(
+                        f"Resource {resource_index + 1}/{self.stats.total_resources}: {resource_name} - SKIPPED (intra-run duplicate)"
+                    )
+                    self.stats.skipped += 1
+                    return True
+                self._seen_ids.add(resource_id)
+
+        if self._journal is not None:
+            self._journal.mark_started(resource_id)
 
         try:
-            # Mark resource as being processed
-            self.db_ops.upsert_resource(resource, processing_status="processing")
+            # Carry a known description into the graph writes below
+            prefetched = resource_id in self._snapshots
+            if not prefetched:
+                self._llm_integration.attach_cached_description(resource)
 
             # Determine if resource should be processed
             should_process, reason = self._should_process_resource(resource)
@@ -163,8 +316,8 @@ class ResourceProcessor:
                 logger.info(
                     f"Resource {resource_index + 1}/{self.stats.total_resources}: {resource_name} - SKIPPED ({reason})"
                 )
-                # Always create relationships, even if resource is skipped
-                self._relationship_emitter.create_resource_group_relationships(resource)
+                # Always refresh the node and its containment, even if skipped
+                await self._write_resource(resource, enrich=False)
                 self.stats.skipped += 1
                 return True
 
@@ -172,11 +325,20 @@ class ResourceProcessor:
                 f"Processing resource {resource_index + 1}/{self.stats.total_resources}: {resource_name} ({resource_type}) - {reason}"
             )
 
-            # Generate LLM description if needed
-            if reason in ["new_resource", "needs_llm_description", "retry_failed"]:
+            # Generate LLM description if needed, unless a cached one matches
+            needs_description = reason in [
+                "new_resource",
+                "needs_llm_description",
+                "retry_failed",
+                "resume_interrupted",
+            ]
+            if needs_description and self._llm_integration.has_description(resource):
+                self.stats.llm_skipped += 1
+                logger.debug(str(f"Reusing cached description for {resource_name}"))
+            elif needs_description:
                 logger.debug(str(f"Generating LLM description for {resource_name}"))
                 llm_success, description = await self._process_single_resource_llm(
-                    resource
+                    resource, check_graph=not prefetched
                 )
                 resource["llm_description"] = description
 
@@ -194,20 +356,8 @@ class ResourceProcessor:
                         str(f"Using fallback description for {resource_name}")
                     )
 
-            # Upsert resource to database
-            success = self.db_ops.upsert_resource(
-                resource, processing_status="completed"
-            )
-            if not success:
-                raise Exception("Failed to upsert resource")
-
-            # Create relationships
-            self._relationship_emitter.create_subscription_relationship(
-                resource["subscription_id"], resource_id
-            )
-            self._relationship_emitter.create_resource_group_relationships(resource)
-            # Enriched relationships (non-containment)
-            self._create_enriched_relationships(resource)
+            # Single node write, then containment and enriched relationships
+            await self._write_resource(resource, enrich=True)
 
             logger.debug(str(f"Successfully processed {resource_name}"))
             self.stats.successful += 1
@@ -230,6 +380,43 @@ class ResourceProcessor:
         finally:
             self.stats.processed += 1
 
+    async def _write_resource(self, resource: Dict[str, Any], enrich: bool) -> None:
+        """
+        Write the resource's node once, with status "completed".
+
+        With a writer, the write (and, after it commits, containment and
+        enriched relationships) happens on the writer thread; otherwise it
+        runs inline.
+
+        Args:
+            resource: Resource dictionary
+            enrich: Also emit enriched (non-containment) relationships
+        """
+        if self._writer is not None:
+            if not await self._writer.submit(resource, context=enrich):
+                raise Exception("Failed to upsert resource")
+            return
+
+        if not self.db_ops.upsert_resource(resource, processing_status="completed"):
+            raise Exception("Failed to upsert resource")
+        if enrich:
+            self._relationship_emitter.create_subscription_relationship(
+                resource["subscription_id"], resource["id"]
+            )
+        self._relationship_emitter.create_resource_group_relationships(resource)
+        if enrich:
+            self._create_enriched_relationships(resource)
+        if self._journal is not None:
+            self._journal.mark_written([resource["id"]])
+
+    def _on_resources_written(self, written: List[Tuple[Dict[str, Any], Any]]) -> None:
+        """Writer-thread callback for resources whose node write committed."""
+        for resource, enrich in written:
+            if enrich:
+                self._create_enriched_relationships(resource)
+        if self._journal is not None:
+            self._journal.mark_written(resource["id"] for resource, _ in written)
+
     async def process_resources(
         self,
         resources: List[Dict[str, Any]],
@@ -249,7 +436,6 @@ class ResourceProcessor:
         Returns:
             ProcessingStats: Final processing statistics
         """
-        import asyncio
         import time
         from collections import deque
 
@@ -269,6 +455,8 @@ class ResourceProcessor:
             print("[DEBUG][RP] No resources to process", flush=True)
             return self.stats
 
+        self.prefetch_resource_state(resources)
+
         retry_queue: deque[tuple[Dict[str, Any], int, float]] = deque()
         poison_list: List[Dict[str, Any]] = []
         main_queue: deque[tuple[Dict[str, Any], int, float]] = deque(
@@ -431,6 +619,110 @@ class ResourceProcessor:
 
         logger.debug("Exited main processing loop")
 
+        await self._finish_processing(poison_list)
+        logger.debug("Returning from ResourceProcessor.process_resources")
+        return self.stats
+
+    async def process_resource_stream(
+        self,
+        stream: ResourceStream,
+        max_workers: int = 5,
+        progress_callback: Optional[Any] = None,
+        progress_every: int = 50,
+    ) -> ProcessingStats:
+        """
+        Process resources as they arrive on a stream until it is closed.
+
+        Workers pull directly from the stream, so discovery and processing
+        overlap and only the stream's bounded queue is held in memory. The
+        stream de-duplicates on ID, so the per-processor seen set is bypassed.
+        Relationship rules buffer their edges and are flushed once the stream
+        is drained, when every target node exists.
+
+        Args:
+            stream: ResourceStream fed by discovery
+            max_workers: Maximum concurrent workers
+            progress_callback: Optional callback for progress updates
+            progress_every: How often to log progress
+
+        Returns:
+            ProcessingStats: Final processing statistics
+        """
+        poison_list: List[Dict[str, Any]] = []
+        base_delay = 1.0
+        resource_index_counter = 0
+
+        async def worker() -> None:
+            nonlocal resource_index_counter
+            while True:
+                resource = await stream.get()
+                if resource is None:
+                    return
+                resource_index = resource_index_counter
+                resource_index_counter += 1
+                self.stats.total_resources = stream.accepted
+
+                attempt = 1
+                while True:
+                    try:
+                        success = await self.process_single_resource(
+                            resource, resource_index, dedupe=False
+                        )
+                    except Exception as e:
+                        logger.exception(
+                            f"Exception in worker for resource {resource.get('id', 'Unknown')}: {e}"
+                        )
+                        success = False
+                    if success:
+                        break
+                    if attempt >= self.max_retries:
+                        poison_list.append(resource)
+                        logger.error(
+                            str(f"Poisoned after {attempt} attempts: {resource['id']}")
+                        )
+                        break
+                    delay = base_delay * (2 ** (attempt - 1))
+                    logger.info(
+                        f"Retry in {delay}s (attempt {attempt + 1}/{self.max_retries})."
+                    )
+                    await asyncio.sleep(delay)
+                    attempt += 1
+
+                if progress_callback:
+                    progress_callback(
+                        processed=self.stats.processed,
+                        total=self.stats.total_resources,
+                        successful=self.stats.successful,
+                        failed=self.stats.failed,
+                        skipped=self.stats.skipped,
+                        llm_generated=self.stats.llm_generated,
+                        llm_skipped=self.stats.llm_skipped,
+                    )
+                if self.stats.processed % progress_every == 0:
+                    logger.info(
+                        f"Progress: {self.stats.processed} processed "
+                        f"({stream.accepted} discovered so far) - "
+                        f"Success: {self.stats.successful} | Failed: {self.stats.failed} | Skipped: {self.stats.skipped}"
+                    )
+
+        await asyncio.gather(*[worker() for _ in range(max(1, max_workers))])
+        self.stats.total_resources = stream.accepted
+        stream.log_summary()
+
+        await self._finish_processing(poison_list)
+        return self.stats
+
+    async def _finish_processing(self, poison_list: List[Dict[str, Any]]) -> None:
+        """Deferred work that needs every resource in the graph first."""
+        # Drain node writes still queued on the writer thread
+        if self._writer is not None:
+            await self._retry_failed_writes(poison_list)
+            await asyncio.to_thread(self._writer.close)
+        # Unwritten resources stay journaled for the next run
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
         # Flush any remaining buffered relationships
         self._flush_relationship_buffers()
 
@@ -457,16 +749,64 @@ class ResourceProcessor:
                 logger.warning(f"  - {r.get('id', 'Unknown')}")
 
         self._log_final_summary()
-        logger.debug("Returning from ResourceProcessor.process_resources")
-        return self.stats
+
+    async def _retry_failed_writes(self, poison_list: List[Dict[str, Any]]) -> None:
+        """
+        Retry resources whose batched node write failed, or poison them.
+
+        A failed write counts as a failed attempt: the resource is processed
+        again after the usual back-off until it is written or has used
+        max_retries attempts, when it joins the poison list.
+        """
+        if self._writer is None:
+            return
+        base_delay = 1.0
+        attempts: Dict[str, int] = {}
+        pending: List[Dict[str, Any]] = []
+        while True:
+            await asyncio.to_thread(self._writer.flush)
+            for resource, enriched in self._writer.take_failed():
+                # The worker counted the resource when its write was queued
+                if enriched:
+                    self.stats.successful -= 1
+                else:
+                    self.stats.skipped -= 1
+                pending.append(resource)
+
+            retries = []
+            for resource in pending:
+                rid = resource["id"]
+                attempt = attempts.get(rid, resource.get("__attempt", 1))
+                if attempt >= self.max_retries:
+                    poison_list.append(resource)
+                    logger.error(str(f"Poisoned after {attempt} attempts: {rid}"))
+                    self.stats.failed += 1
+                else:
+                    attempts[rid] = attempt + 1
+                    retries.append(resource)
+            if not retries:
+                return
+
+            delay = base_delay * (2 ** (min(attempts[r["id"]] for r in retries) - 2))
+            logger.info(f"Retrying {len(retries)} failed resource writes in {delay}s.")
+            await asyncio.sleep(delay)
+            results = await asyncio.gather(
+                *(
+                    self.process_single_resource(resource, index, dedupe=False)
+                    for index, resource in enumerate(retries)
+                )
+            )
+            pending = [r for r, ok in zip(retries, results) if not ok]
 
     def _create_enriched_relationships(self, resource: Dict[str, Any]) -> None:
         """
         Emit non-containment relationships for the resource, if applicable.
         Uses modular relationship rules from src.relationship_rules.
         """
+        if not self.relationship_rules_enabled:
+            return
         try:
-            from src.relationship_rules import ALL_RELATIONSHIP_RULES
+            from src.relationship_rules import ALL_RELATIONSHIP_RULE_DISPATCHER
         except ImportError:
             logger.error("Could not import relationship rules package.")
             return
@@ -474,7 +814,8 @@ class ResourceProcessor:
         resource_id = resource.get("id", "unknown")
         applied_rules = []
 
-        for rule in ALL_RELATIONSHIP_RULES:
+        # Only rules indexed for this resource's type or keys can apply
+        for rule in ALL_RELATIONSHIP_RULE_DISPATCHER.candidates(resource):
             try:
                 if rule.applies(resource):
                     applied_rules.append(rule.__class__.__name__)
@@ -522,9 +863,22 @@ class ResourceProcessor:
                         str(rid), "DEPENDS_ON", str(dep_id)
                     )
 
+    def flush_relationship_buffers(self) -> None:
+        """
+        Write relationships buffered by the rules (or spilled to disk).
+
+        Processing flushes on its own once every resource is written; callers
+        that apply the rules outside process_resources (e.g. rebuilding
+        edges) call this once all target nodes exist.
+        """
+        self._flush_relationship_buffers()
+
     def _flush_relationship_buffers(self) -> None:
         """Flush any remaining buffered relationships from all rules."""
         logger.info("🔄 Flushing buffered relationships from all rules...")
+        if self._relationship_spill is not None:
+            self._replay_relationship_spill()
+            return
         try:
             from src.relationship_rules import ALL_RELATIONSHIP_RULES
 
@@ -577,6 +931,41 @@ class ResourceProcessor:
         except Exception as e:
             logger.exception(f"Error flushing relationship buffers: {e}")
 
+    def _replay_relationship_spill(self) -> None:
+        """Spill every rule's buffer, replay the spill file once, then detach it."""
+        from src.relationship_rules import ALL_RELATIONSHIP_RULES
+
+        spill = self._relationship_spill
+        if spill is None:
+            return
+        try:
+            for rule in ALL_RELATIONSHIP_RULES:
+                if rule._relationship_buffer and not rule.enable_dual_graph:
+                    rule.flush_relationship_buffer(self.db_ops)
+                rule.spill_relationship_buffer()
+
+            pending = len(spill)
+            flushed = spill.replay(self.db_ops)
+            remaining = len(spill)
+            logger.info(f"✅ Flushed {flushed}/{pending} buffered relationships")
+            if remaining:
+                logger.error(
+                    f"❌ {remaining} relationships are still pending in {spill.path}; "
+                    "they will be replayed by the next run"
+                )
+            elif flushed < pending:
+                logger.warning(
+                    f"⚠️  {pending - flushed} relationships had no matching nodes. "
+                    "Check if all resources were processed successfully."
+                )
+        except Exception as e:
+            logger.exception(f"Error flushing relationship buffers: {e}")
+        finally:
+            for rule in ALL_RELATIONSHIP_RULES:
+                rule.attach_spill_buffer(None)
+            spill.close()
+            self._relationship_spill = None
+
     def _verify_dual_graph_relationships(self) -> None:
         """Verify dual-graph relationship duplication."""
         logger.info("Verifying dual-graph relationship duplication...")
@@ -0,0 +1,113 @@
+"""
+Progress Journal Module
+
+Write-ahead log of resource processing progress. A resource is journaled as
+started before any work is done on it and as written once its node write has
+committed, so after a crash the resources that were started but never written
+are known without marking them in the graph first. The next run opens the
+same journal and reprocesses exactly those resources.
+
+The journal is a local JSON-lines file. It is compacted when opened (only the
+interrupted resources are kept) and removed when a run closes it with nothing
+outstanding.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Iterable, Set, Union
+
+import structlog  # type: ignore[import-untyped]
+
+logger = structlog.get_logger(__name__)
+
+
+class ProgressJournal:
+    """Append-only record of resources started and durably written."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """
+        Open (creating if needed) the journal and recover interrupted resources.
+
+        Args:
+            path: Journal file path
+        """
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.interrupted: Set[str] = self._recover()
+        self._outstanding: Set[str] = set(self.interrupted)
+        self._compact()
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def _recover(self) -> Set[str]:
+        """Resources a previous run started but never wrote."""
+        if not self.path.exists():
+            return set()
+        started: Set[str] = set()
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn final line from a crash mid-append
+                    continue
+                if "started" in entry:
+                    started.add(entry["started"])
+                else:
+                    started.difference_update(entry.get("written", ()))
+        return started
+
+    def _compact(self) -> None:
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            for resource_id in sorted(self.interrupted):
+                f.write(json.dumps({"started": resource_id}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+    def mark_started(self, resource_id: str) -> None:
+        """Record that work on a resource has begun."""
+        with self._lock:
+            if resource_id in self._outstanding:
+                return
+            self._outstanding.add(resource_id)
+            self._file.write(json.dumps({"started": resource_id}) + "\n")
+            self._file.flush()
+
+    def mark_written(self, resource_ids: Iterable[str]) -> None:
+        """
+        Record that the resources' node writes have committed.
+
+        Synced to disk before returning, as these entries are what lets the
+        next run skip the resources.
+        """
+        ids = list(resource_ids)
+        if not ids:
+            return
+        with self._lock:
+            self._outstanding.difference_update(ids)
+            self._file.write(json.dumps({"written": ids}) + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    @property
+    def outstanding(self) -> int:
+        """Resources started but not yet written."""
+        return len(self._outstanding)
+
+    def close(self) -> None:
+        """Close the journal, removing it if every started resource was written."""
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.close()
+            if self._outstanding:
+                logger.warning(
+                    f"{len(self._outstanding)} resources were not written; "
+                    f"they will be reprocessed from {self.path}"
+                )
+            else:
+                self.path.unlink(missing_ok=True)
@@ -4,12 +4,15 @@ Resource State Module
 This module manages the state of resource processing.
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 import structlog  # type: ignore[import-untyped]
 
 logger = structlog.get_logger(__name__)
 
+# Resource IDs per UNWIND lookup in get_resource_snapshots
+SNAPSHOT_CHUNK_SIZE = 1000
+
 
 class ResourceState:
     """Manages the state of resource processing."""
@@ -105,3 +108,49 @@ class ResourceState:
         except Exception:
             logger.exception(f"Error getting processing metadata for {resource_id}")
             return {}
+
+    def get_resource_snapshots(
+        self, resource_ids: List[str]
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Get the processing state of many resources in bulk.
+
+        Replaces the per-resource resource_exists / has_llm_description /
+        get_processing_metadata round-trips with one UNWIND query per chunk
+        of SNAPSHOT_CHUNK_SIZE IDs.
+
+        Args:
+            resource_ids: Resource IDs to look up
+
+        Returns:
+            dict: Resource ID -> {llm_description, llm_description_hash,
+            processing_status} for the resources that exist; IDs missing
+            from the result are not in the graph. None if the lookup failed.
+        """
+        snapshots: Dict[str, Dict[str, Any]] = {}
+        try:
+            with self.session_manager.session() as session:
+                for start in range(0, len(resource_ids), SNAPSHOT_CHUNK_SIZE):
+                    result = session.run(
+                        """
+                        UNWIND $ids AS id
+                        MATCH (r:Resource:Original {id: id})
+                        RETURN r.id AS id,
+                               r.llm_description AS llm_description,
+                               r.llm_description_hash AS llm_description_hash,
+                               r.processing_status AS processing_status
+                    """,
+                        ids=resource_ids[start : start + SNAPSHOT_CHUNK_SIZE],
+                    )
+                    for record in result:
+                        snapshots[record["id"]] = {
+                            "llm_description": record["llm_description"],
+                            "llm_description_hash": record["llm_description_hash"],
+                            "processing_status": record["processing_status"],
+                        }
+        except Exception:
+            logger.exception(
+                f"Error getting bulk resource state for {len(resource_ids)} resources"
+            )
+            return None
+        return snapshots
@@ -0,0 +1,164 @@
+"""
+Resource Stream Module
+
+This module provides the bounded queue that connects discovery to processing
+workers. Discovery pushes hydrated batches as they complete; workers pull
+resources one at a time. A full queue blocks the producer (back-pressure), so
+memory is proportional to queue depth rather than tenant size.
+"""
+
+import asyncio
+import hashlib
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+import structlog  # type: ignore[import-untyped]
+
+logger = structlog.get_logger(__name__)
+
+_CLOSED = object()
+
+
+def _id_digest(resource_id: str) -> int:
+    """Compact 64-bit fingerprint of a resource ID for the seen set."""
+    return int.from_bytes(
+        hashlib.blake2b(resource_id.encode("utf-8"), digest_size=8).digest(), "big"
+    )
+
+
+class ResourceStream:
+    """
+    Bounded, de-duplicating stream of resources between discovery and processing.
+
+    Resources are de-duplicated on ID with a set of 64-bit fingerprints instead
+    of keeping every resource (or every full ID string) alive for the whole
+    run. Resources without an ID are dropped, matching the in-memory
+    de-duplication this replaces.
+    """
+
+    def __init__(self, max_depth: int = 1000, resource_limit: Optional[int] = None):
+        """
+        Initialize the stream.
+
+        Args:
+            max_depth: Maximum number of resources buffered between producer
+                and consumers before producers block
+            resource_limit: Optional cap on the number of unique resources
+                accepted; later resources are dropped
+        """
+        self.max_depth = max(1, max_depth)
+        # Unbounded queue plus a slot semaphore, so close() never blocks on a
+        # full queue (e.g. while a cancelled producer unwinds)
+        self._queue: asyncio.Queue[Any] = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.max_depth)
+        self._seen: Set[int] = set()
+        self._closed = False
+        self.resource_limit = resource_limit
+        self.accepted = 0
+        self.duplicates = 0
+        self.dropped = 0
+        self.peak_depth = 0
+        self._batch_hooks: List[Callable[[List[Dict[str, Any]]], Any]] = []
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def limit_reached(self) -> bool:
+        return bool(self.resource_limit and self.accepted >= self.resource_limit)
+
+    def add_batch_hook(self, hook: Callable[[List[Dict[str, Any]]], Any]) -> None:
+        """
+        Call hook with every batch accepted by put_many before it is queued.
+
+        Lets the consumer look up state for a whole batch at once (e.g.
+        ResourceProcessor.prefetch_resource_state) instead of per resource.
+        Hooks may block on I/O, so they run in a worker thread while the
+        producer awaits them; a failing hook is logged and ignored.
+        """
+        self._batch_hooks.append(hook)
+
+    def _accept(self, resource: Dict[str, Any]) -> bool:
+        """Apply de-duplication and the resource limit to one resource."""
+        if self._closed:
+            raise RuntimeError("Cannot put into a closed ResourceStream")
+        rid = resource.get("id")
+        if not rid:
+            self.dropped += 1
+            return False
+        digest = _id_digest(str(rid))
+        if digest in self._seen:
+            self.duplicates += 1
+            return False
+        if self.limit_reached:
+            self.dropped += 1
+            return False
+        self._seen.add(digest)
+        self.accepted += 1
+        return True
+
+    async def _enqueue(self, resource: Dict[str, Any]) -> None:
+        await self._slots.acquire()
+        self._queue.put_nowait(resource)
+        self.peak_depth = max(self.peak_depth, self._queue.qsize())
+
+    async def put(self, resource: Dict[str, Any]) -> bool:
+        """
+        Enqueue one resource, waiting while the queue is full.
+
+        Returns:
+            True if the resource was accepted, False if it was a duplicate,
+            had no ID, or the resource limit was reached
+        """
+        if not self._accept(resource):
+            return False
+        await self._enqueue(resource)
+        return True
+
+    async def put_many(self, resources: Iterable[Dict[str, Any]]) -> int:
+        """
+        Enqueue a batch of resources, waiting while the queue is full.
+
+        Returns:
+            Number of resources accepted
+        """
+        accepted = [r for r in resources if self._accept(r)]
+        if accepted:
+            for hook in self._batch_hooks:
+                try:
+                    await asyncio.to_thread(hook, accepted)
+                except Exception:
+                    logger.exception(
+                        f"Resource stream batch hook failed for {len(accepted)} resources"
+                    )
+        for resource in accepted:
+            await self._enqueue(resource)
+        return len(accepted)
+
+    async def close(self) -> None:
+        """Signal that no more resources will be produced."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put_nowait(_CLOSED)
+
+    async def get(self) -> Optional[Dict[str, Any]]:
+        """
+        Wait for the next resource.
+
+        Returns:
+            The next resource, or None once the stream is closed and drained
+        """
+        item = await self._queue.get()
+        if item is _CLOSED:
+            # Leave the marker for the remaining consumers
+            self._queue.put_nowait(_CLOSED)
+            return None
+        self._slots.release()
+        return item
+
+    def log_summary(self) -> None:
+        logger.info(
+            f"Resource stream: {self.accepted} accepted, {self.duplicates} duplicates "
+            f"removed, {self.dropped} dropped, peak queue depth {self.peak_depth}"
+        )
@@ -1,4 +1,5 @@
 import logging
+from pathlib import Path
 from typing import Any, Callable, Optional
 
 from src.config_manager import ProcessingConfig
@@ -13,6 +14,7 @@ from src.resource_processor import (
 )
 from src.services.identity_collector import IdentityCollector
 from src.services.managed_identity_resolver import ManagedIdentityResolver
+from src.services.resource_processing import ResourceStream
 from src.utils.console_icons import ICON_SUCCESS, ICON_WARNING
 from src.utils.session_manager import Neo4jSessionManager
 
@@ -36,6 +38,100 @@ class ResourceProcessingService:
         self.processor_factory = processor_factory or ResourceProcessor
         self.aad_graph_service = aad_graph_service
 
+    def _configure_batched_writes(self, processor: ResourceProcessor) -> None:
+        """Enable UNWIND-batched node writes when configured."""
+        batch_size = getattr(self.config, "node_write_batch_size", 0)
+        flush_interval = getattr(self.config, "node_write_flush_interval", 5.0)
+        if isinstance(batch_size, int) and batch_size > 0:
+            processor.enable_batched_writes(
+                batch_size,
+                flush_interval if isinstance(flush_interval, (int, float)) else 5.0,
+            )
+
+    def _configure_description_cache(self, processor: ResourceProcessor) -> None:
+        """Reuse LLM descriptions from the persistent cache when configured."""
+        path = getattr(self.config, "description_cache_path", "")
+        if not self.llm_generator or not isinstance(path, str) or not path:
+            return
+        try:
+            processor.enable_description_cache(path)
+        except Exception as exc:
+            logger.warning(
+                f"{ICON_WARNING} LLM description cache unavailable at {path}: {exc}"
+            )
+
+    def _configure_relationship_spill(
+        self, processor: ResourceProcessor, tenant_id: Optional[str]
+    ) -> None:
+        """Spill buffered relationships to a per-tenant file when configured."""
+        spill_dir = getattr(self.config, "relationship_spill_dir", "")
+        window = getattr(self.config, "relationship_buffer_window", 10_000)
+        if not isinstance(spill_dir, str) or not spill_dir:
+            return
+        path = str(Path(spill_dir).expanduser() / f"{tenant_id or 'default'}.sqlite")
+        try:
+            processor.enable_relationship_spill(
+                path, window if isinstance(window, int) else 10_000
+            )
+        except Exception as exc:
+            logger.warning(
+                f"{ICON_WARNING} Relationship spill file unavailable at {path}: {exc}"
+            )
+
+    def _configure_progress_journal(
+        self, processor: ResourceProcessor, tenant_id: Optional[str]
+    ) -> None:
+        """Journal processing progress to a per-tenant file when configured."""
+        journal_dir = getattr(self.config, "progress_journal_dir", "")
+        if not isinstance(journal_dir, str) or not journal_dir:
+            return
+        path = str(Path(journal_dir).expanduser() / f"{tenant_id or 'default'}.jsonl")
+        try:
+            processor.enable_progress_journal(path)
+        except Exception as exc:
+            logger.warning(
+                f"{ICON_WARNING} Progress journal unavailable at {path}: {exc}"
+            )
+
+    def reevaluate_relationships(
+        self,
+        resources: list[dict[str, Any]],
+        tenant_id: Optional[str] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> int:
+        """
+        Re-run relationship rules over resources already in the graph.
+
+        Node writes are skipped; buffered relationships are flushed once the
+        rules have run. Callers remove the relationships being rebuilt first.
+
+        Args:
+            resources: Resource dicts as stored on their nodes
+            tenant_id: Tenant ID for dual-graph architecture
+            progress_callback: Called with (done, total) after each resource
+
+        Returns:
+            Number of relationships queued from extracted plans
+        """
+        from src.relationship_rules import ALL_RELATIONSHIP_RULES, RuleEvaluator
+
+        processor = self.processor_factory(
+            self.session_manager,
+            self.llm_generator,
+            getattr(self.config, "resource_limit", None),
+            getattr(self.config, "max_retries", 3),
+            tenant_id,
+        )
+        self._configure_relationship_spill(processor, tenant_id)
+        # Rule matching and pure edge extraction run in a process pool for
+        # large inputs
+        queued = RuleEvaluator(ALL_RELATIONSHIP_RULES).apply(
+            resources, processor.db_ops, progress_callback=progress_callback
+        )
+        # Rules buffer with auto-flush disabled; every node already exists
+        processor.flush_relationship_buffers()
+        return queued
+
     async def process_resources(
         self,
         resources: list[dict[str, Any]],
@@ -43,6 +139,7 @@ class ResourceProcessingService:
         max_workers: Optional[int] = None,
         filter_config: Optional[Any] = None,
         tenant_id: Optional[str] = None,
+        evaluate_relationships: bool = True,
     ) -> ProcessingStats:
         logger.info("[DEBUG][RPS] Entered ResourceProcessingService.process_resources")
         """
@@ -54,6 +151,8 @@ class ResourceProcessingService:
             progress_callback: Optional callback for progress updates
             max_workers: Maximum number of concurrent threads (defaults to config)
             tenant_id: Tenant ID for dual-graph architecture (required)
+            evaluate_relationships: Run relationship rules for the resources;
+                disable when the caller re-evaluates them afterwards
 
         Returns:
             ProcessingStats: Final processing statistics
@@ -65,6 +164,12 @@ class ResourceProcessingService:
             getattr(self.config, "max_retries", 3),
             tenant_id,
         )
+        self._configure_batched_writes(processor)
+        self._configure_description_cache(processor)
+        self._configure_relationship_spill(processor, tenant_id)
+        self._configure_progress_journal(processor, tenant_id)
+        if not evaluate_relationships:
+            processor.relationship_rules_enabled = False
 
         # --- AAD Graph Ingestion ---
         # Use config value which defaults to True, can be overridden by env var
@@ -154,3 +259,61 @@ class ResourceProcessingService:
         )
         logger.info("[DEBUG][RPS] processor.process_resources returned")
         return result
+
+    async def process_resource_stream(
+        self,
+        stream: ResourceStream,
+        progress_callback: Optional[Callable[[ProcessingStats], None]] = None,
+        max_workers: Optional[int] = None,
+        tenant_id: Optional[str] = None,
+    ) -> ProcessingStats:
+        """
+        Process resources from a stream while discovery is still producing them.
+
+        Only used for unfiltered scans: importing just the identities referenced
+        by a filtered resource set needs that whole set up front, so filtered
+        scans keep using process_resources. With AAD import enabled, all users
+        and groups are ingested before workers start.
+
+        Args:
+            stream: ResourceStream fed by discovery; processing ends when it is closed
+            progress_callback: Optional callback for progress updates
+            max_workers: Maximum number of concurrent workers (defaults to config)
+            tenant_id: Tenant ID for dual-graph architecture (required)
+
+        Returns:
+            ProcessingStats: Final processing statistics
+        """
+        processor = self.processor_factory(
+            self.session_manager,
+            self.llm_generator,
+            getattr(self.config, "resource_limit", None),
+            getattr(self.config, "max_retries", 3),
+            tenant_id,
+        )
+        self._configure_batched_writes(processor)
+        self._configure_description_cache(processor)
+        self._configure_relationship_spill(processor, tenant_id)
+        self._configure_progress_journal(processor, tenant_id)
+        # Registered before the first await so no discovered batch misses it
+        stream.add_batch_hook(processor.prefetch_resource_state)
+
+        if getattr(self.config, "enable_aad_import", True) and self.aad_graph_service:
+            logger.info(
+                "AAD import enabled: ingesting all Azure AD users and groups into graph."
+            )
+            try:
+                await self.aad_graph_service.ingest_into_graph(processor.db_ops)
+            except Exception as ex:
+                logger.exception(f"Failed to ingest AAD users/groups: {ex}")
+
+        if max_workers is None:
+            max_workers = getattr(self.config, "max_concurrency", 5) or 5
+        logger.info(
+            f"Streaming resources into processing with max_workers={max_workers}"
+        )
+        return await processor.process_resource_stream(
+            stream,
+            max_workers=max_workers,
+            progress_callback=progress_callback,
+        )
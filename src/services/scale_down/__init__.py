@@ -6,7 +6,8 @@ It uses a modular architecture with separate components for extraction, sampling
 quality metrics, and export.
 
 Main Components:
-- GraphExtractor: Neo4j to NetworkX conversion
+- GraphExtractor: Neo4j to NetworkX (or CSRGraph) conversion
+- CSRGraph: Array-backed graph that samplers and metrics run on
 - QualityMetrics & QualityMetricsCalculator: Sampling quality assessment
 - GraphOperations: Node deletion and motif discovery
 - Sampling algorithms: ForestFire, MHRW, RandomWalk, Pattern
@@ -25,6 +26,8 @@ Usage:
 """
 
 # Core components
+from src.services.scale_down.csr_graph import CSRGraph
+
 # Exporters
 from src.services.scale_down.exporters import (
     BaseExporter,
@@ -55,6 +58,7 @@ __all__ = [
     "BaseExporter",
     # Samplers
     "BaseSampler",
+    "CSRGraph",
     "ForestFireSampler",
     # Core components
     "GraphExtractor",
@@ -0,0 +1,365 @@
+"""
+Compressed Sparse Row (CSR) Graph for Scale-Down Sampling
+
+NetworkX stores every node and edge as nested Python dicts (roughly 1KB per
+edge), which dominates memory and time on million-edge tenants. CSRGraph
+keeps the same graph as NumPy arrays:
+
+- ``node_ids``: node ID strings; node ``i`` is ``node_ids[i]``
+- ``sources`` / ``targets``: directed edge endpoints (int32)
+- ``rel_types``: interned relationship type per edge (int16)
+- ``indptr`` / ``indices``: undirected adjacency without self-loops, the
+  view samplers walk and metrics are computed on
+
+Samplers and ``QualityMetricsCalculator`` accept either graph type;
+``to_networkx`` rebuilds a DiGraph for the (small) sampled subgraph at
+export time.
+"""
+
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+import networkx as nx
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
+
+
+class CSRGraphBuilder:
+    """Accumulate nodes and edges into typed buffers, then build a CSRGraph."""
+
+    def __init__(self) -> None:
+        self.node_ids: List[str] = []
+        self.index: Dict[str, int] = {}
+        self._sources = array("i")
+        self._targets = array("i")
+        self._rel_types = array("h")
+        self._rel_type_codes: Dict[str, int] = {}
+        self._edge_properties: Dict[int, Dict[str, Any]] = {}
+
+    def add_node(self, node_id: str) -> int:
+        """Add a node (no-op if present) and return its index."""
+        node = self.index.get(node_id)
+        if node is None:
+            node = len(self.node_ids)
+            self.node_ids.append(node_id)
+            self.index[node_id] = node
+        return node
+
+    def add_edge(
+        self,
+        source: str,
+        target: str,
+        rel_type: Optional[str] = None,
+        properties: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """
+        Add a directed edge between two known nodes.
+
+        Returns:
+            False if either endpoint has not been added, True otherwise
+        """
+        source_index = self.index.get(source)
+        target_index = self.index.get(target)
+        if source_index is None or target_index is None:
+            return False
+
+        code = -1
+        if rel_type is not None:
+            code = self._rel_type_codes.setdefault(rel_type, len(self._rel_type_codes))
+        if properties:
+            self._edge_properties[len(self._sources)] = dict(properties)
+        self._sources.append(source_index)
+        self._targets.append(target_index)
+        self._rel_types.append(code)
+        return True
+
+    def build(self) -> "CSRGraph":
+        """Build the graph; repeated ``(source, target)`` pairs keep the first edge."""
+        sources = np.frombuffer(self._sources, dtype=np.int32).copy()
+        targets = np.frombuffer(self._targets, dtype=np.int32).copy()
+        rel_types = np.frombuffer(self._rel_types, dtype=np.int16).copy()
+        edge_properties = self._edge_properties
+
+        node_count = len(self.node_ids)
+        if len(sources):
+            keys = sources.astype(np.int64) * node_count + targets
+            _, first = np.unique(keys, return_index=True)
+            if len(first) < len(keys):
+                kept = np.sort(first)
+                position = {int(old): new for new, old in enumerate(kept)}
+                edge_properties = {
+                    position[old]: props
+                    for old, props in edge_properties.items()
+                    if old in position
+                }
+                sources, targets, rel_types = (
+                    sources[kept],
+                    targets[kept],
+                    rel_types[kept],
+                )
+
+        rel_type_names = sorted(self._rel_type_codes, key=self._rel_type_codes.get)
+        return CSRGraph(
+            self.node_ids,
+            sources,
+            targets,
+            rel_types=rel_types,
+            rel_type_names=rel_type_names,
+            edge_properties=edge_properties,
+            index=self.index,
+        )
+
+
+class CSRGraph:
+    """
+    Array-backed directed graph with an undirected CSR adjacency.
+
+    Node indices are positions in ``node_ids``. The directed edge list keeps
+    relationship types (and any non-empty relationship properties) for
+    export; sampling and metrics use the undirected ``indptr``/``indices``.
+    """
+
+    def __init__(
+        self,
+        node_ids: Sequence[str],
+        sources: np.ndarray,
+        targets: np.ndarray,
+        rel_types: Optional[np.ndarray] = None,
+        rel_type_names: Sequence[str] = (),
+        edge_properties: Optional[Dict[int, Dict[str, Any]]] = None,
+        index: Optional[Dict[str, int]] = None,
+    ) -> None:
+        """
+        Initialize from deduplicated directed edge arrays.
+
+        Args:
+            node_ids: Node ID per index
+            sources: Source index per edge
+            targets: Target index per edge
+            rel_types: Code into ``rel_type_names`` per edge (-1 for none)
+            rel_type_names: Relationship type names
+            edge_properties: Relationship properties by edge position
+            index: Precomputed node ID to index map
+        """
+        self.node_ids = list(node_ids)
+        self.index = (
+            index
+            if index is not None
+            else {node_id: i for i, node_id in enumerate(self.node_ids)}
+        )
+        self.sources = np.asarray(sources, dtype=np.int32)
+        self.targets = np.asarray(targets, dtype=np.int32)
+        self.rel_types = (
+            np.asarray(rel_types, dtype=np.int16)
+            if rel_types is not None
+            else np.full(len(self.sources), -1, dtype=np.int16)
+        )
+        self.rel_type_names = list(rel_type_names)
+        self.edge_properties = edge_properties or {}
+        self.indptr, self.indices = self._undirected_adjacency()
+
+    @classmethod
+    def from_networkx(cls, graph: nx.DiGraph) -> "CSRGraph":
+        """Convert a NetworkX graph (edge ``relationship_type`` becomes the rel type)."""
+        builder = CSRGraphBuilder()
+        for node_id in graph.nodes:
+            builder.add_node(node_id)
+        for source, target, data in graph.edges(data=True):
+            properties = {k: v for k, v in data.items() if k != "relationship_type"}
+            builder.add_edge(
+                source, target, data.get("relationship_type"), properties or None
+            )
+        return builder.build()
+
+    def _undirected_adjacency(self):
+        node_count = len(self.node_ids)
+        indptr = np.zeros(node_count + 1, dtype=np.int64)
+        if not len(self.sources):
+            return indptr, np.zeros(0, dtype=np.int32)
+
+        rows = np.concatenate([self.sources, self.targets]).astype(np.int64)
+        cols = np.concatenate([self.targets, self.sources]).astype(np.int64)
+        distinct = rows != cols
+        keys = np.unique(rows[distinct] * node_count + cols[distinct])
+        rows, cols = np.divmod(keys, node_count)
+
+        np.cumsum(np.bincount(rows, minlength=node_count), out=indptr[1:])
+        return indptr, cols.astype(np.int32)
+
+    # ------------------------------------------------------------------
+    # NetworkX-compatible basics
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def nodes(self) -> List[str]:
+        """Node IDs in index order."""
+        return self.node_ids
+
+    def number_of_nodes(self) -> int:
+        return len(self.node_ids)
+
+    def number_of_edges(self) -> int:
+        return len(self.sources)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the edge and adjacency arrays."""
+        return sum(
+            a.nbytes
+            for a in (
+                self.sources,
+                self.targets,
+                self.rel_types,
+                self.indptr,
+                self.indices,
+            )
+        )
+
+    # ------------------------------------------------------------------
+    # Adjacency
+    # ------------------------------------------------------------------
+
+    def neighbors(self, node: int) -> np.ndarray:
+        """Undirected neighbor indices of a node (sorted, no self-loops)."""
+        return self.indices[self.indptr[node] : self.indptr[node + 1]]
+
+    def degree(self) -> np.ndarray:
+        """Undirected degree of every node (distinct neighbors)."""
+        return np.diff(self.indptr)
+
+    def directed_degree(self) -> np.ndarray:
+        """In-degree plus out-degree, as ``nx.DiGraph.degree`` reports it."""
+        node_count = len(self.node_ids)
+        return np.bincount(self.sources, minlength=node_count) + np.bincount(
+            self.targets, minlength=node_count
+        )
+
+    def adjacency(self) -> csr_matrix:
+        """Undirected adjacency as a SciPy CSR matrix."""
+        node_count = len(self.node_ids)
+        return csr_matrix(
+            (np.ones(len(self.indices), dtype=np.int64), self.indices, self.indptr),
+            shape=(node_count, node_count),
+        )
+
+    def indices_of(self, node_ids: Iterable[str]) -> np.ndarray:
+        """Indices of the given node IDs (unknown IDs are skipped)."""
+        index = self.index
+        return np.fromiter((index[n] for n in node_ids if n in index), dtype=np.int64)
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def triangles(self) -> np.ndarray:
+        """
+        Triangles through every node.
+
+        Edges are oriented from lower to higher (degree, index) rank so each
+        node's out-degree is at most sqrt(2m); every triangle ``a -> b -> c``
+        is then counted once by each of two sparse products.
+        """
+        node_count = len(self.node_ids)
+        if not len(self.indices):
+            return np.zeros(node_count, dtype=np.int64)
+
+        rank = np.empty(node_count, dtype=np.int64)
+        rank[np.lexsort((np.arange(node_count), self.degree()))] = np.arange(node_count)
+        rows = np.repeat(np.arange(node_count), self.degree())
+        upward = rank[rows] < rank[self.indices]
+        oriented = csr_matrix(
+            (
+                np.ones(int(upward.sum()), dtype=np.int64),
+                (rows[upward], self.indices[upward]),
+            ),
+            shape=(node_count, node_count),
+        )
+
+        # lowest[a, c]: paths a -> b -> c closed by a -> c
+        lowest = (oriented @ oriented).multiply(oriented)
+        # middle[b, c]: common lower neighbors a of the edge b -> c
+        middle = (oriented.T @ oriented).multiply(oriented)
+        counts = (
+            np.asarray(lowest.sum(axis=1)).ravel()
+            + np.asarray(lowest.sum(axis=0)).ravel()
+            + np.asarray(middle.sum(axis=1)).ravel()
+        )
+        return counts.astype(np.int64)
+
+    def average_clustering(self) -> float:
+        """Mean local clustering coefficient (matches ``nx.average_clustering``)."""
+        if not self.node_ids:
+            raise ZeroDivisionError("average clustering of an empty graph")
+        degree = self.degree().astype(np.float64)
+        possible = degree * (degree - 1)
+        coefficients = np.divide(
+            2.0 * self.triangles(),
+            possible,
+            out=np.zeros(len(degree)),
+            where=possible > 0,
+        )
+        return float(coefficients.mean())
+
+    def number_connected_components(self) -> int:
+        """Connected components of the undirected view (weak components)."""
+        if not self.node_ids:
+            return 0
+        count, _ = connected_components(self.adjacency(), directed=False)
+        return int(count)
+
+    # ------------------------------------------------------------------
+    # Subgraphs and export
+    # ------------------------------------------------------------------
+
+    def subgraph(self, node_ids: Iterable[str]) -> "CSRGraph":
+        """Induced subgraph on the given node IDs (unknown IDs are skipped)."""
+        keep = np.zeros(len(self.node_ids), dtype=bool)
+        keep[self.indices_of(node_ids)] = True
+        kept_nodes = np.flatnonzero(keep)
+        renumber = np.full(len(self.node_ids), -1, dtype=np.int64)
+        renumber[kept_nodes] = np.arange(len(kept_nodes))
+
+        kept_edges = np.flatnonzero(keep[self.sources] & keep[self.targets])
+        position = {int(old): new for new, old in enumerate(kept_edges)}
+        edge_properties = {
+            position[old]: props
+            for old, props in self.edge_properties.items()
+            if old in position
+        }
+        return CSRGraph(
+            [self.node_ids[i] for i in kept_nodes],
+            renumber[self.sources[kept_edges]],
+            renumber[self.targets[kept_edges]],
+            rel_types=self.rel_types[kept_edges],
+            rel_type_names=self.rel_type_names,
+            edge_properties=edge_properties,
+        )
+
+    def to_networkx(self) -> nx.DiGraph:
+        """Rebuild a NetworkX DiGraph with ``relationship_type`` edge attributes."""
+        graph = nx.DiGraph()
+        graph.add_nodes_from(self.node_ids)
+        node_ids = self.node_ids
+        for position, (source, target, code) in enumerate(
+            zip(self.sources.tolist(), self.targets.tolist(), self.rel_types.tolist())
+        ):
+            attributes = dict(self.edge_properties.get(position, {}))
+            if code >= 0:
+                attributes["relationship_type"] = self.rel_type_names[code]
+            graph.add_edge(node_ids[source], node_ids[target], **attributes)
+        return graph
+
+
+# Graphs accepted by samplers and quality metrics
+SamplingGraph = Union[nx.DiGraph, CSRGraph]
+
+
+def as_csr_graph(graph: SamplingGraph) -> CSRGraph:
+    """Return the graph as a CSRGraph, converting NetworkX graphs."""
+    if isinstance(graph, CSRGraph):
+        return graph
+    return CSRGraph.from_networkx(graph)
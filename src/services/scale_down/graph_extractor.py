@@ -6,22 +6,41 @@ It operates ONLY on the abstracted layer (:Resource nodes without :Original labe
 and excludes SCAN_SOURCE_NODE relationships.
 
 Key Features:
-- Streaming extraction in configurable batches (default: 5000)
-- Memory-efficient processing for large graphs
+- Keyset pagination over the indexed ``Resource.id`` for nodes (each page is
+  an index seek, so extraction is linear and deterministic)
+- Relationships read through a single streaming cursor
+- Only the node properties samplers and metrics need are loaded; full
+  properties for the sampled subset are fetched at export time
+- Optional array-backed output (``CSRGraph``) that never materializes
+  NetworkX dicts, for samplers on million-edge tenants
 - Operates only on abstracted layer
 - Excludes SCAN_SOURCE_NODE relationships
 """
 
 import logging
-from typing import Any, Callable, Dict, Optional, Tuple
+import re
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple, Union
 
 import networkx as nx
 
 from src.services.base_scale_service import BaseScaleService
+from src.services.scale_down.csr_graph import CSRGraph, CSRGraphBuilder
 from src.utils.session_manager import Neo4jSessionManager
 
 logger = logging.getLogger(__name__)
 
+# Node properties read by samplers and quality metrics
+DEFAULT_PROPERTY_KEYS: Tuple[str, ...] = ("id", "type")
+
+_PROPERTY_KEY = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+NODE_PROPERTIES_QUERY = """
+UNWIND $ids AS node_id
+MATCH (r:Resource {id: node_id})
+WHERE NOT r:Original
+RETURN r.id as id, properties(r) as props
+"""
+
 
 class GraphExtractor(BaseScaleService):
     """
@@ -47,11 +66,14 @@ class GraphExtractor(BaseScaleService):
         tenant_id: str,
         progress_callback: Optional[Callable[[str, int, int], None]] = None,
         batch_size: int = 5000,
-    ) -> Tuple[nx.DiGraph, Dict[str, Dict[str, Any]]]:
+        property_keys: Sequence[str] = DEFAULT_PROPERTY_KEYS,
+        as_csr: bool = False,
+    ) -> Tuple[Union[nx.DiGraph, CSRGraph], Dict[str, Dict[str, Any]]]:
         """
         Convert Neo4j graph to NetworkX directed graph.
 
-        Streams data in configurable batches for memory efficiency.
+        Nodes are paged by ``r.id`` (keyset pagination on the Resource.id
+        index); relationships are streamed through a single cursor.
         Queries ONLY the abstracted layer (:Resource nodes without :Original label).
         Excludes SCAN_SOURCE_NODE relationships.
 
@@ -59,14 +81,19 @@ class GraphExtractor(BaseScaleService):
             tenant_id: Azure tenant ID to extract
             progress_callback: Optional callback(phase, current, total)
             batch_size: Number of records per batch (default: 5000)
+            property_keys: Node properties to load (default: id and type). Use
+                ``load_full_properties`` to fetch everything for a subset.
+            as_csr: Return a ``CSRGraph`` built straight from the result
+                stream instead of a NetworkX graph
 
         Returns:
-            Tuple[nx.DiGraph, Dict[str, Dict[str, Any]]]:
-                - NetworkX directed graph with node IDs
-                - Dictionary mapping node IDs to full properties
+            Tuple[Union[nx.DiGraph, CSRGraph], Dict[str, Dict[str, Any]]]:
+                - Directed graph with node IDs (NetworkX unless ``as_csr``)
+                - Dictionary mapping node IDs to the requested properties
 
         Raises:
-            ValueError: If tenant not found or has no resources
+            ValueError: If tenant not found, has no resources, or a property
+                key is not a plain identifier
             Exception: If database query fails
 
         Example:
@@ -80,30 +107,36 @@ class GraphExtractor(BaseScaleService):
             str(f"Converting Neo4j graph to NetworkX for tenant {tenant_id}")
         )
 
+        invalid = [key for key in property_keys if not _PROPERTY_KEY.fullmatch(key)]
+        if invalid:
+            raise ValueError(f"Invalid property keys: {invalid}")
+
         # Validate tenant exists
         if not await self.validate_tenant_exists(tenant_id):
             raise ValueError(f"Tenant {tenant_id} not found in database")
 
         G = nx.DiGraph()
+        builder = CSRGraphBuilder() if as_csr else None
         node_properties: Dict[str, Dict[str, Any]] = {}
 
-        # Step 1: Load nodes from abstracted layer
-        node_query = """
+        # Step 1: Load nodes from abstracted layer, one index seek per page
+        projection = ", ".join(f".{key}" for key in property_keys)
+        node_query = f"""
         MATCH (r:Resource)
-        WHERE NOT r:Original
-        RETURN r.id as id, properties(r) as props
-        SKIP $skip
+        WHERE NOT r:Original AND r.id > $after
+        RETURN r.id as id, r {{{projection}}} as props
+        ORDER BY r.id
         LIMIT $limit
         """
 
         nodes_loaded = 0
-        skip = 0
+        after = ""
 
         with self.session_manager.session() as session:
             while True:
                 result = session.run(
                     node_query,
-                    {"tenant_id": tenant_id, "skip": skip, "limit": batch_size},
+                    {"tenant_id": tenant_id, "after": after, "limit": batch_size},
                 )
                 batch = list(result)
 
@@ -112,21 +145,23 @@ class GraphExtractor(BaseScaleService):
 
                 for record in batch:
                     node_id = record["id"]
-                    props = dict(record["props"])
 
                     # Add node to graph
-                    G.add_node(node_id)
+                    if builder is not None:
+                        builder.add_node(node_id)
+                    else:
+                        G.add_node(node_id)
 
-                    # Store full properties
-                    node_properties[node_id] = props
+                    # Store the requested properties
+                    node_properties[node_id] = dict(record["props"])
 
                     nodes_loaded += 1
 
+                after = batch[-1]["id"]
+
                 if progress_callback:
                     progress_callback("Loading nodes", nodes_loaded, nodes_loaded)
 
-                skip += batch_size
-
                 # Log progress
                 if nodes_loaded % 10000 == 0:
                     self.logger.debug(str(f"Loaded {nodes_loaded} nodes..."))
@@ -136,7 +171,7 @@ class GraphExtractor(BaseScaleService):
         if nodes_loaded == 0:
             raise ValueError(f"No resources found for tenant {tenant_id}")
 
-        # Step 2: Load relationships (exclude SCAN_SOURCE_NODE)
+        # Step 2: Stream relationships (exclude SCAN_SOURCE_NODE)
         # Only include Resource->Resource for NetworkX (sampling needs consistent node types)
         edge_query = """
         MATCH (r1:Resource)-[rel]->(r2:Resource)
@@ -144,50 +179,89 @@ class GraphExtractor(BaseScaleService):
           AND type(rel) <> 'SCAN_SOURCE_NODE'
         RETURN r1.id as source, r2.id as target, type(rel) as rel_type,
                properties(rel) as rel_props
-        SKIP $skip
-        LIMIT $limit
         """
 
         edges_loaded = 0
-        skip = 0
-
-        with self.session_manager.session() as session:
-            while True:
-                result = session.run(
-                    edge_query,
-                    {"tenant_id": tenant_id, "skip": skip, "limit": batch_size},
-                )
-                batch = list(result)
-
-                if not batch:
-                    break
-
-                for record in batch:
-                    source = record["source"]
-                    target = record["target"]
-                    rel_type = record["rel_type"]
-                    rel_props = dict(record["rel_props"]) if record["rel_props"] else {}
-
-                    # Only add edge if both nodes exist in our graph
-                    if source in G.nodes and target in G.nodes:
-                        G.add_edge(
-                            source, target, relationship_type=rel_type, **rel_props
-                        )
-                        edges_loaded += 1
 
-                if progress_callback:
-                    progress_callback("Loading edges", edges_loaded, edges_loaded)
+        with self.session_manager.session(fetch_size=batch_size) as session:
+            result = session.run(edge_query, {"tenant_id": tenant_id})
+
+            for record in result:
+                source = record["source"]
+                target = record["target"]
+                rel_type = record["rel_type"]
+                rel_props = dict(record["rel_props"]) if record["rel_props"] else {}
+
+                # Only add edge if both nodes exist in our graph
+                if builder is not None:
+                    added = builder.add_edge(source, target, rel_type, rel_props)
+                elif source in G.nodes and target in G.nodes:
+                    G.add_edge(source, target, relationship_type=rel_type, **rel_props)
+                    added = True
+                else:
+                    added = False
+
+                if added:
+                    edges_loaded += 1
+
+                    if edges_loaded % batch_size == 0:
+                        if progress_callback:
+                            progress_callback(
+                                "Loading edges", edges_loaded, edges_loaded
+                            )
+                        self.logger.debug(str(f"Loaded {edges_loaded} edges..."))
+
+        if progress_callback:
+            progress_callback("Loading edges", edges_loaded, edges_loaded)
 
-                skip += batch_size
+        self.logger.info(str(f"Loaded {edges_loaded} edges from Neo4j"))
 
-                # Log progress
-                if edges_loaded % 10000 == 0:
-                    self.logger.debug(str(f"Loaded {edges_loaded} edges..."))
+        if builder is not None:
+            csr_graph = builder.build()
+            self.logger.info(
+                f"Conversion complete: {csr_graph.number_of_nodes()} nodes, "
+                f"{csr_graph.number_of_edges()} edges "
+                f"({csr_graph.nbytes / 1e6:.1f} MB of edge arrays)"
+            )
+            return csr_graph, node_properties
 
-        self.logger.info(str(f"Loaded {edges_loaded} edges from Neo4j"))
         self.logger.info(
             f"Conversion complete: {G.number_of_nodes()} nodes, "
             f"{G.number_of_edges()} edges"
         )
 
         return G, node_properties
+
+    async def load_full_properties(
+        self,
+        node_properties: Dict[str, Dict[str, Any]],
+        node_ids: Iterable[str],
+        batch_size: int = 5000,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Replace the properties of a subset of nodes with all their properties.
+
+        Used at export time so only the sampled nodes are fully loaded.
+
+        Args:
+            node_properties: Property map returned by ``extract_graph`` (updated in place)
+            node_ids: Node IDs to load fully (e.g. the sampled nodes)
+            batch_size: Number of IDs per lookup query
+
+        Returns:
+            The updated property map
+        """
+        ids = list(node_ids)
+        loaded = 0
+
+        with self.session_manager.session() as session:
+            for start in range(0, len(ids), batch_size):
+                result = session.run(
+                    NODE_PROPERTIES_QUERY, {"ids": ids[start : start + batch_size]}
+                )
+                for record in result:
+                    node_properties[record["id"]] = dict(record["props"])
+                    loaded += 1
+
+        self.logger.info(str(f"Loaded full properties for {loaded} nodes"))
+        return node_properties
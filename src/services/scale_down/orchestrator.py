@@ -9,19 +9,20 @@ Main entry point for scale-down workflows.
 
 import logging
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, cast
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
 
 import networkx as nx
 
-# Python 3.10 compatibility: UTC was added in 3.11
-UTC = timezone.utc
-
 from src.services.base_scale_service import BaseScaleService
+from src.services.scale_down.csr_graph import as_csr_graph
 from src.services.scale_down.exporters.iac_exporter import IaCExporter
 from src.services.scale_down.exporters.json_exporter import JsonExporter
 from src.services.scale_down.exporters.neo4j_exporter import Neo4jExporter
 from src.services.scale_down.exporters.yaml_exporter import YamlExporter
-from src.services.scale_down.graph_extractor import GraphExtractor
+from src.services.scale_down.graph_extractor import (
+    DEFAULT_PROPERTY_KEYS,
+    GraphExtractor,
+)
 from src.services.scale_down.graph_operations import GraphOperations
 from src.services.scale_down.quality_metrics import (
     QualityMetrics,
@@ -33,6 +34,9 @@ from src.services.scale_down.sampling.pattern_sampler import PatternSampler
 from src.services.scale_down.sampling.random_walk_sampler import RandomWalkSampler
 from src.utils.session_manager import Neo4jSessionManager
 
+# Python 3.10 compatibility: UTC was added in 3.11
+UTC = timezone.utc
+
 logger = logging.getLogger(__name__)
 
 
@@ -106,6 +110,7 @@ class ScaleDownOrchestrator(BaseScaleService):
         self,
         tenant_id: str,
         progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        property_keys: Sequence[str] = DEFAULT_PROPERTY_KEYS,
     ) -> Tuple[nx.DiGraph, Dict[str, Dict[str, Any]]]:
         """
         Convert Neo4j graph to NetworkX directed graph.
@@ -115,11 +120,14 @@ class ScaleDownOrchestrator(BaseScaleService):
         Args:
             tenant_id: Azure tenant ID to extract
             progress_callback: Optional callback(phase, current, total)
+            property_keys: Node properties to load (default: id and type). Use
+                ``extractor.load_full_properties`` to fetch everything for a
+                subset of nodes.
 
         Returns:
             Tuple[nx.DiGraph, Dict[str, Dict[str, Any]]]:
                 - NetworkX directed graph with node IDs
-                - Dictionary mapping node IDs to full properties
+                - Dictionary mapping node IDs to the requested properties
 
         Raises:
             ValueError: If tenant not found or has no resources
@@ -135,7 +143,9 @@ class ScaleDownOrchestrator(BaseScaleService):
         # Copy validation state from orchestrator to extractor for test mocking
         if hasattr(self, "validate_tenant_exists"):
             self.extractor.validate_tenant_exists = self.validate_tenant_exists
-        return await self.extractor.extract_graph(tenant_id, progress_callback)
+        return await self.extractor.extract_graph(
+            tenant_id, progress_callback, property_keys=property_keys
+        )
 
     async def sample_graph(
         self,
@@ -218,9 +228,11 @@ class ScaleDownOrchestrator(BaseScaleService):
         if progress_callback:
             progress_callback("Extracting graph", 0, 100)
 
+        # Samplers and metrics run on the array-backed CSR graph
         G, node_properties = await self.extractor.extract_graph(
-            tenant_id, progress_callback
+            tenant_id, progress_callback, as_csr=True
         )
+        G = as_csr_graph(G)
 
         # Calculate target node count
         if target_size < 1.0:
@@ -265,7 +277,7 @@ class ScaleDownOrchestrator(BaseScaleService):
         )
 
         # Create sampled subgraph
-        sampled_graph = G.subgraph(sampled_node_ids).copy()
+        sampled_graph = G.subgraph(sampled_node_ids)
 
         # Stage 3: Calculate quality metrics
         if progress_callback:
@@ -273,7 +285,7 @@ class ScaleDownOrchestrator(BaseScaleService):
 
         metrics = self.metrics_calculator.calculate_metrics(
             G,
-            cast(nx.DiGraph, sampled_graph),
+            sampled_graph,
             node_properties,
             sampled_node_ids,
             sampling_time,
@@ -297,10 +309,13 @@ class ScaleDownOrchestrator(BaseScaleService):
             if progress_callback:
                 progress_callback("Exporting sample", 0, 100)
 
+            # Extraction only loads the properties sampling needs
+            await self.extractor.load_full_properties(node_properties, sampled_node_ids)
+
             await self.export_sample(
                 sampled_node_ids,
                 node_properties,
-                cast(nx.DiGraph, sampled_graph),
+                sampled_graph.to_networkx(),
                 output_mode,
                 output_path,
             )
@@ -15,6 +15,9 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, Set
 
 import networkx as nx
+import numpy as np
+
+from src.services.scale_down.csr_graph import CSRGraph, SamplingGraph
 
 logger = logging.getLogger(__name__)
 
@@ -187,10 +190,41 @@ class QualityMetricsCalculator:
 
         return kl_div
 
+    @staticmethod
+    def _degree_distribution(graph: SamplingGraph) -> Counter:
+        """Histogram of in+out degree (``nx.DiGraph.degree``) per node."""
+        if isinstance(graph, CSRGraph):
+            histogram = np.bincount(graph.directed_degree())
+            return Counter(
+                {int(d): int(histogram[d]) for d in np.flatnonzero(histogram)}
+            )
+        return Counter(dict(graph.degree()).values())  # type: ignore[misc]
+
+    @staticmethod
+    def _average_degree(degree_dist: Counter) -> float:
+        nodes = sum(degree_dist.values())
+        if not nodes:
+            return 0.0
+        return sum(d * count for d, count in degree_dist.items()) / nodes
+
+    @staticmethod
+    def _average_clustering(graph: SamplingGraph) -> float:
+        """Average clustering coefficient of the undirected view."""
+        if isinstance(graph, CSRGraph):
+            return graph.average_clustering()
+        return nx.average_clustering(graph.to_undirected())
+
+    @staticmethod
+    def _count_components(graph: SamplingGraph) -> int:
+        """Number of weakly connected components."""
+        if isinstance(graph, CSRGraph):
+            return graph.number_connected_components()
+        return nx.number_weakly_connected_components(graph)
+
     def calculate_metrics(
         self,
-        original_graph: nx.DiGraph,
-        sampled_graph: nx.DiGraph,
+        original_graph: SamplingGraph,
+        sampled_graph: SamplingGraph,
         node_properties: Dict[str, Dict[str, Any]],
         sampled_node_ids: Set[str],
         computation_time: float,
@@ -198,9 +232,13 @@ class QualityMetricsCalculator:
         """
         Calculate quality metrics comparing original and sampled graphs.
 
+        CSRGraph inputs are measured with vectorized NumPy/SciPy kernels
+        (degree histograms, sparse triangle counts, csgraph components)
+        instead of NetworkX traversals.
+
         Args:
-            original_graph: Full NetworkX graph
-            sampled_graph: Sampled NetworkX graph
+            original_graph: Full NetworkX graph or CSRGraph
+            sampled_graph: Sampled NetworkX graph or CSRGraph
             node_properties: Properties for all nodes
             sampled_node_ids: Set of sampled node IDs
             computation_time: Time taken for sampling
@@ -224,13 +262,9 @@ class QualityMetricsCalculator:
         sampled_edges = sampled_graph.number_of_edges()
         sampling_ratio = sampled_nodes / original_nodes if original_nodes > 0 else 0.0
 
-        # Degree distributions
-        original_degrees = dict(original_graph.degree())  # type: ignore[misc]
-        sampled_degrees = dict(sampled_graph.degree())  # type: ignore[misc]
-
-        # Convert to degree distribution histograms
-        original_degree_dist = Counter(original_degrees.values())
-        sampled_degree_dist = Counter(sampled_degrees.values())
+        # Degree distribution histograms
+        original_degree_dist = self._degree_distribution(original_graph)
+        sampled_degree_dist = self._degree_distribution(sampled_graph)
 
         # Calculate KL divergence
         degree_similarity = self._calculate_kl_divergence(
@@ -238,25 +272,13 @@ class QualityMetricsCalculator:
         )
 
         # Average degrees
-        avg_degree_original = (
-            sum(original_degrees.values()) / len(original_degrees)
-            if original_degrees
-            else 0.0
-        )
-        avg_degree_sampled = (
-            sum(sampled_degrees.values()) / len(sampled_degrees)
-            if sampled_degrees
-            else 0.0
-        )
+        avg_degree_original = self._average_degree(original_degree_dist)
+        avg_degree_sampled = self._average_degree(sampled_degree_dist)
 
         # Clustering coefficients
         try:
-            # Convert to undirected for clustering coefficient
-            original_undirected = original_graph.to_undirected()
-            sampled_undirected = sampled_graph.to_undirected()
-
-            clustering_original = nx.average_clustering(original_undirected)
-            clustering_sampled = nx.average_clustering(sampled_undirected)
+            clustering_original = self._average_clustering(original_graph)
+            clustering_sampled = self._average_clustering(sampled_graph)
             clustering_diff = abs(clustering_original - clustering_sampled)
         except (ValueError, ZeroDivisionError, nx.NetworkXError) as e:
             self.logger.warning(str(f"Failed to calculate clustering coefficient: {e}"))
@@ -270,8 +292,8 @@ class QualityMetricsCalculator:
         # Connected components
         try:
             # Use weakly connected for directed graphs
-            components_original = nx.number_weakly_connected_components(original_graph)
-            components_sampled = nx.number_weakly_connected_components(sampled_graph)
+            components_original = self._count_components(original_graph)
+            components_sampled = self._count_components(sampled_graph)
         except (ValueError, nx.NetworkXError) as e:
             self.logger.warning(str(f"Failed to calculate connected components: {e}"))
             components_original = 0
@@ -5,10 +5,13 @@ This module provides the abstract base class for all sampling algorithms.
 All samplers inherit from BaseSampler and implement the sample() method.
 """
 
+import random
 from abc import ABC, abstractmethod
 from typing import Callable, Optional, Set
 
-import networkx as nx
+import numpy as np
+
+from src.services.scale_down.csr_graph import SamplingGraph
 
 
 class BaseSampler(ABC):
@@ -16,14 +19,16 @@ class BaseSampler(ABC):
     Abstract base class for graph sampling algorithms.
 
     All sampling algorithms must inherit from this class and implement
-    the sample() method. Samplers operate on NetworkX graphs and return
-    a set of node IDs representing the sampled subgraph.
+    the sample() method. Samplers operate on NetworkX graphs or CSRGraphs
+    and return a set of node IDs representing the sampled subgraph.
     """
 
+    seed: Optional[int] = None
+
     @abstractmethod
     async def sample(
         self,
-        graph: nx.DiGraph,
+        graph: SamplingGraph,
         target_count: int,
         progress_callback: Optional[Callable[[str, int, int], None]] = None,
     ) -> Set[str]:
@@ -31,7 +36,7 @@ class BaseSampler(ABC):
         Sample nodes from the graph.
 
         Args:
-            graph: NetworkX directed graph to sample
+            graph: NetworkX directed graph or CSRGraph to sample
             target_count: Target number of nodes to sample
             progress_callback: Optional callback(phase, current, total)
 
@@ -43,3 +48,44 @@ class BaseSampler(ABC):
             Exception: If sampling fails
         """
         pass
+
+    def _rng(self) -> np.random.Generator:
+        """
+        Create the NumPy generator for one run.
+
+        Uses ``self.seed`` when set, otherwise seeds from ``random`` so that
+        ``random.seed`` still makes runs reproducible.
+        """
+        seed = self.seed if self.seed is not None else random.getrandbits(64)
+        return np.random.default_rng(seed)
+
+
+class RandomNodePool:
+    """
+    Unsampled nodes in random order.
+
+    Each draw skips nodes sampled since the pool was shuffled, so jumping to
+    a random unsampled node costs O(n) over a whole run instead of per jump.
+    Nodes drawn but never sampled come back when the pool is reshuffled from
+    the nodes still unsampled.
+    """
+
+    def __init__(self, rng: np.random.Generator, sampled: np.ndarray) -> None:
+        self.rng = rng
+        self.order = rng.permutation(len(sampled))
+        self.sampled = sampled
+        self.position = 0
+
+    def draw(self) -> Optional[int]:
+        """Next unsampled node, or None when every node is sampled."""
+        while True:
+            while self.position < len(self.order):
+                node = int(self.order[self.position])
+                self.position += 1
+                if not self.sampled[node]:
+                    return node
+            unsampled = np.flatnonzero(~self.sampled)
+            if not len(unsampled):
+                return None
+            self.order = self.rng.permutation(unsampled)
+            self.position = 0
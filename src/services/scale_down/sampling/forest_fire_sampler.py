@@ -10,12 +10,14 @@ Leskovec, J., & Faloutsos, C. (2006). "Sampling from large graphs."
 """
 
 import logging
-import random
+from collections import deque
 from typing import Callable, Optional, Set
 
 import networkx as nx
+import numpy as np
 
-from src.services.scale_down.sampling.base_sampler import BaseSampler
+from src.services.scale_down.csr_graph import SamplingGraph, as_csr_graph
+from src.services.scale_down.sampling.base_sampler import BaseSampler, RandomNodePool
 
 logger = logging.getLogger(__name__)
 
@@ -32,16 +34,25 @@ class ForestFireSampler(BaseSampler):
     1. Start from a random seed node
     2. Sample neighbors with probability p
     3. Recursively spread to sampled neighbors
-    4. Continue until target size reached
+    4. When the fire dies out, reignite at a random unsampled node
+    5. Continue until target size reached
+
+    Runs on the CSR adjacency of the graph (NetworkX input is converted).
     """
 
-    def __init__(self) -> None:
-        """Initialize the Forest Fire sampler."""
+    def __init__(self, seed: Optional[int] = None) -> None:
+        """
+        Initialize the Forest Fire sampler.
+
+        Args:
+            seed: Optional NumPy RNG seed (default: drawn from ``random``)
+        """
+        self.seed = seed
         self.logger = logging.getLogger(__name__)
 
     async def sample(
         self,
-        graph: nx.DiGraph,
+        graph: SamplingGraph,
         target_count: int,
         progress_callback: Optional[Callable[[str, int, int], None]] = None,
     ) -> Set[str]:
@@ -49,7 +60,7 @@ class ForestFireSampler(BaseSampler):
         Sample graph using Forest Fire algorithm.
 
         Args:
-            graph: NetworkX graph to sample
+            graph: NetworkX graph or CSRGraph to sample
             target_count: Target number of nodes to sample
             progress_callback: Optional progress callback
 
@@ -67,67 +78,62 @@ class ForestFireSampler(BaseSampler):
         """
         self.logger.info(str(f"Applying Forest Fire sampling (target={target_count})"))
 
-        if not graph.nodes():
+        csr = as_csr_graph(graph)
+        node_count = csr.number_of_nodes()
+
+        if node_count == 0:
             raise ValueError("Graph has no nodes")
 
         if target_count <= 0:
             raise ValueError(f"target_count must be positive, got {target_count}")
 
-        # Forest Fire requires undirected graph
-        G_undirected = graph.to_undirected()
-
         # Calculate sampling probability (p parameter)
         # Higher p = larger samples
-        sampling_ratio = target_count / graph.number_of_nodes()
+        sampling_ratio = target_count / node_count
         p = min(0.7, sampling_ratio * 2)  # Heuristic: scale p with ratio
 
         try:
-            sampled_nodes = set()
-            nodes_list = list(G_undirected.nodes())
-
-            # Start from random seed node
-            seed = random.choice(nodes_list)
-            queue = [seed]
-            sampled_nodes.add(seed)
+            rng = self._rng()
+            target = min(target_count, node_count)
+            sampled = np.zeros(node_count, dtype=bool)
+            seeds = RandomNodePool(rng, sampled)
+            queue: deque = deque()
+            count = 0
 
             # Spread the fire
-            while len(sampled_nodes) < target_count and queue:
-                current = queue.pop(0)
-
-                # Get neighbors
-                neighbors = list(G_undirected.neighbors(current))
-                if not neighbors:
-                    # If current node has no neighbors, pick a random unvisited node
-                    unvisited = [n for n in nodes_list if n not in sampled_nodes]
-                    if unvisited and len(sampled_nodes) < target_count:
-                        new_seed = random.choice(unvisited)
-                        queue.append(new_seed)
-                        sampled_nodes.add(new_seed)
+            while count < target:
+                if not queue:
+                    # Fire died out (isolated node or exhausted component)
+                    seed = seeds.draw()
+                    if seed is None:
+                        break
+                    sampled[seed] = True
+                    queue.append(seed)
+                    count += 1
                     continue
 
-                # Sample neighbors with probability p
-                unvisited_neighbors = [n for n in neighbors if n not in sampled_nodes]
-                if unvisited_neighbors:
+                current = queue.popleft()
+
+                # Sample unvisited neighbors with probability p
+                neighbors = csr.neighbors(current)
+                unvisited_neighbors = neighbors[~sampled[neighbors]]
+                if len(unvisited_neighbors):
                     num_to_burn = min(
                         len(unvisited_neighbors),
                         max(1, int(len(unvisited_neighbors) * p)),
-                        target_count - len(sampled_nodes),
+                        target - count,
                     )
-                    burned = random.sample(unvisited_neighbors, num_to_burn)
-                    for node in burned:
-                        sampled_nodes.add(node)
-                        queue.append(node)
-
-                if progress_callback and len(sampled_nodes) % 100 == 0:
-                    progress_callback(
-                        "Forest Fire sampling", len(sampled_nodes), target_count
+                    burned = rng.choice(
+                        unvisited_neighbors, size=num_to_burn, replace=False
                     )
+                    sampled[burned] = True
+                    queue.extend(burned.tolist())
+                    previous, count = count, count + num_to_burn
+
+                    if progress_callback and count // 100 > previous // 100:
+                        progress_callback("Forest Fire sampling", count, target_count)
 
-            # If we didn't reach target (disconnected graph), add random nodes
-            if len(sampled_nodes) < target_count:
-                remaining = [n for n in nodes_list if n not in sampled_nodes]
-                needed = min(target_count - len(sampled_nodes), len(remaining))
-                sampled_nodes.update(random.sample(remaining, needed))
+            sampled_nodes = {csr.node_ids[i] for i in np.flatnonzero(sampled)}
 
             self.logger.info(
                 f"Forest Fire sampling completed: {len(sampled_nodes)} nodes"
@@ -2,7 +2,8 @@
 Metropolis-Hastings Random Walk (MHRW) Sampler
 
 Custom implementation for Python 3.11-3.13 compatibility.
-Replaces littleballoffur dependency with pure NetworkX implementation.
+Replaces littleballoffur dependency; runs batched walkers over the CSR
+adjacency with NumPy.
 
 Algorithm Reference:
 Gjoka, M., Kurant, M., Butts, C. T., & Markopoulou, A. (2010).
@@ -11,12 +12,13 @@ INFOCOM, 2010 Proceedings IEEE.
 """
 
 import logging
-import random
 from typing import Callable, Optional, Set
 
 import networkx as nx
+import numpy as np
 
-from src.services.scale_down.sampling.base_sampler import BaseSampler
+from src.services.scale_down.csr_graph import CSRGraph, SamplingGraph, as_csr_graph
+from src.services.scale_down.sampling.base_sampler import BaseSampler, RandomNodePool
 
 logger = logging.getLogger(__name__)
 
@@ -25,25 +27,37 @@ class MHRWSampler(BaseSampler):
     """
     Metropolis-Hastings Random Walk (MHRW) sampling algorithm.
 
-    Pure NetworkX implementation providing unbiased, uniform sampling.
+    Provides unbiased, uniform sampling.
 
     Algorithm:
-    1. Convert directed graph to undirected
-    2. Start from random node
+    1. Walk the undirected CSR adjacency of the graph
+    2. Start each walker from a random node
     3. Propose move to random neighbor
     4. Accept with probability: min(1, degree(current) / degree(candidate))
     5. If accepted: move to candidate, else: stay at current
     6. Repeat until target_count unique nodes sampled
     7. Includes 10% burn-in period to reduce initialization bias
+
+    Independent walkers advance together, one vectorized step per round;
+    every walker converges to the same uniform distribution.
     """
 
-    def __init__(self) -> None:
-        """Initialize the MHRW sampler."""
+    def __init__(self, walkers: int = 64, seed: Optional[int] = None) -> None:
+        """
+        Initialize the MHRW sampler.
+
+        Args:
+            walkers: Maximum number of walkers advanced per round; small
+                samples use fewer so each walker contributes ~10 nodes
+            seed: Optional NumPy RNG seed (default: drawn from ``random``)
+        """
+        self.walkers = max(1, walkers)
+        self.seed = seed
         self.logger = logging.getLogger(__name__)
 
     async def sample(
         self,
-        graph: nx.DiGraph,
+        graph: SamplingGraph,
         target_count: int,
         progress_callback: Optional[Callable[[str, int, int], None]] = None,
     ) -> Set[str]:
@@ -51,7 +65,7 @@ class MHRWSampler(BaseSampler):
         Sample graph using Metropolis-Hastings Random Walk.
 
         Args:
-            graph: NetworkX graph to sample
+            graph: NetworkX graph or CSRGraph to sample
             target_count: Target number of nodes to sample
             progress_callback: Optional progress callback
 
@@ -70,20 +84,18 @@ class MHRWSampler(BaseSampler):
             f"Applying Metropolis-Hastings Random Walk sampling (target={target_count})"
         )
 
-        if not graph.nodes():
+        # MHRW walks the undirected adjacency
+        csr = as_csr_graph(graph)
+
+        if csr.number_of_nodes() == 0:
             raise ValueError("Graph has no nodes")
 
         if target_count <= 0:
             raise ValueError(f"target_count must be positive, got {target_count}")
 
-        # MHRW requires undirected graph
-        G_undirected = graph.to_undirected()
-
         try:
             # Custom MHRW implementation
-            sampled_nodes = self._mhrw_sample(
-                G_undirected, target_count, progress_callback
-            )
+            sampled_nodes = self._mhrw_sample(csr, target_count, progress_callback)
 
             self.logger.info(
                 str(f"MHRW sampling completed: {len(sampled_nodes)} nodes")
@@ -103,7 +115,7 @@ class MHRWSampler(BaseSampler):
 
     def _mhrw_sample(
         self,
-        graph: nx.Graph,
+        graph: CSRGraph,
         target_count: int,
         progress_callback: Optional[Callable[[str, int, int], None]] = None,
     ) -> Set[str]:
@@ -114,7 +126,7 @@ class MHRWSampler(BaseSampler):
         P(accept) = min(1, degree(current) / degree(candidate))
 
         Args:
-            graph: Undirected NetworkX graph
+            graph: CSR graph (undirected adjacency is walked)
             target_count: Number of nodes to sample
             progress_callback: Optional callback for progress updates
 
@@ -122,82 +134,94 @@ class MHRWSampler(BaseSampler):
             Set of sampled node IDs
         """
         # Handle edge cases
-        all_nodes = list(graph.nodes())
-        if target_count >= len(all_nodes):
-            return set(all_nodes)
-
-        # Start at random node
-        current = random.choice(all_nodes)
-        sampled = set()
-
-        # Calculate burn-in period (10% of target)
+        node_count = graph.number_of_nodes()
+        if target_count >= node_count:
+            return set(graph.node_ids)
+
+        rng = self._rng()
+        indptr, indices = graph.indptr, graph.indices
+        degree = graph.degree()
+        walkers = max(1, min(self.walkers, target_count // 10))
+
+        # Start at random nodes
+        current = rng.integers(node_count, size=walkers)
+        sampled = np.zeros(node_count, dtype=bool)
+        order = []
+        jumps = RandomNodePool(rng, sampled)
+
+        def record(nodes: np.ndarray) -> None:
+            for node in nodes.tolist():
+                if not sampled[node] and len(order) < target_count:
+                    sampled[node] = True
+                    order.append(node)
+
+        # Burn-in period (10% of target), counted in steps of each walker;
+        # every walker advances one step per round
         burn_in = int(target_count * 0.1)
 
+        def jump() -> int:
+            # Burn-in jumps land anywhere: pool nodes are kept for sampling
+            node = jumps.draw() if rounds > burn_in else None
+            return node if node is not None else int(rng.integers(node_count))
+
         # Perform random walk with Metropolis-Hastings acceptance
-        steps = 0
-        steps_without_new_sample = 0
-        max_steps_without_progress = 100
-
-        while len(sampled) < target_count:
-            steps += 1
-            prev_sampled_count = len(sampled)
-
-            # Safety check: if no progress for too long, jump to unsampled node
-            if steps_without_new_sample >= max_steps_without_progress:
-                # Find unsampled nodes
-                unsampled = set(all_nodes) - sampled
-                if unsampled:
-                    current = random.choice(list(unsampled))
-                    steps_without_new_sample = 0
-                    # Force add current to sample
-                    if steps > burn_in:
-                        sampled.add(current)
-                    continue
-                else:
-                    # All nodes sampled
-                    break
-
-            # Get neighbors of current node
-            neighbors = list(graph.neighbors(current))
-            if not neighbors:
-                # Isolated node - add it to sample and pick new random node
-                if steps > burn_in:
-                    sampled.add(current)
-                    if len(sampled) >= target_count:
-                        break
-                # Jump to a random unsampled node if possible
-                unsampled = set(all_nodes) - sampled
-                if unsampled:
-                    current = random.choice(list(unsampled))
-                else:
-                    current = random.choice(all_nodes)
+        rounds = 0
+        rounds_without_new_sample = 0
+        max_rounds_without_progress = 100
+        progress_every = max(1, target_count // 10)
+
+        while len(order) < target_count:
+            rounds += 1
+            prev_sampled_count = len(order)
+
+            # Safety check: if no progress for too long, jump to unsampled nodes
+            if rounds_without_new_sample >= max_rounds_without_progress:
+                for walker in range(walkers):
+                    current[walker] = jump()
+                rounds_without_new_sample = 0
+                # Force add current to sample
+                if rounds > burn_in:
+                    record(current)
                 continue
 
-            # Propose move to random neighbor
-            candidate = random.choice(neighbors)
-
-            # Metropolis-Hastings acceptance probability
-            current_degree = graph.degree(current)  # type: ignore[misc]
-            candidate_degree = graph.degree(candidate)  # type: ignore[misc]
+            current_degree = degree[current]
+            isolated = current_degree == 0
+
+            # Propose move to random neighbor of each walker
+            draws = rng.random((2, walkers))
+            offsets = (draws[0] * current_degree).astype(np.int64)
+            positions = np.minimum(indptr[current] + offsets, max(len(indices) - 1, 0))
+            candidate = (
+                np.where(isolated, current, indices[positions])
+                if len(indices)
+                else current
+            )
 
             # Accept with probability min(1, degree(current) / degree(candidate))
-            acceptance_prob = min(1.0, current_degree / candidate_degree)
-
-            if random.random() < acceptance_prob:
-                current = candidate
+            accept = draws[1] * degree[candidate] < current_degree
+            current = np.where(accept & ~isolated, candidate, current)
 
             # Add to sample after burn-in period
-            if steps > burn_in:
-                sampled.add(current)
+            if rounds > burn_in:
+                record(current)
+
+            # Isolated walkers jump to a random unsampled node, which is
+            # recorded right away so the walker cannot leave it unsampled
+            if isolated.any():
+                jumped = np.flatnonzero(isolated)
+                for walker in jumped.tolist():
+                    current[walker] = jump()
+                if rounds > burn_in:
+                    record(current[jumped])
 
             # Track progress
-            if len(sampled) == prev_sampled_count:
-                steps_without_new_sample += 1
+            if len(order) == prev_sampled_count:
+                rounds_without_new_sample += 1
             else:
-                steps_without_new_sample = 0
+                rounds_without_new_sample = 0
 
             # Progress callback every 10% of target
-            if progress_callback and steps % max(1, target_count // 10) == 0:
-                progress_callback("MHRW sampling", len(sampled), target_count)
+            if progress_callback and rounds % progress_every == 0:
+                progress_callback("MHRW sampling", len(order), target_count)
 
-        return sampled
+        return {graph.node_ids[node] for node in order}
@@ -6,12 +6,13 @@ Random walk explores the graph by taking random steps from each node.
 """
 
 import logging
-import random
 from typing import Callable, Optional, Set
 
 import networkx as nx
+import numpy as np
 
-from src.services.scale_down.sampling.base_sampler import BaseSampler
+from src.services.scale_down.csr_graph import SamplingGraph, as_csr_graph
+from src.services.scale_down.sampling.base_sampler import BaseSampler, RandomNodePool
 
 logger = logging.getLogger(__name__)
 
@@ -29,15 +30,23 @@ class RandomWalkSampler(BaseSampler):
     2. Walk to a random neighbor
     3. Repeat until target size reached
     4. If stuck, jump to random unvisited node
+
+    Runs on the CSR adjacency of the graph (NetworkX input is converted).
     """
 
-    def __init__(self) -> None:
-        """Initialize the Random Walk sampler."""
+    def __init__(self, seed: Optional[int] = None) -> None:
+        """
+        Initialize the Random Walk sampler.
+
+        Args:
+            seed: Optional NumPy RNG seed (default: drawn from ``random``)
+        """
+        self.seed = seed
         self.logger = logging.getLogger(__name__)
 
     async def sample(
         self,
-        graph: nx.DiGraph,
+        graph: SamplingGraph,
         target_count: int,
         progress_callback: Optional[Callable[[str, int, int], None]] = None,
     ) -> Set[str]:
@@ -45,7 +54,7 @@ class RandomWalkSampler(BaseSampler):
         Sample graph using simple Random Walk.
 
         Args:
-            graph: NetworkX graph to sample
+            graph: NetworkX graph or CSRGraph to sample
             target_count: Target number of nodes to sample
             progress_callback: Optional progress callback
 
@@ -63,47 +72,51 @@ class RandomWalkSampler(BaseSampler):
         """
         self.logger.info(str(f"Applying Random Walk sampling (target={target_count})"))
 
-        if not graph.nodes():
+        csr = as_csr_graph(graph)
+        node_count = csr.number_of_nodes()
+
+        if node_count == 0:
             raise ValueError("Graph has no nodes")
 
         if target_count <= 0:
             raise ValueError(f"target_count must be positive, got {target_count}")
 
-        # Random walk requires undirected graph
-        G_undirected = graph.to_undirected()
-
         try:
-            sampled_nodes = set()
-            nodes_list = list(G_undirected.nodes())
+            rng = self._rng()
+            target = min(target_count, node_count)
+            sampled = np.zeros(node_count, dtype=bool)
+            jumps = RandomNodePool(rng, sampled)
 
             # Start from random seed node
-            current = random.choice(nodes_list)
-            sampled_nodes.add(current)
+            current = jumps.draw()
+            sampled[current] = True
+            count = 1
 
             # Perform random walk
-            while len(sampled_nodes) < target_count:
+            while count < target:
                 # Get unvisited neighbors
-                neighbors = list(G_undirected.neighbors(current))
-                unvisited_neighbors = [n for n in neighbors if n not in sampled_nodes]
+                neighbors = csr.neighbors(current)
+                unvisited_neighbors = neighbors[~sampled[neighbors]]
 
-                if unvisited_neighbors:
+                if len(unvisited_neighbors):
                     # Walk to random unvisited neighbor
-                    current = random.choice(unvisited_neighbors)
-                    sampled_nodes.add(current)
+                    current = int(
+                        unvisited_neighbors[rng.integers(len(unvisited_neighbors))]
+                    )
                 else:
-                    # Stuck - no unvisited neighbors
-                    # Jump to random unvisited node
-                    unvisited = [n for n in nodes_list if n not in sampled_nodes]
-                    if not unvisited:
+                    # Stuck - jump to random unvisited node
+                    current = jumps.draw()
+                    if current is None:
                         # All nodes visited
                         break
-                    current = random.choice(unvisited)
-                    sampled_nodes.add(current)
 
-                if progress_callback and len(sampled_nodes) % 100 == 0:
-                    progress_callback(
-                        "Random Walk sampling", len(sampled_nodes), target_count
-                    )
+                sampled[current] = True
+                count += 1
+
+                if progress_callback and count % 100 == 0:
+                    progress_callback("Random Walk sampling", count, target_count)
+
+            sampled_nodes = {csr.node_ids[i] for i in np.flatnonzero(sampled)}
 
             self.logger.info(
                 f"Random Walk sampling completed: {len(sampled_nodes)} nodes"
@@ -6,7 +6,7 @@ CRITICAL SAFETY FEATURES:
 - Crypto audit logging with hash chain
 - Redis distributed lock
 - Rate limiting (1/hour/tenant)
-- Dependency-aware deletion ordering
+- Dependency-graph deletion scheduling
 - Pre/post-flight validation
 
 This service performs DESTRUCTIVE operations. All 10 security controls
@@ -17,6 +17,7 @@ import asyncio
 import contextlib
 import hashlib
 import json
+import logging
 import os
 import re
 import subprocess
@@ -49,10 +50,18 @@ except ImportError:
     Group = None
 
 from src.services.audit_log import TamperProofAuditLog
+from src.services.deletion_scheduler import (
+    RESOURCE_DEPENDENCIES_QUERY,
+    DeletionGraph,
+    DeletionScheduler,
+    wait_for_poller,
+)
 from src.services.reset_confirmation import (
     SecurityError,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class TenantResetService:
     """
@@ -78,6 +87,7 @@ class TenantResetService:
         concurrency: int = 10,
         audit_log_path: Optional[Path] = None,
         redis_client: Optional[any] = None,
+        poll_interval: float = 5.0,
     ):
         """
         Initialize Tenant Reset Service.
@@ -88,10 +98,12 @@ class TenantResetService:
             concurrency: Maximum concurrent deletions
             audit_log_path: Path to audit log file (default: ./.reset-audit.jsonl)
             redis_client: Redis client for distributed locking (optional)
+            poll_interval: Seconds between status checks of a pending deletion
         """
         self.credential = credential
         self.tenant_id = tenant_id
         self.concurrency = concurrency
+        self.poll_interval = poll_interval
         self.audit_log_path = audit_log_path or Path(".reset-audit.jsonl")
         self.redis_client = redis_client
 
@@ -518,12 +530,10 @@ class TenantResetService:
         """
         Order resources by dependencies for safe deletion.
 
-        Deletion waves:
-        1. VMs, App Services (consumer resources)
-        2. NICs, Public IPs (network interfaces)
-        3. Disks, Storage (storage resources)
-        4. VNets, Subnets (network infrastructure)
-        5. Resource Groups
+        Waves are the depth levels of the deletion graph (see
+        ``DeletionGraph.from_resources``): children before their parents, and
+        within a resource group VMs, then NICs, then disks, then VNets, then
+        everything else, with resource groups last.
 
         Args:
             resources: List of resource IDs
@@ -531,49 +541,7 @@ class TenantResetService:
         Returns:
             List of deletion waves (each wave is a list of resource IDs)
         """
-        waves = []
-
-        # Wave 1: VMs
-        vm_resources = [r for r in resources if "virtualMachines" in r]
-        if vm_resources:
-            waves.append(vm_resources)
-
-        # Wave 2: NICs
-        nic_resources = [r for r in resources if "networkInterfaces" in r]
-        if nic_resources:
-            waves.append(nic_resources)
-
-        # Wave 3: Disks
-        disk_resources = [r for r in resources if "disks" in r]
-        if disk_resources:
-            waves.append(disk_resources)
-
-        # Wave 4: VNets
-        vnet_resources = [r for r in resources if "virtualNetworks" in r]
-        if vnet_resources:
-            waves.append(vnet_resources)
-
-        # Wave 5: Resource Groups
-        rg_resources = [
-            r for r in resources if r.endswith("/resourceGroups/" + r.split("/")[-1])
-        ]
-        if rg_resources:
-            waves.append(rg_resources)
-
-        # Wave 6: Everything else
-        other_resources = [
-            r
-            for r in resources
-            if r not in vm_resources
-            and r not in nic_resources
-            and r not in disk_resources
-            and r not in vnet_resources
-            and r not in rg_resources
-        ]
-        if other_resources:
-            waves.append(other_resources)
-
-        return waves
+        return DeletionGraph.from_resources(resources).levels()
 
     async def delete_resources(
         self, deletion_waves: List[List[str]], concurrency: int
@@ -583,42 +551,80 @@ class TenantResetService:
 
         Args:
             deletion_waves: List of deletion waves
-            concurrency: Maximum concurrent deletions per wave
+            concurrency: Maximum concurrent deletions
 
         Returns:
             Deletion results: {
                 "deleted": List[str],
                 "failed": List[str],
-                "errors": Dict[str, str]
+                "errors": Dict[str, str],
+                "stats": Dict (see DeletionStats)
             }
         """
-        deleted = []
-        failed = []
-        errors = {}
+        scheduler = DeletionScheduler(self._delete_single_resource, concurrency)
+        return await scheduler.run(DeletionGraph.from_waves(deletion_waves))
 
-        for _wave_index, wave in enumerate(deletion_waves):
-            # Create semaphore for concurrency control
-            semaphore = asyncio.Semaphore(concurrency)
+    async def delete_resources_by_dependencies(
+        self, resources: List[str], concurrency: Optional[int] = None
+    ) -> Dict:
+        """
+        Delete resources as soon as everything that must go first is gone.
 
-            async def delete_with_semaphore(resource_id, semaphore=semaphore):
-                async with semaphore:
-                    try:
-                        await self._delete_single_resource(resource_id)
-                        deleted.append(resource_id)
-                    except Exception as e:
-                        failed.append(resource_id)
-                        errors[resource_id] = str(e)
+        Builds the deletion graph from resource IDs plus the relationships
+        recorded in Neo4j, then schedules deletes without wave barriers.
 
-            # Execute deletions concurrently
-            tasks = [delete_with_semaphore(resource_id) for resource_id in wave]
-            await asyncio.gather(*tasks)
+        Args:
+            resources: List of resource IDs
+            concurrency: Maximum concurrent deletions (default: service setting)
 
-        return {"deleted": deleted, "failed": failed, "errors": errors}
+        Returns:
+            Deletion results (same shape as ``delete_resources``)
+        """
+        dependencies = await self._fetch_resource_dependencies(resources)
+        graph = DeletionGraph.from_resources(resources, dependencies)
+        scheduler = DeletionScheduler(
+            self._delete_single_resource, concurrency or self.concurrency
+        )
+        return await scheduler.run(graph)
+
+    async def _fetch_resource_dependencies(
+        self, resources: List[str]
+    ) -> List[Tuple[str, str]]:
+        """
+        Read (dependent, dependency) pairs between resources from Neo4j.
+
+        Returns an empty list if the graph is unavailable; ordering then falls
+        back to ID containment and resource type.
+        """
+        if not resources:
+            return []
+
+        def query() -> List[Tuple[str, str]]:
+            driver = self._get_neo4j_driver()
+            try:
+                with driver.session() as session:
+                    result = session.run(RESOURCE_DEPENDENCIES_QUERY, ids=resources)
+                    return [(r["dependent"], r["dependency"]) for r in result]
+            finally:
+                driver.close()
+
+        try:
+            return await asyncio.to_thread(query)
+        except Exception as e:
+            # Non-critical - the graph only refines the deletion order
+            logger.warning(
+                f"Could not read resource dependencies from Neo4j, ordering "
+                f"deletions by ID containment and resource type only: {e}"
+            )
+            return []
 
     async def _delete_single_resource(self, resource_id: str):
         """
         Delete single resource via Azure SDK.
 
+        The long-running operation is polled with ``asyncio.sleep`` between
+        checks so other deletions proceed while it completes.
+
         Args:
             resource_id: Azure resource ID
 
@@ -636,11 +642,13 @@ class TenantResetService:
         # Delete resource
         try:
             # Use begin_delete_by_id for long-running operation
-            poller = client.resources.begin_delete_by_id(
-                resource_id, api_version="2021-04-01"
+            poller = await asyncio.to_thread(
+                client.resources.begin_delete_by_id,
+                resource_id,
+                api_version="2021-04-01",
             )
             # Wait for deletion to complete
-            poller.result()
+            await wait_for_poller(poller, self.poll_interval)
         except ResourceNotFoundError:
             # Resource already deleted - that's OK
             pass
@@ -894,6 +902,18 @@ class TenantResetService:
 
         return self._graph_client
 
+    def _get_neo4j_driver(self):
+        """Get a synchronous Neo4j driver from the NEO4J_* environment."""
+        from neo4j import GraphDatabase
+
+        return GraphDatabase.driver(
+            os.environ.get("NEO4J_URI", "bolt://localhost:7687"),
+            auth=(
+                os.environ.get("NEO4J_USER", "neo4j"),
+                os.environ.get("NEO4J_PASSWORD", "password"),
+            ),
+        )
+
     async def _get_neo4j_session(self):
         """Get Neo4j database session."""
         try:
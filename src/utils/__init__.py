@@ -8,18 +8,26 @@ functionality across the application.
 # Import console_icons first (no dependencies)
 from . import console_icons
 
-# Lazy import session_manager to avoid import errors in tests
-try:
-    from .session_manager import Neo4jSessionManager, create_session_manager, neo4j_session
-    __all__ = [
-        "Neo4jSessionManager",
-        "create_session_manager",
-        "neo4j_session",
-        "console_icons",
-    ]
-except ImportError:
-    # If dependencies not available (e.g., during testing), only export console_icons
-    __all__ = ["console_icons"]
+# Lazy import session_manager: it pulls in the Neo4j driver, which is too
+# heavy for callers (e.g. CLI startup) that only need a small utility module
+_SESSION_MANAGER_EXPORTS = frozenset(
+    {"Neo4jSessionManager", "create_session_manager", "neo4j_session"}
+)
+
+__all__ = [
+    "Neo4jSessionManager",
+    "console_icons",
+    "create_session_manager",
+    "neo4j_session",
+]
+
+
+def __getattr__(name: str):
+    if name in _SESSION_MANAGER_EXPORTS:
+        from . import session_manager
+
+        return getattr(session_manager, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def extract_subscription_id_from_resource_id(resource_id: str) -> str:
@@ -0,0 +1,139 @@
+"""Integer-range index for CIDR address spaces.
+
+Each CIDR block is a closed integer interval ``[network_address, broadcast_address]``
+keyed by IP version. Two operations matter for address space validation:
+
+- Finding every overlapping pair among n prefixes. CIDR blocks are laminar
+  (any two are either disjoint or one contains the other), so a sweep over
+  prefixes sorted by ``(start, -end)`` with a stack of enclosing blocks finds
+  all k overlapping pairs in O(n log n + k).
+- Allocating a free range. Used ranges are kept as sorted, merged, disjoint
+  intervals, so "does this candidate overlap anything?" is a binary search and
+  the next free aligned block is found by jumping over occupied intervals
+  instead of rescanning every used range.
+"""
+
+import bisect
+import ipaddress
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+IPNetwork = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+
+def _interval(network: IPNetwork) -> Tuple[int, int]:
+    return int(network.network_address), int(network.broadcast_address)
+
+
+def find_overlapping_pairs(networks: Sequence[IPNetwork]) -> List[Tuple[int, int]]:
+    """Find every pair of overlapping networks.
+
+    Args:
+        networks: Networks to compare (IPv4 and IPv6 may be mixed; they never
+            overlap each other)
+
+    Returns:
+        Sorted ``(i, j)`` index pairs with ``i < j`` for every overlapping pair,
+        including exact duplicates
+    """
+    order = sorted(
+        range(len(networks)),
+        key=lambda i: (
+            networks[i].version,
+            int(networks[i].network_address),
+            -int(networks[i].broadcast_address),
+            i,
+        ),
+    )
+
+    pairs: List[Tuple[int, int]] = []
+    stack: List[Tuple[int, int]] = []  # (end, index) of enclosing blocks
+    version = None
+    for i in order:
+        network = networks[i]
+        if network.version != version:
+            version = network.version
+            stack.clear()
+        start, end = _interval(network)
+        while stack and stack[-1][0] < start:
+            stack.pop()
+        # Laminar family: every block still on the stack contains this one
+        for _, j in stack:
+            pairs.append((j, i) if j < i else (i, j))
+        stack.append((end, i))
+
+    pairs.sort()
+    return pairs
+
+
+class AddressRangeIndex:
+    """Set of used address ranges with fast overlap checks and free-range allocation."""
+
+    def __init__(self, networks: Iterable[IPNetwork] = ()):
+        # Per IP version: sorted, merged, disjoint intervals
+        self._starts: Dict[int, List[int]] = {4: [], 6: []}
+        self._ends: Dict[int, List[int]] = {4: [], 6: []}
+        for network in networks:
+            self.add(network)
+
+    @classmethod
+    def from_cidrs(cls, cidrs: Iterable[str]) -> "AddressRangeIndex":
+        """Build an index from CIDR strings, ignoring invalid entries."""
+        index = cls()
+        for cidr in cidrs:
+            try:
+                index.add(ipaddress.ip_network(cidr, strict=False))
+            except ValueError:
+                continue
+        return index
+
+    def __len__(self) -> int:
+        return len(self._starts[4]) + len(self._starts[6])
+
+    def add(self, network: IPNetwork) -> None:
+        """Mark a network as used, merging it with touching or overlapping ranges."""
+        starts, ends = self._starts[network.version], self._ends[network.version]
+        start, end = _interval(network)
+
+        # First interval that could touch [start, end]
+        lo = bisect.bisect_left(ends, start - 1)
+        hi = lo
+        while hi < len(starts) and starts[hi] <= end + 1:
+            start = min(start, starts[hi])
+            end = max(end, ends[hi])
+            hi += 1
+        starts[lo:hi] = [start]
+        ends[lo:hi] = [end]
+
+    def overlaps(self, network: IPNetwork) -> bool:
+        """True if any part of the network is already used."""
+        starts, ends = self._starts[network.version], self._ends[network.version]
+        start, end = _interval(network)
+        i = bisect.bisect_right(starts, end) - 1
+        return i >= 0 and ends[i] >= start
+
+    def find_free(self, prefixlen: int, within: IPNetwork) -> Optional[IPNetwork]:
+        """Find the lowest free, aligned block of a prefix length inside a range.
+
+        Args:
+            prefixlen: Prefix length of the block to allocate (e.g. 16)
+            within: Range to allocate from (e.g. 10.0.0.0/8)
+
+        Returns:
+            The first free block, or None if the range is exhausted
+        """
+        if prefixlen < within.prefixlen:
+            return None
+        starts, ends = self._starts[within.version], self._ends[within.version]
+        block = 1 << (within.max_prefixlen - prefixlen)
+        candidate, limit = _interval(within)
+
+        i = bisect.bisect_right(ends, candidate - 1)
+        while candidate + block - 1 <= limit:
+            # Skip used intervals that end before the candidate
+            while i < len(starts) and ends[i] < candidate:
+                i += 1
+            if i == len(starts) or starts[i] > candidate + block - 1:
+                return type(within)((candidate, prefixlen))
+            # Jump to the first aligned block after this used interval
+            candidate = ((ends[i] // block) + 1) * block
+        return None
@@ -10,6 +10,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+from .address_range_index import AddressRangeIndex, find_overlapping_pairs
+
 logger = logging.getLogger(__name__)
 
 
@@ -256,29 +258,27 @@ class AddressSpaceValidator:
                         f"Invalid address space '{address_space}' for VNet '{vnet_name}': {e}"
                     )
 
-        # Check all pairs for overlaps
-        for i in range(len(vnet_networks)):
+        # Sweep sorted integer ranges instead of comparing every pair
+        networks = [network for _, network in vnet_networks]
+        for i, j in find_overlapping_pairs(networks):
             vnet_name_a, network_a = vnet_networks[i]
-            for j in range(i + 1, len(vnet_networks)):
-                vnet_name_b, network_b = vnet_networks[j]
-
-                # Check if networks overlap
-                if network_a.overlaps(network_b):
-                    # Skip if exact duplicates (already caught)
-                    if network_a == network_b:
-                        continue
-
-                    conflict = AddressSpaceConflict(
-                        vnet_names=[vnet_name_a, vnet_name_b],
-                        address_space=f"{network_a} overlaps {network_b}",
-                        severity="warning",
-                        message=(
-                            f"VNets '{vnet_name_a}' ({network_a}) and '{vnet_name_b}' ({network_b}) "
-                            f"have overlapping address spaces"
-                        ),
-                    )
-                    conflicts.append(conflict)
-                    logger.warning(conflict.message)
+            vnet_name_b, network_b = vnet_networks[j]
+
+            # Skip if exact duplicates (already caught)
+            if network_a == network_b:
+                continue
+
+            conflict = AddressSpaceConflict(
+                vnet_names=[vnet_name_a, vnet_name_b],
+                address_space=f"{network_a} overlaps {network_b}",
+                severity="warning",
+                message=(
+                    f"VNets '{vnet_name_a}' ({network_a}) and '{vnet_name_b}' ({network_b}) "
+                    f"have overlapping address spaces"
+                ),
+            )
+            conflicts.append(conflict)
+            logger.warning(conflict.message)
 
         return conflicts
 
@@ -297,13 +297,17 @@ class AddressSpaceValidator:
             List of VNet names that were renumbered
         """
         renumbered: List[str] = []
-        assigned_ranges: Set[str] = set()
 
         # First pass: collect all currently assigned ranges
         vnets = self._extract_vnets(resources)
+        assigned_ranges = AddressRangeIndex.from_cidrs(
+            address_space
+            for vnet in vnets
+            for address_space in self._get_address_spaces(vnet)
+        )
+        vnets_by_name: Dict[str, List[Dict[str, Any]]] = {}
         for vnet in vnets:
-            address_spaces = self._get_address_spaces(vnet)
-            assigned_ranges.update(address_spaces)
+            vnets_by_name.setdefault(vnet.get("name"), []).append(vnet)  # type: ignore[arg-type]
 
         # Second pass: renumber conflicting VNets
         for conflict in conflicts:
@@ -311,29 +315,23 @@ class AddressSpaceValidator:
             vnets_to_renumber = conflict.vnet_names[1:]
 
             for vnet_name in vnets_to_renumber:
-                # Find this VNet in resources
-                for resource in resources:
-                    if (
-                        resource.get("type") == "Microsoft.Network/virtualNetworks"
-                        and resource.get("name") == vnet_name
-                    ):
-                        # Find an available address space
-                        new_address_space = self._find_available_range(assigned_ranges)
-
-                        if new_address_space:
-                            old_address_space = resource.get("address_space", [])
-                            resource["address_space"] = [new_address_space]
-                            assigned_ranges.add(new_address_space)
-                            renumbered.append(vnet_name)
-
-                            logger.info(
-                                f"Auto-renumbered VNet '{vnet_name}': "
-                                f"{old_address_space} -> [{new_address_space}]"
-                            )
-                        else:
-                            logger.error(
-                                f"Could not find available address space for VNet '{vnet_name}'"
-                            )
+                for resource in vnets_by_name.get(vnet_name, []):
+                    # Find an available address space
+                    new_address_space = self._allocate_range(assigned_ranges)
+
+                    if new_address_space:
+                        old_address_space = resource.get("address_space", [])
+                        resource["address_space"] = [new_address_space]
+                        renumbered.append(vnet_name)
+
+                        logger.info(
+                            f"Auto-renumbered VNet '{vnet_name}': "
+                            f"{old_address_space} -> [{new_address_space}]"
+                        )
+                    else:
+                        logger.error(
+                            f"Could not find available address space for VNet '{vnet_name}'"
+                        )
 
         return renumbered
 
@@ -343,19 +341,35 @@ class AddressSpaceValidator:
         Args:
             used_ranges: Set of already-used CIDR ranges
 
+        Returns:
+            Available CIDR range or None if exhausted
+        """
+        return self._allocate_range(AddressRangeIndex.from_cidrs(used_ranges))
+
+    def _allocate_range(self, used_ranges: AddressRangeIndex) -> Optional[str]:
+        """Allocate a private address range that overlaps no used range.
+
+        The allocated range is added to ``used_ranges``.
+
+        Args:
+            used_ranges: Index of already-used ranges
+
         Returns:
             Available CIDR range or None if exhausted
         """
         # Try common private ranges first
         for candidate in self.PRIVATE_RANGES:
-            if candidate not in used_ranges:
+            network = ipaddress.ip_network(candidate)
+            if not used_ranges.overlaps(network):
+                used_ranges.add(network)
                 return candidate
 
-        # Generate additional 10.x.0.0/16 ranges
-        for i in range(4, 256):
-            candidate = f"10.{i}.0.0/16"
-            if candidate not in used_ranges:
-                return candidate
+        # Then any free /16 in the 10.0.0.0/8 and 172.16.0.0/12 private blocks
+        for block in ("10.0.0.0/8", "172.16.0.0/12"):
+            free = used_ranges.find_free(16, ipaddress.ip_network(block))
+            if free is not None:
+                used_ranges.add(free)
+                return str(free)
 
         logger.error("Exhausted all available private address ranges")
         return None
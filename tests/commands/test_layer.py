@@ -24,6 +24,7 @@ from src.commands.layer_cmd import (
     layer_delete,
     layer_diff,
     layer_list,
+    layer_materialize,
     layer_refresh_stats,
     layer_restore,
     layer_show,
@@ -294,6 +295,54 @@ class TestLayerCopyCommand:
         assert call_args["source"] == "source-layer"
         assert call_args["target"] == "target-layer"
         assert call_args["copy_metadata"] is True
+        assert call_args["copy_on_write"] is False
+
+    @patch("src.commands.layer_cmd.layer_copy_command_handler")
+    def test_layer_copy_on_write(self, mock_handler, runner):
+        """Test layer copy forwards --copy-on-write."""
+        mock_handler.return_value = AsyncMock()
+
+        runner.invoke(
+            layer_copy,
+            ["source-layer", "target-layer", "--copy-on-write", "--yes"],
+            obj={"debug": False},
+            catch_exceptions=False,
+        )
+
+        assert mock_handler.call_args[1]["copy_on_write"] is True
+
+
+class TestLayerMaterializeCommand:
+    """Test suite for layer materialize CLI command."""
+
+    @pytest.fixture
+    def runner(self):
+        """Click CLI test runner."""
+        return CliRunner()
+
+    def test_layer_materialize_help(self, runner):
+        """Test layer materialize help text displays correctly."""
+        result = runner.invoke(layer_materialize, ["--help"])
+
+        assert result.exit_code == 0
+        assert "copy-on-write layer" in result.output
+
+    @patch("src.commands.layer_cmd.layer_materialize_command_handler")
+    def test_layer_materialize_basic(self, mock_handler, runner):
+        """Test basic layer materialize invocation."""
+        mock_handler.return_value = AsyncMock()
+
+        runner.invoke(
+            layer_materialize,
+            ["scaled-layer", "--yes"],
+            obj={"debug": False},
+            catch_exceptions=False,
+        )
+
+        assert mock_handler.called
+        call_args = mock_handler.call_args[1]
+        assert call_args["layer_id"] == "scaled-layer"
+        assert call_args["yes"] is True
 
 
 class TestLayerDeleteCommand:
@@ -522,6 +571,26 @@ class TestLayerRestoreCommand:
         assert call_args["archive_path"] == str(archive_file)
         assert call_args["layer_id"] is None
         assert call_args["make_active"] is False
+        assert call_args["resume"] is False
+
+    @patch("src.commands.layer_cmd.layer_restore_command_handler")
+    def test_layer_restore_resume(self, mock_handler, runner, tmp_path):
+        """Test layer restore --resume is passed to the handler."""
+        mock_handler.return_value = AsyncMock()
+
+        archive_file = tmp_path / "archive.atgl"
+        archive_file.write_bytes(b"")
+
+        runner.invoke(
+            layer_restore,
+            [str(archive_file), "--layer-id", "restored", "--resume", "--yes"],
+            obj={"debug": False},
+            catch_exceptions=False,
+        )
+
+        call_args = mock_handler.call_args[1]
+        assert call_args["layer_id"] == "restored"
+        assert call_args["resume"] is True
 
 
 class TestBackwardCompatibility:
@@ -563,6 +632,7 @@ class TestBackwardCompatibility:
             "layer_active",
             "layer_create",
             "layer_copy",
+            "layer_materialize",
             "layer_delete",
             "layer_diff",
             "layer_validate",
@@ -0,0 +1,128 @@
+"""Tests for the lazily loading CLI command group."""
+
+import subprocess
+import sys
+import types
+from pathlib import Path
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from src.commands.lazy import LazyGroup
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+@pytest.fixture
+def fake_module(monkeypatch):
+    """A command module that records when it is imported."""
+    imported = []
+
+    @click.command("hello")
+    def hello() -> None:
+        """Say hello to the world."""
+        click.echo("hello")
+
+    module = types.ModuleType("fake_lazy_commands")
+    module.hello = hello
+    module.not_a_command = object()
+
+    import importlib
+
+    real_import = importlib.import_module
+
+    def import_module(name, package=None):
+        if name == "fake_lazy_commands":
+            imported.append(name)
+            return module
+        return real_import(name, package)
+
+    monkeypatch.setattr(importlib, "import_module", import_module)
+    return imported
+
+
+def make_group() -> click.Group:
+    @click.group(cls=LazyGroup)
+    def group() -> None:
+        pass
+
+    return group
+
+
+class TestLazyGroup:
+    def test_help_lists_lazy_commands_without_importing(self, fake_module):
+        group = make_group()
+        group.add_lazy_command("hi", "fake_lazy_commands:hello", "Say hello.")
+
+        result = CliRunner().invoke(group, ["--help"])
+
+        assert result.exit_code == 0
+        assert "hi" in result.output
+        assert "Say hello." in result.output
+        assert fake_module == []
+
+    def test_dispatch_imports_and_registers(self, fake_module):
+        group = make_group()
+        group.add_lazy_command("hi", "fake_lazy_commands:hello", "Say hello.")
+
+        runner = CliRunner()
+        assert runner.invoke(group, ["hi"]).output == "hello\n"
+        assert runner.invoke(group, ["hi"]).output == "hello\n"
+
+        assert fake_module == ["fake_lazy_commands"]
+        assert "hi" in group.commands
+        assert "hi" not in group.lazy_commands
+
+    def test_lazy_registration_replaces_eager_command(self, fake_module):
+        group = make_group()
+
+        @group.command("hi")
+        def eager() -> None:
+            click.echo("eager")
+
+        group.add_lazy_command("hi", "fake_lazy_commands:hello", "Say hello.")
+
+        assert CliRunner().invoke(group, ["hi"]).output == "hello\n"
+
+    def test_rejects_non_command_targets(self, fake_module):
+        group = make_group()
+        group.add_lazy_command("bad", "fake_lazy_commands:not_a_command", "Broken.")
+
+        with pytest.raises(TypeError, match=r"expected a click\.Command"):
+            group.get_command(click.Context(group), "bad")
+
+    def test_requires_module_attribute_path(self):
+        with pytest.raises(ValueError, match="module:attribute"):
+            make_group().add_lazy_command("bad", "fake_lazy_commands", "Broken.")
+
+
+class TestAtgLazyRegistration:
+    def test_help_imports_no_command_modules(self):
+        script = (
+            "import sys\n"
+            "from click.testing import CliRunner\n"
+            "from scripts.cli import cli\n"
+            "result = CliRunner().invoke(cli, ['--help'])\n"
+            "assert result.exit_code == 0, result.output\n"
+            "loaded = sorted(m for m in sys.modules if m.startswith('src.commands.')"
+            " and m != 'src.commands.lazy')\n"
+            "print(','.join(loaded))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == ""
+
+    def test_registered_short_help_matches_command(self):
+        from scripts.cli import cli
+
+        ctx = click.Context(cli)
+        for name, (_, short_help) in dict(cli.lazy_commands).items():
+            command = cli.get_command(ctx, name)
+            assert command is not None, name
+            assert command.get_short_help_str(limit=200) == short_help, name
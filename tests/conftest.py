@@ -1,7 +1,7 @@
 import os
 import sys
-from typing import Any, Dict, List
-from unittest.mock import Mock
+from typing import Any, Callable, Dict, List
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -108,6 +108,44 @@ def sample_resources(sample_resource: Dict[str, Any]) -> List[Dict[str, Any]]:
     return [resource1, resource2]
 
 
+@pytest.fixture
+def make_resource() -> Callable[..., Dict[str, Any]]:
+    """Provide a factory for numbered storage accounts; keyword arguments override fields."""
+
+    def factory(i: int, sub: str = "sub", **fields: Any) -> Dict[str, Any]:
+        resource = {
+            "id": f"/subscriptions/{sub}/resourceGroups/rg/providers/Microsoft.Storage/storageAccounts/sa{i}",
+            "name": f"sa{i}",
+            "type": "Microsoft.Storage/storageAccounts",
+            "location": "eastus",
+            "resource_group": "rg",
+            "subscription_id": sub,
+            "sku": {"name": "Standard_LRS"},
+            "properties": {"accessTier": "Hot"},
+        }
+        resource.update(fields)
+        return resource
+
+    return factory
+
+
+@pytest.fixture
+def make_node_manager() -> Callable[..., Any]:
+    """Provide a factory for NodeManagers that skip the dual-graph tenant seed."""
+    from src.services.resource_processing.node_manager import NodeManager
+
+    def factory(session_manager: Any, **kwargs: Any) -> NodeManager:
+        kwargs.setdefault("tenant_id", "t1")
+        with patch.object(
+            NodeManager,
+            "_initialize_dual_graph_services",
+            side_effect=RuntimeError("no tenant seed in tests"),
+        ):
+            return NodeManager(session_manager, **kwargs)
+
+    return factory
+
+
 # ============================================================================
 # Neo4j Container Fixtures
 # ============================================================================
@@ -81,23 +81,32 @@ def sample_graph_with_communities():
     return graph
 
 
+def _route_queries(session, ids, edges):
+    """Answer the detector's node and edge list queries from plain lists."""
+    from src.iac.community_detector import RESOURCE_EDGES_QUERY, RESOURCE_IDS_QUERY
+
+    def run(query, **params):
+        if query == RESOURCE_IDS_QUERY:
+            return [{"id": i} for i in ids]
+        if query == RESOURCE_EDGES_QUERY:
+            return [{"src": s, "tgt": t} for s, t in edges]
+        raise AssertionError(f"unexpected query: {query}")
+
+    session.run.side_effect = run
+
+
 def test_community_detector_detects_communities(mock_neo4j_driver):
     """Test that CommunityDetector correctly identifies communities."""
-    # Mock Neo4j query results for 3 communities
     session = mock_neo4j_driver.session.return_value.__enter__.return_value
 
-    # Simulate Neo4j results: 3 communities
-    mock_records = [
-        {"resource_id": "vnet-hash1", "connected_ids": ["vm-hash1"]},
-        {"resource_id": "vm-hash1", "connected_ids": ["vnet-hash1"]},
-        {"resource_id": "storage-hash2", "connected_ids": ["kv-hash2"]},
-        {"resource_id": "kv-hash2", "connected_ids": ["storage-hash2"]},
-        {"resource_id": "nsg-hash3", "connected_ids": []},  # Isolated node
-    ]
-
-    session.run.return_value = mock_records
+    # Simulate Neo4j results: 3 communities, one of them an isolated node
+    _route_queries(
+        session,
+        ids=["vnet-hash1", "vm-hash1", "storage-hash2", "kv-hash2", "nsg-hash3"],
+        edges=[("vm-hash1", "vnet-hash1"), ("storage-hash2", "kv-hash2")],
+    )
 
-    detector = CommunityDetector(mock_neo4j_driver)
+    detector = CommunityDetector(mock_neo4j_driver, use_gds=False)
     communities = detector.detect_communities()
 
     # Should have 3 communities
@@ -117,6 +126,55 @@ def test_community_detector_detects_communities(mock_neo4j_driver):
     assert "storage-hash2" in all_resource_ids
     assert "kv-hash2" in all_resource_ids
     assert "nsg-hash3" in all_resource_ids
+    assert {"storage-hash2", "kv-hash2"} in communities
+
+
+def test_community_detector_merges_chains_with_union_find(mock_neo4j_driver):
+    """Long chains and edges arriving in any order end up in one component."""
+    session = mock_neo4j_driver.session.return_value.__enter__.return_value
+    n = 20000
+    # Two interleaved chains (even and odd IDs), edges in reverse order
+    edges = [(f"r{i}", f"r{i + 2}") for i in range(n - 2)][::-1]
+    _route_queries(session, ids=[f"r{i}" for i in range(n)] + ["lonely"], edges=edges)
+
+    communities = CommunityDetector(
+        mock_neo4j_driver, use_gds=False
+    ).detect_communities()
+
+    assert [len(c) for c in communities] == [n // 2, n // 2, 1]
+    assert "r0" in communities[0] or "r0" in communities[1]
+
+
+def test_community_detector_uses_gds_when_available(mock_neo4j_driver):
+    """GDS WCC results are grouped by component and the projection is dropped."""
+    from src.iac.community_detector import (
+        GDS_AVAILABLE_QUERY,
+        GDS_DROP_QUERY,
+        GDS_WCC_QUERY,
+    )
+
+    session = mock_neo4j_driver.session.return_value.__enter__.return_value
+    queries = []
+
+    def run(query, **params):
+        queries.append(query)
+        result = MagicMock()
+        if query == GDS_AVAILABLE_QUERY:
+            result.single.return_value = {"available": 1}
+        elif query == GDS_WCC_QUERY:
+            return [
+                {"id": "a", "component": 7},
+                {"id": "b", "component": 7},
+                {"id": "c", "component": 9},
+            ]
+        return result
+
+    session.run.side_effect = run
+
+    communities = CommunityDetector(mock_neo4j_driver).detect_communities()
+
+    assert communities == [{"a", "b"}, {"c"}]
+    assert queries[-1] == GDS_DROP_QUERY
 
 
 def test_terraform_emitter_split_by_community_disabled(
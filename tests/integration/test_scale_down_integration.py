@@ -262,7 +262,7 @@ class TestNeo4jToNetworkXIntegration:
         try:
             # Convert to NetworkX
             G, node_properties = await scale_down_service.neo4j_to_networkx(
-                test_tenant_id
+                test_tenant_id, property_keys=("id", "type", "tenant_id")
             )
 
             # Verify graph structure
@@ -0,0 +1,90 @@
+"""
+Address Space Overlap Benchmark
+
+Times overlap detection for 50k VNet prefixes with the sorted-interval sweep
+and compares it with the previous pairwise ``ipaddress.overlaps`` scan, which
+is measured on a smaller sample and extrapolated (it is O(n^2)).
+
+Run with:
+    uv run pytest tests/performance/test_address_space_overlap_benchmark.py -s
+"""
+
+import ipaddress
+import logging
+import random
+import time
+
+import pytest
+
+from src.validation.address_space_validator import AddressSpaceValidator
+
+logger = logging.getLogger(__name__)
+
+pytestmark = [pytest.mark.performance]
+
+PREFIX_COUNT = 50_000
+PAIRWISE_SAMPLE = 2_000
+
+
+def make_hub_spoke_vnets(prefix_count: int, seed: int = 42):
+    """Mostly disjoint /24 spokes, a few /16 hubs and some accidental overlaps."""
+    rng = random.Random(seed)
+    vnets = []
+    for i in range(prefix_count):
+        if i % 1000 == 0:
+            cidr = f"10.{(i // 1000) % 256}.0.0/16"
+        elif i % 53 == 0:
+            # Spoke carved out of its hub's range by mistake
+            cidr = f"10.{(i // 1000) % 256}.{16 * rng.randrange(16)}.0/20"
+        elif i % 97 == 0:
+            # Accidental re-use of a spoke range in another region
+            cidr = f"172.{16 + rng.randrange(16)}.{rng.randrange(256)}.0/24"
+        else:
+            n = i + 70_000
+            cidr = f"{100 + (n >> 16) % 100}.{(n >> 8) % 256}.{n % 256}.0/24"
+        vnets.append(
+            {
+                "type": "Microsoft.Network/virtualNetworks",
+                "name": f"vnet-{i}",
+                "address_space": [cidr],
+            }
+        )
+    return vnets
+
+
+def pairwise_overlaps(networks):
+    count = 0
+    for i in range(len(networks)):
+        for j in range(i + 1, len(networks)):
+            if networks[i].overlaps(networks[j]) and networks[i] != networks[j]:
+                count += 1
+    return count
+
+
+def test_overlap_detection_at_50k_prefixes():
+    validator = AddressSpaceValidator()
+    vnets = make_hub_spoke_vnets(PREFIX_COUNT)
+
+    start = time.perf_counter()
+    conflicts = validator._detect_overlaps(vnets)
+    sweep_seconds = time.perf_counter() - start
+
+    sample = [
+        ipaddress.ip_network(v["address_space"][0]) for v in vnets[:PAIRWISE_SAMPLE]
+    ]
+    start = time.perf_counter()
+    pairwise_overlaps(sample)
+    sample_seconds = time.perf_counter() - start
+    extrapolated = sample_seconds * (PREFIX_COUNT / PAIRWISE_SAMPLE) ** 2
+
+    logger.info(f"Overlap detection for {PREFIX_COUNT} prefixes:")
+    logger.info(f"  sweep-line: {sweep_seconds:.2f}s, {len(conflicts)} overlaps")
+    logger.info(
+        f"  pairwise (extrapolated from {PAIRWISE_SAMPLE}): {extrapolated:.0f}s"
+    )
+
+    # Same answer as the pairwise scan on the sample
+    sample_vnets = vnets[:PAIRWISE_SAMPLE]
+    assert len(validator._detect_overlaps(sample_vnets)) == pairwise_overlaps(sample)
+    assert sweep_seconds < 30
+    assert sweep_seconds * 10 < extrapolated
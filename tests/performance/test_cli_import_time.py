@@ -0,0 +1,79 @@
+"""
+CLI Import-Time Benchmark
+
+Measures the cold import of ``scripts.cli`` with ``python -X importtime``.
+Command modules are registered lazily, so starting the CLI for ``--help``
+or a lightweight command must not import Azure SDKs, Neo4j, NetworkX or
+the Rich dashboard.
+
+Run with:
+    uv run pytest tests/performance/test_cli_import_time.py -s
+"""
+
+import logging
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+logger = logging.getLogger(__name__)
+
+pytestmark = [pytest.mark.performance]
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Cold-start budget for importing the CLI entry point
+IMPORT_BUDGET_US = 300_000
+
+HEAVY_MODULES = (
+    "azure",
+    "msgraph",
+    "neo4j",
+    "networkx",
+    "numpy",
+    "pandas",
+    "openai",
+    "docker",
+    "src.rich_dashboard",
+    "src.commands.base",
+)
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def import_profile(module: str) -> dict[str, int]:
+    """Import a module in a fresh interpreter and return cumulative times (us)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    profile = {}
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            profile[match.group(4)] = int(match.group(2))
+    return profile
+
+
+def test_cli_import_skips_heavy_dependencies():
+    profile = import_profile("scripts.cli")
+
+    loaded = sorted(
+        name
+        for name in profile
+        if any(name == h or name.startswith(h + ".") for h in HEAVY_MODULES)
+    )
+    assert loaded == []
+
+
+def test_cli_cold_import_under_budget():
+    # Best of a few runs to absorb noise from a busy CI host
+    cumulative = min(import_profile("scripts.cli")["scripts.cli"] for _ in range(3))
+
+    logger.info(f"scripts.cli cold import: {cumulative / 1000:.0f}ms")
+    assert cumulative < IMPORT_BUDGET_US
@@ -0,0 +1,116 @@
+"""
+Configuration Coherence Clustering Benchmark
+
+Clusters 5k resources by configuration coherence with the vectorized
+similarity kernel and cached-partner average linkage, and compares it with
+the previous pairwise merge loop (dict of similarities, ``resources.index``
+inside the merge scan), which is timed on a small sample and extrapolated by
+n^4.
+
+Run with:
+    uv run pytest tests/performance/test_coherence_clustering_benchmark.py -s
+"""
+
+import logging
+import random
+import time
+
+import pytest
+
+from src.replicator.modules.configuration_similarity import ConfigurationSimilarity
+
+logger = logging.getLogger(__name__)
+
+pytestmark = [pytest.mark.performance]
+
+RESOURCE_COUNT = 5_000
+PAIRWISE_SAMPLE = 60
+
+
+def make_resource_group(resource_count, seed=42):
+    """Resources spread over a few regions, SKU tiers and tag conventions."""
+    rng = random.Random(seed)
+    tag_keys = ["env", "owner", "costCenter", "app", "team", "tier"]
+    resources = []
+    fingerprints = {}
+    for i in range(resource_count):
+        resource_id = f"vm-{i}"
+        resources.append({"id": resource_id, "type": "virtualMachines"})
+        fingerprints[resource_id] = {
+            "location": rng.choice(["eastus", "eastus2", "westus", "westeurope"]),
+            "sku": rng.choice(["Standard_D2s_v3", "Standard_D4s_v3", "Premium_LRS"]),
+            "tags": dict.fromkeys(rng.sample(tag_keys, rng.randint(0, 3)), "x"),
+        }
+    return resources, fingerprints
+
+
+def pairwise_cluster(resources, fingerprints, threshold):
+    """The previous implementation, kept here as the baseline."""
+    similarity_matrix = {}
+    for i, res1 in enumerate(resources):
+        for j, res2 in enumerate(resources):
+            if i < j:
+                similarity_matrix[(i, j)] = ConfigurationSimilarity.compute_similarity(
+                    fingerprints[res1["id"]], fingerprints[res2["id"]]
+                )
+    clusters = [[res] for res in resources]
+    merged = True
+    while merged and len(clusters) > 1:
+        merged = False
+        best_sim = threshold
+        best_pair = None
+        for i in range(len(clusters)):
+            for j in range(i + 1, len(clusters)):
+                similarities = []
+                for res1 in clusters[i]:
+                    for res2 in clusters[j]:
+                        idx1 = resources.index(res1)
+                        idx2 = resources.index(res2)
+                        key = (min(idx1, idx2), max(idx1, idx2))
+                        similarities.append(similarity_matrix[key])
+                avg_sim = sum(similarities) / len(similarities)
+                if avg_sim > best_sim:
+                    best_sim = avg_sim
+                    best_pair = (i, j)
+        if best_pair:
+            i, j = best_pair
+            merged_cluster = clusters[i] + clusters[j]
+            clusters.pop(j)
+            clusters.pop(i)
+            clusters.append(merged_cluster)
+            merged = True
+    return [c for c in clusters if len(c) >= 2]
+
+
+def test_coherence_clustering_at_5k_resources():
+    resources, fingerprints = make_resource_group(RESOURCE_COUNT)
+
+    start = time.perf_counter()
+    clusters = ConfigurationSimilarity.cluster_by_coherence(
+        resources, fingerprints, coherence_threshold=0.7
+    )
+    vectorized_seconds = time.perf_counter() - start
+
+    sample = resources[:PAIRWISE_SAMPLE]
+    start = time.perf_counter()
+    expected = pairwise_cluster(sample, fingerprints, 0.7)
+    sample_seconds = time.perf_counter() - start
+    extrapolated = sample_seconds * (RESOURCE_COUNT / PAIRWISE_SAMPLE) ** 4
+
+    logger.info(f"Coherence clustering of {RESOURCE_COUNT} resources:")
+    logger.info(
+        f"  vectorized average linkage: {vectorized_seconds:.2f}s, "
+        f"{len(clusters)} clusters"
+    )
+    logger.info(
+        f"  pairwise loop (extrapolated from {PAIRWISE_SAMPLE}): {extrapolated:.0f}s"
+    )
+
+    # Same clusters as the pairwise loop on the sample
+    actual = ConfigurationSimilarity.cluster_by_coherence(sample, fingerprints, 0.7)
+    assert sorted(sorted(r["id"] for r in c) for c in actual) == sorted(
+        sorted(r["id"] for r in c) for c in expected
+    )
+    assert sum(len(c) for c in clusters) <= RESOURCE_COUNT
+    assert vectorized_seconds < 60
+    assert vectorized_seconds * 10 < extrapolated
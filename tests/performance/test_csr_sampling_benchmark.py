@@ -0,0 +1,129 @@
+"""
+CSR Graph Sampling Benchmark
+
+Loads a 1M-edge tenant graph into CSRGraph and into a NetworkX DiGraph,
+compares their memory, and times Forest Fire sampling and quality metrics on
+the CSR arrays against the previous NetworkX implementation
+(``to_undirected()`` copy, ``list(G.neighbors())`` per step), which is kept
+here as the baseline.
+
+Run with:
+    uv run pytest tests/performance/test_csr_sampling_benchmark.py -s
+"""
+
+import asyncio
+import logging
+import random
+import time
+import tracemalloc
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from src.services.scale_down.csr_graph import CSRGraphBuilder
+from src.services.scale_down.quality_metrics import QualityMetricsCalculator
+from src.services.scale_down.sampling import ForestFireSampler, MHRWSampler
+
+logger = logging.getLogger(__name__)
+
+pytestmark = [pytest.mark.performance]
+
+NODE_COUNT = 200_000
+EDGE_COUNT = 1_000_000
+TARGET_COUNT = 20_000
+
+
+def make_edges(seed=42):
+    """Resource IDs and skewed (hub-heavy) edges, like shared VNets and vaults."""
+    rng = np.random.default_rng(seed)
+    node_ids = [
+        f"/subscriptions/s/resourceGroups/rg{i % 500}/providers/X/y/r{i}"
+        for i in range(NODE_COUNT)
+    ]
+    sources = rng.integers(NODE_COUNT, size=EDGE_COUNT)
+    targets = (rng.pareto(1.5, size=EDGE_COUNT) * 50).astype(np.int64) % NODE_COUNT
+    return node_ids, list(zip(sources.tolist(), targets.tolist()))
+
+
+def forest_fire_networkx(graph, target_count):
+    """The previous Forest Fire loop on NetworkX, kept as the baseline."""
+    undirected = graph.to_undirected()
+    p = min(0.7, target_count / graph.number_of_nodes() * 2)
+    nodes_list = list(undirected.nodes())
+    seed = random.choice(nodes_list)
+    queue = [seed]
+    sampled = {seed}
+    while len(sampled) < target_count and queue:
+        current = queue.pop(0)
+        neighbors = list(undirected.neighbors(current))
+        unvisited = [n for n in neighbors if n not in sampled]
+        if unvisited:
+            burn = min(
+                len(unvisited),
+                max(1, int(len(unvisited) * p)),
+                target_count - len(sampled),
+            )
+            for node in random.sample(unvisited, burn):
+                sampled.add(node)
+                queue.append(node)
+    return sampled
+
+
+def test_csr_sampling_at_1m_edges():
+    node_ids, edges = make_edges()
+
+    tracemalloc.start()
+    builder = CSRGraphBuilder()
+    for node_id in node_ids:
+        builder.add_node(node_id)
+    for source, target in edges:
+        builder.add_edge(node_ids[source], node_ids[target], "DEPENDS_ON")
+    csr = builder.build()
+    del builder
+    csr_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    G = nx.DiGraph()
+    G.add_nodes_from(node_ids)
+    for source, target in edges:
+        G.add_edge(node_ids[source], node_ids[target], relationship_type="DEPENDS_ON")
+    networkx_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    sampled = asyncio.run(ForestFireSampler(seed=1).sample(csr, TARGET_COUNT))
+    csr_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    random.seed(1)
+    baseline = forest_fire_networkx(G, TARGET_COUNT)
+    networkx_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    walked = asyncio.run(MHRWSampler(seed=1).sample(csr, TARGET_COUNT))
+    mhrw_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    metrics = QualityMetricsCalculator().calculate_metrics(
+        csr, csr.subgraph(sampled), {}, sampled, csr_seconds
+    )
+    metrics_seconds = time.perf_counter() - start
+
+    logger.info(f"Scale-down sampling of {NODE_COUNT} nodes / {EDGE_COUNT} edges:")
+    logger.info(
+        f"  memory: CSRGraph {csr_bytes / 1e6:.0f} MB, "
+        f"NetworkX {networkx_bytes / 1e6:.0f} MB"
+    )
+    logger.info(
+        f"  forest fire: CSR {csr_seconds:.2f}s, NetworkX {networkx_seconds:.2f}s"
+    )
+    logger.info(f"  batched MHRW: {mhrw_seconds:.2f}s")
+    logger.info(f"  quality metrics (CSR): {metrics_seconds:.2f}s")
+
+    assert len(sampled) == len(baseline) == TARGET_COUNT
+    assert len(walked) == TARGET_COUNT
+    assert metrics.original_edges == csr.number_of_edges()
+    assert csr_bytes * 5 < networkx_bytes
+    assert csr_seconds * 10 < networkx_seconds
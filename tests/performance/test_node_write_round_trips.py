@@ -0,0 +1,97 @@
+"""
+Neo4j Round-Trip Benchmark for Resource Node Writes
+
+Counts the statements and commits sent to Neo4j when writing 10k resources
+through NodeManager, per-resource (upsert_resource) versus UNWIND-batched
+(prepare_resource_row + write_rows, as the graph writer thread does). Runs against a counting session manager,
+so no database is required; the counts are what a live Neo4j would receive.
+
+Run with:
+    uv run pytest tests/performance/test_node_write_round_trips.py -s
+"""
+
+import logging
+import time
+from typing import Any
+
+import pytest
+
+logger = logging.getLogger(__name__)
+
+pytestmark = [pytest.mark.performance]
+
+RESOURCE_COUNT = 10_000
+
+
+class CountingTx:
+    def __init__(self, counter: "CountingSessionManager") -> None:
+        self.counter = counter
+
+    def __enter__(self) -> "CountingTx":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def run(self, query: str, **params: Any) -> None:
+        self.counter.round_trips += 1
+
+    def commit(self) -> None:
+        self.counter.round_trips += 1
+
+
+class CountingSession(CountingTx):
+    def begin_transaction(self) -> CountingTx:
+        return CountingTx(self.counter)
+
+
+class CountingSessionManager:
+    """Counts every statement and commit as one Neo4j round-trip."""
+
+    def __init__(self) -> None:
+        self.round_trips = 0
+
+    def session(self) -> CountingSession:
+        return CountingSession(self)
+
+
+def test_round_trips_per_10k_resources(make_resource, make_node_manager):
+    resources = [make_resource(i, f"sub-{i % 5}") for i in range(RESOURCE_COUNT)]
+
+    per_resource = CountingSessionManager()
+    nm = make_node_manager(per_resource)
+    start = time.perf_counter()
+    for resource in resources:
+        assert nm.upsert_resource(resource)
+    per_resource_seconds = time.perf_counter() - start
+
+    results = {}
+    for batch_size in (100, 500, 1000):
+        batched = CountingSessionManager()
+        nm = make_node_manager(batched)
+        start = time.perf_counter()
+        for offset in range(0, RESOURCE_COUNT, batch_size):
+            rows = [
+                nm.prepare_resource_row(resource)
+                for resource in resources[offset : offset + batch_size]
+            ]
+            assert len(nm.write_rows(rows)) == len(rows)  # type: ignore[arg-type]
+        results[batch_size] = (batched.round_trips, time.perf_counter() - start)
+
+    logger.info(f"Neo4j round-trips per {RESOURCE_COUNT} resources:")
+    logger.info(
+        f"  per-resource upsert_resource: {per_resource.round_trips} "
+        f"({per_resource_seconds:.2f}s client-side)"
+    )
+    for batch_size, (round_trips, seconds) in results.items():
+        logger.info(
+            f"  write_rows batch={batch_size}: {round_trips} "
+            f"({seconds:.2f}s client-side)"
+        )
+
+    # Per resource: Subscription MERGE, Original MERGE, Abstracted MERGE,
+    # SCAN_SOURCE_NODE MERGE and a commit
+    assert per_resource.round_trips == 5 * RESOURCE_COUNT
+    # Per batch: one Subscription UNWIND, one resource UNWIND and a commit
+    assert results[500][0] == 3 * (RESOURCE_COUNT // 500)
+    assert per_resource.round_trips / results[500][0] > 500
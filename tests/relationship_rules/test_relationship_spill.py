@@ -0,0 +1,188 @@
+"""Tests for the spill-to-disk relationship buffer."""
+
+from typing import Any, Dict, List, Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.relationship_rules import SpillingRelationshipBuffer
+from src.relationship_rules.relationship_rule import RelationshipRule
+
+
+class ConcreteRelationshipRule(RelationshipRule):
+    def applies(self, resource: Dict[str, Any]) -> bool:
+        return True
+
+    def emit(self, resource: Dict[str, Any], db_ops: Any) -> None:
+        pass
+
+
+class FakeTransaction:
+    def __init__(self, db: "FakeDb"):
+        self.db = db
+
+    def __enter__(self) -> "FakeTransaction":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def run(self, query: str, relationships: List[Dict[str, Any]]) -> Any:
+        if self.db.fail_on_batch == len(self.db.batches):
+            raise RuntimeError("connection lost")
+        rel_type = query.split("[r_orig:")[1].split("]")[0]
+        self.db.batches.append((rel_type, relationships))
+        result = MagicMock()
+        result.single.return_value = {"created": len(relationships)}
+        return result
+
+    def commit(self) -> None:
+        pass
+
+
+class FakeDb:
+    """db_ops stand-in recording every UNWIND batch."""
+
+    def __init__(self, fail_on_batch: Optional[int] = None):
+        self.batches: List[Any] = []
+        self.fail_on_batch = fail_on_batch
+        self.session_manager = MagicMock()
+        session = self.session_manager.session.return_value.__enter__.return_value
+        session.begin_transaction.side_effect = lambda: FakeTransaction(self)
+
+    def edges(self) -> set:
+        return {
+            (rel["src_id"], rel_type, rel["tgt_id"])
+            for rel_type, batch in self.batches
+            for rel in batch
+        }
+
+
+def queue_edges(rule: RelationshipRule, count: int) -> None:
+    for i in range(count):
+        rel_type = "USES" if i % 2 else "CONNECTED_TO"
+        rule.queue_dual_graph_relationship(f"/r/{count - i:05d}", rel_type, f"/t/{i}")
+
+
+@pytest.fixture
+def spill(tmp_path):
+    buffer = SpillingRelationshipBuffer(
+        tmp_path / "spill" / "tenant.sqlite", window_size=50, batch_size=200
+    )
+    yield buffer
+    buffer.close()
+
+
+class TestSpillingRelationshipBuffer:
+    def test_window_bounds_memory_and_nothing_is_dropped(self, spill):
+        rule = ConcreteRelationshipRule(enable_dual_graph=True)
+        rule.attach_spill_buffer(spill)
+
+        queue_edges(rule, 1500)  # past the old 10x-buffer drop threshold
+        assert len(rule._relationship_buffer) < spill.window_size
+        assert len(spill) + len(rule._relationship_buffer) == 1500
+
+        db = FakeDb()
+        assert rule.flush_relationship_buffer(db) == 1500
+        assert len(db.edges()) == 1500
+        assert len(spill) == 0
+        assert rule._relationship_buffer == []
+
+    def test_replay_is_grouped_by_type_and_sorted(self, spill):
+        rule = ConcreteRelationshipRule(enable_dual_graph=True)
+        rule.attach_spill_buffer(spill)
+        queue_edges(rule, 600)
+
+        db = FakeDb()
+        rule.flush_relationship_buffer(db)
+
+        types = [rel_type for rel_type, _ in db.batches]
+        assert types == sorted(types)
+        assert all(len(batch) <= spill.batch_size for _, batch in db.batches)
+        for rel_type in set(types):
+            sources = [
+                rel["src_id"]
+                for t, batch in db.batches
+                if t == rel_type
+                for rel in batch
+            ]
+            assert sources == sorted(sources)
+
+    def test_duplicate_edges_are_stored_once(self, spill):
+        spill.extend([("/a", "USES", "/b", None)] * 3)
+        spill.extend([("/a", "USES", "/b", {"weight": 2})])
+        assert len(spill) == 1
+
+        db = FakeDb()
+        spill.replay(db)
+        assert db.batches == [
+            ("USES", [{"src_id": "/a", "tgt_id": "/b", "properties": {"weight": 2}}])
+        ]
+
+    def test_invalid_relationship_types_are_rejected(self, spill):
+        assert spill.extend([("/a", "DROP_ALL", "/b", None)]) == 0
+        assert len(spill) == 0
+
+    def test_interrupted_replay_resumes_from_disk(self, tmp_path):
+        path = tmp_path / "tenant.sqlite"
+        spill = SpillingRelationshipBuffer(path, batch_size=100)
+        spill.extend((f"/s/{i:04d}", "DEPENDS_ON", f"/t/{i}", None) for i in range(450))
+
+        first = FakeDb(fail_on_batch=2)
+        assert spill.replay(first) == 200
+        assert len(spill) == 250
+        spill.close()
+
+        resumed = SpillingRelationshipBuffer(path, batch_size=100)
+        second = FakeDb()
+        assert resumed.replay(second) == 250
+        assert len(resumed) == 0
+        assert len(first.edges() | second.edges()) == 450
+        assert first.edges().isdisjoint(second.edges())
+        resumed.close()
+
+    def test_replay_without_session_manager_keeps_edges(self, spill):
+        spill.extend([("/a", "USES", "/b", None)])
+        db_ops = MagicMock()
+        db_ops.session_manager = None
+        assert spill.replay(db_ops) == 0
+        assert len(spill) == 1
+
+
+@pytest.fixture
+def isolated_global_rules():
+    """Empty the shared rule buffers for one test and restore them afterwards."""
+    from src.relationship_rules import ALL_RELATIONSHIP_RULES
+
+    saved = [
+        (rule, rule._relationship_buffer, rule._spill_buffer)
+        for rule in ALL_RELATIONSHIP_RULES
+    ]
+    for rule in ALL_RELATIONSHIP_RULES:
+        rule._relationship_buffer = []
+        rule._spill_buffer = None
+    yield ALL_RELATIONSHIP_RULES
+    for rule, buffer, spill in saved:
+        rule._relationship_buffer = buffer
+        rule._spill_buffer = spill
+
+
+class TestProcessorSpill:
+    def test_processor_replays_and_detaches(self, tmp_path, isolated_global_rules):
+        from src.services.resource_processing.processor import ResourceProcessor
+
+        processor = ResourceProcessor(MagicMock())
+        db = FakeDb()
+        processor.db_ops.session_manager = db.session_manager
+        processor.enable_relationship_spill(str(tmp_path / "t.sqlite"), window_size=10)
+
+        rule = isolated_global_rules[0]
+        for i in range(25):
+            rule.queue_dual_graph_relationship(f"/vnet/{i}", "CONTAINS", f"/s/{i}")
+        assert len(rule._relationship_buffer) < 10
+
+        processor._flush_relationship_buffers()
+
+        assert len(db.edges()) == 25
+        assert rule._spill_buffer is None
+        assert rule._relationship_buffer == []
@@ -0,0 +1,194 @@
+"""Tests for type-indexed rule dispatch and parallel rule evaluation."""
+
+import json
+from typing import Any, Dict, List
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.relationship_rules import (
+    RuleDispatcher,
+    RuleEvaluator,
+    create_relationship_rules,
+)
+
+SUB = "/subscriptions/sub1/resourceGroups/rg1/providers"
+
+
+def sample_resources() -> List[Dict[str, Any]]:
+    """One resource per rule branch, plus resources no rule cares about."""
+    return [
+        {
+            "id": f"{SUB}/Microsoft.Network/virtualNetworks/vnet1",
+            "type": "Microsoft.Network/virtualNetworks",
+            "name": "vnet1",
+            "location": "eastus",
+            "properties": {"subnets": []},
+        },
+        {
+            "id": f"{SUB}/Microsoft.Network/networkInterfaces/nic1",
+            "type": "Microsoft.Network/networkInterfaces",
+            "properties": json.dumps(
+                {
+                    "ipConfigurations": [
+                        {"properties": {"subnet": {"id": f"{SUB}/s/subnet1"}}}
+                    ],
+                    "networkSecurityGroup": {"id": f"{SUB}/nsg1"},
+                }
+            ),
+        },
+        {
+            "id": f"{SUB}/Microsoft.Compute/virtualMachines/vm1",
+            "type": "Microsoft.Compute/virtualMachines",
+            "properties": {
+                "networkProfile": {"networkInterfaces": [{"id": f"{SUB}/nic1"}]}
+            },
+            "tags": {"env": "prod"},
+            "dependsOn": [f"{SUB}/nic1"],
+            "diagnosticSettings": [{"workspaceId": f"{SUB}/ws1"}],
+        },
+        {
+            "id": f"{SUB}/Microsoft.Network/virtualNetworks/vnet1/subnets/s1",
+            "type": "Microsoft.Network/virtualNetworks/subnets",
+            "properties": {"networkSecurityGroup": {"id": f"{SUB}/nsg1"}},
+        },
+        {
+            "id": f"{SUB}/Microsoft.Network/privateEndpoints/pe1",
+            "type": "Microsoft.Network/privateEndpoints",
+            "properties": {"privateLinkServiceConnections": []},
+        },
+        {
+            "id": f"{SUB}/Microsoft.Authorization/roleAssignments/ra1",
+            "type": "Microsoft.Authorization/roleAssignments",
+            "properties": {"principalId": "p1", "principalType": "User"},
+        },
+        {"id": f"{SUB}/Microsoft.Web/sites/app1", "type": "Microsoft.Web/sites"},
+        {"id": f"{SUB}/untyped"},
+    ]
+
+
+def naive_applicable(rules, resource) -> List[int]:
+    return [i for i, rule in enumerate(rules) if rule.applies(resource)]
+
+
+class TestRuleDispatcher:
+    def test_candidates_cover_every_applicable_rule(self):
+        rules = create_relationship_rules()
+        dispatcher = RuleDispatcher(rules)
+
+        for resource in sample_resources():
+            candidates = dispatcher.candidate_indices(resource)
+            assert list(candidates) == sorted(candidates)
+            applicable = [i for i in candidates if rules[i].applies(resource)]
+            assert applicable == naive_applicable(rules, resource)
+
+    def test_unrelated_types_skip_type_specific_rules(self):
+        dispatcher = RuleDispatcher(create_relationship_rules())
+        names = {
+            rule.__class__.__name__
+            for rule in dispatcher.candidates(
+                {"id": "x", "type": "Microsoft.Web/sites", "location": "eastus"}
+            )
+        }
+        assert names == {"RegionRule"}
+
+    def test_type_match_is_case_insensitive(self):
+        dispatcher = RuleDispatcher(create_relationship_rules())
+        names = [
+            rule.__class__.__name__
+            for rule in dispatcher.candidates(
+                {"id": "x", "type": "microsoft.network/NETWORKINTERFACES"}
+            )
+        ]
+        assert names == ["NICRelationshipRule"]
+
+    def test_rules_without_hints_see_everything(self):
+        rule = MagicMock()
+        rule.resource_types = frozenset()
+        rule.resource_type_suffixes = ()
+        rule.trigger_keys = frozenset()
+        assert RuleDispatcher([rule]).candidates({"type": "Any/thing"}) == [rule]
+
+
+class TestRuleEvaluator:
+    def run_serial(self, resources):
+        rules = create_relationship_rules()
+        db_ops = MagicMock()
+        for resource in resources:
+            for rule in rules:
+                if rule.applies(resource):
+                    rule.emit(resource, db_ops)
+        return rules, db_ops
+
+    def assert_same_effects(self, resources, evaluator_kwargs):
+        serial_rules, serial_db = self.run_serial(resources)
+        rules = create_relationship_rules()
+        db_ops = MagicMock()
+        RuleEvaluator(rules, **evaluator_kwargs).apply(resources, db_ops)
+
+        for serial, rule in zip(serial_rules, rules):
+            assert rule._relationship_buffer == serial._relationship_buffer
+        assert db_ops.method_calls == serial_db.method_calls
+
+    def test_matches_serial_emit(self):
+        self.assert_same_effects(sample_resources(), {"max_workers": 1})
+
+    def test_process_pool_matches_serial_emit(self):
+        resources = sample_resources() * 3
+        self.assert_same_effects(
+            resources, {"max_workers": 2, "chunk_size": 5, "min_parallel": 1}
+        )
+
+    def test_process_pool_does_not_fork(self, monkeypatch):
+        from src.relationship_rules import evaluation
+
+        assert evaluation._pool_context().get_start_method() != "fork"
+        in_process = MagicMock(side_effect=evaluation.plan_resources)
+        monkeypatch.setattr(evaluation, "plan_resources", in_process)
+
+        plans = RuleEvaluator(
+            create_relationship_rules(), max_workers=2, chunk_size=5, min_parallel=1
+        ).evaluate(sample_resources() * 3)
+
+        assert len(plans) == len(sample_resources()) * 3
+        # Planned in the workers, not by the in-process fallback
+        in_process.assert_not_called()
+
+    def test_db_rules_are_deferred_to_emit(self):
+        rules = create_relationship_rules()
+        plans = RuleEvaluator(rules, max_workers=1).evaluate(sample_resources())
+
+        by_name = {
+            rules[i].__class__.__name__: edges for plan in plans for i, edges in plan
+        }
+        assert by_name["RegionRule"] is None
+        assert by_name["DependsOnRule"] == [
+            (
+                f"{SUB}/Microsoft.Compute/virtualMachines/vm1",
+                "DEPENDS_ON",
+                f"{SUB}/nic1",
+                None,
+            )
+        ]
+
+    def test_rule_errors_are_logged_not_raised(self, monkeypatch):
+        rules = create_relationship_rules()
+        nic_rule = next(
+            r for r in rules if r.__class__.__name__ == "NICRelationshipRule"
+        )
+        monkeypatch.setattr(
+            nic_rule, "extract_relationships", MagicMock(side_effect=ValueError)
+        )
+        monkeypatch.setattr(nic_rule, "emit", MagicMock(side_effect=ValueError))
+
+        RuleEvaluator(rules, max_workers=1).apply(sample_resources(), MagicMock())
+
+        assert nic_rule.emit.call_count == 1
+
+
+@pytest.mark.parametrize("rule_index", range(len(create_relationship_rules())))
+def test_every_rule_declares_dispatch_hints(rule_index):
+    rule = create_relationship_rules()[rule_index]
+    assert rule.resource_types or rule.resource_type_suffixes or rule.trigger_keys
+    assert all(t == t.lower() for t in rule.resource_types)
+    assert all(s == s.lower() for s in rule.resource_type_suffixes)
@@ -4,11 +4,55 @@ Unit tests for ConfigurationSimilarity brick.
 Tests configuration similarity computation and clustering logic.
 """
 
+import json
+import random
+
+import numpy as np
 import pytest
 
+from src.configuration_coherence_analyzer import ConfigurationCoherenceAnalyzer
 from src.replicator.modules.configuration_similarity import ConfigurationSimilarity
 
 
+def random_fingerprints(count, seed):
+    rng = random.Random(seed)
+    fingerprints = []
+    for _ in range(count):
+        tags = dict.fromkeys(
+            rng.sample(["env", "owner", "app", "team"], rng.randint(0, 3)), "v"
+        )
+        fingerprints.append(
+            {
+                "location": rng.choice(["eastus", "westus", "", "NoLocation"]),
+                "sku": rng.choice(["Standard_D2s_v3", "Premium_LRS", "", "UnknownSKU"]),
+                "tags": rng.choice([tags, json.dumps(tags)]),
+            }
+        )
+    return fingerprints
+
+
+def pairwise_average_linkage(similarity, threshold):
+    """Reference: repeatedly merge the best pair of the current cluster list."""
+    clusters = [[i] for i in range(len(similarity))]
+    while len(clusters) > 1:
+        best_sim, best_pair = threshold, None
+        for i in range(len(clusters)):
+            for j in range(i + 1, len(clusters)):
+                avg = np.mean(
+                    [similarity[a][b] for a in clusters[i] for b in clusters[j]]
+                )
+                if avg > best_sim:
+                    best_sim, best_pair = avg, (i, j)
+        if best_pair is None:
+            break
+        i, j = best_pair
+        merged = clusters[i] + clusters[j]
+        clusters.pop(j)
+        clusters.pop(i)
+        clusters.append(merged)
+    return clusters
+
+
 class TestConfigurationSimilarity:
     """Test suite for ConfigurationSimilarity brick."""
 
@@ -17,12 +61,12 @@ class TestConfigurationSimilarity:
         fp1 = {
             "location": "eastus",
             "sku": "Standard_D2s_v3",
-            "tags": {"env": "prod", "team": "platform"}
+            "tags": {"env": "prod", "team": "platform"},
         }
         fp2 = {
             "location": "eastus",
             "sku": "Standard_D2s_v3",
-            "tags": {"env": "prod", "team": "platform"}
+            "tags": {"env": "prod", "team": "platform"},
         }
 
         score = ConfigurationSimilarity.compute_similarity(fp1, fp2)
@@ -65,12 +109,12 @@ class TestConfigurationSimilarity:
         fp1 = {
             "location": "eastus",
             "sku": "Standard_D2s_v3",
-            "tags": {"env": "prod", "team": "platform", "app": "web"}
+            "tags": {"env": "prod", "team": "platform", "app": "web"},
         }
         fp2 = {
             "location": "eastus",
             "sku": "Standard_D2s_v3",
-            "tags": {"env": "prod", "team": "platform", "region": "us"}
+            "tags": {"env": "prod", "team": "platform", "region": "us"},
         }
 
         score = ConfigurationSimilarity.compute_similarity(fp1, fp2)
@@ -80,15 +124,11 @@ class TestConfigurationSimilarity:
 
     def test_compute_similarity_no_tag_key_overlap(self):
         """Test similarity with no tag key overlap."""
-        fp1 = {
-            "location": "eastus",
-            "sku": "Standard_D2s_v3",
-            "tags": {"env": "prod"}
-        }
+        fp1 = {"location": "eastus", "sku": "Standard_D2s_v3", "tags": {"env": "prod"}}
         fp2 = {
             "location": "eastus",
             "sku": "Standard_D2s_v3",
-            "tags": {"region": "us"}  # Different key
+            "tags": {"region": "us"},  # Different key
         }
 
         score = ConfigurationSimilarity.compute_similarity(fp1, fp2)
@@ -123,12 +163,12 @@ class TestConfigurationSimilarity:
         fp1 = {
             "location": "eastus",
             "sku": "Standard_D2s_v3",
-            "tags": '{"env": "prod"}'
+            "tags": '{"env": "prod"}',
         }
         fp2 = {
             "location": "eastus",
             "sku": "Standard_D2s_v3",
-            "tags": '{"env": "prod"}'
+            "tags": '{"env": "prod"}',
         }
 
         score = ConfigurationSimilarity.compute_similarity(fp1, fp2)
@@ -138,16 +178,8 @@ class TestConfigurationSimilarity:
 
     def test_compute_similarity_invalid_json_tags(self):
         """Test similarity with invalid JSON tags."""
-        fp1 = {
-            "location": "eastus",
-            "sku": "Standard_D2s_v3",
-            "tags": "{invalid json"
-        }
-        fp2 = {
-            "location": "eastus",
-            "sku": "Standard_D2s_v3",
-            "tags": "{also invalid"
-        }
+        fp1 = {"location": "eastus", "sku": "Standard_D2s_v3", "tags": "{invalid json"}
+        fp2 = {"location": "eastus", "sku": "Standard_D2s_v3", "tags": "{also invalid"}
 
         score = ConfigurationSimilarity.compute_similarity(fp1, fp2)
 
@@ -225,15 +257,11 @@ class TestConfigurationSimilarity:
 
     def test_cluster_by_coherence_similar_configs(self):
         """Test clustering with similar configurations."""
-        resources = [
-            {"id": "r1"},
-            {"id": "r2"},
-            {"id": "r3"}
-        ]
+        resources = [{"id": "r1"}, {"id": "r2"}, {"id": "r3"}]
         fingerprints = {
             "r1": {"location": "eastus", "sku": "Standard_D2s_v3", "tags": {}},
             "r2": {"location": "eastus", "sku": "Standard_D4s_v3", "tags": {}},
-            "r3": {"location": "eastus", "sku": "Standard_D8s_v3", "tags": {}}
+            "r3": {"location": "eastus", "sku": "Standard_D8s_v3", "tags": {}},
         }
 
         clusters = ConfigurationSimilarity.cluster_by_coherence(
@@ -245,15 +273,11 @@ class TestConfigurationSimilarity:
 
     def test_cluster_by_coherence_different_configs(self):
         """Test clustering with different configurations."""
-        resources = [
-            {"id": "r1"},
-            {"id": "r2"},
-            {"id": "r3"}
-        ]
+        resources = [{"id": "r1"}, {"id": "r2"}, {"id": "r3"}]
         fingerprints = {
             "r1": {"location": "eastus", "sku": "Standard_D2s_v3", "tags": {}},
             "r2": {"location": "westus", "sku": "Premium_LRS", "tags": {}},
-            "r3": {"location": "northeurope", "sku": "Basic_A0", "tags": {}}
+            "r3": {"location": "northeurope", "sku": "Basic_A0", "tags": {}},
         }
 
         clusters = ConfigurationSimilarity.cluster_by_coherence(
@@ -277,13 +301,10 @@ class TestConfigurationSimilarity:
 
     def test_cluster_by_coherence_low_threshold(self):
         """Test clustering with low threshold (more merging)."""
-        resources = [
-            {"id": "r1"},
-            {"id": "r2"}
-        ]
+        resources = [{"id": "r1"}, {"id": "r2"}]
         fingerprints = {
             "r1": {"location": "eastus", "sku": "Standard_D2s_v3", "tags": {}},
-            "r2": {"location": "westus", "sku": "Premium_LRS", "tags": {}}
+            "r2": {"location": "westus", "sku": "Premium_LRS", "tags": {}},
         }
 
         clusters = ConfigurationSimilarity.cluster_by_coherence(
@@ -297,13 +318,10 @@ class TestConfigurationSimilarity:
 
     def test_cluster_by_coherence_high_threshold(self):
         """Test clustering with high threshold (less merging)."""
-        resources = [
-            {"id": "r1"},
-            {"id": "r2"}
-        ]
+        resources = [{"id": "r1"}, {"id": "r2"}]
         fingerprints = {
             "r1": {"location": "eastus", "sku": "Standard_D2s_v3", "tags": {}},
-            "r2": {"location": "westus", "sku": "Standard_D4s_v3", "tags": {}}
+            "r2": {"location": "westus", "sku": "Standard_D4s_v3", "tags": {}},
         }
 
         clusters = ConfigurationSimilarity.cluster_by_coherence(
@@ -313,3 +331,65 @@ class TestConfigurationSimilarity:
         # High threshold should prevent clustering unless very similar
         # May result in no clusters if similarity < threshold and < min cluster size
         assert isinstance(clusters, list)
+
+
+class TestCoherenceClusteringEngine:
+    """Tests for the encoded similarity kernel and average-linkage engine."""
+
+    def test_similarity_matrix_matches_compute_similarity(self):
+        """Vectorized kernel gives exactly the pairwise compute_similarity values."""
+        fingerprints = random_fingerprints(80, seed=1)
+
+        matrix = ConfigurationSimilarity.similarity_matrix(
+            ConfigurationSimilarity.encode_fingerprints(fingerprints)
+        )
+
+        for i, fp1 in enumerate(fingerprints):
+            for j, fp2 in enumerate(fingerprints):
+                if i != j:
+                    assert matrix[i, j] == ConfigurationSimilarity.compute_similarity(
+                        fp1, fp2
+                    )
+
+    @pytest.mark.parametrize("threshold", [0.1, 0.5, 0.7, 0.9])
+    def test_average_linkage_matches_pairwise_merging(self, threshold):
+        """Same clusters as the pairwise merge loop."""
+        for seed in range(5):
+            fingerprints = random_fingerprints(40, seed=seed)
+            matrix = ConfigurationSimilarity.similarity_matrix(
+                ConfigurationSimilarity.encode_fingerprints(fingerprints)
+            )
+            expected = pairwise_average_linkage(matrix, threshold)
+
+            clusters = ConfigurationSimilarity.average_linkage(matrix.copy(), threshold)
+
+            assert sorted(map(sorted, clusters)) == sorted(map(sorted, expected))
+
+    def test_merge_order_and_ties_follow_cluster_creation_order(self):
+        """Ties go to the earliest pair; merged clusters are appended last."""
+        # 0/1 and 2/3 tie at 0.9; 4 joins nobody
+        similarity = np.array(
+            [
+                [0.0, 0.9, 0.2, 0.2, 0.0],
+                [0.9, 0.0, 0.2, 0.2, 0.0],
+                [0.2, 0.2, 0.0, 0.9, 0.0],
+                [0.2, 0.2, 0.9, 0.0, 0.0],
+                [0.0, 0.0, 0.0, 0.0, 0.0],
+            ]
+        )
+
+        assert ConfigurationSimilarity.average_linkage(similarity, 0.5) == [
+            [4],
+            [0, 1],
+            [2, 3],
+        ]
+
+    def test_coherence_analyzer_uses_same_engine(self):
+        """ConfigurationCoherenceAnalyzer.cluster_by_coherence gives the same clusters."""
+        fingerprints = random_fingerprints(30, seed=9)
+        resources = [{"id": f"r{i}"} for i in range(len(fingerprints))]
+        by_id = {r["id"]: fp for r, fp in zip(resources, fingerprints)}
+
+        assert ConfigurationCoherenceAnalyzer().cluster_by_coherence(
+            resources, by_id, 0.6
+        ) == ConfigurationSimilarity.cluster_by_coherence(resources, by_id, 0.6)
@@ -0,0 +1,226 @@
+"""
+Unit tests for GraphSnapshot brick.
+
+Tests snapshot construction, lookups and persistence (with a fake Neo4j session).
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.replicator.modules.graph_snapshot import (
+    EDGES_QUERY,
+    GRAPH_VERSION_QUERY,
+    NODES_QUERY,
+    GraphSnapshot,
+)
+from src.replicator.modules.pattern_instance_finder import PatternInstanceFinder
+from src.replicator.modules.target_graph_builder import TargetGraphBuilder
+
+RG1 = "/subscriptions/sub/resourceGroups/rg1"
+RG2 = "/subscriptions/sub/resourceGroups/rg2"
+VM1 = f"{RG1}/providers/Microsoft.Compute/virtualMachines/vm1"
+NIC1 = f"{RG1}/providers/Microsoft.Network/networkInterfaces/nic1"
+KV1 = f"{RG2}/providers/Microsoft.KeyVault/vaults/kv1"
+FOREIGN = (
+    "/providers/Microsoft.Management/managementGroups/"
+    "11111111-2222-3333-4444-555555555555/subscriptions/other/vm9"
+)
+
+NODES = [
+    (1, ["ResourceGroup"], RG1, "Microsoft.Resources/resourceGroups", "rg1"),
+    (2, ["ResourceGroup"], RG2, "Microsoft.Resources/resourceGroups", "rg2"),
+    (3, ["Resource", "Original"], VM1, "Microsoft.Compute/virtualMachines", "vm1"),
+    (4, ["Resource", "Original"], NIC1, "Microsoft.Network/networkInterfaces", "nic1"),
+    (5, ["Resource", "Original"], KV1, "Microsoft.KeyVault/vaults", "kv1"),
+    (6, ["Resource", "Original"], FOREIGN, "Microsoft.Compute/virtualMachines", "vm9"),
+    (7, ["Resource"], "vm-abstract", "Microsoft.Compute/virtualMachines", "vm1"),
+]
+
+EDGES = [
+    (1, 3, "CONTAINS"),
+    (1, 4, "CONTAINS"),
+    (2, 5, "CONTAINS"),
+    (3, 4, "DEPENDS_ON"),
+    (3, 5, "USES_IDENTITY"),
+    (6, 3, "CONNECTED_TO"),
+]
+
+
+class FakeResult(list):
+    def single(self):
+        return self[0] if self else None
+
+
+class FakeSession:
+    """Answers the snapshot queries from the tables above."""
+
+    def __init__(self, updated_at="2024-01-01T00:00:00"):
+        self.updated_at = updated_at
+        self.queries = []
+
+    def run(self, query, *args, **kwargs):
+        self.queries.append(query)
+        if query == NODES_QUERY:
+            return FakeResult(
+                {
+                    "nid": nid,
+                    "labels": labels,
+                    "id": rid,
+                    "type": rtype,
+                    "name": name,
+                    "location": "eastus" if "Original" in labels else None,
+                    "tags": None,
+                    "properties": (
+                        '{"sku": "Standard"}' if "Original" in labels else None
+                    ),
+                }
+                for nid, labels, rid, rtype, name in NODES
+            )
+        if query == EDGES_QUERY:
+            return FakeResult(
+                {"source": source, "target": target, "rel_type": rel_type}
+                for source, target, rel_type in EDGES
+            )
+        if query == GRAPH_VERSION_QUERY:
+            return FakeResult(
+                [
+                    {
+                        "nodes": len(NODES),
+                        "relationships": len(EDGES),
+                        "updated_at": self.updated_at,
+                    }
+                ]
+            )
+        raise AssertionError(f"Unexpected query: {query}")
+
+
+@pytest.fixture
+def snapshot():
+    return GraphSnapshot.from_session(FakeSession())
+
+
+class TestGraphSnapshot:
+    """Test suite for GraphSnapshot brick."""
+
+    def test_relationships_match_fetch_all_relationships_shape(self, snapshot):
+        relationships = snapshot.relationships()
+
+        assert len(relationships) == len(EDGES)
+        assert relationships[3] == {
+            "source_labels": ["Resource", "Original"],
+            "source_type": "Microsoft.Compute/virtualMachines",
+            "rel_type": "DEPENDS_ON",
+            "target_labels": ["Resource", "Original"],
+            "target_type": "Microsoft.Network/networkInterfaces",
+        }
+
+    def test_relationships_exclude_foreign_management_groups(self, snapshot):
+        relationships = snapshot.relationships("our-tenant")
+
+        assert len(relationships) == len(EDGES) - 1
+        assert "CONNECTED_TO" not in {r["rel_type"] for r in relationships}
+        # The foreign resource is kept when its id mentions the tenant
+        assert len(snapshot.relationships("other")) == len(EDGES)
+
+    def test_resource_type_counts_only_original_resources(self, snapshot):
+        assert snapshot.resource_type_counts() == {
+            "Microsoft.Compute/virtualMachines": 2,
+            "Microsoft.Network/networkInterfaces": 1,
+            "Microsoft.KeyVault/vaults": 1,
+        }
+
+    def test_resource_group_records(self, snapshot):
+        records = snapshot.resource_group_records()
+
+        assert [(r["resource_group_id"], r["name"]) for r in records] == [
+            (RG1, "vm1"),
+            (RG1, "nic1"),
+            (RG2, "kv1"),
+        ]
+        assert records[0]["location"] == "eastus"
+        assert records[0]["properties"] == '{"sku": "Standard"}'
+
+        typed = snapshot.resource_group_records(types=["Microsoft.KeyVault/vaults"])
+        assert [r["id"] for r in typed] == [KV1]
+
+    def test_connections_among(self, snapshot):
+        assert snapshot.connections_among([VM1, NIC1]) == [
+            {"source_id": VM1, "target_id": NIC1}
+        ]
+        assert snapshot.connections_among([VM1, "missing"]) == []
+
+    def test_relationships_touching(self, snapshot):
+        records = snapshot.relationships_touching([VM1])
+
+        assert {(r["source_id"], r["rel_type"], r["target_id"]) for r in records} == {
+            (RG1, "CONTAINS", VM1),
+            (VM1, "DEPENDS_ON", NIC1),
+            (VM1, "USES_IDENTITY", KV1),
+            (FOREIGN, "CONNECTED_TO", VM1),
+        }
+
+    def test_abstracted_nodes_are_not_indexed(self, snapshot):
+        assert "vm-abstract" not in snapshot.index
+        assert snapshot.relationships_touching(["vm-abstract"]) == []
+
+    def test_save_and_load_round_trip(self, snapshot, tmp_path):
+        path = tmp_path / "snapshot.npz"
+        snapshot.save(path)
+
+        loaded = GraphSnapshot.from_file(path)
+
+        assert len(loaded) == len(snapshot)
+        assert loaded.relationships() == snapshot.relationships()
+        assert loaded.resource_group_records() == snapshot.resource_group_records()
+
+    def test_load_reuses_snapshot_for_unchanged_graph(self, tmp_path):
+        first = GraphSnapshot.load(FakeSession(), cache_dir=tmp_path)
+
+        session = FakeSession()
+        second = GraphSnapshot.load(session, cache_dir=tmp_path)
+
+        assert session.queries == [GRAPH_VERSION_QUERY]
+        assert second.version == first.version
+        assert second.relationships() == first.relationships()
+
+        changed = FakeSession(updated_at="2024-02-01T00:00:00")
+        GraphSnapshot.load(changed, cache_dir=tmp_path)
+        assert NODES_QUERY in changed.queries
+
+    def test_finder_uses_snapshot(self, snapshot):
+        analyzer = MagicMock()
+        analyzer._get_resource_type_name.side_effect = lambda labels, azure_type: (
+            azure_type.split("/")[-1] if azure_type else "Unknown"
+        )
+        finder = PatternInstanceFinder(analyzer, MagicMock(), snapshot=snapshot)
+        session = MagicMock()
+
+        instances = finder.find_connected_instances(
+            session,
+            {"virtualMachines", "networkInterfaces"},
+            "vm",
+            {"vm": {"matched_resources": ["virtualMachines", "networkInterfaces"]}},
+            include_colocated_orphaned_resources=False,
+        )
+
+        session.run.assert_not_called()
+        # kv1 joins through its direct connection to vm1
+        assert [sorted(r["name"] for r in instance) for instance in instances] == [
+            ["kv1", "nic1", "vm1"]
+        ]
+
+    @patch("src.replicator.modules.target_graph_builder.GraphDatabase")
+    def test_builder_uses_snapshot(self, mock_graph_db, snapshot):
+        analyzer = MagicMock()
+        analyzer.aggregate_relationships.return_value = []
+        builder = TargetGraphBuilder(
+            analyzer, "bolt://localhost:7687", "neo4j", "password", snapshot=snapshot
+        )
+
+        builder.warm_cache([("vm", [[{"id": VM1}, {"id": NIC1}]])])
+        builder.build_from_instances([("vm", [{"id": NIC1, "type": "nics"}])])
+
+        mock_graph_db.driver.assert_not_called()
+        relationships = analyzer.aggregate_relationships.call_args[0][0]
+        assert [r["rel_type"] for r in relationships] == ["CONTAINS", "DEPENDS_ON"]
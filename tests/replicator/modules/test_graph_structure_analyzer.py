@@ -5,9 +5,24 @@ Tests graph structural similarity using spectral methods.
 """
 
 import networkx as nx
+import numpy as np
 import pytest
 
-from src.replicator.modules.graph_structure_analyzer import GraphStructureAnalyzer
+from src.replicator.modules.graph_structure_analyzer import (
+    GraphStructureAnalyzer,
+    SpectralDistanceEngine,
+)
+
+
+def padded_dense_distance(graph1, graph2):
+    """Reference: full eigvalsh on zero-padded dense Laplacians."""
+    L1 = nx.laplacian_matrix(graph1.to_undirected()).toarray()
+    L2 = nx.laplacian_matrix(graph2.to_undirected()).toarray()
+    size = max(L1.shape[0], L2.shape[0])
+    eigenvals1 = np.sort(np.linalg.eigvalsh(np.pad(L1, (0, size - L1.shape[0]))))
+    eigenvals2 = np.sort(np.linalg.eigvalsh(np.pad(L2, (0, size - L2.shape[0]))))
+    max_eigenval = max(np.max(np.abs(eigenvals1)), np.max(np.abs(eigenvals2)), 1.0)
+    return np.linalg.norm(eigenvals1 - eigenvals2) / (max_eigenval * np.sqrt(size))
 
 
 class TestGraphStructureAnalyzer:
@@ -241,3 +256,75 @@ class TestGraphStructureAnalyzer:
 
         # Should handle disconnected graphs
         assert 0.0 <= distance <= 1.0
+
+
+class TestSpectralDistanceEngine:
+    """Test suite for the memoized sparse spectral engine."""
+
+    def test_exact_spectra_match_padded_dense_laplacians(self):
+        """Small graphs give the same distance as padded dense eigvalsh."""
+        engine = SpectralDistanceEngine()
+        pairs = [
+            (
+                nx.gnm_random_graph(n1, m1, seed=n1, directed=True),
+                nx.gnm_random_graph(n2, m2, seed=n2, directed=True),
+            )
+            for n1, m1, n2, m2 in [(5, 6, 9, 14), (30, 80, 12, 11), (40, 0, 40, 90)]
+        ]
+        # Reciprocal edges, parallel edges and self-loops
+        multi = nx.MultiDiGraph([("a", "b"), ("b", "a"), ("a", "b"), ("c", "c")])
+        pairs.append((multi, nx.DiGraph([("a", "b"), ("b", "a"), ("b", "c")])))
+
+        for graph1, graph2 in pairs:
+            assert engine.distance(graph1, graph2) == pytest.approx(
+                padded_dense_distance(graph1, graph2), abs=1e-9
+            )
+
+    def test_source_spectrum_is_computed_once(self):
+        """Repeated comparisons against one source reuse its cached spectrum."""
+        engine = SpectralDistanceEngine(min_cached_size=1)
+        source = nx.DiGraph([("vm", "disk"), ("vm", "nic"), ("nic", "subnet")])
+        candidates = [nx.DiGraph([("vm", "disk")]), nx.DiGraph([("vm", "nic")])]
+
+        for _ in range(3):
+            for candidate in candidates:
+                engine.distance(source, candidate)
+
+        # Source plus two structurally identical candidates (single edge)
+        assert engine.misses == 2
+        assert engine.hits == 10
+
+    def test_tiny_graphs_are_not_memoized(self):
+        """Graphs below min_cached_size are decomposed directly."""
+        engine = SpectralDistanceEngine(min_cached_size=10)
+
+        engine.distance(nx.path_graph(5), nx.path_graph(5))
+        engine.distance(nx.path_graph(20), nx.path_graph(20))
+
+        assert (engine.misses, engine.hits) == (1, 1)
+
+    def test_top_k_approximation_tracks_exact_distance(self):
+        """Large graphs use top-k eigsh plus spectral moments."""
+        source = nx.barabasi_albert_graph(600, 2, seed=1)
+        targets = [
+            nx.barabasi_albert_graph(540, 3, seed=2),
+            nx.gnm_random_graph(600, 1200, seed=3),
+        ]
+        engine = SpectralDistanceEngine(dense_threshold=100, top_k=16)
+
+        for target in targets:
+            approx = engine.distance(source, target)
+            assert not engine.spectrum(target).exact
+            assert approx == pytest.approx(
+                padded_dense_distance(source, target), rel=0.1
+            )
+
+    def test_cache_is_bounded(self):
+        """Least recently used spectra are evicted."""
+        engine = SpectralDistanceEngine(cache_size=2, min_cached_size=1)
+
+        for n in range(2, 6):
+            engine.spectrum(nx.path_graph(n))
+
+        assert len(engine._cache) == 2
+        assert engine.spectrum(nx.DiGraph()) is None
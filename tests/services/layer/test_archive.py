@@ -0,0 +1,230 @@
+"""
+Unit tests for the chunked layer archive format and streaming restore
+
+Test Coverage:
+- Chunked archive round trip (metadata, node and relationship chunks)
+- Checksum and truncation detection
+- Streamed JSON (2.0) archives stay loadable with json.load
+- archive_layer picks the format from the output path
+- restore_layer applies one UNWIND query per chunk and resumes after failure
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.services.layer.archive import (
+    JsonArchiveWriter,
+    LayerArchiveWriter,
+    is_chunked_archive,
+    iter_archive_chunks,
+    read_archive_manifest,
+    read_archive_metadata,
+)
+from src.services.layer.export import LayerExportOperations
+from src.services.layer.models import LayerArchiveError, LayerMetadata
+
+METADATA = {
+    "layer_id": "baseline",
+    "name": "Baseline",
+    "description": "",
+    "created_at": "2026-01-01T00:00:00",
+    "layer_type": "baseline",
+    "tenant_id": "test-tenant",
+    "node_count": 5,
+    "relationship_count": 3,
+}
+NODES = [{"id": f"vm{i}", "name": f"vm{i}", "layer_id": "baseline"} for i in range(5)]
+RELATIONSHIPS = [
+    {"source": "vm0", "target": "vm1", "type": "CONNECTED_TO", "properties": {}},
+    {"source": "vm1", "target": "vm2", "type": "CONNECTED_TO", "properties": {}},
+    {"source": "vm0", "target": "orig0", "type": "SCAN_SOURCE_NODE", "properties": {}},
+]
+
+
+def write_archive(path, chunk_size=2):
+    with LayerArchiveWriter(str(path), chunk_size=chunk_size) as writer:
+        writer.write_metadata(METADATA)
+        for node in NODES:
+            writer.add_node(node)
+        for rel in RELATIONSHIPS:
+            writer.add_relationship(rel)
+
+
+@pytest.fixture
+def mock_session_manager():
+    """Session manager whose session() context yields a MagicMock session."""
+    mock_manager = MagicMock()
+    mock_session = MagicMock()
+    mock_manager.session.return_value.__enter__.return_value = mock_session
+    return mock_manager, mock_session
+
+
+@pytest.fixture
+def export_operations(mock_session_manager, mock_stats_operations):
+    session_manager, _ = mock_session_manager
+    crud = AsyncMock()
+    crud.get_layer.return_value = LayerMetadata.from_dict(METADATA)
+    return LayerExportOperations(
+        session_manager, crud_operations=crud, stats_operations=mock_stats_operations
+    )
+
+
+class TestChunkedArchive:
+    """Test the chunked archive writer and readers."""
+
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "baseline.atgl"
+        write_archive(path)
+
+        assert is_chunked_archive(str(path))
+        assert not (tmp_path / "baseline.atgl.partial").exists()
+        manifest = read_archive_manifest(str(path))
+        assert manifest.metadata == METADATA
+        assert manifest.node_count == 5
+        assert manifest.relationship_count == 3
+        # 5 nodes in chunks of 2, then 3 relationships in chunks of 2
+        assert [c["count"] for c in manifest.chunks] == [2, 2, 1, 2, 1]
+
+        chunks = list(iter_archive_chunks(str(path)))
+        assert [r for c in chunks if c.kind == "nodes" for r in c.records] == NODES
+        assert [
+            r for c in chunks if c.kind == "relationships" for r in c.records
+        ] == RELATIONSHIPS
+        assert [c.seq for c in iter_archive_chunks(str(path), start_seq=4)] == [4, 5]
+
+    def test_corrupt_chunk_is_detected(self, tmp_path):
+        path = tmp_path / "baseline.atgl"
+        write_archive(path)
+        data = bytearray(path.read_bytes())
+        # Flip the last payload byte, just ahead of the end frame
+        data[data.rindex(b'{"kind":"end"') - 5] ^= 0xFF
+        path.write_bytes(bytes(data))
+
+        with pytest.raises(LayerArchiveError, match="chunk 5 checksum mismatch"):
+            list(iter_archive_chunks(str(path)))
+
+    def test_truncated_archive_is_rejected(self, tmp_path):
+        path = tmp_path / "baseline.atgl"
+        write_archive(path)
+        path.write_bytes(path.read_bytes()[:-40])
+
+        with pytest.raises(LayerArchiveError):
+            read_archive_manifest(str(path))
+
+    def test_failed_write_leaves_no_archive(self, tmp_path):
+        path = tmp_path / "baseline.atgl"
+        with pytest.raises(RuntimeError):
+            with LayerArchiveWriter(str(path)) as writer:
+                writer.write_metadata(METADATA)
+                raise RuntimeError("connection lost")
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_json_writer_streams_legacy_layout(self, tmp_path):
+        path = tmp_path / "baseline.json"
+        with JsonArchiveWriter(str(path)) as writer:
+            writer.write_metadata(METADATA)
+            for rel in RELATIONSHIPS:
+                writer.add_relationship(rel)
+
+        data = json.loads(path.read_text())
+        assert data["version"] == "2.0"
+        assert data["includes_scan_source_node"] is True
+        assert data["nodes"] == []
+        assert data["relationships"] == RELATIONSHIPS
+        assert read_archive_metadata(str(path)) == METADATA
+
+
+class TestArchiveLayer:
+    """Test archive_layer format selection."""
+
+    @pytest.mark.parametrize(
+        ("filename", "chunked"), [("layer.json", False), ("layer.atgl", True)]
+    )
+    @pytest.mark.asyncio
+    async def test_format_follows_extension(
+        self, export_operations, mock_session_manager, tmp_path, filename, chunked
+    ):
+        _, mock_session = mock_session_manager
+        mock_session.run.side_effect = [
+            [{"r": node} for node in NODES],
+            [
+                {
+                    "source": r["source"],
+                    "target": r["target"],
+                    "type": r["type"],
+                    "props": r["properties"],
+                }
+                for r in RELATIONSHIPS
+            ],
+        ]
+        path = tmp_path / filename
+
+        await export_operations.archive_layer("baseline", str(path))
+
+        assert is_chunked_archive(str(path)) is chunked
+        if chunked:
+            assert read_archive_manifest(str(path)).relationship_count == 3
+        else:
+            assert len(json.loads(path.read_text())["nodes"]) == 5
+
+
+class TestRestoreLayer:
+    """Test chunked, resumable restore."""
+
+    @pytest.mark.asyncio
+    async def test_restore_resumes_after_failed_chunk(
+        self, export_operations, mock_session_manager, tmp_path
+    ):
+        _, mock_session = mock_session_manager
+        path = tmp_path / "baseline.atgl"
+        write_archive(path)
+        applied = []
+        failures = [RuntimeError("Neo4j unavailable")]
+
+        def run(query, params):
+            if "UNWIND $relationships" in query and failures:
+                raise failures.pop()
+            applied.append(params.get("nodes") or params.get("relationships"))
+
+        mock_session.run.side_effect = run
+
+        with pytest.raises(RuntimeError):
+            await export_operations.restore_layer(str(path), target_layer_id="copy")
+        assert json.loads((tmp_path / "baseline.atgl.copy.restore").read_text()) == {
+            "next_seq": 4
+        }
+
+        await export_operations.restore_layer(
+            str(path), target_layer_id="copy", resume=True
+        )
+
+        assert export_operations.crud_operations.create_layer.await_count == 1
+        assert [len(batch) for batch in applied] == [2, 2, 1, 2, 1]
+        assert not (tmp_path / "baseline.atgl.copy.restore").exists()
+
+    @pytest.mark.asyncio
+    async def test_json_restore_is_batched(
+        self, export_operations, mock_session_manager, tmp_path
+    ):
+        _, mock_session = mock_session_manager
+        path = tmp_path / "baseline.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "version": "2.0",
+                    "metadata": METADATA,
+                    "nodes": NODES,
+                    "relationships": RELATIONSHIPS,
+                }
+            )
+        )
+
+        await export_operations.restore_layer(str(path), batch_size=10)
+
+        queries = [call.args[0] for call in mock_session.run.call_args_list]
+        assert len(queries) == 2
+        assert "UNWIND $nodes" in queries[0]
+        assert "SCAN_SOURCE_NODE" in queries[1]
@@ -0,0 +1,427 @@
+"""
+Unit tests for copy-on-write layers (LayerCopyOnWriteOperations)
+
+Test Coverage:
+- Creating a copy-on-write layer writes only layer metadata
+- Layer chain resolution through copy-on-write parents
+- Relationship resolution (shadowed sources, deleted targets)
+- Deleting a layer with copy-on-write children is refused
+- Materialize copies inherited nodes and clears the flag
+- Stats, compare, validation, copy and archive read through the parent chain
+"""
+
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+
+from src.services.layer.cow import (
+    LayerCopyOnWriteOperations,
+    chain_params,
+    effective_relationships,
+    get_layer_chain,
+    resolved_resources_query,
+)
+from src.services.layer.crud import LayerCrudOperations
+from src.services.layer.export import LayerExportOperations
+from src.services.layer.models import (
+    LayerIntegrityError,
+    LayerMetadata,
+    LayerProtectedError,
+)
+from src.services.layer.stats import LayerStatsOperations
+from src.services.layer.validation import LayerValidationOperations
+
+
+def make_layer(layer_id, parent=None, copy_on_write=False):
+    return LayerMetadata(
+        layer_id=layer_id,
+        name=layer_id,
+        description="",
+        created_at=datetime.utcnow(),
+        parent_layer_id=parent,
+        metadata={"copy_on_write": True} if copy_on_write else {},
+    )
+
+
+@pytest.fixture
+def mock_session_manager():
+    """Session manager whose session() context yields a MagicMock session."""
+    mock_manager = MagicMock()
+    mock_session = MagicMock()
+    mock_manager.session.return_value.__enter__.return_value = mock_session
+    return mock_manager, mock_session
+
+
+@pytest.fixture
+def layers():
+    return {
+        "baseline": make_layer("baseline"),
+        "scaled": make_layer("scaled", parent="baseline", copy_on_write=True),
+        "scaled-2": make_layer("scaled-2", parent="scaled", copy_on_write=True),
+    }
+
+
+@pytest.fixture
+def crud(layers):
+    crud = AsyncMock()
+    crud.get_layer.side_effect = lambda layer_id: layers.get(layer_id)
+    crud.create_layer.side_effect = lambda **kwargs: make_layer(
+        kwargs["layer_id"],
+        parent=kwargs["parent_layer_id"],
+        copy_on_write=kwargs["metadata"].get("copy_on_write", False),
+    )
+    return crud
+
+
+@pytest.fixture
+def cow(mock_session_manager, crud, mock_stats_operations):
+    session_manager, _ = mock_session_manager
+    return LayerCopyOnWriteOperations(
+        session_manager,
+        crud_operations=crud,
+        stats_operations=mock_stats_operations,
+    )
+
+
+def records(*rows):
+    return iter([dict(row) for row in rows])
+
+
+@pytest.mark.asyncio
+async def test_create_layer_writes_no_nodes(cow, crud, mock_session_manager):
+    _, mock_session = mock_session_manager
+
+    layer = await cow.create_layer("baseline", "experiment", "Experiment", "")
+
+    assert layer.is_copy_on_write
+    kwargs = crud.create_layer.call_args.kwargs
+    assert kwargs["parent_layer_id"] == "baseline"
+    assert kwargs["metadata"]["copy_on_write"] is True
+    mock_session.run.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_layer_chain_follows_copy_on_write_parents(crud, layers):
+    assert await get_layer_chain(crud, "scaled-2") == [
+        "scaled-2",
+        "scaled",
+        "baseline",
+    ]
+    assert await get_layer_chain(crud, "baseline") == ["baseline"]
+
+    # A full (non copy-on-write) parent ends the chain
+    layers["standalone"] = make_layer("standalone", parent="baseline")
+    assert await get_layer_chain(crud, "standalone") == ["standalone"]
+
+
+@pytest.mark.asyncio
+async def test_layer_chain_with_missing_parent(crud, layers):
+    layers["orphan"] = make_layer("orphan", parent="gone", copy_on_write=True)
+
+    with pytest.raises(LayerIntegrityError):
+        await get_layer_chain(crud, "orphan")
+
+
+def test_resolved_query_for_single_layer_is_a_plain_match():
+    query = resolved_resources_query(["baseline"])
+
+    assert "r.layer_id = $layer_id" in query
+    assert "LayerTombstone" not in query
+
+    chained = resolved_resources_query(["scaled", "baseline"], by_ids=True)
+    assert "r.layer_id IN $chain AND r.id IN $resource_ids" in chained
+    assert "LayerTombstone" in chained
+    assert chain_params(["scaled", "baseline"])["depths"] == {
+        "scaled": 0,
+        "baseline": 1,
+    }
+
+
+def test_effective_relationships_skip_shadowed_and_deleted():
+    session = MagicMock()
+    session.run.side_effect = [
+        records(
+            # vm was overridden in "scaled": its baseline edges are shadowed
+            {
+                "source": "vm",
+                "source_layer": "baseline",
+                "rel_type": "USES",
+                "target": "nic",
+            },
+            {
+                "source": "vm",
+                "source_layer": "scaled",
+                "rel_type": "USES",
+                "target": "nic-2",
+            },
+            # disk was deleted in "scaled"
+            {
+                "source": "vm",
+                "source_layer": "scaled",
+                "rel_type": "USES",
+                "target": "disk",
+            },
+            {
+                "source": "nic",
+                "source_layer": "baseline",
+                "rel_type": "IN",
+                "target": "vnet",
+            },
+        ),
+        records(
+            {"id": "vm", "layer_id": "scaled"},
+            {"id": "nic", "layer_id": "baseline"},
+            {"id": "nic-2", "layer_id": "scaled"},
+            {"id": "vnet", "layer_id": "baseline"},
+        ),
+    ]
+
+    relationships = effective_relationships(session, ["scaled", "baseline"])
+
+    assert relationships == {("vm", "USES", "nic-2"), ("nic", "IN", "vnet")}
+
+
+@pytest.mark.asyncio
+async def test_delete_resource_tombstones_inherited_ids(cow, mock_session_manager):
+    _, mock_session = mock_session_manager
+    queries = []
+
+    def run(query, params=None):
+        queries.append(query)
+        if "RETURN r.id AS id" in query:
+            return records({"id": "vm", "layer_id": "baseline"})
+        return Mock()
+
+    mock_session.run.side_effect = run
+
+    await cow.delete_resource("scaled", "vm")
+
+    assert any("MERGE (:LayerTombstone" in query for query in queries)
+
+
+@pytest.mark.asyncio
+async def test_materialize_copies_inherited_nodes(cow, crud, mock_session_manager):
+    _, mock_session = mock_session_manager
+    calls = []
+
+    def run(query, params=None):
+        calls.append((query, params))
+        if "RETURN r.id AS id" in query:
+            return records(
+                {"id": "vm", "layer_id": "scaled"},
+                {"id": "nic", "layer_id": "baseline"},
+                {"id": "vnet", "layer_id": "baseline"},
+            )
+        return Mock()
+
+    mock_session.run.side_effect = run
+    progress = []
+
+    await cow.materialize_layer(
+        "scaled", batch_size=1, progress_callback=lambda c, t: progress.append(c)
+    )
+
+    node_batches = [
+        params["rows"]
+        for query, params in calls
+        if "SET new = properties(src)" in query
+    ]
+    assert node_batches == [
+        [{"id": "nic", "owner": "baseline"}],
+        [{"id": "vnet", "owner": "baseline"}],
+    ]
+    assert progress == [1, 2]
+    assert any("DELETE t" in query for query, _ in calls)
+    crud.update_layer.assert_awaited_once_with(
+        "scaled", metadata={"copy_on_write": False}
+    )
+
+
+@pytest.mark.asyncio
+async def test_delete_layer_refuses_copy_on_write_parent(mock_session_manager):
+    session_manager, mock_session = mock_session_manager
+    crud = LayerCrudOperations(session_manager)
+    crud.get_layer = AsyncMock(return_value=make_layer("baseline"))
+    crud.node_to_layer_metadata = Mock(
+        return_value=make_layer("scaled", parent="baseline", copy_on_write=True)
+    )
+    mock_session.run.return_value = [{"l": object()}]
+
+    with pytest.raises(LayerProtectedError, match="scaled"):
+        await crud.delete_layer("baseline")
+
+
+# =============================================================================
+# Consumers of a copy-on-write layer ("scaled" over "baseline")
+# =============================================================================
+
+# Effective view of "scaled": vm is overridden, nic is inherited, disk deleted
+SCALED_OWNERS = (
+    {"id": "vm", "layer_id": "scaled"},
+    {"id": "nic", "layer_id": "baseline"},
+)
+
+
+def chained_run(calls, counts=None):
+    """Fake session.run answering chain-resolved reads of "scaled"."""
+
+    def run(query, params=None):
+        calls.append((query, params))
+        if "RETURN r.id AS id" in query:
+            return records(*SCALED_OWNERS)
+        if "RETURN DISTINCT u.id AS source" in query:
+            return records(
+                {
+                    "source": "vm",
+                    "source_layer": "scaled",
+                    "rel_type": "USES",
+                    "target": "nic",
+                },
+                {
+                    "source": "vm",
+                    "source_layer": "scaled",
+                    "rel_type": "USES",
+                    "target": "disk",
+                },
+            )
+        if "collect(r.id)" in query:
+            ids = ["vm", "nic"] if len(params["chain"]) > 1 else ["vm", "disk"]
+            return Mock(single=Mock(return_value={"ids": ids, "count": len(ids)}))
+        if "as count" in query:
+            return Mock(
+                single=Mock(
+                    return_value={
+                        "count": (counts or {}).get(
+                            "chained" if "LayerTombstone" in query else "plain", 0
+                        )
+                    }
+                )
+            )
+        return Mock()
+
+    return run
+
+
+@pytest.mark.asyncio
+async def test_refresh_stats_counts_through_parent_chain(crud, mock_session_manager):
+    session_manager, mock_session = mock_session_manager
+    calls = []
+    mock_session.run.side_effect = chained_run(calls, {"chained": 2})
+
+    await LayerStatsOperations(session_manager, crud).refresh_layer_stats("scaled")
+
+    node_query, node_params = calls[0]
+    assert "LayerTombstone" in node_query
+    assert node_params["chain"] == ["scaled", "baseline"]
+    update = next(params for query, params in calls if "SET l.node_count" in query)
+    # disk is deleted in "scaled", so only vm -> nic counts
+    assert (update["node_count"], update["rel_count"]) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_compare_resolves_copy_on_write_layer(crud, layers, mock_session_manager):
+    session_manager, mock_session = mock_session_manager
+    layers["standalone"] = make_layer("standalone")
+    calls = []
+    mock_session.run.side_effect = chained_run(calls, {"plain": 0})
+
+    diff = await LayerValidationOperations(session_manager, crud).compare_layers(
+        "standalone", "scaled", detailed=True
+    )
+
+    assert diff.added_node_ids == ["nic"]
+    assert diff.removed_node_ids == ["disk"]
+    assert diff.relationships_added == 1
+
+
+@pytest.mark.asyncio
+async def test_validate_integrity_checks_through_parent_chain(
+    crud, mock_session_manager
+):
+    session_manager, mock_session = mock_session_manager
+    calls = []
+    mock_session.run.side_effect = chained_run(calls)
+
+    report = await LayerValidationOperations(
+        session_manager, crud
+    ).validate_layer_integrity("scaled")
+
+    assert report.is_valid
+    assert len(calls) == 3
+    for query, params in calls:
+        assert "LayerTombstone" in query
+        assert params["chain"] == ["scaled", "baseline"]
+
+
+@pytest.mark.asyncio
+async def test_copy_layer_copies_effective_nodes_of_copy_on_write_source(
+    crud, mock_session_manager, mock_stats_operations
+):
+    session_manager, mock_session = mock_session_manager
+    calls = []
+    mock_session.run.side_effect = chained_run(calls)
+    export = LayerExportOperations(session_manager, crud, mock_stats_operations)
+
+    await export.copy_layer("scaled", "copy", "Copy", "")
+
+    assert "copy_on_write" not in crud.create_layer.call_args.kwargs["metadata"]
+    node_batches = [
+        params["rows"]
+        for query, params in calls
+        if "SET new = properties(src)" in query
+    ]
+    assert node_batches == [
+        [{"id": "nic", "owner": "baseline"}, {"id": "vm", "owner": "scaled"}]
+    ]
+    rel_query, rel_params = calls[-1]
+    assert "apoc.create.relationship" in rel_query
+    assert "LayerTombstone" in rel_query
+    assert rel_params["chain"] == ["scaled", "baseline"]
+    assert rel_params["target_layer_id"] == "copy"
+
+
+@pytest.mark.asyncio
+async def test_archive_layer_includes_inherited_nodes(
+    crud, mock_session_manager, tmp_path
+):
+    session_manager, mock_session = mock_session_manager
+
+    def run(query, params=None):
+        if query.rstrip().endswith("RETURN r"):
+            return [
+                {"r": {"id": row["id"], "layer_id": row["layer_id"]}}
+                for row in SCALED_OWNERS
+            ]
+        if "RETURN r.id AS id" in query:
+            return records(*SCALED_OWNERS)
+        return [
+            {
+                "source": "vm",
+                "target": target,
+                "original": target == "vm-original",
+                "type": rel_type,
+                "props": {},
+            }
+            for rel_type, target in (
+                ("USES", "nic"),
+                ("USES", "disk"),
+                ("SCAN_SOURCE_NODE", "vm-original"),
+            )
+        ]
+
+    mock_session.run.side_effect = run
+    path = tmp_path / "scaled.json"
+
+    await LayerExportOperations(session_manager, crud).archive_layer(
+        "scaled", str(path)
+    )
+
+    archive = json.loads(path.read_text())
+    assert sorted(node["id"] for node in archive["nodes"]) == ["nic", "vm"]
+    # disk is deleted in "scaled"; the SCAN_SOURCE_NODE link is kept
+    assert [rel["target"] for rel in archive["relationships"]] == [
+        "nic",
+        "vm-original",
+    ]
@@ -0,0 +1,226 @@
+"""
+Tests for the dependency-graph deletion scheduler (Issue #627).
+
+Test Coverage:
+- Deletion DAG from ID containment, resource types and graph relationships
+- Cycle breaking
+- Scheduling without wave barriers
+- Non-blocking long-running operation polling (fake ARM client)
+- Throughput and critical-path reporting
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+from azure.core.exceptions import ResourceNotFoundError
+
+from src.services.deletion_scheduler import (
+    RESOURCE_DEPENDENCIES_QUERY,
+    DeletionGraph,
+    DeletionScheduler,
+)
+from src.services.tenant_reset_service import TenantResetService
+
+RG = "/subscriptions/sub-1/resourceGroups/rg-1"
+RG2 = "/subscriptions/sub-1/resourceGroups/rg-2"
+VM = f"{RG}/providers/Microsoft.Compute/virtualMachines/vm-1"
+NIC = f"{RG}/providers/Microsoft.Network/networkInterfaces/nic-1"
+DISK = f"{RG}/providers/Microsoft.Compute/disks/disk-1"
+VNET = f"{RG2}/providers/Microsoft.Network/virtualNetworks/vnet-1"
+SUBNET = f"{VNET}/subnets/default"
+NSG = f"{RG2}/providers/Microsoft.Network/networkSecurityGroups/nsg-1"
+KV = f"{RG2}/providers/Microsoft.KeyVault/vaults/kv-1"
+
+
+def wave_of(waves, resource_id):
+    return next(i for i, wave in enumerate(waves) if resource_id in wave)
+
+
+class FakePoller:
+    """LROPoller stand-in that completes after a number of polls."""
+
+    def __init__(self, polls, error=None):
+        self.polls = polls
+        self.error = error
+
+    def done(self):
+        self.polls -= 1
+        return self.polls < 0
+
+    def result(self):
+        if self.error:
+            raise self.error
+
+
+class FakeArmClient:
+    """ResourceManagementClient stand-in recording begin_delete_by_id calls."""
+
+    def __init__(self, polls=None, errors=None):
+        self.polls = polls or {}
+        self.errors = errors or {}
+        self.started = []
+        self.resources = Mock()
+        self.resources.begin_delete_by_id = self.begin_delete_by_id
+
+    def begin_delete_by_id(self, resource_id, api_version):
+        self.started.append(resource_id)
+        return FakePoller(
+            self.polls.get(resource_id, 0), error=self.errors.get(resource_id)
+        )
+
+
+class TestDeletionGraph:
+    """Test deletion DAG construction."""
+
+    def test_type_and_containment_order(self):
+        waves = DeletionGraph.from_resources([RG, DISK, VNET, NIC, SUBNET, VM]).levels()
+
+        assert wave_of(waves, VM) < wave_of(waves, NIC) < wave_of(waves, DISK)
+        assert wave_of(waves, DISK) < wave_of(waves, RG)
+        assert wave_of(waves, SUBNET) < wave_of(waves, VNET)
+
+    def test_resource_groups_are_independent(self):
+        graph = DeletionGraph.from_resources([VM, DISK, VNET, NSG])
+
+        # rg-1 and rg-2 chains run side by side
+        assert graph.levels() == [[VM, VNET], [DISK, NSG]]
+        assert graph.critical_path_length() == 2
+
+    def test_graph_dependencies_cross_resource_groups(self):
+        graph = DeletionGraph.from_resources([VM, KV], dependencies=[(VM, KV)])
+
+        assert graph.levels() == [[VM], [KV]]
+
+    def test_dependency_cycles_are_dropped(self):
+        graph = DeletionGraph.from_resources(
+            [VM, NIC, KV], dependencies=[(NIC, KV), (KV, VM)]
+        )
+
+        waves = graph.levels()
+        assert sorted(r for wave in waves for r in wave) == sorted([VM, NIC, KV])
+        assert wave_of(waves, VM) < wave_of(waves, NIC)
+
+    def test_from_waves_chains_waves(self):
+        graph = DeletionGraph.from_waves([[VM, NIC], [DISK], [RG]])
+
+        assert graph.levels() == [[VM, NIC], [DISK], [RG]]
+        assert graph.critical_path_length() == 3
+
+
+class TestDeletionScheduler:
+    """Test scheduling without wave barriers."""
+
+    @pytest.mark.asyncio
+    async def test_starts_deletes_when_predecessors_finish(self):
+        durations = {VM: 0.01, NIC: 0.01, VNET: 0.1}
+        started = {}
+
+        async def delete(resource_id):
+            started[resource_id] = time.perf_counter()
+            await asyncio.sleep(durations[resource_id])
+
+        graph = DeletionGraph.from_resources([VM, NIC, VNET])
+        results = await DeletionScheduler(delete, concurrency=5).run(graph)
+
+        assert sorted(results["deleted"]) == sorted([VM, NIC, VNET])
+        # NIC follows VM without waiting for the slow VNet in the same level
+        assert started[NIC] - started[VNET] < durations[VNET]
+        assert results["stats"]["critical_path_length"] == 2
+        assert results["stats"]["max_in_flight"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_is_reported_and_releases_successors(self):
+        async def delete(resource_id):
+            if resource_id == VM:
+                raise Exception("Resource has delete lock")
+
+        graph = DeletionGraph.from_resources([VM, NIC])
+        results = await DeletionScheduler(delete, concurrency=2).run(graph)
+
+        assert results["failed"] == [VM]
+        assert results["deleted"] == [NIC]
+        assert "delete lock" in results["errors"][VM]
+
+
+class TestServiceDeletion:
+    """Test TenantResetService deletion with a fake ARM client."""
+
+    @pytest.fixture
+    def service(self):
+        return TenantResetService(
+            credential=Mock(),
+            tenant_id="12345678-1234-1234-1234-123456789abc",
+            concurrency=10,
+            poll_interval=0.01,
+        )
+
+    @pytest.mark.asyncio
+    async def test_long_running_deletes_overlap(self, service):
+        resources = [
+            f"{RG}/providers/Microsoft.Storage/storageAccounts/sa{i}" for i in range(10)
+        ]
+        client = FakeArmClient(polls=dict.fromkeys(resources, 10))
+
+        with patch.object(
+            service, "_get_resource_management_client", return_value=client
+        ), patch.object(
+            service, "_fetch_resource_dependencies", AsyncMock(return_value=[])
+        ):
+            start = time.perf_counter()
+            results = await service.delete_resources_by_dependencies(resources)
+            elapsed = time.perf_counter() - start
+
+        assert sorted(results["deleted"]) == sorted(resources)
+        # 10 deletes x 10 polls x 10ms would take ~1s if polled serially
+        assert elapsed < 0.5
+        assert results["stats"]["max_in_flight"] == 10
+        assert results["stats"]["throughput"] > 0
+
+    @pytest.mark.asyncio
+    async def test_uses_graph_dependencies(self, service):
+        client = FakeArmClient(
+            errors={NIC: ResourceNotFoundError("Resource not found")}
+        )
+
+        with patch.object(
+            service, "_get_resource_management_client", return_value=client
+        ), patch.object(
+            service, "_fetch_resource_dependencies", AsyncMock(return_value=[(NIC, KV)])
+        ):
+            results = await service.delete_resources_by_dependencies([KV, VM, NIC])
+
+        assert client.started.index(NIC) < client.started.index(KV)
+        # Already-deleted resources count as deleted
+        assert sorted(results["deleted"]) == sorted([KV, VM, NIC])
+        assert results["stats"]["critical_path_length"] == 3
+
+    @pytest.mark.asyncio
+    async def test_dependencies_read_from_neo4j(self, service):
+        session = MagicMock()
+        session.run.return_value = [{"dependent": NIC, "dependency": KV}]
+        driver = MagicMock()
+        driver.session.return_value.__enter__.return_value = session
+
+        with patch("neo4j.GraphDatabase.driver", return_value=driver) as connect:
+            pairs = await service._fetch_resource_dependencies([KV, NIC])
+
+        assert pairs == [(NIC, KV)]
+        connect.assert_called_once()
+        session.run.assert_called_once_with(RESOURCE_DEPENDENCIES_QUERY, ids=[KV, NIC])
+        driver.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_unavailable_graph_is_logged_and_yields_no_dependencies(
+        self, service, caplog
+    ):
+        with patch(
+            "neo4j.GraphDatabase.driver", side_effect=OSError("connection refused")
+        ), caplog.at_level("WARNING", logger="src.services.tenant_reset_service"):
+            assert await service._fetch_resource_dependencies([KV]) == []
+
+        assert any("connection refused" in r.message for r in caplog.records)
+
+
+pytestmark = pytest.mark.unit
@@ -0,0 +1,221 @@
+"""Tests for batched AAD identity ingestion."""
+
+from types import SimpleNamespace
+from typing import Any, List
+from unittest.mock import MagicMock, patch
+
+from src.services.aad_graph_service import AADGraphService
+from src.services.aad_identity_writer import AADIdentityWriter
+
+
+class RecordingSession:
+    def __init__(self, recorder: "RecordingSessionManager") -> None:
+        self.recorder = recorder
+
+    def __enter__(self) -> "RecordingSession":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def run(self, query: str, **params: Any) -> None:
+        self.recorder.statements.append((" ".join(query.split()), params))
+        if self.recorder.fail_batches and "UNWIND" in query:
+            if len(params["rows"]) > 1 or params["rows"][0] in self.recorder.bad_rows:
+                raise RuntimeError("batch failed")
+
+
+class RecordingSessionManager:
+    def __init__(self, fail_batches: bool = False, bad_rows=()) -> None:
+        self.statements: List[Any] = []
+        self.fail_batches = fail_batches
+        self.bad_rows = list(bad_rows)
+
+    def session(self) -> RecordingSession:
+        return RecordingSession(self)
+
+
+class FixtureAADGraphService(AADGraphService):
+    def __init__(self, users, groups, service_principals, members):
+        self.use_mock = True
+        self.client = None
+        self._users = users
+        self._groups = groups
+        self._sps = service_principals
+        self._members = members
+
+    async def get_users(self):
+        return self._users
+
+    async def get_groups(self):
+        return self._groups
+
+    async def get_service_principals(self):
+        return self._sps
+
+    async def get_group_memberships(self, group_id):
+        return self._members.get(group_id, [])
+
+
+class TestIngestIntoGraph:
+    async def test_writes_identities_in_unwind_batches(self, make_node_manager):
+        users = [{"id": f"u{i}", "displayName": f"User {i}"} for i in range(2500)]
+        groups = [{"id": "g1", "displayName": "Group 1"}, {"id": "g2"}]
+        members = {
+            "g1": [
+                {"id": f"u{i}", "@odata.type": "#microsoft.graph.user"}
+                for i in range(10)
+            ]
+            + [{"id": "g2", "@odata.type": "#microsoft.graph.group"}],
+        }
+        sm = RecordingSessionManager()
+        service = FixtureAADGraphService(users, groups, [{"id": "sp1"}], members)
+
+        await service.ingest_into_graph(make_node_manager(sm))
+
+        user_batches = [p for q, p in sm.statements if "MERGE (n:User" in q]
+        assert [len(p["rows"]) for p in user_batches] == [1000, 1000, 500]
+        assert user_batches[0]["rows"][0]["props"]["displayName"] == "User 0"
+        assert sum(1 for q, _ in sm.statements if "MERGE (n:IdentityGroup" in q) == 1
+        assert sum(1 for q, _ in sm.statements if "MERGE (n:ServicePrincipal" in q) == 1
+
+        edges = {
+            q.split("MATCH (src:")[1].split(" ")[0]: p["rows"]
+            for q, p in sm.statements
+            if "MEMBER_OF" in q
+        }
+        assert len(edges["User"]) == 10
+        assert edges["IdentityGroup"] == [{"src_id": "g2", "tgt_key": "g1"}]
+        # Every node batch is written before the first edge batch
+        kinds = ["MEMBER_OF" in q for q, _ in sm.statements]
+        assert kinds == sorted(kinds)
+
+    async def test_logs_throughput_per_label(self, caplog, make_node_manager):
+        service = FixtureAADGraphService([{"id": "u1"}], [], [], {})
+
+        with caplog.at_level("INFO", logger="src.services.aad_identity_writer"):
+            await service.ingest_into_graph(
+                make_node_manager(RecordingSessionManager())
+            )
+
+        assert any(
+            "AAD ingestion User: 1 rows" in r.message and "rows/sec" in r.message
+            for r in caplog.records
+        )
+
+
+class TestAADIdentityWriter:
+    def test_failed_batch_falls_back_to_row_writes(self, make_node_manager):
+        nm = make_node_manager(RecordingSessionManager(fail_batches=True))
+        writer = AADIdentityWriter(nm, batch_size=10)
+
+        with patch.object(nm, "upsert_generic", return_value=True) as upsert:
+            writer.add_nodes("User", [{"id": f"u{i}"} for i in range(3)])
+            writer.flush()
+
+        assert upsert.call_count == 3
+        assert writer.metrics["User"].rows == 3
+
+    def test_failed_edge_batch_is_retried_per_row_on_identity_labels(
+        self, caplog, make_node_manager
+    ):
+        sm = RecordingSessionManager(
+            fail_batches=True, bad_rows=[{"src_id": "u2", "tgt_key": "g1"}]
+        )
+        writer = AADIdentityWriter(make_node_manager(sm), batch_size=10)
+        for i in range(3):
+            writer.add_member_of("user", f"u{i}", "g1")
+
+        with caplog.at_level("ERROR", logger="src.services.aad_identity_writer"):
+            writer.flush()
+
+        retries = [p["rows"] for q, p in sm.statements if "MEMBER_OF" in q][1:]
+        assert retries == [[{"src_id": f"u{i}", "tgt_key": "g1"}] for i in range(3)]
+        assert all(
+            "MATCH (src:User {id: row.src_id})" in q
+            for q, _ in sm.statements
+            if "MEMBER_OF" in q
+        )
+        assert writer.metrics["MEMBER_OF"].rows == 2
+        assert writer.metrics["MEMBER_OF"].failed == 1
+        assert any("u2->g1" in r.message for r in caplog.records)
+
+    def test_batches_for_any_db_ops_with_batch_methods(self):
+        class BatchOps:
+            def __init__(self) -> None:
+                self.batches: List[Any] = []
+
+            def upsert_generic_batch(self, label, key_prop, rows):
+                self.batches.append((label, len(rows)))
+                return len(rows)
+
+            def create_generic_rels_batch(self, *args, **kwargs):
+                raise AssertionError("no edges buffered")
+
+        ops = BatchOps()
+        writer = AADIdentityWriter(ops, batch_size=10)
+        writer.add_nodes("User", [{"id": f"u{i}"} for i in range(3)])
+        writer.flush()
+        assert ops.batches == [("User", 3)]
+
+        mock_ops = MagicMock()
+        writer = AADIdentityWriter(mock_ops, batch_size=10)
+        writer.add_nodes("User", [{"id": "u1"}])
+        writer.flush()
+        mock_ops.upsert_generic.assert_called_once()
+        mock_ops.upsert_generic_batch.assert_not_called()
+
+    def test_dry_run_counts_without_writing(self, make_node_manager):
+        sm = RecordingSessionManager()
+        writer = AADIdentityWriter(make_node_manager(sm), dry_run=True)
+        writer.add_nodes("User", [{"id": "u1"}, {"displayName": "no id"}])
+        writer.add_member_of("user", "u1", "g1")
+        writer.flush()
+
+        assert sm.statements == []
+        assert writer.metrics["User"].rows == 1
+        assert writer.metrics["MEMBER_OF"].rows == 1
+
+
+class TestPagedListing:
+    async def test_get_users_follows_next_link_page_by_page(self):
+        def page(ids, next_link=None):
+            return SimpleNamespace(
+                value=[
+                    SimpleNamespace(
+                        id=i,
+                        display_name=i.upper(),
+                        user_principal_name=None,
+                        mail=None,
+                    )
+                    for i in ids
+                ],
+                odata_next_link=next_link,
+            )
+
+        pages = {None: page(["a", "b"], "next-1"), "next-1": page(["c"])}
+
+        class FakeUsers:
+            async def get(self, request_configuration=None):
+                return pages[None]
+
+            def with_url(self, url):
+                return SimpleNamespace(get=lambda: _resolve(pages[url]))
+
+        async def _resolve(value):
+            return value
+
+        service = AADGraphService(use_mock=True)
+        service.use_mock = False
+        service.client = SimpleNamespace(users=FakeUsers())  # type: ignore[assignment]
+
+        streamed = [p async for p in service.iter_user_pages()]
+        users = await service.get_users()
+
+        assert [len(p) for p in streamed] == [2, 1]
+        assert users[2] == {
+            "id": "c",
+            "displayName": "C",
+            "userPrincipalName": None,
+            "mail": None,
+        }
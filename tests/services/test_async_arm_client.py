@@ -0,0 +1,273 @@
+"""Tests for the native async ARM discovery backend against a local mock ARM server."""
+
+import time
+from unittest.mock import Mock
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from azure.core.credentials import AccessToken
+
+from src.config_manager import AzureTenantGrapherConfig
+from src.exceptions import AzureDiscoveryError
+from src.services.async_arm_client import AsyncArmClient
+from src.services.azure_discovery_service import AzureDiscoveryService
+
+SUB = "00000000-0000-0000-0000-000000000001"
+VM_PREFIX = f"/subscriptions/{SUB}/resourceGroups/rg1/providers/Microsoft.Compute/virtualMachines"
+
+
+class FakeCredential:
+    """Credential returning a fixed token and counting refreshes."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def get_token(self, *scopes, **kwargs):
+        self.calls += 1
+        return AccessToken("fake-token", int(time.time()) + 3600)
+
+
+class MockArmState:
+    """Mutable behaviour and counters for the mock ARM server."""
+
+    def __init__(self):
+        self.throttle_first_n = 0
+        self.ratelimit_remaining = "11999"
+        self.resource_requests = 0
+        self.provider_requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.auth_headers = set()
+
+
+def build_mock_arm_app(state: MockArmState) -> web.Application:
+    app = web.Application()
+
+    async def provider(request: web.Request) -> web.Response:
+        state.provider_requests += 1
+        return web.json_response(
+            {
+                "namespace": request.match_info["namespace"],
+                "resourceTypes": [
+                    {"resourceType": "virtualMachines", "apiVersions": ["2023-03-01"]}
+                ],
+            }
+        )
+
+    async def resource(request: web.Request) -> web.Response:
+        state.resource_requests += 1
+        state.auth_headers.add(request.headers.get("Authorization"))
+        if state.throttle_first_n > 0:
+            state.throttle_first_n -= 1
+            return web.json_response(
+                {"error": {"code": "TooManyRequests"}},
+                status=429,
+                headers={"Retry-After": "0"},
+            )
+        state.in_flight += 1
+        state.max_in_flight = max(state.max_in_flight, state.in_flight)
+        try:
+            import asyncio
+
+            await asyncio.sleep(0.01)
+        finally:
+            state.in_flight -= 1
+        name = request.match_info["name"]
+        return web.json_response(
+            {
+                "id": f"{VM_PREFIX}/{name}",
+                "name": name,
+                "properties": {
+                    "vmSize": "Standard_D2s_v3",
+                    "apiVersion": request.query.get("api-version"),
+                },
+            },
+            headers={
+                "x-ms-ratelimit-remaining-subscription-reads": state.ratelimit_remaining
+            },
+        )
+
+    async def paged(request: web.Request) -> web.Response:
+        page = int(request.query.get("page", "1"))
+        body = {"value": [{"id": f"item-{page}-{i}"} for i in range(2)]}
+        if page < 3:
+            body["nextLink"] = str(request.url.with_query({"page": str(page + 1)}))
+        return web.json_response(body)
+
+    async def not_found(request: web.Request) -> web.Response:
+        return web.json_response({"error": {"code": "NotFound"}}, status=404)
+
+    app.router.add_get(f"/subscriptions/{SUB}/providers/{{namespace}}", provider)
+    app.router.add_get(f"{VM_PREFIX}/missing", not_found)
+    app.router.add_get(f"{VM_PREFIX}/{{name}}", resource)
+    app.router.add_get("/paged", paged)
+    return app
+
+
+@pytest.fixture
+async def mock_arm():
+    state = MockArmState()
+    server = TestServer(build_mock_arm_app(state))
+    await server.start_server()
+    try:
+        yield state, str(server.make_url("")).rstrip("/")
+    finally:
+        await server.close()
+
+
+class TestAsyncArmClient:
+    async def test_get_resource_by_id(self, mock_arm):
+        state, endpoint = mock_arm
+        async with AsyncArmClient(FakeCredential(), endpoint=endpoint) as client:
+            result = await client.get_resource_by_id(f"{VM_PREFIX}/vm1", "2023-03-01")
+
+        assert result["properties"]["vmSize"] == "Standard_D2s_v3"
+        assert result["properties"]["apiVersion"] == "2023-03-01"
+        assert state.auth_headers == {"Bearer fake-token"}
+
+    async def test_token_is_cached_across_requests(self, mock_arm):
+        _, endpoint = mock_arm
+        credential = FakeCredential()
+        async with AsyncArmClient(credential, endpoint=endpoint) as client:
+            for i in range(5):
+                await client.get_resource_by_id(f"{VM_PREFIX}/vm{i}", "2023-03-01")
+
+        assert credential.calls == 1
+
+    async def test_retries_after_429_using_retry_after(self, mock_arm):
+        state, endpoint = mock_arm
+        state.throttle_first_n = 2
+        async with AsyncArmClient(
+            FakeCredential(), endpoint=endpoint, max_retries=3
+        ) as client:
+            result = await client.get_resource_by_id(f"{VM_PREFIX}/vm1", "2023-03-01")
+            stats = client.get_stats()
+
+        assert result["name"] == "vm1"
+        assert stats["throttled"] == 2
+        assert stats["retries"] == 2
+        assert state.resource_requests == 3
+
+    async def test_raises_after_retries_exhausted(self, mock_arm):
+        state, endpoint = mock_arm
+        state.throttle_first_n = 10
+        async with AsyncArmClient(
+            FakeCredential(), endpoint=endpoint, max_retries=1
+        ) as client:
+            with pytest.raises(AzureDiscoveryError):
+                await client.get_resource_by_id(f"{VM_PREFIX}/vm1", "2023-03-01")
+
+        assert state.resource_requests == 2
+
+    async def test_non_retryable_error_is_not_retried(self, mock_arm):
+        _, endpoint = mock_arm
+        async with AsyncArmClient(FakeCredential(), endpoint=endpoint) as client:
+            with pytest.raises(AzureDiscoveryError):
+                await client.get_resource_by_id(f"{VM_PREFIX}/missing", "2023-03-01")
+            assert client.get_stats()["retries"] == 0
+
+    async def test_per_host_concurrency_limit(self, mock_arm):
+        import asyncio
+
+        state, endpoint = mock_arm
+        async with AsyncArmClient(
+            FakeCredential(), endpoint=endpoint, per_host_concurrency=3
+        ) as client:
+            await asyncio.gather(
+                *[
+                    client.get_resource_by_id(f"{VM_PREFIX}/vm{i}", "2023-03-01")
+                    for i in range(20)
+                ]
+            )
+
+        assert state.max_in_flight <= 3
+
+    async def test_low_ratelimit_remaining_paces_host(self, mock_arm):
+        state, endpoint = mock_arm
+        state.ratelimit_remaining = "0"
+        async with AsyncArmClient(
+            FakeCredential(),
+            endpoint=endpoint,
+            base_backoff=0.05,
+            ratelimit_low_watermark=10,
+        ) as client:
+            await client.get_resource_by_id(f"{VM_PREFIX}/vm1", "2023-03-01")
+            host_state = next(iter(client._hosts.values()))
+
+        assert host_state.resume_at > 0
+
+    async def test_list_paged_follows_next_link(self, mock_arm):
+        _, endpoint = mock_arm
+        async with AsyncArmClient(FakeCredential(), endpoint=endpoint) as client:
+            items = [item async for item in client.list_paged("/paged")]
+
+        assert len(items) == 6
+        assert items[-1]["id"] == "item-3-1"
+
+
+class TestAsyncDiscoveryBackend:
+    @pytest.fixture
+    def async_config(self, mock_arm):
+        _, endpoint = mock_arm
+        config = Mock(spec=AzureTenantGrapherConfig)
+        config.tenant_id = "test-tenant-id"
+        config.processing = Mock()
+        config.processing.max_retries = 3
+        config.processing.max_build_threads = 5
+        config.processing.discovery_backend = "aiohttp"
+        config.processing.arm_endpoint = endpoint
+        config.processing.arm_max_connections = 10
+        config.processing.arm_per_host_concurrency = 5
+        return config
+
+    async def test_hydrates_properties_through_shared_pool(
+        self, mock_arm, async_config
+    ):
+        state, _ = mock_arm
+        service = AzureDiscoveryService(
+            config=async_config, credential=FakeCredential()
+        )
+        resources = [
+            {
+                "id": f"{VM_PREFIX}/vm{i}",
+                "name": f"vm{i}",
+                "type": "Microsoft.Compute/virtualMachines",
+                "properties": {},
+            }
+            for i in range(25)
+        ]
+        resources.append(
+            {
+                "id": f"/subscriptions/{SUB}/providers/Microsoft.Authorization/roleAssignments/ra1",
+                "type": "Microsoft.Authorization/roleAssignments",
+                "properties": {"principalId": "p1"},
+            }
+        )
+
+        result = await service._fetch_resources_with_properties_async(resources, SUB)
+
+        assert len(result) == 26
+        assert all(r["properties"] for r in result)
+        assert result[0]["properties"]["apiVersion"] == "2023-03-01"
+        # Role assignments skip hydration; provider is looked up once for all VMs
+        assert state.resource_requests == 25
+        assert state.provider_requests == 1
+        assert state.max_in_flight <= 5
+
+    async def test_failed_fetch_keeps_resource(self, mock_arm, async_config):
+        service = AzureDiscoveryService(
+            config=async_config, credential=FakeCredential()
+        )
+        resources = [
+            {
+                "id": f"{VM_PREFIX}/missing",
+                "name": "missing",
+                "type": "Microsoft.Compute/virtualMachines",
+                "properties": {},
+            }
+        ]
+
+        result = await service._fetch_resources_with_properties_async(resources, SUB)
+
+        assert result == resources
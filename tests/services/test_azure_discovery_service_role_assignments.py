@@ -7,12 +7,13 @@ Accounts, etc.) using AuthorizationManagementClient.list_for_resource().
 """
 
 import asyncio
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from src.config_manager import AzureTenantGrapherConfig
 from src.services.azure_discovery_service import AzureDiscoveryService
+from src.services.discovery_budget import DiscoveryBudget
 
 
 class MockRoleAssignment:
@@ -470,3 +471,46 @@ def test_discover_resource_scoped_role_assignments_preserves_scan_metadata(
     assert len(result) == 1
     assert result[0]["scan_id"] == "critical-scan-id"
     assert result[0]["tenant_id"] == "critical-tenant-id"
+
+
+def test_resource_scoped_role_assignments_take_a_budget_token_per_call(
+    mock_config, mock_credential, mock_authorization_client
+):
+    """Under a budget each list_for_resource call holds its own token."""
+    subscription_id = "test-subscription-id"
+    resources = [
+        {
+            "id": f"/subscriptions/{subscription_id}/resourceGroups/rg/providers/Microsoft.KeyVault/vaults/kv{i}",
+            "name": f"kv{i}",
+            "type": "Microsoft.KeyVault/vaults",
+            "resource_group": "rg",
+        }
+        for i in range(3)
+    ]
+    mock_authorization_client.role_assignments.list_for_resource.return_value = []
+
+    service = AzureDiscoveryService(
+        mock_config,
+        mock_credential,
+        authorization_client_factory=lambda credential, sub_id: (
+            mock_authorization_client
+        ),
+    )
+    budget = DiscoveryBudget(1)
+    run_blocking = budget.run_blocking
+    budget.run_blocking = AsyncMock(side_effect=run_blocking)  # type: ignore[method-assign]
+    service.budget = budget
+
+    assert (
+        asyncio.run(
+            service.discover_resource_scoped_role_assignments(
+                subscription_id, resources
+            )
+        )
+        == []
+    )
+    assert mock_authorization_client.role_assignments.list_for_resource.call_count == 3
+    assert budget.run_blocking.await_count == 3
+    timing = budget.timing_for(subscription_id)
+    assert set(timing.phase_seconds) == {"role_assignments"}
+    assert budget.in_use == 0
@@ -0,0 +1,197 @@
+"""Tests for the columnar cost store and the vectorized cost analytics."""
+
+import statistics
+from datetime import date, timedelta
+
+import pytest
+
+from src.models.cost_models import CostData, SeverityLevel
+from src.services.cost.anomaly_detection import AnomalyDetector
+from src.services.cost.columnar import ColumnarCostStore, CostSeries
+from src.services.cost.forecasting import CostForecaster
+from src.services.cost.query import CostQueryService
+
+SUB = "sub-1"
+RG_PREFIX = f"/subscriptions/{SUB}/resourceGroups/rg"
+
+
+def _cost(resource: str, day: date, amount: float, **overrides) -> CostData:
+    fields = {
+        "resource_id": f"{RG_PREFIX}/providers/x/{resource}",
+        "date": day,
+        "actual_cost": amount,
+        "amortized_cost": amount,
+        "usage_quantity": 1.0,
+        "currency": "USD",
+        "service_name": "Compute",
+        "meter_category": "VM",
+        "meter_name": "D2",
+        "tags": {"team": "a"},
+        "subscription_id": SUB,
+        "resource_group": "rg",
+    }
+    fields.update(overrides)
+    return CostData(**fields)
+
+
+def _reference_anomalies(costs_by_resource, sensitivity):
+    """The original pure-Python z-score loop."""
+    found = []
+    for resource_id, daily_costs in costs_by_resource.items():
+        if len(daily_costs) < AnomalyDetector.MIN_LOOKBACK_DAYS:
+            continue
+        costs = [c for _, c in daily_costs]
+        mean, std = statistics.mean(costs), statistics.stdev(costs)
+        if std == 0:
+            continue
+        for day, cost in daily_costs:
+            if abs((cost - mean) / std) > sensitivity:
+                found.append((resource_id, day))
+    return found
+
+
+class TestColumnarCostStore:
+    def test_append_spans_months_and_last_write_wins(self, tmp_path):
+        store = ColumnarCostStore(tmp_path)
+        start = date(2026, 1, 30)
+        store.append([_cost("vm1", start + timedelta(days=i), 1.0) for i in range(4)])
+        store.append([_cost("vm1", start, 5.0, tags={"team": "b"})])
+
+        assert store.months() == ["2026-01", "2026-02"]
+        frame = store.load()
+        assert len(frame) == 4
+        assert sorted(frame.actual_cost.tolist()) == [1.0, 1.0, 1.0, 5.0]
+        january = store.load(end_date=date(2026, 1, 31))
+        assert january.resources[0]["tags"] == {"team": "b"}
+
+    def test_load_filters_scope_and_dates(self, tmp_path):
+        store = ColumnarCostStore(tmp_path)
+        day = date(2026, 3, 1)
+        store.append(
+            [
+                _cost("vm1", day, 1.0),
+                _cost("vm1", day + timedelta(days=1), 2.0),
+                _cost("other", day, 9.0, subscription_id="sub-2"),
+            ]
+        )
+        scoped = store.load(f"/subscriptions/{SUB}", day, day)
+        assert scoped.actual_cost.tolist() == [1.0]
+        totals = store.daily_totals(f"/subscriptions/{SUB}", day, day + timedelta(1))
+        assert totals == [
+            (day, 1.0),
+            (day + timedelta(days=1), 2.0),
+        ]
+
+    def test_monthly_totals(self, tmp_path):
+        store = ColumnarCostStore(tmp_path)
+        store.append([_cost("vm1", date(2026, 4, d), 2.0) for d in range(1, 11)])
+        [total] = store.monthly_totals(["2026-04"])
+        assert total["month"] == "2026-04"
+        assert total["days"] == 10
+        assert total["actual_cost"] == pytest.approx(20.0)
+
+    def test_series_round_trip(self, tmp_path):
+        store = ColumnarCostStore(tmp_path)
+        days = [date(2026, 5, 1) + timedelta(days=i) for i in range(3)]
+        store.append([_cost("vm1", d, float(i)) for i, d in enumerate(days)])
+        store.append([_cost("vm2", days[2], 7.0)])
+        mapping = store.series(RG_PREFIX, days[0], days[-1]).to_mapping()
+        assert mapping[f"{RG_PREFIX}/providers/x/vm1"] == list(
+            zip(days, [0.0, 1.0, 2.0])
+        )
+        assert mapping[f"{RG_PREFIX}/providers/x/vm2"] == [(days[2], 7.0)]
+
+
+class TestColumnarQuery:
+    async def test_query_costs_and_allocation_use_store(self, tmp_path):
+        store = ColumnarCostStore(tmp_path)
+        day = date(2026, 6, 1)
+        store.append(
+            [
+                _cost("vm1", day, 3.0),
+                _cost("db1", day, 5.0, service_name="SQL", tags={}),
+            ]
+        )
+        service = CostQueryService(neo4j_driver=None, columnar_store=store)
+
+        summary = await service.query_costs(
+            f"/subscriptions/{SUB}", day, day, group_by="service_name"
+        )
+        assert summary.total_cost == pytest.approx(8.0)
+        assert summary.resource_count == 2
+        assert summary.service_breakdown == {"SQL": 5.0, "Compute": 3.0}
+
+        allocation = await service.allocate_by_tags("team", day, day)
+        assert allocation == {"untagged": 5.0, "a": 3.0}
+
+
+class TestVectorizedAnomalyDetection:
+    def _costs(self):
+        start = date(2026, 1, 1)
+        spiky = [10.0] * 20
+        spiky[12] = 80.0
+        spiky[3] = 11.0
+        return {
+            "spiky": [(start + timedelta(days=i), c) for i, c in enumerate(spiky)],
+            "flat": [(start + timedelta(days=i), 0.1) for i in range(15)],
+            "short": [(start, 1.0), (start + timedelta(days=1), 100.0)],
+            "drift": [(start + timedelta(days=i), 1.0 + i * i) for i in range(9)],
+        }
+
+    def test_matches_reference_loop(self):
+        costs = self._costs()
+        anomalies = AnomalyDetector().detect_anomalies(costs, sensitivity=2.0)
+        assert [(a.resource_id, a.date) for a in anomalies] == _reference_anomalies(
+            costs, 2.0
+        )
+        spike = anomalies[0]
+        assert spike.actual_cost == 80.0
+        assert spike.expected_cost == pytest.approx(
+            statistics.mean(c for _, c in costs["spiky"])
+        )
+        assert spike.severity == SeverityLevel.CRITICAL
+
+    def test_accepts_cost_series(self):
+        costs = self._costs()
+        detector = AnomalyDetector()
+        assert detector.detect_anomalies(
+            CostSeries.from_mapping(costs)
+        ) == detector.detect_anomalies(costs)
+
+    def test_rolling_window(self):
+        start = date(2026, 1, 1)
+        values = [10.0, 11.0, 10.0, 9.0, 10.0, 50.0, 10.0, 10.0, 10.0, 10.0]
+        costs = {
+            "r": [(start + timedelta(days=i), c) for i, c in enumerate(values)],
+            "flat": [(start + timedelta(days=i), 3.0) for i in range(10)],
+        }
+        anomalies = AnomalyDetector().detect_anomalies_with_window(costs, window_size=5)
+        assert [(a.resource_id, a.date) for a in anomalies] == [
+            ("r", start + timedelta(days=5))
+        ]
+        assert anomalies[0].expected_cost == pytest.approx(10.0)
+
+
+class TestBatchedForecasting:
+    def test_batch_matches_single_series(self):
+        start = date(2026, 1, 1)
+        costs = {
+            "a": [
+                (start + timedelta(days=i), 5.0 + 0.5 * i + (i % 3)) for i in range(20)
+            ],
+            "b": [(start + timedelta(days=i), 100.0 - i) for i in range(30)],
+            "too_short": [(start + timedelta(days=i), 1.0) for i in range(5)],
+        }
+        forecaster = CostForecaster()
+        batch = forecaster.generate_forecasts_batch(
+            CostSeries.from_mapping(costs), forecast_days=3
+        )
+
+        assert set(batch) == {"a", "b"}
+        slope, intercept = forecaster.calculate_trend(costs["a"])
+        first = batch["a"][0]
+        assert first.forecast_date == start + timedelta(days=20)
+        assert first.predicted_cost == pytest.approx(slope * 20 + intercept)
+        assert batch["b"][2].predicted_cost == pytest.approx(100.0 - 32)
+        assert batch["b"][2].confidence_range == pytest.approx(0.0, abs=1e-9)
+        assert forecaster.generate_forecasts(costs["a"], 3, "a") == batch["a"]
@@ -0,0 +1,213 @@
+"""Tests for the persistent LLM description cache and bulk skip-check."""
+
+import asyncio
+import json
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+from src.services.resource_processing import (
+    DescriptionCache,
+    ResourceStream,
+    description_fingerprint,
+)
+from src.services.resource_processing.processor import ResourceProcessor
+
+
+class RecordingSession:
+    def __init__(self, graph: dict[str, dict[str, Any]], queries: list[str]):
+        self.graph = graph
+        self.queries = queries
+
+    def __enter__(self) -> "RecordingSession":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def run(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        self.queries.append(query)
+        result = MagicMock()
+        rows = []
+        if "UNWIND $ids" in query:
+            rows = [
+                {"id": rid, **self.graph[rid]}
+                for rid in kwargs["ids"]
+                if rid in self.graph
+            ]
+        result.__iter__.return_value = iter(rows)
+        result.single.return_value = None
+        return result
+
+
+class RecordingSessionManager:
+    """Session manager over a fake graph of resource ID -> node state."""
+
+    def __init__(self, graph: dict[str, dict[str, Any]]):
+        self.graph = graph
+        self.queries: list[str] = []
+
+    def session(self) -> RecordingSession:
+        return RecordingSession(self.graph, self.queries)
+
+    def per_resource_queries(self) -> list[str]:
+        return [
+            q
+            for q in self.queries
+            if "count(r) as count" in q
+            or "keys(r)" in q
+            or "RETURN r.llm_description" in q
+        ]
+
+
+def make_generator() -> Mock:
+    generator = Mock()
+    generator.generate_resource_description = AsyncMock(
+        side_effect=lambda r: f"Storage account {r['name']} with {r['sku']['name']}."
+    )
+    return generator
+
+
+def graph_after(resources: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Node state a completed scan leaves behind."""
+    return {
+        r["id"]: {
+            "llm_description": r["llm_description"],
+            "llm_description_hash": r.get("llm_description_hash"),
+            "processing_status": "completed",
+        }
+        for r in resources
+    }
+
+
+def make_processor(session_manager, generator, cache_path) -> ResourceProcessor:
+    processor = ResourceProcessor(session_manager, generator)
+    processor.enable_description_cache(str(cache_path))
+    processor.db_ops.upsert_resource = Mock(return_value=True)  # type: ignore[method-assign]
+    return processor
+
+
+async def scan(session_manager, generator, cache_path, resources) -> ResourceProcessor:
+    processor = make_processor(session_manager, generator, cache_path)
+    await processor.process_resources(resources, max_workers=2)
+    return processor
+
+
+class TestDescriptionFingerprint:
+    def test_ignores_volatile_properties_and_encoding(self, make_resource):
+        resource = make_resource(1)
+        touched = make_resource(1)
+        touched["properties"] = json.dumps(
+            {"accessTier": "Hot", "provisioningState": "Updating", "etag": "x"}
+        )
+        touched["id"] = "/elsewhere"
+        assert description_fingerprint(resource) == description_fingerprint(touched)
+
+    def test_changes_with_prompt_fields(self, make_resource):
+        assert description_fingerprint(make_resource(1)) != description_fingerprint(
+            make_resource(1, sku={"name": "Premium_LRS"})
+        )
+
+
+class TestDescriptionCache:
+    def test_round_trip_persists(self, tmp_path):
+        path = tmp_path / "cache" / "descriptions.sqlite"
+        cache = DescriptionCache(path)
+        cache.put_many((f"fp{i}", "T", f"desc {i}") for i in range(1200))
+        cache.put("fp0", "replaced", "T")
+        cache.close()
+
+        reopened = DescriptionCache(path)
+        assert len(reopened) == 1200
+        found = reopened.get_many(f"fp{i}" for i in range(0, 1300, 100))
+        assert len(found) == 12
+        assert found["fp0"] == "replaced"
+        assert reopened.get("missing") is None
+
+
+class TestBulkSkipCheck:
+    async def test_unchanged_rescan_makes_no_llm_calls(self, tmp_path, make_resource):
+        cache_path = tmp_path / "descriptions.sqlite"
+        resources = [make_resource(i) for i in range(3)]
+        first = RecordingSessionManager({})
+        generator = make_generator()
+
+        processor = await scan(first, generator, cache_path, resources)
+        assert generator.generate_resource_description.await_count == 3
+        assert processor.stats.llm_generated == 3
+        assert all(r["llm_description_hash"] for r in resources)
+        assert first.per_resource_queries() == []
+
+        rescan = RecordingSessionManager(graph_after(resources))
+        generator = make_generator()
+        processor = await scan(
+            rescan, generator, cache_path, [make_resource(i) for i in range(3)]
+        )
+        generator.generate_resource_description.assert_not_awaited()
+        assert processor.stats.skipped == 3
+        assert rescan.per_resource_queries() == []
+        assert sum("UNWIND $ids" in q for q in rescan.queries) == 1
+
+    async def test_cache_survives_graph_reset(self, tmp_path, make_resource):
+        cache_path = tmp_path / "descriptions.sqlite"
+        await scan(
+            RecordingSessionManager({}),
+            make_generator(),
+            cache_path,
+            [make_resource(i) for i in range(2)],
+        )
+
+        generator = make_generator()
+        resources = [make_resource(0), make_resource(1, sku={"name": "Premium_LRS"})]
+        processor = await scan(
+            RecordingSessionManager({}), generator, cache_path, resources
+        )
+        assert generator.generate_resource_description.await_count == 1
+        assert processor.stats.llm_generated == 1
+        assert processor.stats.llm_skipped == 1
+        assert (
+            resources[0]["llm_description"] == "Storage account sa0 with Standard_LRS."
+        )
+
+    async def test_adopts_graph_descriptions_without_fingerprint(
+        self, tmp_path, make_resource
+    ):
+        resources = [make_resource(0)]
+        graph = {
+            resources[0]["id"]: {
+                "llm_description": "Hand-written description.",
+                "llm_description_hash": None,
+                "processing_status": "completed",
+            }
+        }
+        generator = make_generator()
+        cache_path = tmp_path / "descriptions.sqlite"
+        await scan(RecordingSessionManager(graph), generator, cache_path, resources)
+
+        generator.generate_resource_description.assert_not_awaited()
+        assert DescriptionCache(cache_path).get(
+            description_fingerprint(resources[0])
+        ) == ("Hand-written description.")
+
+    async def test_stream_batches_are_prefetched(self, tmp_path, make_resource):
+        cache_path = tmp_path / "descriptions.sqlite"
+        resources = [make_resource(i) for i in range(4)]
+        await scan(RecordingSessionManager({}), make_generator(), cache_path, resources)
+
+        session_manager = RecordingSessionManager(graph_after(resources))
+        generator = make_generator()
+        processor = make_processor(session_manager, generator, cache_path)
+        stream = ResourceStream(max_depth=2)
+        stream.add_batch_hook(processor.prefetch_resource_state)
+
+        async def produce() -> None:
+            await stream.put_many(make_resource(i) for i in range(2))
+            await stream.put_many(make_resource(i) for i in range(2, 4))
+            await stream.close()
+
+        _, stats = await asyncio.gather(
+            produce(), processor.process_resource_stream(stream, max_workers=2)
+        )
+        generator.generate_resource_description.assert_not_awaited()
+        assert stats.skipped == 4
+        assert session_manager.per_resource_queries() == []
+        assert sum("UNWIND $ids" in q for q in session_manager.queries) == 2
@@ -0,0 +1,154 @@
+"""Tests for the shared discovery budget and concurrent subscription discovery."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+
+from src.azure_tenant_grapher import AzureTenantGrapher
+from src.config_manager import AzureTenantGrapherConfig
+from src.services.discovery_budget import DiscoveryBudget
+
+
+class TestDiscoveryBudget:
+    async def test_limits_total_in_flight(self):
+        budget = DiscoveryBudget(3)
+        in_flight = 0
+        peak = 0
+
+        async def work(sub):
+            nonlocal in_flight, peak
+            async with budget.acquire(sub, "listing"):
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        await asyncio.gather(*[work(f"sub{i % 2}") for i in range(12)])
+
+        assert peak == 3
+        assert budget.in_use == 0
+
+    async def test_large_subscription_cannot_starve_others(self):
+        budget = DiscoveryBudget(4)
+        big_holding = 0
+        big_peak_while_small_waiting = 0
+        small_pending = 0
+
+        async def big_request():
+            nonlocal big_holding, big_peak_while_small_waiting
+            async with budget.acquire("big", "properties"):
+                big_holding += 1
+                if small_pending:
+                    big_peak_while_small_waiting = max(
+                        big_peak_while_small_waiting, big_holding
+                    )
+                await asyncio.sleep(0.01)
+                big_holding -= 1
+
+        async def small_request():
+            nonlocal small_pending
+            small_pending += 1
+            async with budget.acquire("small", "listing"):
+                await asyncio.sleep(0.01)
+            small_pending -= 1
+
+        big = [asyncio.create_task(big_request()) for _ in range(40)]
+        await asyncio.sleep(0.005)
+        small = [asyncio.create_task(small_request()) for _ in range(4)]
+        start = time.perf_counter()
+        await asyncio.gather(*small)
+        small_elapsed = time.perf_counter() - start
+        await asyncio.gather(*big)
+
+        # Once the small subscription is waiting, the big one is held to half
+        assert big_peak_while_small_waiting <= 2
+        # Small subscription finishes long before the big backlog drains
+        assert small_elapsed < 0.08
+
+    async def test_records_phase_and_wait_timings(self):
+        budget = DiscoveryBudget(1)
+
+        def blocking_call(value):
+            time.sleep(0.01)
+            return value * 2
+
+        results = await asyncio.gather(
+            budget.run_blocking("sub1", "listing", blocking_call, 1),
+            budget.run_blocking("sub1", "diagnostics", blocking_call, 2),
+        )
+
+        assert results == [2, 4]
+        timing = budget.timing_for("sub1")
+        assert set(timing.phase_seconds) == {"listing", "diagnostics"}
+        assert all(v >= 0.01 for v in timing.phase_seconds.values())
+        assert sum(timing.wait_seconds.values()) >= 0.005
+
+
+class TestConcurrentBuildGraph:
+    @pytest.fixture
+    def mock_config(self) -> Mock:
+        config = Mock(spec=AzureTenantGrapherConfig)
+        config.tenant_id = "test-tenant-id"
+        processing_config = Mock()
+        processing_config.auto_start_container = False
+        processing_config.resource_limit = None
+        processing_config.enable_aad_import = False
+        processing_config.subscription_concurrency = 4
+        processing_config.arm_request_budget = 8
+        config.processing = processing_config
+        config.neo4j = Mock()
+        config.azure_openai = Mock()
+        config.azure_openai.is_configured.return_value = False
+        config.log_configuration_summary = Mock()
+        config.specification = Mock()
+        return config
+
+    async def test_subscriptions_discovered_concurrently_with_timings(
+        self, mock_config
+    ):
+        subscriptions = [
+            {"id": f"sub{i}", "display_name": f"Subscription {i}"} for i in range(6)
+        ]
+        in_flight = 0
+        peak = 0
+
+        async def discover(subscription_id, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            if subscription_id == "sub3":
+                raise RuntimeError("boom")
+            return [{"id": f"/subscriptions/{subscription_id}/r1"}]
+
+        with patch("src.utils.session_manager.Neo4jSessionManager"), patch(
+            "src.services.resource_processing_service.ResourceProcessingService"
+        ) as MockProcessing:
+            stats = MagicMock()
+            stats.to_dict.return_value = {"total_resources": 5}
+            MockProcessing.return_value.process_resources = AsyncMock(
+                return_value=stats
+            )
+            grapher = AzureTenantGrapher(mock_config)
+            grapher.discovery_service.discover_subscriptions = AsyncMock(
+                return_value=subscriptions
+            )
+            grapher.discovery_service.discover_resources_in_subscription = discover
+
+            result = await grapher.build_graph()
+
+        assert result["success"] is True
+        assert peak == 4
+        processed = MockProcessing.return_value.process_resources.call_args[0][0]
+        assert [r["id"] for r in processed] == [
+            f"/subscriptions/sub{i}/r1" for i in range(6) if i != 3
+        ]
+        timings = {t["subscription_id"]: t for t in result["subscription_timings"]}
+        assert set(timings) == {f"sub{i}" for i in range(6)}
+        assert timings["sub3"]["error"] == "boom"
+        assert timings["sub0"]["resource_count"] == 1
+        assert timings["sub0"]["wall_seconds"] > 0
+        assert grapher.discovery_service.budget is None
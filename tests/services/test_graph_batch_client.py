@@ -0,0 +1,284 @@
+"""Tests for bulk AAD identity lookups against a local stub of the Graph $batch endpoint."""
+
+import asyncio
+import re
+import time
+from unittest.mock import Mock
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from azure.core.credentials import AccessToken
+
+from src.exceptions import AzureDiscoveryError
+from src.services.aad_graph_service import AADGraphService
+from src.services.graph_batch_client import (
+    MAX_BATCH_REQUESTS,
+    MAX_FILTER_IDS,
+    GraphBatchClient,
+)
+
+FILTER_RE = re.compile(r"^/(\w+)\?\$filter=id in \(([^)]*)\)&\$select=(.*)$")
+
+USERS, GROUPS, SERVICE_PRINCIPALS, MISSING = 1, 2, 3, 9
+
+
+def oid(kind: int, n: int) -> str:
+    """Directory object ID (a GUID) for test object n of a kind."""
+    return f"{kind:08d}-0000-0000-0000-{n:012d}"
+
+
+class FakeCredential:
+    def __init__(self):
+        self.calls = 0
+
+    def get_token(self, *scopes, **kwargs):
+        self.calls += 1
+        return AccessToken("fake-token", int(time.time()) + 3600)
+
+
+class StubGraphState:
+    """Directory contents, injected failures and counters for the stub Graph server."""
+
+    def __init__(self):
+        self.directory = {
+            "users": {
+                oid(USERS, i): {
+                    "id": oid(USERS, i),
+                    "displayName": f"User {i}",
+                    "userPrincipalName": f"u{i}@contoso.com",
+                    "mail": None,
+                }
+                for i in range(1000)
+            },
+            "groups": {
+                oid(GROUPS, 1): {
+                    "id": oid(GROUPS, 1),
+                    "displayName": "Group 1",
+                    "description": "d",
+                }
+            },
+            "servicePrincipals": {
+                oid(SERVICE_PRINCIPALS, 1): {
+                    "id": oid(SERVICE_PRINCIPALS, 1),
+                    "displayName": "App",
+                    "appId": "a1",
+                }
+            },
+        }
+        self.throttle_batches = 0
+        # Batches containing this ID fail with HTTP 400
+        self.poison_id = None
+        self.throttle_sub_requests = 0
+        self.forbidden_collections = set()
+        self.batch_requests = 0
+        self.sub_requests = 0
+        self.max_sub_requests_per_batch = 0
+        self.max_ids_per_filter = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+
+def build_stub_graph_app(state: StubGraphState) -> web.Application:
+    app = web.Application()
+
+    def handle_sub_request(sub):
+        match = FILTER_RE.match(sub["url"])
+        assert match, sub["url"]
+        collection, id_list, select = match.groups()
+        ids = [i.strip("'") for i in id_list.split(",")]
+        state.max_ids_per_filter = max(state.max_ids_per_filter, len(ids))
+        if collection in state.forbidden_collections:
+            return {
+                "id": sub["id"],
+                "status": 403,
+                "body": {"error": {"message": "Insufficient privileges"}},
+            }
+        if state.throttle_sub_requests > 0:
+            state.throttle_sub_requests -= 1
+            return {"id": sub["id"], "status": 429, "headers": {"Retry-After": "0"}}
+        fields = select.split(",")
+        found = [
+            {k: v for k, v in obj.items() if k in fields}
+            for i in ids
+            if (obj := state.directory[collection].get(i))
+        ]
+        return {"id": sub["id"], "status": 200, "body": {"value": found}}
+
+    async def batch(request: web.Request) -> web.Response:
+        state.batch_requests += 1
+        assert request.headers["Authorization"] == "Bearer fake-token"
+        if state.throttle_batches > 0:
+            state.throttle_batches -= 1
+            return web.json_response(
+                {"error": {"code": "TooManyRequests"}},
+                status=429,
+                headers={"Retry-After": "0"},
+            )
+        body = await request.json()
+        if state.poison_id and any(
+            state.poison_id in sub["url"] for sub in body["requests"]
+        ):
+            return web.json_response(
+                {"error": {"code": "BadRequest"}},
+                status=400,
+            )
+        state.sub_requests += len(body["requests"])
+        state.max_sub_requests_per_batch = max(
+            state.max_sub_requests_per_batch, len(body["requests"])
+        )
+        state.in_flight += 1
+        state.max_in_flight = max(state.max_in_flight, state.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            state.in_flight -= 1
+        # Sub-responses may come back in any order
+        responses = [handle_sub_request(sub) for sub in reversed(body["requests"])]
+        return web.json_response({"responses": responses})
+
+    app.router.add_post("/v1.0/$batch", batch)
+    return app
+
+
+@pytest.fixture
+async def stub_graph():
+    state = StubGraphState()
+    server = TestServer(build_stub_graph_app(state))
+    await server.start_server()
+    try:
+        yield state, str(server.make_url("")).rstrip("/")
+    finally:
+        await server.close()
+
+
+class TestGraphBatchClient:
+    async def test_packs_ids_into_filtered_batches(self, stub_graph):
+        state, endpoint = stub_graph
+        ids = {oid(USERS, i) for i in range(1000)} | {oid(MISSING, 1), oid(MISSING, 2)}
+
+        async with GraphBatchClient(
+            FakeCredential(), endpoint=endpoint, max_concurrent_batches=2
+        ) as client:
+            users = await client.get_by_ids(
+                "users", ids, ["id", "displayName", "userPrincipalName"]
+            )
+
+        assert len(users) == 1000
+        assert {u["id"] for u in users} == {oid(USERS, i) for i in range(1000)}
+        sub_requests = -(-len(ids) // MAX_FILTER_IDS)
+        assert state.sub_requests == sub_requests
+        assert state.batch_requests == -(-sub_requests // MAX_BATCH_REQUESTS)
+        assert state.max_sub_requests_per_batch == MAX_BATCH_REQUESTS
+        assert state.max_ids_per_filter == MAX_FILTER_IDS
+        assert state.max_in_flight <= 2
+
+    async def test_retries_throttled_batch_using_retry_after(self, stub_graph):
+        state, endpoint = stub_graph
+        state.throttle_batches = 2
+
+        async with GraphBatchClient(FakeCredential(), endpoint=endpoint) as client:
+            users = await client.get_by_ids(
+                "users", {oid(USERS, 1), oid(USERS, 2)}, ["id"]
+            )
+            stats = client.get_stats()
+
+        assert len(users) == 2
+        assert stats["throttled"] == 2
+        assert state.batch_requests == 3
+
+    async def test_retries_only_throttled_sub_requests(self, stub_graph):
+        state, endpoint = stub_graph
+        state.throttle_sub_requests = 1
+
+        async with GraphBatchClient(FakeCredential(), endpoint=endpoint) as client:
+            users = await client.get_by_ids(
+                "users", {oid(USERS, i) for i in range(45)}, ["id"]
+            )
+
+        assert len(users) == 45
+        # Three filter queries, then a follow-up batch with just the throttled one
+        assert state.batch_requests == 2
+        assert state.sub_requests == 4
+
+    async def test_sub_request_errors_are_skipped(self, stub_graph):
+        state, endpoint = stub_graph
+        state.forbidden_collections.add("groups")
+
+        async with GraphBatchClient(FakeCredential(), endpoint=endpoint) as client:
+            groups = await client.get_by_ids("groups", {oid(GROUPS, 1)}, ["id"])
+
+        assert groups == []
+        assert state.batch_requests == 1
+
+    async def test_raises_after_retries_exhausted(self, stub_graph):
+        state, endpoint = stub_graph
+        state.throttle_batches = 10
+
+        async with GraphBatchClient(
+            FakeCredential(), endpoint=endpoint, max_retries=1
+        ) as client:
+            with pytest.raises(AzureDiscoveryError):
+                await client.get_by_ids("users", {oid(USERS, 1)}, ["id"])
+
+        assert state.batch_requests == 2
+
+    async def test_ids_that_are_not_guids_are_skipped(self, stub_graph):
+        state, endpoint = stub_graph
+
+        async with GraphBatchClient(FakeCredential(), endpoint=endpoint) as client:
+            users = await client.get_by_ids(
+                "users", {oid(USERS, 1), "x') or startswith(id,'"}, ["id"]
+            )
+            assert await client.get_by_ids("users", {"not-a-guid"}, ["id"]) == []
+
+        assert [u["id"] for u in users] == [oid(USERS, 1)]
+        assert state.max_ids_per_filter == 1
+        assert state.batch_requests == 1
+
+    async def test_failed_batch_does_not_lose_the_others(self, stub_graph):
+        state, endpoint = stub_graph
+        ids = {oid(USERS, i) for i in range(MAX_FILTER_IDS * MAX_BATCH_REQUESTS * 2)}
+        # Sorted IDs fill the first batch first; fail the second batch only
+        state.poison_id = sorted(ids)[-1]
+
+        async with GraphBatchClient(FakeCredential(), endpoint=endpoint) as client:
+            users = await client.get_by_ids("users", ids, ["id"])
+
+        assert len(users) == MAX_FILTER_IDS * MAX_BATCH_REQUESTS
+
+
+class TestAADGraphServiceBatchLookups:
+    @pytest.fixture
+    def service(self, stub_graph, monkeypatch):
+        _, endpoint = stub_graph
+        monkeypatch.setenv("GRAPH_ENDPOINT", endpoint)
+        service = AADGraphService(use_mock=True)
+        service.use_mock = False
+        service.client = Mock()
+        service.credential = FakeCredential()  # type: ignore[assignment]
+        return service
+
+    async def test_lookups_by_id_use_batches(self, service, stub_graph):
+        state, _ = stub_graph
+
+        users, groups, sps = await asyncio.gather(
+            service.get_users_by_ids({oid(USERS, i) for i in range(100)}),
+            service.get_groups_by_ids({oid(GROUPS, 1), oid(MISSING, 1)}),
+            service.get_service_principals_by_ids({oid(SERVICE_PRINCIPALS, 1)}),
+        )
+
+        assert len(users) == 100
+        assert set(users[0]) == {"id", "displayName", "userPrincipalName", "mail"}
+        assert groups == [
+            {
+                "id": oid(GROUPS, 1),
+                "displayName": "Group 1",
+                "mail": None,
+                "description": "d",
+            }
+        ]
+        assert sps[0]["appId"] == "a1"
+        assert sps[0]["servicePrincipalType"] is None
+        assert state.batch_requests == 3
+        service.client.users.by_user_id.assert_not_called()
@@ -0,0 +1,304 @@
+"""Tests for the single-pass resource write, the writer thread and the progress journal."""
+
+import asyncio
+import json
+import threading
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.services.resource_processing import (
+    GraphWriter,
+    ProgressJournal,
+    ResourceStream,
+)
+from src.services.resource_processing.node_manager import (
+    BATCH_UPSERT_CONTAINMENT_QUERY,
+    BATCH_UPSERT_RESOURCES_QUERY,
+)
+from src.services.resource_processing.processor import ResourceProcessor
+
+
+class RecordingTx:
+    def __init__(self, recorder: "RecordingSessionManager") -> None:
+        self.recorder = recorder
+
+    def __enter__(self) -> "RecordingTx":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def run(self, query: str, *args: Any, **params: Any) -> Any:
+        self.recorder.statements.append(
+            (query, params, threading.current_thread().name)
+        )
+        if "rows" in params and (self.recorder.fail_rows or self.recorder.failures):
+            self.recorder.failures = max(0, self.recorder.failures - 1)
+            raise RuntimeError("write failed")
+        result = MagicMock()
+        result.__iter__.return_value = iter([])
+        result.single.return_value = None
+        return result
+
+    def commit(self) -> None:
+        pass
+
+
+class RecordingSession(RecordingTx):
+    def begin_transaction(self) -> RecordingTx:
+        return RecordingTx(self.recorder)
+
+
+class RecordingSessionManager:
+    """Records every statement with the thread that ran it; the graph is empty."""
+
+    def __init__(self, fail_rows: bool = False, failures: int = 0) -> None:
+        self.statements: List[Any] = []
+        self.fail_rows = fail_rows
+        # Fail only this many row statements, then succeed
+        self.failures = failures
+
+    def session(self) -> RecordingSession:
+        return RecordingSession(self)
+
+    def params_for(self, query: str) -> List[Dict[str, Any]]:
+        return [p for q, p, _ in self.statements if q == query]
+
+
+def make_processor(sm: RecordingSessionManager, **kwargs: Any) -> ResourceProcessor:
+    processor = ResourceProcessor(sm, tenant_id="t1", **kwargs)
+    processor.enriched_threads = []  # type: ignore[attr-defined]
+    processor._create_enriched_relationships = (  # type: ignore[method-assign]
+        lambda resource: processor.enriched_threads.append(  # type: ignore[attr-defined]
+            threading.current_thread().name
+        )
+    )
+    return processor
+
+
+async def stream_through(
+    processor: ResourceProcessor, resources: List[Dict[str, Any]]
+) -> Any:
+    stream = ResourceStream()
+    await stream.put_many(resources)
+    await stream.close()
+    return await processor.process_resource_stream(stream)
+
+
+class TestProgressJournal:
+    def test_recovers_started_but_unwritten_resources(self, tmp_path):
+        path = tmp_path / "t1.jsonl"
+        journal = ProgressJournal(path)
+        for rid in ("/a", "/b", "/c"):
+            journal.mark_started(rid)
+        journal.mark_written(["/a"])
+        # Simulate a crash: no close(), and a torn final line
+        journal._file.write('{"written": ["/b"')
+        journal._file.flush()
+
+        resumed = ProgressJournal(path)
+        assert resumed.interrupted == {"/b", "/c"}
+        assert resumed.outstanding == 2
+        assert path.read_text().splitlines() == [
+            json.dumps({"started": "/b"}),
+            json.dumps({"started": "/c"}),
+        ]
+        resumed.close()
+        assert path.exists()
+
+    def test_close_removes_journal_when_everything_was_written(self, tmp_path):
+        path = tmp_path / "t1.jsonl"
+        journal = ProgressJournal(path)
+        journal.mark_started("/a")
+        journal.mark_written(["/a"])
+        journal.close()
+        assert not path.exists()
+        assert ProgressJournal(path).interrupted == set()
+
+
+class TestGraphWriter:
+    def test_batches_rows_on_its_own_thread(self, make_resource):
+        sm = RecordingSessionManager()
+        processor = make_processor(sm)
+        written: List[Any] = []
+        writer = GraphWriter(
+            processor.db_ops,
+            batch_size=3,
+            flush_interval=60.0,
+            on_written=lambda items: written.extend(
+                (r["name"], ctx, threading.current_thread().name) for r, ctx in items
+            ),
+        )
+
+        async def submit_all() -> None:
+            for i in range(7):
+                assert await writer.submit(make_resource(i), context=i)
+
+        asyncio.run(submit_all())
+        writer.close()
+
+        batches = sm.params_for(BATCH_UPSERT_RESOURCES_QUERY)
+        assert [len(p["rows"]) for p in batches] == [3, 3, 1]
+        assert all("containment" not in row for p in batches for row in p["rows"])
+        assert {thread for _, _, thread in sm.statements} == {"graph-writer"}
+        assert [(name, ctx) for name, ctx, _ in written] == [
+            (f"sa{i}", i) for i in range(7)
+        ]
+        assert {thread for _, _, thread in written} == {"graph-writer"}
+        assert writer.written == 7
+
+    def test_failed_rows_are_reported_not_called_back(self, make_resource):
+        sm = RecordingSessionManager(fail_rows=True)
+        processor = make_processor(sm)
+        on_written = MagicMock()
+        writer = GraphWriter(processor.db_ops, batch_size=10, on_written=on_written)
+
+        asyncio.run(writer.submit(make_resource(1), context="ctx"))
+        writer.close()
+
+        assert [(r["name"], ctx) for r, ctx in writer.take_failed()] == [("sa1", "ctx")]
+        assert writer.take_failed() == []
+        on_written.assert_not_called()
+
+    def test_flush_writes_the_partial_batch_and_keeps_running(self, make_resource):
+        sm = RecordingSessionManager()
+        processor = make_processor(sm)
+        writer = GraphWriter(processor.db_ops, batch_size=10, flush_interval=60.0)
+
+        asyncio.run(writer.submit(make_resource(1)))
+        writer.flush()
+
+        assert writer.written == 1
+        assert writer._thread is not None and writer._thread.is_alive()
+        writer.close()
+
+    def test_invalid_resource_is_rejected_at_submit(self, make_resource):
+        processor = make_processor(RecordingSessionManager())
+        writer = GraphWriter(processor.db_ops)
+        bad = make_resource(1)
+        del bad["subscription_id"]
+        assert asyncio.run(writer.submit(bad)) is False
+        assert writer._thread is None
+
+
+class TestSinglePassProcessing:
+    def test_each_resource_is_written_once_with_its_containment(self, make_resource):
+        sm = RecordingSessionManager()
+        processor = make_processor(sm)
+        processor.enable_batched_writes(2, flush_interval=60.0)
+
+        stats = asyncio.run(
+            processor.process_resources([make_resource(i) for i in range(5)])
+        )
+
+        assert stats.successful == 5
+        rows = [
+            row
+            for p in sm.params_for(BATCH_UPSERT_RESOURCES_QUERY)
+            for row in p["rows"]
+        ]
+        assert len(rows) == 5
+        assert {row["props"]["processing_status"] for row in rows} == {"completed"}
+        containment = [
+            row
+            for p in sm.params_for(BATCH_UPSERT_CONTAINMENT_QUERY)
+            for row in p["rows"]
+        ]
+        assert {row["rg_id"] for row in containment} == {
+            "/subscriptions/sub/resourceGroups/rg"
+        }
+        assert len(containment) == 5
+        # No per-resource marker writes or containment queries
+        node_writes = [q for q, _, _ in sm.statements if "MERGE (orig:Resource" in q]
+        assert node_writes == [BATCH_UPSERT_RESOURCES_QUERY] * 3
+        assert not any("$subscription_id" in q for q, _, _ in sm.statements)
+        assert processor.enriched_threads == ["graph-writer"] * 5  # type: ignore[attr-defined]
+        writes = {t for q, _, t in sm.statements if q == BATCH_UPSERT_RESOURCES_QUERY}
+        assert threading.main_thread().name not in writes
+
+    def test_inline_path_writes_completed_once(self, make_resource):
+        processor = make_processor(RecordingSessionManager())
+        processor.db_ops = MagicMock()
+        processor._relationship_emitter = MagicMock()
+
+        assert asyncio.run(processor.process_single_resource(make_resource(1), 0))
+
+        processor.db_ops.upsert_resource.assert_called_once()
+        assert processor.db_ops.upsert_resource.call_args.kwargs == {
+            "processing_status": "completed"
+        }
+
+    def test_relationship_rules_can_be_left_to_the_caller(self, make_resource):
+        processor = ResourceProcessor(RecordingSessionManager(), tenant_id="t1")
+        processor.relationship_rules_enabled = False
+
+        with patch(
+            "src.relationship_rules.ALL_RELATIONSHIP_RULE_DISPATCHER"
+        ) as dispatcher:
+            processor._create_enriched_relationships(make_resource(1))
+
+        dispatcher.candidates.assert_not_called()
+
+    def test_failed_batch_write_is_retried_then_poisoned(self, make_resource):
+        sm = RecordingSessionManager(fail_rows=True)
+        processor = make_processor(sm, max_retries=3)
+        processor.enable_batched_writes(10)
+
+        with patch(
+            "src.services.resource_processing.processor.asyncio.sleep", AsyncMock()
+        ):
+            stats = asyncio.run(processor.process_resources([make_resource(1)]))
+
+        # Each of the three attempts writes the batch, then the row alone
+        assert len(sm.params_for(BATCH_UPSERT_RESOURCES_QUERY)) == 6
+        assert stats.successful == 0
+        assert stats.failed == 1
+        assert processor.enriched_threads == []  # type: ignore[attr-defined]
+
+    def test_transient_write_failure_is_retried(self, make_resource):
+        # The batch and its row-by-row fallback fail once, then writes succeed
+        sm = RecordingSessionManager(failures=2)
+        processor = make_processor(sm)
+        processor.enable_batched_writes(10)
+
+        with patch(
+            "src.services.resource_processing.processor.asyncio.sleep", AsyncMock()
+        ):
+            stats = asyncio.run(stream_through(processor, [make_resource(1)]))
+
+        assert stats.successful == 1
+        assert stats.failed == 0
+        assert processor.enriched_threads == ["graph-writer"]  # type: ignore[attr-defined]
+
+    def test_journal_resumes_resources_a_crashed_run_left_unwritten(
+        self, tmp_path, make_resource
+    ):
+        path = tmp_path / "t1.jsonl"
+        crashed = ProgressJournal(path)
+        for i in (1, 2):
+            crashed.mark_started(make_resource(i)["id"])
+        crashed.mark_written([make_resource(1)["id"]])
+
+        processor = make_processor(RecordingSessionManager())
+        processor.enable_batched_writes(10)
+        processor.enable_progress_journal(str(path))
+        completed = {"processing_status": "completed", "llm_description": "d"}
+        processor._snapshots = {
+            make_resource(1)["id"]: completed,
+            make_resource(2)["id"]: completed,
+        }
+
+        assert processor._should_process_resource(make_resource(1)) == (
+            False,
+            "already_processed",
+        )
+        assert processor._should_process_resource(make_resource(2)) == (
+            True,
+            "resume_interrupted",
+        )
+
+        stats = asyncio.run(
+            processor.process_resources([make_resource(2), make_resource(3)])
+        )
+        assert stats.successful == 2
+        assert not path.exists()
@@ -0,0 +1,107 @@
+"""Tests for UNWIND-batched resource node writes in NodeManager."""
+
+from typing import Any, Dict, List
+
+from src.services.resource_processing.node_manager import (
+    BATCH_UPSERT_RESOURCES_QUERY,
+    BATCH_UPSERT_SUBSCRIPTIONS_QUERY,
+    NodeManager,
+)
+
+
+class RecordingTx:
+    def __init__(self, recorder: "RecordingSessionManager") -> None:
+        self.recorder = recorder
+
+    def __enter__(self) -> "RecordingTx":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def run(self, query: str, **params: Any) -> None:
+        self.recorder.statements.append((query, params))
+        if self.recorder.fail_when and self.recorder.fail_when(query, params):
+            raise RuntimeError("write failed")
+
+    def commit(self) -> None:
+        self.recorder.commits += 1
+
+
+class RecordingSession(RecordingTx):
+    def begin_transaction(self) -> RecordingTx:
+        return RecordingTx(self.recorder)
+
+
+class RecordingSessionManager:
+    def __init__(self, fail_when=None) -> None:
+        self.statements: List[Any] = []
+        self.commits = 0
+        self.fail_when = fail_when
+
+    def session(self) -> RecordingSession:
+        return RecordingSession(self)
+
+
+def write_batch(nm: NodeManager, resources: List[Dict[str, Any]]) -> List[str]:
+    rows = [nm.prepare_resource_row(resource) for resource in resources]
+    return nm.write_rows([row for row in rows if row is not None])
+
+
+class TestWriteRows:
+    def test_batch_is_written_in_one_transaction(
+        self, make_resource, make_node_manager
+    ):
+        sm = RecordingSessionManager()
+        nm = make_node_manager(sm)
+
+        written = write_batch(nm, [make_resource(i) for i in range(3)])
+
+        assert len(written) == 3
+        batches = [p for q, p in sm.statements if q == BATCH_UPSERT_RESOURCES_QUERY]
+        assert [len(p["rows"]) for p in batches] == [3]
+        assert sm.commits == 1
+
+    def test_rows_carry_dual_graph_properties(self, make_resource, make_node_manager):
+        sm = RecordingSessionManager()
+        nm = make_node_manager(sm)
+        write_batch(nm, [make_resource(1, "sub-a"), make_resource(2, "sub-b")])
+
+        subs = [p for q, p in sm.statements if q == BATCH_UPSERT_SUBSCRIPTIONS_QUERY]
+        assert subs == [{"ids": ["sub-a", "sub-b"]}]
+        row = next(p for q, p in sm.statements if q == BATCH_UPSERT_RESOURCES_QUERY)[
+            "rows"
+        ][0]
+        assert row["original_id"].endswith("/sa1")
+        assert row["abstracted_id"].startswith("storage-")
+        assert row["props"]["processing_status"] == "completed"
+        assert row["abstracted_props"]["original_name"] == "sa1"
+        assert row["abstracted_props"]["name"] == row["abstracted_id"]
+        assert row["abstraction_type"] == "storage"
+
+    def test_invalid_resource_has_no_row(self, make_resource, make_node_manager):
+        nm = make_node_manager(RecordingSessionManager())
+        bad = make_resource(1)
+        del bad["subscription_id"]
+        assert nm.prepare_resource_row(bad) is None
+
+    def test_failed_batch_is_retried_row_by_row(self, make_resource, make_node_manager):
+        def fail(query, params):
+            rows = params.get("rows")
+            # The batch fails as a whole; only the row for sa1 is actually bad
+            return rows is not None and (
+                len(rows) > 1 or rows[0]["original_id"].endswith("/sa1")
+            )
+
+        sm = RecordingSessionManager(fail_when=fail)
+        nm = make_node_manager(sm)
+
+        written = write_batch(nm, [make_resource(i) for i in range(3)])
+
+        assert sorted(rid.rsplit("/", 1)[1] for rid in written) == ["sa0", "sa2"]
+        single_rows = [
+            p["rows"][0]["original_id"]
+            for q, p in sm.statements
+            if q == BATCH_UPSERT_RESOURCES_QUERY and len(p["rows"]) == 1
+        ]
+        assert len(single_rows) == 3
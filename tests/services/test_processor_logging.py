@@ -116,6 +116,12 @@ class TestProcessorEnhancedLogging:
         ]
         assert len(flush_complete_logs) > 0
 
+    def test_public_flush_relationship_buffers(self, processor):
+        """Test that flush_relationship_buffers runs the internal flush."""
+        with patch.object(processor, "_flush_relationship_buffers") as flush:
+            processor.flush_relationship_buffers()
+        flush.assert_called_once_with()
+
     @patch("src.services.resource_processing.processor.logger")
     def test_flush_relationship_buffers_logs_per_rule_details(
         self, mock_logger, processor
@@ -397,10 +403,11 @@ class TestProcessorLoggingEdgeCases:
             rule = ALL_RELATIONSHIP_RULES[0]
 
             # Mock applies() to raise exception
+            # Rules are dispatched by type, so use a type the rule is indexed for
             with patch.object(rule, "applies", side_effect=Exception("Test error")):
                 resource = {
-                    "id": "/subscriptions/sub1/resourceGroups/rg1/providers/Microsoft.Compute/virtualMachines/vm1",
-                    "type": "Microsoft.Compute/virtualMachines",
+                    "id": "/subscriptions/sub1/resourceGroups/rg1/providers/Microsoft.Network/virtualNetworks/vnet1",
+                    "type": "Microsoft.Network/virtualNetworks",
                 }
 
                 # Should not raise exception (should catch and log)
@@ -0,0 +1,200 @@
+"""Tests for bulk property hydration via Azure Resource Graph."""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from src.config_manager import AzureTenantGrapherConfig
+from src.services.azure_discovery_service import AzureDiscoveryService
+from src.services.resource_graph_hydrator import ResourceGraphHydrator
+
+SUB = "12345678-1234-1234-1234-123456789012"
+
+
+def make_resource(name, resource_type="Microsoft.Storage/storageAccounts", rg="rg1"):
+    provider, type_name = resource_type.split("/", 1)
+    return {
+        "id": f"/subscriptions/{SUB}/resourceGroups/{rg}/providers/{provider}/{type_name}/{name}",
+        "name": name,
+        "type": resource_type,
+        "properties": {},
+        "subscription_id": SUB,
+        "resource_group": rg,
+    }
+
+
+class FakeResourceGraphClient:
+    """Serves rows in pages of ``page_size`` using integer skip tokens."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.requests = []
+
+    def resources(self, query):
+        self.requests.append(query)
+        top = query.options.top
+        start = int(query.options.skip_token or 0)
+        page = self.rows[start : start + top]
+        next_token = str(start + top) if start + top < len(self.rows) else None
+        return SimpleNamespace(data=page, skip_token=next_token)
+
+
+def rows_for(resources):
+    # Resource Graph returns lower-cased IDs for some types; match case-insensitively
+    return [
+        {
+            "id": r["id"].lower(),
+            "type": r["type"].lower(),
+            "properties": {"name": r["name"], "provisioningState": "Succeeded"},
+        }
+        for r in resources
+    ]
+
+
+class TestBuildQuery:
+    def test_query_filters_subscriptions_and_orders(self):
+        query = ResourceGraphHydrator.build_query([SUB])
+        assert f"subscriptionId in ('{SUB}')" in query
+        assert "order by id asc" in query
+
+    def test_query_narrows_resource_groups(self):
+        query = ResourceGraphHydrator.build_query([SUB], ["rg-b", "rg-a"])
+        assert "resourceGroup in~ ('rg-a', 'rg-b')" in query
+
+    def test_invalid_subscription_rejected(self):
+        with pytest.raises(ValueError):
+            ResourceGraphHydrator.build_query(["' or 1==1 //"])
+
+    def test_invalid_resource_group_rejected(self):
+        with pytest.raises(ValueError):
+            ResourceGraphHydrator.build_query([SUB], ["rg'; drop"])
+
+
+class TestHydrate:
+    async def test_pages_through_skip_tokens(self):
+        resources = [make_resource(f"sa{i}") for i in range(25)]
+        client = FakeResourceGraphClient(rows_for(resources))
+        hydrator = ResourceGraphHydrator(
+            Mock(), resource_graph_client_factory=lambda _: client, page_size=10
+        )
+
+        hydrated, fallback, report = await hydrator.hydrate(resources, [SUB])
+
+        assert len(hydrated) == 25
+        assert fallback == []
+        assert len(client.requests) == 3
+        assert report.pages == 3
+        assert hydrated[0]["properties"]["provisioningState"] == "Succeeded"
+
+    async def test_missing_and_truncated_types_fall_back(self):
+        storage = [make_resource(f"sa{i}") for i in range(3)]
+        site = make_resource("app1", "Microsoft.Web/sites")
+        subnet = make_resource(
+            "vnet1/subnets/s1", "Microsoft.Network/virtualNetworks/subnets"
+        )
+        client = FakeResourceGraphClient(rows_for([*storage, site]))
+        hydrator = ResourceGraphHydrator(
+            Mock(), resource_graph_client_factory=lambda _: client
+        )
+
+        hydrated, fallback, report = await hydrator.hydrate(
+            [*storage, site, subnet], [SUB]
+        )
+
+        assert {r["name"] for r in hydrated} == {"sa0", "sa1", "sa2"}
+        assert {r["name"] for r in fallback} == {"app1", "vnet1/subnets/s1"}
+        coverage = report.to_dict()["by_type"]
+        assert coverage["Microsoft.Storage/storageAccounts"]["coverage"] == 1.0
+        assert coverage["Microsoft.Web/sites"]["fallback"] == 1
+        assert dict(report.slow_path_types()) == {
+            "Microsoft.Web/sites": 1,
+            "Microsoft.Network/virtualNetworks/subnets": 1,
+        }
+
+    async def test_role_assignments_are_passed_through(self):
+        assignment = {
+            "id": f"/subscriptions/{SUB}/providers/Microsoft.Authorization/roleAssignments/ra1",
+            "type": "Microsoft.Authorization/roleAssignments",
+            "properties": {"principalId": "p1"},
+        }
+        factory = Mock()
+        hydrator = ResourceGraphHydrator(Mock(), resource_graph_client_factory=factory)
+
+        hydrated, fallback, _ = await hydrator.hydrate([assignment], [SUB])
+
+        assert hydrated == [assignment]
+        assert fallback == []
+        factory.assert_not_called()
+
+    async def test_query_failure_falls_back_for_everything(self):
+        resources = [make_resource("sa0")]
+        client = Mock()
+        client.resources.side_effect = RuntimeError("throttled")
+        hydrator = ResourceGraphHydrator(
+            Mock(), resource_graph_client_factory=lambda _: client
+        )
+
+        hydrated, fallback, report = await hydrator.hydrate(resources, [SUB])
+
+        assert hydrated == []
+        assert fallback == resources
+        assert report.fallback == 1
+
+
+class TestDiscoveryIntegration:
+    async def test_only_uncovered_resources_use_per_resource_get(self):
+        storage = make_resource("sa0")
+        site = make_resource("app1", "Microsoft.Web/sites")
+
+        config = Mock(spec=AzureTenantGrapherConfig)
+        config.tenant_id = "tenant"
+        config.processing = Mock()
+        config.processing.max_retries = 1
+        config.processing.max_build_threads = 5
+        config.processing.discovery_backend = "sdk"
+        config.processing.property_hydration = "resource_graph"
+
+        resource_client = Mock()
+        resource_client.resources.list.return_value = [
+            SimpleNamespace(
+                id=r["id"],
+                name=r["name"],
+                type=r["type"],
+                location="eastus",
+                tags={},
+                properties=None,
+            )
+            for r in (storage, site)
+        ]
+        full = Mock()
+        full.properties = {"siteConfig": {"alwaysOn": True}}
+        resource_client.resources.get_by_id.return_value = full
+        resource_client.providers.get.side_effect = RuntimeError("no provider")
+
+        client = FakeResourceGraphClient(rows_for([storage, site]))
+        service = AzureDiscoveryService(
+            config=config,
+            credential=Mock(),
+            resource_client_factory=lambda *_: resource_client,
+            resource_graph_client_factory=lambda _: client,
+        )
+        service.discover_role_assignments_in_subscription = _async_return([])
+        service.discover_resource_scoped_role_assignments = _async_return([])
+        service.discover_child_resources = _async_return([])
+        service.discover_diagnostic_settings = _async_return([])
+
+        result = await service.discover_resources_in_subscription(SUB)
+
+        by_name = {r["name"]: r for r in result}
+        assert by_name["sa0"]["properties"]["provisioningState"] == "Succeeded"
+        assert by_name["app1"]["properties"] == {"siteConfig": {"alwaysOn": True}}
+        assert resource_client.resources.get_by_id.call_count == 1
+        assert service.hydration_reports[SUB].hydrated == 1
+
+
+def _async_return(value):
+    async def _inner(*args, **kwargs):
+        return value
+
+    return _inner
@@ -0,0 +1,274 @@
+"""Tests for the streaming discover -> process pipeline."""
+
+import asyncio
+import threading
+from typing import Any
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from src.azure_tenant_grapher import AzureTenantGrapher
+from src.config_manager import AzureTenantGrapherConfig
+from src.services.azure_discovery_service import AzureDiscoveryService
+from src.services.resource_processing import ProcessingStats, ResourceStream
+from src.services.resource_processing.processor import ResourceProcessor
+
+
+class DummySession:
+    def __enter__(self) -> "DummySession":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def run(self, *args: Any, **kwargs: Any) -> Any:
+        result = MagicMock()
+        result.__iter__.return_value = iter([])
+        return result
+
+
+class DummySessionManager:
+    def session(self) -> DummySession:
+        return DummySession()
+
+
+class TestResourceStream:
+    async def test_deduplicates_and_drops_missing_ids(self, make_resource):
+        stream = ResourceStream(max_depth=10)
+
+        accepted = await stream.put_many(
+            [make_resource(1), make_resource(2), make_resource(1), {"properties": {}}]
+        )
+        await stream.close()
+
+        assert accepted == 2
+        assert stream.duplicates == 1
+        assert stream.dropped == 1
+        assert [(await stream.get())["name"], (await stream.get())["name"]] == [
+            "sa1",
+            "sa2",
+        ]
+        assert await stream.get() is None
+
+    async def test_producer_blocks_when_queue_is_full(self, make_resource):
+        stream = ResourceStream(max_depth=3)
+        producer = asyncio.create_task(
+            stream.put_many(make_resource(i) for i in range(10))
+        )
+        await asyncio.sleep(0.01)
+
+        assert not producer.done()
+        assert stream.peak_depth == 3
+
+        received = []
+        while len(received) < 10:
+            received.append(await stream.get())
+        await producer
+        assert stream.peak_depth <= 3
+
+    async def test_resource_limit(self, make_resource):
+        stream = ResourceStream(max_depth=10, resource_limit=2)
+        assert await stream.put_many(make_resource(i) for i in range(5)) == 2
+        assert stream.limit_reached
+
+    async def test_close_releases_every_consumer(self, make_resource):
+        stream = ResourceStream(max_depth=2)
+
+        async def consume() -> int:
+            count = 0
+            while await stream.get() is not None:
+                count += 1
+            return count
+
+        consumers = [asyncio.create_task(consume()) for _ in range(4)]
+        await stream.put_many(make_resource(i) for i in range(7))
+        await stream.close()
+
+        assert sum(await asyncio.gather(*consumers)) == 7
+
+    async def test_put_after_close_raises(self, make_resource):
+        stream = ResourceStream()
+        await stream.close()
+        with pytest.raises(RuntimeError):
+            await stream.put(make_resource(1))
+
+    async def test_blocking_batch_hook_runs_off_the_event_loop(self, make_resource):
+        release = threading.Event()
+        batches: list[list[str]] = []
+
+        def hook(batch: list[dict[str, Any]]) -> None:
+            release.wait(timeout=5)
+            batches.append([r["name"] for r in batch])
+
+        def failing_hook(batch: list[dict[str, Any]]) -> None:
+            raise RuntimeError("graph unavailable")
+
+        stream = ResourceStream(max_depth=10)
+        stream.add_batch_hook(hook)
+        stream.add_batch_hook(failing_hook)
+        producer = asyncio.create_task(
+            stream.put_many(make_resource(i) for i in range(2))
+        )
+        await asyncio.sleep(0.01)
+
+        # The loop keeps running while the hook blocks; nothing is queued yet
+        assert not producer.done()
+        assert stream._queue.qsize() == 0
+        release.set()
+
+        assert await producer == 2
+        assert batches == [["sa0", "sa1"]]
+        assert stream._queue.qsize() == 2
+
+
+class TestProcessResourceStream:
+    async def test_workers_overlap_with_producer_and_retry_failures(
+        self, make_resource
+    ):
+        processor = ResourceProcessor(DummySessionManager(), max_retries=2)
+        stream = ResourceStream(max_depth=2)
+        attempts: dict[str, int] = {}
+
+        async def fake_process(resource, resource_index, dedupe=True):
+            assert dedupe is False
+            attempts[resource["id"]] = attempts.get(resource["id"], 0) + 1
+            processor.stats.processed += 1
+            if resource["name"] == "sa3" and attempts[resource["id"]] == 1:
+                return False
+            processor.stats.successful += 1
+            return True
+
+        processor.process_single_resource = fake_process  # type: ignore[method-assign]
+
+        async def produce() -> None:
+            await stream.put_many(make_resource(i) for i in range(20))
+            await stream.close()
+
+        with patch("asyncio.sleep", return_value=None):
+            _, stats = await asyncio.gather(
+                produce(), processor.process_resource_stream(stream, max_workers=3)
+            )
+
+        assert stats.total_resources == 20
+        assert stats.successful == 20
+        assert attempts[make_resource(3)["id"]] == 2
+        assert stream.peak_depth <= 2
+
+
+class TestDiscoverySink:
+    async def test_property_batches_are_sent_to_sink(self, make_resource):
+        config = Mock(spec=AzureTenantGrapherConfig)
+        config.tenant_id = "tenant"
+        config.processing = Mock()
+        config.processing.max_retries = 1
+        config.processing.max_build_threads = 5
+        config.processing.discovery_backend = "sdk"
+        config.processing.property_hydration = "arm"
+        service = AzureDiscoveryService(config=config, credential=Mock())
+
+        async def fetch(resource, resource_client, semaphore):
+            return {**resource, "properties": {"ok": True}}
+
+        service._fetch_single_resource_with_properties = fetch  # type: ignore[method-assign]
+        batches: list[int] = []
+
+        async def sink(batch):
+            batches.append(len(batch))
+
+        result = await service._fetch_resources_with_properties(
+            [make_resource(i) for i in range(250)], Mock(), "sub", sink
+        )
+
+        assert result == []
+        assert batches == [100, 100, 50]
+
+
+class TestStreamingBuildGraph:
+    @pytest.fixture
+    def mock_config(self) -> Mock:
+        config = Mock(spec=AzureTenantGrapherConfig)
+        config.tenant_id = "test-tenant-id"
+        processing_config = Mock()
+        processing_config.auto_start_container = False
+        processing_config.resource_limit = None
+        processing_config.enable_aad_import = False
+        processing_config.subscription_concurrency = 2
+        processing_config.arm_request_budget = 4
+        processing_config.streaming_pipeline = True
+        processing_config.pipeline_queue_depth = 5
+        config.processing = processing_config
+        config.neo4j = Mock()
+        config.azure_openai = Mock()
+        config.azure_openai.is_configured.return_value = False
+        config.log_configuration_summary = Mock()
+        config.specification = Mock()
+        return config
+
+    async def test_discovery_streams_into_processing(self, mock_config, make_resource):
+        subscriptions = [{"id": "sub1"}, {"id": "sub2"}]
+        in_queue_when_discovery_finished = []
+
+        async def discover(subscription_id, resource_sink=None, **kwargs):
+            assert resource_sink is not None
+            for start in range(0, 30, 10):
+                # Duplicate IDs across subscriptions are de-duplicated by the stream
+                await resource_sink(
+                    [make_resource(i) for i in range(start, start + 10)]
+                )
+            return []
+
+        async def drain(stream, progress_callback=None, tenant_id=None):
+            stats = ProcessingStats()
+            while await stream.get() is not None:
+                await asyncio.sleep(0)
+                stats.processed += 1
+                stats.successful += 1
+            stats.total_resources = stream.accepted
+            in_queue_when_discovery_finished.append(stream.peak_depth)
+            return stats
+
+        with patch("src.utils.session_manager.Neo4jSessionManager"), patch(
+            "src.services.resource_processing_service.ResourceProcessingService"
+        ) as MockProcessing:
+            MockProcessing.return_value.process_resource_stream = drain
+            grapher = AzureTenantGrapher(mock_config)
+            grapher.discovery_service.discover_subscriptions = MagicMock(
+                side_effect=lambda **_: asyncio.sleep(0, subscriptions)
+            )
+            grapher.discovery_service.discover_resources_in_subscription = discover
+
+            result = await grapher.build_graph()
+
+        assert result["success"] is True
+        assert result["total_resources"] == 30
+        assert result["processed"] == 30
+        assert in_queue_when_discovery_finished[0] <= 5
+        timings = {t["subscription_id"]: t for t in result["subscription_timings"]}
+        assert timings["sub1"]["resource_count"] == 30
+        MockProcessing.return_value.process_resources.assert_not_called()
+
+    async def test_processing_failure_stops_discovery(self, mock_config, make_resource):
+        async def discover(subscription_id, resource_sink=None, **kwargs):
+            for start in range(0, 1000, 10):
+                await resource_sink(
+                    [make_resource(i) for i in range(start, start + 10)]
+                )
+            return []
+
+        async def fail(stream, progress_callback=None, tenant_id=None):
+            raise RuntimeError("neo4j down")
+
+        with patch("src.utils.session_manager.Neo4jSessionManager"), patch(
+            "src.services.resource_processing_service.ResourceProcessingService"
+        ) as MockProcessing:
+            MockProcessing.return_value.process_resource_stream = fail
+            grapher = AzureTenantGrapher(mock_config)
+            grapher.discovery_service.discover_subscriptions = MagicMock(
+                side_effect=lambda **_: asyncio.sleep(0, [{"id": "sub1"}])
+            )
+            grapher.discovery_service.discover_resources_in_subscription = discover
+
+            result = await asyncio.wait_for(grapher.build_graph(), timeout=5)
+
+        assert result["success"] is False
+        assert "neo4j down" in result["error"]
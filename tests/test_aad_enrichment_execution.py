@@ -29,6 +29,8 @@ def mock_config():
     config.processing.auto_start_container = False
     # Set a small resource limit for fast testing
     config.processing.resource_limit = 5
+    # These tests inspect the materialised list handed to process_resources
+    config.processing.streaming_pipeline = False
     return config
 
 
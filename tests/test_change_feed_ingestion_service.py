@@ -3,7 +3,12 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from src.services.change_feed_ingestion_service import (
+    CHANGED_AND_NEIGHBOURS_QUERY,
+    CLEAR_OUTGOING_RELATIONSHIPS_QUERY,
+    MARK_DELETED_QUERY,
     ChangeFeedIngestionService,
+    coalesce_changes,
+    latest_change_time,
     validate_iso8601_timestamp,
     validate_subscription_id,
 )
@@ -222,3 +227,225 @@ async def test_ingest_changes_with_invalid_timestamp():
 
     with pytest.raises(ValueError, match="Invalid timestamp format"):
         await service.ingest_changes_for_subscription(valid_sub_id, invalid_timestamp)
+
+
+# Incremental sync: paging, coalescing, watermarks, batched writes
+
+
+SUB_ID = "12345678-1234-1234-1234-123456789012"
+RG_PREFIX = f"/subscriptions/{SUB_ID}/resourceGroups/rg1/providers/Microsoft.Web/sites"
+
+
+def change(name: str, change_type: str, when: str, **after) -> dict:
+    return {
+        "id": f"{RG_PREFIX}/{name}",
+        "changeType": change_type,
+        "changeTime": when,
+        "after": {"type": "Microsoft.Web/sites", **after}
+        if change_type != "Delete"
+        else None,
+        "before": None,
+    }
+
+
+class RecordingSessionManager:
+    """Records (query, params); queries in `results` return those records."""
+
+    def __init__(self, results: dict | None = None):
+        self.runs: list = []
+        self.results = results or {}
+
+    def session(self):
+        manager = self
+        session = MagicMock()
+        session.__enter__.return_value = session
+
+        def run(query, params=None):
+            manager.runs.append((query, params))
+            result = MagicMock()
+            result.__iter__.return_value = iter(manager.results.get(query, []))
+            result.single.return_value = None
+            return result
+
+        session.run.side_effect = run
+        return session
+
+    def params_for(self, query: str) -> list:
+        return [params for q, params in self.runs if q == query]
+
+
+class TestCoalesceChanges:
+    def test_last_change_per_resource_wins(self):
+        upserts, deletes = coalesce_changes(
+            [
+                change("a", "Create", "2024-06-01T00:00:00Z", v=1),
+                change("b", "Create", "2024-06-01T00:00:00Z"),
+                change("a", "Update", "2024-06-01T00:05:00Z", v=2),
+                change("b", "Delete", "2024-06-01T00:06:00Z"),
+                change("c", "Delete", "2024-06-01T00:00:00Z"),
+                change("c", "Create", "2024-06-01T00:09:00Z"),
+            ]
+        )
+        assert sorted((r["id"].rsplit("/", 1)[1], r.get("v")) for r in upserts) == [
+            ("a", 2),
+            ("c", None),
+        ]
+        assert deletes == [f"{RG_PREFIX}/b"]
+
+    def test_change_time_order_not_input_order(self):
+        late = change("a", "Update", "2024-06-01T00:10:00+00:00", v="late")
+        early = change("a", "Update", "2024-06-01T00:01:00Z", v="early")
+        upserts, _ = coalesce_changes([late, early])
+        assert [r["v"] for r in upserts] == ["late"]
+
+    def test_ids_are_case_insensitive(self):
+        upper = change("A", "Update", "2024-06-01T00:01:00Z")
+        upper["id"] = upper["id"].upper()
+        upserts, deletes = coalesce_changes(
+            [upper, change("a", "Delete", "2024-06-01T00:02:00Z")]
+        )
+        assert upserts == []
+        assert len(deletes) == 1
+
+    def test_latest_change_time(self):
+        assert latest_change_time([]) is None
+        assert (
+            latest_change_time(
+                [
+                    change("a", "Update", "2024-06-01T00:10:00Z"),
+                    change("b", "Update", "2024-06-01T00:02:00Z"),
+                ]
+            )
+            == "2024-06-01T00:10:00+00:00"
+        )
+
+
+class TestIncrementalSync:
+    def make_service(self, sm, **kwargs):
+        config = DummyConfig()
+        config.tenant_id = "tenant-1"
+        rps = MagicMock()
+        rps.process_resources = AsyncMock()
+        rps.reevaluate_relationships.return_value = 0
+        return ChangeFeedIngestionService(config, sm, rps, **kwargs), rps
+
+    def test_fetch_changes_follows_skip_tokens(self):
+        service, _ = self.make_service(RecordingSessionManager(), page_size=2)
+        pages = [
+            MagicMock(data=[change("a", "Create", "t1")], skip_token="tok1"),
+            MagicMock(data=[change("b", "Create", "t2")], skip_token="tok2"),
+            MagicMock(data=[change("c", "Create", "t3")], skip_token=None),
+        ]
+        client = MagicMock()
+        client.resources.side_effect = pages
+        service._resource_graph_client = client
+
+        changes = service.fetch_changes(SUB_ID, "2024-06-01T00:00:00Z")
+
+        assert [c["id"].rsplit("/", 1)[1] for c in changes] == ["a", "b", "c"]
+        options = [
+            call.kwargs["query"].options for call in client.resources.call_args_list
+        ]
+        assert [o.skip_token for o in options] == [None, "tok1", "tok2"]
+        assert {o.top for o in options} == {2}
+
+    @pytest.mark.asyncio
+    async def test_sync_applies_coalesced_changes_and_advances_watermark(self):
+        sm = RecordingSessionManager()
+        service, rps = self.make_service(sm, write_batch_size=2)
+        changes = [
+            change("a", "Create", "2024-06-01T00:00:00Z"),
+            change("a", "Update", "2024-06-01T00:03:00Z", sku="S1"),
+            change("b", "Delete", "2024-06-01T00:01:00Z"),
+            change("c", "Delete", "2024-06-01T00:02:00Z"),
+            change("d", "Delete", "2024-06-01T00:02:30Z"),
+        ]
+        with patch.object(service, "fetch_changes", return_value=changes), patch.object(
+            service, "fetch_deletions", return_value=[]
+        ), patch.object(service, "refresh_relationships") as refresh:
+            upserted = await service.ingest_changes_for_subscription(
+                SUB_ID, "2024-05-31T00:00:00Z"
+            )
+
+        assert len(upserted) == 1
+        resource = upserted[0]
+        assert resource["sku"] == "S1"
+        assert resource["resource_group"] == "rg1"
+        assert resource["subscription_id"] == SUB_ID
+        assert resource["name"] == "a"
+        # Rules run once, in refresh_relationships, not during the upsert
+        rps.process_resources.assert_awaited_once_with(
+            upserted, tenant_id="tenant-1", evaluate_relationships=False
+        )
+        refresh.assert_called_once_with([resource["id"]])
+
+        deletes = sm.params_for(MARK_DELETED_QUERY)
+        assert [len(p["ids"]) for p in deletes] == [2, 1]
+        assert sm.runs[-1][1] == {"sub_id": SUB_ID, "ts": "2024-06-01T00:03:00+00:00"}
+
+    def test_deletes_match_ids_case_insensitively(self):
+        sm = RecordingSessionManager()
+        service, _ = self.make_service(sm)
+
+        service.mark_deleted([f"{RG_PREFIX}/App", f"{RG_PREFIX.upper()}/APP"])
+
+        assert sm.params_for(MARK_DELETED_QUERY) == [
+            {"ids": [f"{RG_PREFIX}/app".lower()]}
+        ]
+        assert "toLower(r.id)" in MARK_DELETED_QUERY
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("failing", ["fetch_changes", "fetch_deletions"])
+    async def test_failed_read_keeps_watermark(self, failing):
+        sm = RecordingSessionManager()
+        service, rps = self.make_service(sm)
+        with patch.object(
+            service, "fetch_changes", return_value=[change("a", "Create", "t1")]
+        ), patch.object(service, "fetch_deletions", return_value=[]), patch.object(
+            service, failing, side_effect=RuntimeError("throttled")
+        ):
+            assert (
+                await service.ingest_changes_for_subscription(
+                    SUB_ID, "2024-05-31T00:00:00Z"
+                )
+                == []
+            )
+        assert sm.runs == []
+        rps.process_resources.assert_not_awaited()
+
+    def test_refresh_relationships_covers_neighbours(self):
+        neighbour = {
+            "resource": {"id": "/nic1", "type": "Microsoft.Network/networkInterfaces"}
+        }
+        changed = {"resource": {"id": f"{RG_PREFIX}/a", "type": "Microsoft.Web/sites"}}
+        sm = RecordingSessionManager(
+            {CHANGED_AND_NEIGHBOURS_QUERY: [changed, neighbour]}
+        )
+        service, rps = self.make_service(sm)
+
+        service.refresh_relationships([f"{RG_PREFIX}/a"])
+
+        assert [q for q, _ in sm.runs] == [
+            CHANGED_AND_NEIGHBOURS_QUERY,
+            CLEAR_OUTGOING_RELATIONSHIPS_QUERY,
+        ]
+        resources = rps.reevaluate_relationships.call_args.args[0]
+        assert [r["id"] for r in resources] == [f"{RG_PREFIX}/a", "/nic1"]
+
+    @pytest.mark.asyncio
+    async def test_watch_syncs_each_subscription_every_cycle(self):
+        service, _ = self.make_service(RecordingSessionManager())
+        calls = []
+
+        async def ingest(subscription_id, since_timestamp=None):
+            calls.append(subscription_id)
+            if subscription_id == "bad":
+                raise RuntimeError("boom")
+            return [{"id": "x"}]
+
+        with patch.object(
+            service, "ingest_changes_for_subscription", side_effect=ingest
+        ):
+            await service.watch(["bad", SUB_ID], interval=0, max_cycles=2)
+
+        assert calls == ["bad", SUB_ID, "bad", SUB_ID]
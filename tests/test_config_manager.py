@@ -243,6 +243,32 @@ class TestProcessingConfig:
         with pytest.raises(ValueError, match="Resource limit must be at least 1"):
             config.__post_init__()
 
+    def test_relationship_spill_dir_follows_state_dir(self) -> None:
+        """Test the spill directory defaults under ATG_STATE_DIR."""
+        with patch.dict(os.environ, {"ATG_STATE_DIR": "/srv/atg"}):  # nosec
+            os.environ.pop("RELATIONSHIP_SPILL_DIR", None)
+            config = ProcessingConfig()
+            assert config.relationship_spill_dir == os.path.join(
+                "/srv/atg", "relationship_spill"
+            )
+
+    def test_description_cache_follows_state_dir(self) -> None:
+        """Test the LLM description cache defaults under ATG_STATE_DIR."""
+        with patch.dict(os.environ, {"ATG_STATE_DIR": "/srv/atg"}):  # nosec
+            os.environ.pop("LLM_DESCRIPTION_CACHE", None)
+            config = ProcessingConfig()
+            assert config.description_cache_path == os.path.join(
+                "/srv/atg", "llm_description_cache.sqlite"
+            )
+
+    def test_progress_journal_is_opt_in(self) -> None:
+        """Test the progress journal is disabled unless a directory is set."""
+        with patch.dict(os.environ, {}):
+            os.environ.pop("PROGRESS_JOURNAL_DIR", None)
+            assert ProcessingConfig().progress_journal_dir == ""
+        with patch.dict(os.environ, {"PROGRESS_JOURNAL_DIR": "/srv/atg/progress"}):
+            assert ProcessingConfig().progress_journal_dir == "/srv/atg/progress"
+
 
 class TestLoggingConfig:
     """Test cases for LoggingConfig."""
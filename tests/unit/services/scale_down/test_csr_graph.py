@@ -0,0 +1,167 @@
+# tests/unit/services/scale_down/test_csr_graph.py
+"""Tests for csr_graph module.
+
+Tests CSR construction from NetworkX, vectorized metrics against NetworkX,
+subgraph export, and samplers and quality metrics running on CSRGraph.
+"""
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from src.services.scale_down.csr_graph import CSRGraph, as_csr_graph
+from src.services.scale_down.quality_metrics import QualityMetricsCalculator
+from src.services.scale_down.sampling import (
+    ForestFireSampler,
+    MHRWSampler,
+    RandomWalkSampler,
+)
+
+
+@pytest.fixture
+def random_graph():
+    """Directed random graph with string IDs, a self-loop and reciprocal edges."""
+    G = nx.gnm_random_graph(300, 1200, seed=7, directed=True)
+    G = nx.relabel_nodes(G, {i: f"node-{i}" for i in G})
+    G.add_edge("node-1", "node-1", relationship_type="SELF")
+    G.add_edge("node-2", "node-3", relationship_type="DEPENDS_ON", weight=2)
+    G.add_edge("node-3", "node-2", relationship_type="DEPENDS_ON")
+    G.add_node("isolated")
+    return G
+
+
+class TestCSRGraph:
+    """Test suite for CSRGraph class."""
+
+    def test_from_networkx_adjacency(self, random_graph):
+        csr = CSRGraph.from_networkx(random_graph)
+
+        assert csr.number_of_nodes() == random_graph.number_of_nodes()
+        assert csr.number_of_edges() == random_graph.number_of_edges()
+        undirected = random_graph.to_undirected()
+        for node_id in ["node-1", "node-2", "isolated"]:
+            neighbors = {csr.node_ids[i] for i in csr.neighbors(csr.index[node_id])}
+            assert neighbors == set(undirected.neighbors(node_id)) - {node_id}
+
+    def test_directed_degree_matches_networkx(self, random_graph):
+        csr = CSRGraph.from_networkx(random_graph)
+
+        degrees = dict(random_graph.degree())
+        assert [degrees[n] for n in csr.node_ids] == csr.directed_degree().tolist()
+
+    def test_clustering_and_components_match_networkx(self, random_graph):
+        csr = CSRGraph.from_networkx(random_graph)
+        undirected = nx.Graph(random_graph.to_undirected())
+        undirected.remove_edges_from(nx.selfloop_edges(undirected))
+
+        triangles = nx.triangles(undirected)
+        assert [triangles[n] for n in csr.node_ids] == csr.triangles().tolist()
+        assert csr.average_clustering() == pytest.approx(
+            nx.average_clustering(random_graph.to_undirected())
+        )
+        assert csr.number_connected_components() == (
+            nx.number_weakly_connected_components(random_graph)
+        )
+
+    def test_subgraph_round_trips_to_networkx(self, random_graph):
+        csr = CSRGraph.from_networkx(random_graph)
+        keep = [f"node-{i}" for i in range(0, 300, 3)] + ["node-2", "missing"]
+
+        exported = csr.subgraph(keep).to_networkx()
+        expected = random_graph.subgraph(keep)
+
+        assert set(exported.nodes) == set(expected.nodes)
+        assert set(exported.edges) == set(expected.edges)
+        assert exported.edges["node-3", "node-2"]["relationship_type"] == "DEPENDS_ON"
+        assert exported.edges["node-2", "node-3"]["weight"] == 2
+
+    def test_as_csr_graph_passes_csr_through(self, random_graph):
+        csr = as_csr_graph(random_graph)
+
+        assert as_csr_graph(csr) is csr
+
+    def test_empty_graph(self):
+        csr = CSRGraph([], np.array([]), np.array([]))
+
+        assert csr.number_connected_components() == 0
+        with pytest.raises(ZeroDivisionError):
+            csr.average_clustering()
+
+
+class TestCSRSampling:
+    """Samplers and quality metrics on CSRGraph input."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "sampler",
+        [ForestFireSampler(seed=1), MHRWSampler(seed=1), RandomWalkSampler(seed=1)],
+        ids=["forest_fire", "mhrw", "random_walk"],
+    )
+    async def test_samplers_accept_csr(self, sampler, random_graph):
+        csr = CSRGraph.from_networkx(random_graph)
+
+        sampled = await sampler.sample(csr, 100)
+
+        assert len(sampled) == 100
+        assert sampled <= set(random_graph.nodes)
+        # Same seed, same graph: same sample from either representation
+        assert await sampler.sample(random_graph, 100) == sampled
+
+    @pytest.mark.asyncio
+    async def test_batched_mhrw_reaches_isolated_nodes(self):
+        G = nx.DiGraph()
+        G.add_nodes_from(f"island-{i}" for i in range(50))
+        G.add_edges_from((f"hub-{i}", "hub") for i in range(50))
+
+        sampled = await MHRWSampler(walkers=8, seed=3).sample(G, 90)
+
+        assert len(sampled) == 90
+
+    @pytest.mark.asyncio
+    async def test_mhrw_finishes_on_many_small_components(self):
+        # Jumps used to drain the unsampled-node pool without sampling it,
+        # leaving walkers stuck in exhausted pairs forever
+        G = nx.DiGraph()
+        G.add_edges_from((f"a-{i}", f"b-{i}") for i in range(2000))
+
+        sampled = await MHRWSampler(seed=0).sample(G, G.number_of_nodes() - 1)
+
+        assert len(sampled) == G.number_of_nodes() - 1
+
+    @pytest.mark.asyncio
+    async def test_mhrw_burn_in_is_counted_per_walker(self, random_graph):
+        reports = []
+
+        # 100 targets: burn-in is 10 steps per walker, progress every 10 rounds
+        await MHRWSampler(walkers=8, seed=1).sample(
+            CSRGraph.from_networkx(random_graph),
+            100,
+            lambda phase, current, total: reports.append(current),
+        )
+
+        # Nothing is sampled until every walker has taken its 10 burn-in steps
+        assert reports[0] == 0
+        assert reports[-1] == 100
+
+    def test_metrics_on_csr_match_networkx(self, random_graph):
+        calculator = QualityMetricsCalculator()
+        csr = CSRGraph.from_networkx(random_graph)
+        sampled_ids = {f"node-{i}" for i in range(120)}
+        properties = {
+            node_id: {"type": f"type-{i % 4}"}
+            for i, node_id in enumerate(random_graph.nodes)
+        }
+
+        from_nx = calculator.calculate_metrics(
+            random_graph,
+            random_graph.subgraph(sampled_ids).copy(),
+            properties,
+            sampled_ids,
+            1.0,
+        )
+        from_csr = calculator.calculate_metrics(
+            csr, csr.subgraph(sampled_ids), properties, sampled_ids, 1.0
+        )
+
+        for key, value in from_nx.to_dict().items():
+            assert from_csr.to_dict()[key] == pytest.approx(value), key
@@ -0,0 +1,149 @@
+# tests/unit/services/scale_down/test_graph_extractor.py
+"""Tests for graph_extractor module.
+
+Tests keyset-paginated node extraction, streamed relationships, CSR output
+and export-time loading of full node properties.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.services.scale_down.csr_graph import CSRGraph
+from src.services.scale_down.graph_extractor import (
+    NODE_PROPERTIES_QUERY,
+    GraphExtractor,
+)
+
+NODES = {
+    f"node-{i:03d}": {
+        "id": f"node-{i:03d}",
+        "type": "Microsoft.Compute/virtualMachines",
+        "name": f"vm-{i}",
+        "properties": "{...large ARM payload...}",
+    }
+    for i in range(25)
+}
+EDGES = [(f"node-{i:03d}", f"node-{i + 1:03d}") for i in range(24)] + [
+    ("node-000", "outside-node")
+]
+
+
+class FakeSession:
+    """Answers the extractor queries from NODES/EDGES like Neo4j would."""
+
+    def __init__(self):
+        self.calls = []
+
+    def run(self, query, params):
+        self.calls.append((query, params))
+        if query == NODE_PROPERTIES_QUERY:
+            return [
+                {"id": node_id, "props": NODES[node_id]}
+                for node_id in params["ids"]
+                if node_id in NODES
+            ]
+        if "$after" in query:
+            page = sorted(n for n in NODES if n > params["after"])[: params["limit"]]
+            return [
+                {"id": n, "props": {"id": n, "type": NODES[n]["type"]}} for n in page
+            ]
+        return iter(
+            {"source": s, "target": t, "rel_type": "CONNECTED_TO", "rel_props": {}}
+            for s, t in EDGES
+        )
+
+
+@pytest.fixture
+def session():
+    return FakeSession()
+
+
+@pytest.fixture
+def extractor(session):
+    manager = MagicMock()
+    manager.session.return_value.__enter__.return_value = session
+    extractor = GraphExtractor(manager)
+    extractor.validate_tenant_exists = AsyncMock(return_value=True)
+    return extractor
+
+
+class TestGraphExtractor:
+    """Test suite for GraphExtractor class."""
+
+    @pytest.mark.asyncio
+    async def test_nodes_are_paged_by_id(self, extractor, session):
+        G, _ = await extractor.extract_graph("tenant", batch_size=10)
+
+        node_calls = [params for query, params in session.calls if "$after" in query]
+        assert [params["after"] for params in node_calls] == [
+            "",
+            "node-009",
+            "node-019",
+            "node-024",
+        ]
+        assert "ORDER BY r.id" in session.calls[0][0]
+        assert "SKIP" not in session.calls[0][0]
+        assert G.number_of_nodes() == len(NODES)
+
+    @pytest.mark.asyncio
+    async def test_edges_are_streamed_in_one_query(self, extractor, session):
+        G, _ = await extractor.extract_graph("tenant", batch_size=10)
+
+        edge_calls = [query for query, _ in session.calls if "rel_props" in query]
+        assert len(edge_calls) == 1
+        # Edges to nodes outside the abstracted layer are skipped
+        assert G.number_of_edges() == 24
+        assert G.edges["node-000", "node-001"]["relationship_type"] == "CONNECTED_TO"
+
+    @pytest.mark.asyncio
+    async def test_only_requested_properties_are_loaded(self, extractor, session):
+        _, node_properties = await extractor.extract_graph("tenant")
+
+        assert "r {.id, .type} as props" in session.calls[0][0]
+        assert node_properties["node-003"] == {
+            "id": "node-003",
+            "type": "Microsoft.Compute/virtualMachines",
+        }
+
+    @pytest.mark.asyncio
+    async def test_invalid_property_keys_rejected(self, extractor):
+        with pytest.raises(ValueError, match="Invalid property keys"):
+            await extractor.extract_graph("tenant", property_keys=["type} RETURN 1 //"])
+
+    @pytest.mark.asyncio
+    async def test_load_full_properties_for_subset(self, extractor, session):
+        _, node_properties = await extractor.extract_graph("tenant")
+
+        await extractor.load_full_properties(
+            node_properties, ["node-001", "node-002"], batch_size=1
+        )
+
+        assert node_properties["node-001"] == NODES["node-001"]
+        assert (
+            node_properties["node-002"]["properties"] == NODES["node-002"]["properties"]
+        )
+        assert "properties" not in node_properties["node-003"]
+        lookups = [
+            params for query, params in session.calls if query == NODE_PROPERTIES_QUERY
+        ]
+        assert [params["ids"] for params in lookups] == [["node-001"], ["node-002"]]
+
+    @pytest.mark.asyncio
+    async def test_extract_as_csr_graph(self, extractor):
+        G, node_properties = await extractor.extract_graph(
+            "tenant", batch_size=10, as_csr=True
+        )
+
+        assert isinstance(G, CSRGraph)
+        assert G.number_of_nodes() == len(NODES)
+        assert G.number_of_edges() == 24
+        assert list(G.neighbors(G.index["node-001"])) == [
+            G.index["node-000"],
+            G.index["node-002"],
+        ]
+        exported = G.subgraph(["node-000", "node-001"]).to_networkx()
+        assert exported.edges["node-000", "node-001"]["relationship_type"] == (
+            "CONNECTED_TO"
+        )
+        assert len(node_properties) == len(NODES)
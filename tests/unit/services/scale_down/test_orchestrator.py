@@ -11,6 +11,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import networkx as nx
 import pytest
 
+from src.services.scale_down.graph_extractor import DEFAULT_PROPERTY_KEYS
 from src.services.scale_down.orchestrator import ScaleDownOrchestrator
 from src.services.scale_down.quality_metrics import QualityMetrics
 
@@ -66,7 +67,7 @@ class TestScaleDownOrchestrator:
         assert G == sample_networkx_graph
         assert props == sample_node_properties
         orchestrator.extractor.extract_graph.assert_awaited_once_with(
-            test_tenant_id, None
+            test_tenant_id, None, property_keys=DEFAULT_PROPERTY_KEYS
         )
 
     @pytest.mark.asyncio
@@ -90,7 +91,7 @@ class TestScaleDownOrchestrator:
 
         # Verify callback passed to extractor
         orchestrator.extractor.extract_graph.assert_awaited_once_with(
-            test_tenant_id, mock_progress_callback
+            test_tenant_id, mock_progress_callback, property_keys=DEFAULT_PROPERTY_KEYS
         )
 
     @pytest.mark.asyncio
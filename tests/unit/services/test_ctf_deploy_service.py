@@ -587,6 +587,53 @@ class TestErrorHandling:
                 )
 
 
+class TestCopyOnWriteLayers:
+    """Test that copy-on-write layers are refused until materialized."""
+
+    def test_deploy_refuses_copy_on_write_layer(self, mock_neo4j_driver, tmp_path):
+        """A copy-on-write layer only holds its delta, so deploy stops early."""
+        from src.services.ctf_deploy_service import CTFDeployService
+        from src.services.layer.models import LayerNotMaterializedError
+
+        mock_neo4j_driver.execute_query.return_value = (
+            [{"parent_layer_id": "baseline", "metadata": '{"copy_on_write": true}'}],
+            None,
+            None,
+        )
+        service = CTFDeployService(neo4j_driver=mock_neo4j_driver)
+
+        with pytest.raises(LayerNotMaterializedError, match="materialize"):
+            service.deploy_scenario(
+                layer_id="scaled",
+                ctf_exercise="M003",
+                ctf_scenario="v2-cert",
+                output_dir=tmp_path,
+            )
+
+        assert mock_neo4j_driver.execute_query.call_count == 1
+
+    def test_deploy_queries_standalone_layer(self, mock_neo4j_driver, tmp_path):
+        """A layer that is not copy-on-write is queried by its own nodes."""
+        from src.services.ctf_deploy_service import CTFDeployService
+
+        mock_neo4j_driver.execute_query.side_effect = [
+            ([{"parent_layer_id": "baseline", "metadata": "{}"}], None, None),
+            ([], None, None),
+        ]
+        service = CTFDeployService(neo4j_driver=mock_neo4j_driver)
+
+        result = service.deploy_scenario(
+            layer_id="copy",
+            ctf_exercise="M003",
+            ctf_scenario="v2-cert",
+            output_dir=tmp_path,
+        )
+
+        assert result["success"] is False
+        query = mock_neo4j_driver.execute_query.call_args[0][0]
+        assert "MATCH (r:Resource {layer_id: $layer_id})" in query
+
+
 # ============================================================================
 # Test Summary
 # ============================================================================
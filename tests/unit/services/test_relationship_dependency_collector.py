@@ -7,6 +7,7 @@ from relationship rules and fetches only the missing resources.
 Following TDD methodology - these tests will FAIL until implementation is complete.
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, Mock
 
 import pytest
@@ -14,6 +15,8 @@ import pytest
 from src.models.filter_config import FilterConfig
 from src.services.relationship_dependency_collector import (
     RelationshipDependencyCollector,
+    is_throttling_error,
+    throttle_delay,
 )
 
 
@@ -313,14 +316,23 @@ class TestCheckExistingNodes:
             in existing_ids
         )
 
-        # Verify query was executed with all IDs
+        # Verify one query was executed with all IDs, compared case-insensitively
         mock_session.run.assert_called_once()
         call_args = mock_session.run.call_args
-        assert "UNWIND" in call_args[0][0], "Should use UNWIND for batch query"
-        assert call_args[1]["target_ids"] == list(target_ids), (
+        assert "toLower(r.id) IN $target_ids" in call_args[0][0]
+        assert call_args[1]["target_ids"] == sorted(t.lower() for t in target_ids), (
             "Should pass all target IDs"
         )
 
+    def test_check_existing_nodes_ignores_id_case(self):
+        """A node stored with different casing counts as existing."""
+        db_ops, _ = _session_db_ops(existing={NIC_ID.upper()})
+        collector = RelationshipDependencyCollector(
+            discovery_service=Mock(), db_ops=db_ops, relationship_rules=[]
+        )
+
+        assert collector.check_existing_nodes({NIC_ID, SUBNET_ID}) == {NIC_ID}
+
 
 class TestFetchResourcesByIds:
     """Tests for fetching missing resources in parallel."""
@@ -495,3 +507,200 @@ class TestIntegrationScenarios:
         assert any(r["name"] == "hub-subnet1" for r in missing_resources_pass2), (
             "Should collect hub subnet as transitive dependency"
         )
+
+
+def _rid(rg: str, provider_type: str, name: str) -> str:
+    return f"/subscriptions/sub1/resourceGroups/{rg}/providers/{provider_type}/{name}"
+
+
+VM_ID = _rid("rg-compute", "Microsoft.Compute/virtualMachines", "vm1")
+NIC_ID = _rid("rg-network", "Microsoft.Network/networkInterfaces", "nic1")
+SUBNET_ID = _rid("rg-hub", "Microsoft.Network/virtualNetworks", "vnet1/subnets/s1")
+NSG_ID = _rid("rg-security", "Microsoft.Network/networkSecurityGroups", "nsg1")
+
+# Each resource references the next; every resource also references the VM
+CHAIN = {VM_ID: NIC_ID, NIC_ID: SUBNET_ID, SUBNET_ID: NSG_ID, NSG_ID: None}
+
+
+def _chain_rule() -> Mock:
+    rule = Mock()
+    rule.applies.return_value = True
+    rule.extract_target_ids.side_effect = lambda r: (
+        {CHAIN[r["id"]], VM_ID.upper()} if CHAIN[r["id"]] else {VM_ID}
+    )
+    return rule
+
+
+def _session_db_ops(existing: set) -> tuple:
+    """db_ops whose existence check reports `existing`; returns (db_ops, session)."""
+    lowered = {i.lower() for i in existing}
+    session = Mock()
+    session.run.side_effect = lambda query, target_ids: Mock(
+        data=Mock(return_value=[{"id": i} for i in target_ids if i in lowered])
+    )
+    context = MagicMock()
+    context.__enter__.return_value = session
+    db_ops = Mock(spec=["session_manager"])
+    db_ops.session_manager = Mock()
+    db_ops.session_manager.session.return_value = context
+    return db_ops, session
+
+
+class ThrottledError(Exception):
+    status_code = 429
+
+    def __init__(self) -> None:
+        super().__init__("TooManyRequests")
+        self.response = Mock(headers={"Retry-After": "0"})
+
+
+class TestTransitiveCollection:
+    """Frontier-by-frontier collection up to max_depth."""
+
+    @pytest.mark.asyncio
+    async def test_follows_chain_to_max_depth_fetching_each_resource_once(self):
+        discovery = Mock()
+        discovery.fetch_resource_by_id = AsyncMock(
+            side_effect=lambda rid: {"id": rid, "name": rid.rsplit("/", 1)[1]}
+        )
+        db_ops, session = _session_db_ops(existing=set())
+        collector = RelationshipDependencyCollector(
+            discovery_service=discovery,
+            db_ops=db_ops,
+            relationship_rules=[_chain_rule()],
+            max_depth=2,
+        )
+
+        collected = await collector.collect_missing_dependencies([{"id": VM_ID}])
+
+        assert [r["id"] for r in collected] == [NIC_ID, SUBNET_ID]
+        fetched = [c.args[0] for c in discovery.fetch_resource_by_id.call_args_list]
+        assert fetched == [NIC_ID, SUBNET_ID]
+        # One existence query per frontier, never including the VM again
+        assert [c.kwargs["target_ids"] for c in session.run.call_args_list] == [
+            [NIC_ID.lower()],
+            [SUBNET_ID.lower()],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_existing_targets_are_not_fetched_or_expanded(self):
+        discovery = Mock()
+        discovery.fetch_resource_by_id = AsyncMock(
+            side_effect=lambda rid: {"id": rid, "name": rid.rsplit("/", 1)[1]}
+        )
+        db_ops, session = _session_db_ops(existing={NIC_ID})
+        collector = RelationshipDependencyCollector(
+            discovery_service=discovery,
+            db_ops=db_ops,
+            relationship_rules=[_chain_rule()],
+            max_depth=5,
+        )
+
+        assert await collector.collect_missing_dependencies([{"id": VM_ID}]) == []
+        discovery.fetch_resource_by_id.assert_not_called()
+        assert session.run.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_full_depth_reaches_end_of_chain(self):
+        discovery = Mock()
+        discovery.fetch_resource_by_id = AsyncMock(side_effect=lambda rid: {"id": rid})
+        collector = RelationshipDependencyCollector(
+            discovery_service=discovery,
+            db_ops=_session_db_ops(existing=set())[0],
+            relationship_rules=[_chain_rule()],
+            max_depth=10,
+        )
+
+        collected = await collector.collect_missing_dependencies([{"id": VM_ID}])
+
+        assert [r["id"] for r in collected] == [NIC_ID, SUBNET_ID, NSG_ID]
+        assert discovery.fetch_resource_by_id.call_count == 3
+
+
+class TestBoundedFetchPool:
+    """Fetch concurrency limits and throttling back-off."""
+
+    @pytest.mark.asyncio
+    async def test_in_flight_fetches_never_exceed_concurrency(self):
+        in_flight = 0
+        peak = 0
+
+        async def fetch(rid):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return {"id": rid}
+
+        discovery = Mock()
+        discovery.fetch_resource_by_id = AsyncMock(side_effect=fetch)
+        collector = RelationshipDependencyCollector(
+            discovery_service=discovery,
+            db_ops=Mock(),
+            relationship_rules=[],
+            fetch_concurrency=3,
+        )
+
+        ids = {
+            f"/subscriptions/sub1/resourceGroups/rg/providers/T/x/r{i}"
+            for i in range(20)
+        }
+        resources = await collector.fetch_resources_by_ids(ids)
+
+        assert {r["id"] for r in resources} == ids
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_throttled_fetch_is_retried_after_back_off(self):
+        attempts = []
+
+        async def fetch(rid):
+            attempts.append(rid)
+            if rid.endswith("r0") and attempts.count(rid) == 1:
+                raise ThrottledError()
+            return {"id": rid}
+
+        discovery = Mock()
+        discovery.fetch_resource_by_id = AsyncMock(side_effect=fetch)
+        collector = RelationshipDependencyCollector(
+            discovery_service=discovery,
+            db_ops=Mock(),
+            relationship_rules=[],
+            fetch_concurrency=4,
+        )
+
+        ids = {
+            f"/subscriptions/sub1/resourceGroups/rg/providers/T/x/r{i}"
+            for i in range(3)
+        }
+        resources = await collector.fetch_resources_by_ids(ids)
+
+        assert {r["id"] for r in resources} == ids
+        assert len(attempts) == 4
+
+    @pytest.mark.asyncio
+    async def test_persistent_throttling_gives_up_after_retries(self):
+        discovery = Mock()
+        discovery.fetch_resource_by_id = AsyncMock(side_effect=ThrottledError())
+        collector = RelationshipDependencyCollector(
+            discovery_service=discovery,
+            db_ops=Mock(),
+            relationship_rules=[],
+            throttle_retries=2,
+        )
+
+        assert await collector.fetch_resources_by_ids({NIC_ID}) == []
+        assert discovery.fetch_resource_by_id.call_count == 2
+
+    def test_throttling_is_detected_on_the_response(self):
+        error = Exception("throttled")
+        error.response = Mock(status_code=429)  # type: ignore[attr-defined]
+        assert is_throttling_error(error)
+        assert is_throttling_error(Exception("TooManyRequests"))
+        assert not is_throttling_error(ValueError("boom"))
+
+    def test_throttle_delay_prefers_retry_after(self):
+        assert throttle_delay(ThrottledError(), attempt=0) == 0.0
+        assert throttle_delay(ValueError("boom"), attempt=0) is None
+        assert throttle_delay(Exception("TooManyRequests"), attempt=1) == 4.0
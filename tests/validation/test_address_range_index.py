@@ -0,0 +1,97 @@
+"""Tests for the integer-range CIDR index used by address space validation."""
+
+import ipaddress
+import random
+
+from src.validation.address_range_index import AddressRangeIndex, find_overlapping_pairs
+from src.validation.address_space_validator import AddressSpaceValidator
+
+
+def nets(*cidrs):
+    return [ipaddress.ip_network(c) for c in cidrs]
+
+
+def brute_force_pairs(networks):
+    return [
+        (i, j)
+        for i in range(len(networks))
+        for j in range(i + 1, len(networks))
+        if networks[i].overlaps(networks[j])
+    ]
+
+
+class TestFindOverlappingPairs:
+    def test_nested_duplicate_and_disjoint(self):
+        networks = nets(
+            "10.0.0.0/8", "10.1.0.0/16", "192.168.0.0/24", "10.1.2.0/24", "10.1.0.0/16"
+        )
+
+        assert find_overlapping_pairs(networks) == [
+            (0, 1),
+            (0, 3),
+            (0, 4),
+            (1, 3),
+            (1, 4),
+            (3, 4),
+        ]
+
+    def test_ipv4_and_ipv6_never_overlap(self):
+        networks = nets("0.0.0.0/0", "::/0", "2001:db8::/32", "10.0.0.0/8")
+
+        assert find_overlapping_pairs(networks) == [(0, 3), (1, 2)]
+
+    def test_matches_pairwise_comparison(self):
+        rng = random.Random(7)
+        networks = []
+        for _ in range(600):
+            prefix = rng.choice([8, 12, 16, 20, 24, 28])
+            address = rng.getrandbits(32) & ~((1 << (32 - prefix)) - 1)
+            networks.append(ipaddress.IPv4Network((address & 0x0FFFFFFF, prefix)))
+
+        assert find_overlapping_pairs(networks) == brute_force_pairs(networks)
+
+
+class TestAddressRangeIndex:
+    def test_overlaps_uses_merged_ranges(self):
+        index = AddressRangeIndex(nets("10.0.0.0/16", "10.1.0.0/16", "10.3.0.0/24"))
+
+        assert len(index) == 2  # 10.0/16 and 10.1/16 are adjacent and merged
+        assert index.overlaps(ipaddress.ip_network("10.1.255.0/24"))
+        assert index.overlaps(ipaddress.ip_network("10.0.0.0/8"))
+        assert not index.overlaps(ipaddress.ip_network("10.2.0.0/16"))
+        assert not index.overlaps(ipaddress.ip_network("2001:db8::/32"))
+
+    def test_find_free_skips_used_blocks(self):
+        index = AddressRangeIndex(nets("10.0.0.0/15", "10.2.128.0/17", "10.4.0.0/16"))
+        within = ipaddress.ip_network("10.0.0.0/8")
+
+        assert str(index.find_free(16, within)) == "10.3.0.0/16"
+        index.add(ipaddress.ip_network("10.3.0.0/16"))
+        assert str(index.find_free(16, within)) == "10.5.0.0/16"
+        assert index.find_free(16, ipaddress.ip_network("10.4.0.0/16")) is None
+
+    def test_find_free_ipv6(self):
+        index = AddressRangeIndex(nets("fd00::/48"))
+
+        assert str(index.find_free(48, ipaddress.ip_network("fd00::/40"))) == (
+            "fd00:0:1::/48"
+        )
+
+
+class TestValidatorAllocation:
+    def test_renumbering_never_hands_out_an_overlapping_range(self):
+        validator = AddressSpaceValidator()
+
+        # 10.0.0.0/16 is free as a string but overlaps the used /8
+        assert (
+            validator._find_available_range({"10.0.0.0/8", "172.16.0.0/16"})
+            == "172.17.0.0/16"
+        )
+
+    def test_falls_back_to_free_slash16_blocks(self):
+        validator = AddressSpaceValidator()
+        used = set(AddressSpaceValidator.PRIVATE_RANGES) | {
+            f"10.{i}.0.0/16" for i in range(4, 200)
+        }
+
+        assert validator._find_available_range(used) == "10.200.0.0/16"